@@ -10,7 +10,8 @@ import logging
 from pathlib import Path
 from typing import Optional
 
-from client import create_client
+from client import EnginePool
+from core.mcp_manager import shutdown_mcp_servers
 from linear_updater import (
     LinearTaskState,
     is_linear_enabled,
@@ -43,9 +44,11 @@ from task_logger import (
 from ui import (
     BuildState,
     Icons,
+    MultiBuildStatusManager,
     StatusManager,
     bold,
     box,
+    get_status_flush_interval_ms,
     highlight,
     icon,
     muted,
@@ -55,6 +58,21 @@ from ui import (
 
 from .base import AUTO_CONTINUE_DELAY_SECONDS, HUMAN_INTERVENTION_FILE
 from .memory_manager import debug_memory_system_status, get_graphiti_context
+from .scheduler import (
+    WorkerCommits,
+    WorkerWorkspace,
+    apply_worker_commits,
+    collect_worker_commits,
+    create_worker_workspace,
+    fold_subtask_results,
+    get_max_workers,
+    get_parallel_batch,
+    read_subtask_statuses,
+    reject_subtasks,
+    remove_worker_workspace,
+    subtask_scope,
+    sync_worker_spec,
+)
 from .session import post_session_processing, run_agent_session
 from .utils import (
     find_phase_for_subtask,
@@ -67,6 +85,268 @@ from .utils import (
 logger = logging.getLogger(__name__)
 
 
+async def _build_subtask_prompt(
+    spec_dir: Path,
+    project_dir: Path,
+    subtask: dict,
+    recovery_manager: RecoveryManager,
+) -> str:
+    """
+    Build the coder prompt for a single subtask.
+
+    Combines the focused subtask prompt, recovery hints from previous
+    attempts, relevant file context and Graphiti memory (if enabled).
+    """
+    subtask_id = subtask.get("id")
+
+    # Get attempt count for recovery context
+    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+    recovery_hints = (
+        recovery_manager.get_recovery_hints(subtask_id) if attempt_count > 0 else None
+    )
+
+    # Find the phase for this subtask
+    plan = load_implementation_plan(spec_dir)
+    phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
+
+    # Generate focused, minimal prompt for this subtask
+    prompt = generate_subtask_prompt(
+        spec_dir=spec_dir,
+        project_dir=project_dir,
+        subtask=subtask,
+        phase=phase or {},
+        attempt_count=attempt_count,
+        recovery_hints=recovery_hints,
+    )
+
+    # Load and append relevant file context
+    context = load_subtask_context(spec_dir, project_dir, subtask)
+    if context.get("patterns") or context.get("files_to_modify"):
+        prompt += "\n\n" + format_context_for_prompt(context)
+
+    # Retrieve and append Graphiti memory context (if enabled)
+    graphiti_context = await get_graphiti_context(spec_dir, project_dir, subtask)
+    if graphiti_context:
+        prompt += "\n\n" + graphiti_context
+        print_status("Graphiti memory context loaded", "success")
+
+    return prompt
+
+
+async def _check_stuck_subtask(
+    spec_dir: Path,
+    subtask_id: str,
+    success: bool,
+    recovery_manager: RecoveryManager,
+    linear_is_enabled: bool,
+) -> None:
+    """Mark a subtask as stuck after repeated failures."""
+    attempt_count = recovery_manager.get_attempt_count(subtask_id)
+    if success or attempt_count < 3:
+        return
+
+    recovery_manager.mark_subtask_stuck(
+        subtask_id, f"Failed after {attempt_count} attempts"
+    )
+    print()
+    print_status(
+        f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts",
+        "error",
+    )
+    print(muted("Consider: manual intervention or skipping this subtask"))
+
+    # Record stuck subtask in Linear (if enabled)
+    if linear_is_enabled:
+        await linear_task_stuck(
+            spec_dir=spec_dir,
+            subtask_id=subtask_id,
+            attempt_count=attempt_count,
+        )
+        print_status("Linear notified of stuck subtask", "info")
+
+
+async def _complete_build(
+    spec_dir: Path,
+    status_manager: StatusManager,
+    task_logger,
+    linear_task,
+) -> None:
+    """Report a finished build to the status line, task log and Linear."""
+    print_build_complete_banner(spec_dir)
+    status_manager.update(state=BuildState.COMPLETE)
+
+    # End coding phase in task logger
+    if task_logger:
+        task_logger.end_phase(
+            LogPhase.CODING,
+            success=True,
+            message="All subtasks completed successfully",
+        )
+
+    # Notify Linear that build is complete (moving to QA)
+    if linear_task and linear_task.task_id:
+        await linear_build_complete(spec_dir)
+        print_status("Linear notified: build complete, ready for QA", "success")
+
+
+async def _run_parallel_batch(
+    batch: list[dict],
+    *,
+    project_dir: Path,
+    spec_dir: Path,
+    model: str,
+    verbose: bool,
+    provider: Optional[str],
+    session_num: int,
+    max_workers: int,
+    recovery_manager: RecoveryManager,
+    status_manager: StatusManager,
+    linear_task,
+    source_spec_dir: Path | None,
+    engine_pool: EnginePool,
+) -> str:
+    """
+    Run one agent session per subtask concurrently.
+
+    Subtasks in the batch come from parallel_safe phases and have disjoint
+    file scopes (see agents.scheduler). Each worker runs in its own detached
+    worktree with a private copy of the spec, so workers never share a git
+    index. Afterwards the statuses they left in their plan copies are folded
+    back atomically, and each worker's commits are cherry-picked onto the
+    project worktree in batch order - unless they wrote outside the
+    worker's scope (or don't apply cleanly), in which case the subtask is
+    rejected and none of its commits land. Then the usual post-session
+    processing runs for every subtask with its own commits.
+
+    Returns:
+        "complete", "continue" or "error" (only if every worker errored)
+    """
+    subtask_ids = [subtask["id"] for subtask in batch]
+    content = [
+        bold(f"{icon(Icons.GEAR)} PARALLEL SESSION {session_num}"),
+        "",
+        f"Workers: {len(batch)}/{max_workers}",
+        f"Subtasks: {highlight(', '.join(subtask_ids))}",
+    ]
+    print()
+    print(box(content, width=70, style="heavy"))
+    print()
+
+    commit_before = get_latest_commit(project_dir)
+    commit_count_before = get_commit_count(project_dir)
+
+    # Entries from concurrent sessions can't be attributed to one subtask
+    task_logger = get_task_logger(spec_dir)
+    if task_logger:
+        task_logger.set_subtask(None)
+        task_logger.set_session(session_num)
+
+    active = len(batch)
+    observed: dict[str, str] = {}
+    workspaces: dict[str, WorkerWorkspace] = {}
+    status_manager.update_workers(active, max_workers)
+    status_manager.update_subtasks(in_progress=active)
+    status_manager.flush()
+
+    async def worker(subtask: dict) -> str:
+        nonlocal active
+        subtask_id = subtask["id"]
+        try:
+            workspace = create_worker_workspace(
+                project_dir, spec_dir, subtask_id, commit_before
+            )
+            workspaces[subtask_id] = workspace
+            prompt = await _build_subtask_prompt(
+                workspace.spec_dir, workspace.path, subtask, recovery_manager
+            )
+            client = engine_pool.acquire(
+                workspace.path,
+                workspace.spec_dir,
+                model,
+                verbose=verbose,
+                cwd=workspace.path,
+                provider=provider,
+            )
+            async with client:
+                status, _ = await run_agent_session(
+                    client, prompt, spec_dir, verbose, phase=LogPhase.CODING
+                )
+            observed.update(read_subtask_statuses(workspace.spec_dir, [subtask_id]))
+            return status
+        except Exception as e:
+            logger.warning(f"Worker for subtask {subtask_id} failed: {e}")
+            return "error"
+        finally:
+            active -= 1
+            status_manager.update_workers(active)
+
+    try:
+        statuses = await asyncio.gather(*(worker(subtask) for subtask in batch))
+
+        worker_commits: dict[str, WorkerCommits] = {}
+        rejected = []
+        for subtask in batch:
+            subtask_id = subtask["id"]
+            workspace = workspaces.get(subtask_id)
+            if workspace is None:
+                worker_commits[subtask_id] = WorkerCommits(base=commit_before)
+                continue
+            sync_worker_spec(workspace, spec_dir)
+            commits = collect_worker_commits(workspace, subtask_scope(subtask))
+            if commits.out_of_scope:
+                print_status(
+                    f"Subtask {subtask_id} rejected: wrote outside its file scope "
+                    f"({', '.join(sorted(commits.out_of_scope))})",
+                    "error",
+                )
+                rejected.append(subtask_id)
+                worker_commits[subtask_id] = WorkerCommits(base=commit_before)
+                continue
+            base = get_latest_commit(project_dir)
+            applied = apply_worker_commits(project_dir, commits.commits)
+            if applied is None:
+                print_status(
+                    f"Subtask {subtask_id} rejected: its commits did not apply "
+                    "cleanly",
+                    "error",
+                )
+                rejected.append(subtask_id)
+                applied = []
+            worker_commits[subtask_id] = WorkerCommits(commits=applied, base=base)
+    finally:
+        for workspace in workspaces.values():
+            remove_worker_workspace(project_dir, workspace.path)
+
+    fold_subtask_results(spec_dir, observed)
+    reject_subtasks(spec_dir, rejected)
+
+    linear_is_enabled = linear_task is not None and linear_task.task_id is not None
+    for subtask_id in subtask_ids:
+        commits = worker_commits[subtask_id]
+        success = await post_session_processing(
+            spec_dir=spec_dir,
+            project_dir=project_dir,
+            subtask_id=subtask_id,
+            session_num=session_num,
+            commit_before=commits.base or commit_before,
+            commit_count_before=commit_count_before,
+            recovery_manager=recovery_manager,
+            linear_enabled=linear_is_enabled,
+            status_manager=status_manager,
+            source_spec_dir=source_spec_dir,
+            commits=commits.commits,
+        )
+        await _check_stuck_subtask(
+            spec_dir, subtask_id, success, recovery_manager, linear_is_enabled
+        )
+
+    if is_build_complete(spec_dir):
+        return "complete"
+    if all(status == "error" for status in statuses):
+        return "error"
+    return "continue"
+
+
 async def run_autonomous_agent(
     project_dir: Path,
     spec_dir: Path,
@@ -89,12 +369,47 @@ async def run_autonomous_agent(
         max_iterations: Maximum number of iterations (None for unlimited)
         verbose: Whether to show detailed output
         source_spec_dir: Original spec directory in main project (for syncing from worktree)
+        provider: Model provider to use
     """
+    # Engines are kept warm across sessions and reset between subtasks
+    engine_pool = EnginePool()
+    try:
+        await _run_build_loop(
+            project_dir,
+            spec_dir,
+            model,
+            max_iterations=max_iterations,
+            verbose=verbose,
+            source_spec_dir=source_spec_dir,
+            provider=provider,
+            engine_pool=engine_pool,
+        )
+    finally:
+        await engine_pool.close()
+        # MCP servers are shared for the whole build; stop them with it
+        await shutdown_mcp_servers()
+
+
+async def _run_build_loop(
+    project_dir: Path,
+    spec_dir: Path,
+    model: str,
+    *,
+    max_iterations: int | None,
+    verbose: bool,
+    source_spec_dir: Path | None,
+    provider: Optional[str],
+    engine_pool: EnginePool,
+) -> None:
+    """Body of run_autonomous_agent; sessions take engines from engine_pool."""
     # Initialize recovery manager (handles memory persistence)
     recovery_manager = RecoveryManager(spec_dir, project_dir)
 
-    # Initialize status manager for ccstatusline
-    status_manager = StatusManager(project_dir)
+    # Initialize status manager for ccstatusline (coalesced writes, shared
+    # with other builds running in this project)
+    status_manager = MultiBuildStatusManager(
+        project_dir, flush_interval_ms=get_status_flush_interval_ms()
+    )
     status_manager.set_active(spec_dir.name, BuildState.BUILDING)
 
     # Initialize task logger for persistent logging
@@ -186,6 +501,9 @@ async def run_autonomous_agent(
 
     # Main loop
     iteration = 0
+    max_workers = get_max_workers()
+    if max_workers > 1:
+        status_manager.update_workers(0, max_workers)
 
     while True:
         iteration += 1
@@ -213,6 +531,42 @@ async def run_autonomous_agent(
             print("To continue, run the script again without --max-iterations")
             break
 
+        # Dispatch a concurrent batch when parallel_safe phases allow it
+        if max_workers > 1 and not first_run and not is_planning_phase:
+            plan = load_implementation_plan(spec_dir)
+            # Workers branch their worktrees from HEAD, so it must exist
+            can_batch = plan is not None and get_latest_commit(project_dir)
+            batch = get_parallel_batch(plan, max_workers) if can_batch else []
+            if batch:
+                status_manager.update_session(iteration)
+                status = await _run_parallel_batch(
+                    batch,
+                    project_dir=project_dir,
+                    spec_dir=spec_dir,
+                    model=model,
+                    verbose=verbose,
+                    provider=provider,
+                    session_num=iteration,
+                    max_workers=max_workers,
+                    recovery_manager=recovery_manager,
+                    status_manager=status_manager,
+                    linear_task=linear_task,
+                    source_spec_dir=source_spec_dir,
+                    engine_pool=engine_pool,
+                )
+                if status == "complete":
+                    await _complete_build(
+                        spec_dir, status_manager, task_logger, linear_task
+                    )
+                    break
+
+                print_progress_summary(spec_dir)
+                status_manager.update(
+                    state=BuildState.ERROR if status == "error" else BuildState.BUILDING
+                )
+                await asyncio.sleep(AUTO_CONTINUE_DELAY_SECONDS)
+                continue
+
         # Get the next subtask to work on
         next_subtask = get_next_subtask(spec_dir)
         subtask_id = next_subtask.get("id") if next_subtask else None
@@ -242,12 +596,14 @@ async def run_autonomous_agent(
             else 1,
         )
 
+        status_manager.flush()
+
         # Capture state before session for post-processing
         commit_before = get_latest_commit(project_dir)
         commit_count_before = get_commit_count(project_dir)
 
-        # Create client (fresh context)
-        client = create_client(
+        # Get a client with a fresh context (reused from earlier sessions if possible)
+        client = engine_pool.acquire(
             project_dir,
             spec_dir,
             model,
@@ -284,41 +640,11 @@ async def run_autonomous_agent(
                 print("No pending subtasks found - build may be complete!")
                 break
 
-            # Get attempt count for recovery context
             attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            recovery_hints = (
-                recovery_manager.get_recovery_hints(subtask_id)
-                if attempt_count > 0
-                else None
+            prompt = await _build_subtask_prompt(
+                spec_dir, project_dir, next_subtask, recovery_manager
             )
 
-            # Find the phase for this subtask
-            plan = load_implementation_plan(spec_dir)
-            phase = find_phase_for_subtask(plan, subtask_id) if plan else {}
-
-            # Generate focused, minimal prompt for this subtask
-            prompt = generate_subtask_prompt(
-                spec_dir=spec_dir,
-                project_dir=project_dir,
-                subtask=next_subtask,
-                phase=phase or {},
-                attempt_count=attempt_count,
-                recovery_hints=recovery_hints,
-            )
-
-            # Load and append relevant file context
-            context = load_subtask_context(spec_dir, project_dir, next_subtask)
-            if context.get("patterns") or context.get("files_to_modify"):
-                prompt += "\n\n" + format_context_for_prompt(context)
-
-            # Retrieve and append Graphiti memory context (if enabled)
-            graphiti_context = await get_graphiti_context(
-                spec_dir, project_dir, next_subtask
-            )
-            if graphiti_context:
-                prompt += "\n\n" + graphiti_context
-                print_status("Graphiti memory context loaded", "success")
-
             # Show what we're working on
             print(f"Working on: {highlight(subtask_id)}")
             print(f"Description: {next_subtask.get('description', 'No description')}")
@@ -356,26 +682,9 @@ async def run_autonomous_agent(
             )
 
             # Check for stuck subtasks
-            attempt_count = recovery_manager.get_attempt_count(subtask_id)
-            if not success and attempt_count >= 3:
-                recovery_manager.mark_subtask_stuck(
-                    subtask_id, f"Failed after {attempt_count} attempts"
-                )
-                print()
-                print_status(
-                    f"Subtask {subtask_id} marked as STUCK after {attempt_count} attempts",
-                    "error",
-                )
-                print(muted("Consider: manual intervention or skipping this subtask"))
-
-                # Record stuck subtask in Linear (if enabled)
-                if linear_is_enabled:
-                    await linear_task_stuck(
-                        spec_dir=spec_dir,
-                        subtask_id=subtask_id,
-                        attempt_count=attempt_count,
-                    )
-                    print_status("Linear notified of stuck subtask", "info")
+            await _check_stuck_subtask(
+                spec_dir, subtask_id, success, recovery_manager, linear_is_enabled
+            )
         elif is_planning_phase and source_spec_dir:
             # After planning phase, sync the newly created implementation plan back to source
             if sync_plan_to_source(spec_dir, source_spec_dir):
@@ -383,22 +692,7 @@ async def run_autonomous_agent(
 
         # Handle session status
         if status == "complete":
-            print_build_complete_banner(spec_dir)
-            status_manager.update(state=BuildState.COMPLETE)
-
-            # End coding phase in task logger
-            if task_logger:
-                task_logger.end_phase(
-                    LogPhase.CODING,
-                    success=True,
-                    message="All subtasks completed successfully",
-                )
-
-            # Notify Linear that build is complete (moving to QA)
-            if linear_task and linear_task.task_id:
-                await linear_build_complete(spec_dir)
-                print_status("Linear notified: build complete, ready for QA", "success")
-
+            await _complete_build(spec_dir, status_manager, task_logger, linear_task)
             break
 
         elif status == "continue":
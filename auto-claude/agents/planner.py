@@ -17,7 +17,7 @@ from task_logger import (
 from ui import (
     BuildState,
     Icons,
-    StatusManager,
+    MultiBuildStatusManager,
     bold,
     box,
     highlight,
@@ -62,11 +62,11 @@ async def run_followup_planner(
     Returns:
         bool: True if planning completed successfully
     """
-    from implementation_plan import ImplementationPlan
+    from implementation_plan import ImplementationPlan, get_plan_store
     from prompts import get_followup_planner_prompt
 
     # Initialize status manager for ccstatusline
-    status_manager = StatusManager(project_dir)
+    status_manager = MultiBuildStatusManager(project_dir)
     status_manager.set_active(spec_dir.name, BuildState.PLANNING)
 
     # Initialize task logger for persistent logging
@@ -121,18 +121,20 @@ async def run_followup_planner(
             return False
 
         # Verify the plan was updated (should have pending subtasks now)
-        plan_file = spec_dir / "implementation_plan.json"
-        if plan_file.exists():
-            plan = ImplementationPlan.load(plan_file)
-
+        plan_store = get_plan_store(spec_dir)
+        plan = plan_store.plan()
+        if plan is not None:
             # Check if there are any pending subtasks
             all_subtasks = [c for p in plan.phases for c in p.subtasks]
             pending_subtasks = [c for c in all_subtasks if c.status.value == "pending"]
 
             if pending_subtasks:
                 # Reset the plan status to in_progress (in case planner didn't)
-                plan.reset_for_followup()
-                plan.save(plan_file)
+                def reset(plan: ImplementationPlan) -> bool:
+                    plan.reset_for_followup()
+                    return True
+
+                plan_store.update_plan(reset)
 
                 print()
                 content = [
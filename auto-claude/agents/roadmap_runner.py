@@ -29,6 +29,12 @@ try:
 except ImportError:
     pass
 
+# Debug settings are resolved when debug is first imported; re-read them in
+# case that happened before the .env file above was loaded
+from debug import reload_debug_config
+
+reload_debug_config()
+
 from debug import debug, debug_error, debug_warning
 
 # Import from refactored roadmap package
@@ -0,0 +1,496 @@
+"""
+Subtask Scheduler
+=================
+
+Reads the implementation plan's phase DAG and picks batches of subtasks that
+can be worked on concurrently.
+
+A batch is only formed from phases marked ``parallel_safe`` whose
+``depends_on`` phases are complete. Subtasks in a batch must not share any
+entry in ``files_to_modify``/``files_to_create`` - each worker owns its files
+for the duration of the batch (file-lock scope).
+
+Every worker runs in its own detached git worktree (with a private copy of
+the spec directory) branched from HEAD, so concurrent sessions never share a
+git index or see each other's uncommitted files. When the batch is done the
+worker's commits are checked against its scope: in-scope work is
+cherry-picked back onto the project worktree, while a worker that wrote
+outside its scope is rejected (reset to pending) and its commits are never
+applied.
+
+Concurrency is opt-in via the AUTO_CLAUDE_MAX_WORKERS environment variable
+(default 1 = strictly sequential, the historical behaviour).
+
+Results are folded back into implementation_plan.json through the shared
+PlanStore (exclusive lock, atomic temp-file + rename write), so concurrent
+sessions can't corrupt the plan or lose each other's status updates.
+"""
+
+import json
+import logging
+import os
+import shutil
+import subprocess
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path, PurePosixPath
+
+from implementation_plan.store import get_plan_store
+
+logger = logging.getLogger(__name__)
+
+MAX_WORKERS_ENV = "AUTO_CLAUDE_MAX_WORKERS"
+
+# Higher rank wins when folding results from concurrent sessions
+_STATUS_RANK = {"pending": 0, "failed": 1, "in_progress": 2, "completed": 3}
+
+# Build bookkeeping (specs, status file) any worker may write
+_BOOKKEEPING_PREFIX = ".auto-claude"
+
+# Worker checkouts live in the project's (gitignored) .auto-claude directory
+BATCH_WORKTREES_DIR = ".auto-claude/batch-worktrees"
+
+# Spec files owned by the orchestrator, never copied back from a worker
+_SPEC_SYNC_SKIP = {"implementation_plan.json", ".implementation_plan.lock"}
+
+# Spec files workers only append to (progress notes, memory)
+_SPEC_APPEND_SUFFIXES = {".txt", ".md"}
+
+
+def get_max_workers() -> int:
+    """
+    Get the configured worker cap for concurrent subtask sessions.
+
+    Returns:
+        Number of workers (always >= 1)
+    """
+    try:
+        return max(1, int(os.environ.get(MAX_WORKERS_ENV, "1")))
+    except ValueError:
+        return 1
+
+
+def _phase_key(phase: dict):
+    """Identifier used by depends_on (matches progress.get_next_subtask)."""
+    return phase.get("id") or phase.get("phase")
+
+
+def _normalize_path(path: str) -> str:
+    return PurePosixPath(path.replace("\\", "/")).as_posix()
+
+
+def subtask_scope(subtask: dict) -> set[str]:
+    """
+    Get the files a subtask may write while running in a batch.
+
+    Args:
+        subtask: Subtask dictionary from the plan
+
+    Returns:
+        Normalized project-relative paths from files_to_modify and
+        files_to_create
+    """
+    files = (subtask.get("files_to_modify") or []) + (
+        subtask.get("files_to_create") or []
+    )
+    return {_normalize_path(path) for path in files}
+
+
+def get_available_phases(plan: dict) -> list[dict]:
+    """
+    Get phases whose dependencies are complete and that still have pending work.
+
+    Args:
+        plan: Implementation plan dictionary
+
+    Returns:
+        Phases in plan order
+    """
+    phases = plan.get("phases", [])
+    phase_complete = {
+        _phase_key(phase): all(
+            s.get("status") == "completed" for s in phase.get("subtasks", [])
+        )
+        for phase in phases
+    }
+
+    available = []
+    for phase in phases:
+        deps = phase.get("depends_on", [])
+        if not all(phase_complete.get(dep, False) for dep in deps):
+            continue
+        if any(s.get("status") == "pending" for s in phase.get("subtasks", [])):
+            available.append(phase)
+    return available
+
+
+def get_parallel_batch(plan: dict, max_workers: int) -> list[dict]:
+    """
+    Pick pending subtasks that can run concurrently.
+
+    Subtasks are drawn from every available ``parallel_safe`` phase, skipping
+    any whose scope (see subtask_scope) overlaps a subtask already in the
+    batch. Subtasks that declare no files are left to the sequential path,
+    since their writes could not be told apart from anyone else's.
+
+    Args:
+        plan: Implementation plan dictionary
+        max_workers: Maximum batch size
+
+    Returns:
+        Subtask dicts (same shape as progress.get_next_subtask). Empty when
+        fewer than two subtasks can run together - the caller should fall
+        back to the sequential path.
+    """
+    if max_workers < 2:
+        return []
+
+    available = get_available_phases(plan)
+    # Keep strict ordering when the next phase in line is not parallel_safe
+    if not available or not available[0].get("parallel_safe"):
+        return []
+
+    batch: list[dict] = []
+    claimed_files: set[str] = set()
+
+    for phase in available:
+        if not phase.get("parallel_safe"):
+            continue
+        for subtask in phase.get("subtasks", []):
+            if subtask.get("status") != "pending":
+                continue
+            files = subtask_scope(subtask)
+            if not files or files & claimed_files:
+                continue
+            claimed_files |= files
+            batch.append(
+                {
+                    "phase_id": _phase_key(phase),
+                    "phase_name": phase.get("name"),
+                    "phase_num": phase.get("phase"),
+                    **subtask,
+                }
+            )
+            if len(batch) >= max_workers:
+                return batch
+
+    return batch if len(batch) >= 2 else []
+
+
+def read_subtask_statuses(spec_dir: Path, subtask_ids: list[str]) -> dict[str, str]:
+    """
+    Read the current status of the given subtasks.
+
+    Args:
+        spec_dir: Spec directory containing implementation_plan.json
+        subtask_ids: Subtasks to look up
+
+    Returns:
+        Mapping of subtask ID to status (missing IDs are omitted)
+    """
+    wanted = set(subtask_ids)
+    plan = get_plan_store(spec_dir).read()
+    if plan is None:
+        return {}
+
+    return {
+        subtask["id"]: subtask.get("status", "pending")
+        for phase in plan.get("phases", [])
+        for subtask in phase.get("subtasks", [])
+        if subtask.get("id") in wanted
+    }
+
+
+def fold_subtask_results(spec_dir: Path, results: dict[str, str]) -> bool:
+    """
+    Merge per-subtask statuses from concurrent sessions into the plan.
+
+    A status is only ever promoted (pending < failed < in_progress <
+    completed), so a session that rewrote the plan from a stale copy cannot
+    undo another session's completion.
+
+    Args:
+        spec_dir: Spec directory containing implementation_plan.json
+        results: Mapping of subtask ID to the status observed for it
+
+    Returns:
+        True if the plan was updated
+    """
+    store = get_plan_store(spec_dir)
+    if not results or not store.plan_file.exists():
+        return False
+
+    def fold(plan: dict) -> bool:
+        changed = False
+        for phase in plan.get("phases", []):
+            for subtask in phase.get("subtasks", []):
+                observed = results.get(subtask.get("id"))
+                if observed is None:
+                    continue
+                current = subtask.get("status", "pending")
+                if _STATUS_RANK.get(observed, 0) > _STATUS_RANK.get(current, 0):
+                    subtask["status"] = observed
+                    subtask["updated_at"] = datetime.now(timezone.utc).isoformat()
+                    changed = True
+        if changed:
+            plan["last_updated"] = datetime.now(timezone.utc).isoformat()
+        return changed
+
+    try:
+        return store.update(fold)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Could not fold subtask results into plan: {e}")
+        return False
+
+
+def _git(args: list[str], cwd: Path) -> subprocess.CompletedProcess:
+    return subprocess.run(
+        ["git", *args],
+        cwd=cwd,
+        capture_output=True,
+        text=True,
+        encoding="utf-8",
+        errors="replace",
+    )
+
+
+@dataclass
+class WorkerWorkspace:
+    """Private checkout one worker of a batch runs in."""
+
+    subtask_id: str
+    path: Path  # detached worktree root
+    spec_dir: Path  # worker's copy of the spec directory
+    base: str  # commit the worktree was branched from
+    # Spec file sizes at copy time, used to sync notes back
+    spec_sizes: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class WorkerCommits:
+    """Commits one worker of a batch made in its own worktree."""
+
+    commits: list[str] = field(default_factory=list)  # oldest first
+    base: str | None = None  # commit the worker started from
+    out_of_scope: set[str] = field(default_factory=set)
+
+    @property
+    def head(self) -> str | None:
+        return self.commits[-1] if self.commits else None
+
+
+def _worker_spec_dir(worktree: Path, project_dir: Path, spec_dir: Path) -> Path:
+    """Where the spec directory sits inside a worker's worktree."""
+    try:
+        relative = spec_dir.resolve().relative_to(project_dir.resolve())
+    except ValueError:
+        # Same fallback as prompt_generator.get_relative_spec_path
+        relative = Path(".auto-claude") / "specs" / spec_dir.name
+    return worktree / relative
+
+
+def remove_worker_workspace(project_dir: Path, worktree: Path) -> None:
+    """
+    Remove a worker's worktree and its git bookkeeping.
+
+    Args:
+        project_dir: Worktree the batch was started from
+        worktree: Path of the worker's worktree
+    """
+    result = _git(["worktree", "remove", "--force", str(worktree)], project_dir)
+    if result.returncode != 0 and worktree.exists():
+        shutil.rmtree(worktree, ignore_errors=True)
+    _git(["worktree", "prune"], project_dir)
+
+
+def create_worker_workspace(
+    project_dir: Path, spec_dir: Path, subtask_id: str, base: str
+) -> WorkerWorkspace:
+    """
+    Check out a private worktree for one worker of a batch.
+
+    The worktree is detached at ``base`` and gets its own copy of the spec
+    directory, so the worker's commits, git index and plan edits stay out of
+    every other worker's way until the batch is merged back.
+
+    Args:
+        project_dir: Worktree the batch is started from
+        spec_dir: Spec directory of the build
+        subtask_id: Subtask the worker runs
+        base: Commit to branch from (HEAD when the batch started)
+
+    Returns:
+        The worker's WorkerWorkspace
+
+    Raises:
+        RuntimeError: If the worktree could not be created
+    """
+    path = project_dir / BATCH_WORKTREES_DIR / subtask_id
+    if path.exists():
+        # Left behind by an interrupted batch
+        remove_worker_workspace(project_dir, path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    result = _git(["worktree", "add", "--detach", str(path), base], project_dir)
+    if result.returncode != 0:
+        raise RuntimeError(
+            f"Could not create worktree for subtask {subtask_id}: "
+            f"{result.stderr.strip()}"
+        )
+
+    worker_spec_dir = _worker_spec_dir(path, project_dir, spec_dir)
+    shutil.copytree(
+        spec_dir,
+        worker_spec_dir,
+        ignore=shutil.ignore_patterns(".implementation_plan.lock", "*.tmp"),
+        dirs_exist_ok=True,
+    )
+    spec_sizes = {
+        file.relative_to(spec_dir).as_posix(): file.stat().st_size
+        for file in spec_dir.rglob("*")
+        if file.is_file()
+    }
+    return WorkerWorkspace(subtask_id, path, worker_spec_dir, base, spec_sizes)
+
+
+def collect_worker_commits(
+    workspace: WorkerWorkspace, scope: set[str]
+) -> WorkerCommits:
+    """
+    Read the commits a worker made in its worktree and check them against
+    its scope.
+
+    Args:
+        workspace: The worker's WorkerWorkspace
+        scope: Files the worker may write (see subtask_scope)
+
+    Returns:
+        WorkerCommits with every file outside the scope (other than build
+        bookkeeping) in ``out_of_scope``
+    """
+    worker = WorkerCommits(base=workspace.base)
+    result = _git(
+        [
+            "log",
+            "--reverse",
+            "--no-renames",
+            "--name-only",
+            "--format=%x00%H",
+            f"{workspace.base}..HEAD",
+        ],
+        workspace.path,
+    )
+    if result.returncode != 0:
+        logger.warning(
+            f"Could not read commits of subtask {workspace.subtask_id}: "
+            f"{result.stderr.strip()}"
+        )
+        return worker
+
+    for entry in result.stdout.split("\0")[1:]:
+        commit, _, names = entry.partition("\n")
+        if not commit.strip():
+            continue
+        worker.commits.append(commit.strip())
+        files = {_normalize_path(name) for name in names.splitlines() if name}
+        worker.out_of_scope |= {
+            path for path in files - scope if not path.startswith(_BOOKKEEPING_PREFIX)
+        }
+    return worker
+
+
+def apply_worker_commits(project_dir: Path, commits: list[str]) -> list[str] | None:
+    """
+    Cherry-pick a worker's commits onto the project worktree's HEAD.
+
+    Args:
+        project_dir: Worktree the batch was started from
+        commits: The worker's commits, oldest first
+
+    Returns:
+        Hashes of the applied commits (oldest first), or None if they did not
+        apply cleanly - the cherry-pick is aborted and HEAD is left untouched
+    """
+    if not commits:
+        return []
+    before = _git(["rev-parse", "HEAD"], project_dir).stdout.strip()
+    result = _git(["cherry-pick", *commits], project_dir)
+    if result.returncode != 0:
+        logger.warning(f"Could not apply worker commits: {result.stderr.strip()}")
+        _git(["cherry-pick", "--abort"], project_dir)
+        return None
+    log = _git(["rev-list", "--reverse", f"{before}..HEAD"], project_dir)
+    return log.stdout.split()
+
+
+def sync_worker_spec(workspace: WorkerWorkspace, spec_dir: Path) -> None:
+    """
+    Carry a worker's notes from its spec copy back to the build's spec dir.
+
+    New files are copied over; text notes the worker appended to are
+    appended to the original. The plan is folded separately (see
+    fold_subtask_results), and rewritten files are left alone since another
+    worker may have rewritten them too.
+
+    Args:
+        workspace: The worker's WorkerWorkspace
+        spec_dir: Spec directory of the build
+    """
+    for source in workspace.spec_dir.rglob("*"):
+        if not source.is_file() or source.name in _SPEC_SYNC_SKIP:
+            continue
+        relative = source.relative_to(workspace.spec_dir).as_posix()
+        target = spec_dir / relative
+        size = workspace.spec_sizes.get(relative)
+        try:
+            if size is None:
+                if not target.exists():
+                    target.parent.mkdir(parents=True, exist_ok=True)
+                    shutil.copy2(source, target)
+            elif (
+                source.suffix in _SPEC_APPEND_SUFFIXES and source.stat().st_size > size
+            ):
+                with open(source, "rb") as src:
+                    src.seek(size)
+                    tail = src.read()
+                with open(target, "ab") as dst:
+                    dst.write(tail)
+        except OSError as e:
+            logger.warning(f"Could not sync {relative} from worker spec: {e}")
+
+
+def reject_subtasks(spec_dir: Path, subtask_ids: list[str]) -> bool:
+    """
+    Reset subtasks that broke their batch scope back to pending.
+
+    Args:
+        spec_dir: Spec directory containing implementation_plan.json
+        subtask_ids: Subtasks to reset
+
+    Returns:
+        True if the plan was updated
+    """
+    store = get_plan_store(spec_dir)
+    if not subtask_ids or not store.plan_file.exists():
+        return False
+    rejected = set(subtask_ids)
+
+    def reject(plan: dict) -> bool:
+        changed = False
+        for phase in plan.get("phases", []):
+            for subtask in phase.get("subtasks", []):
+                if subtask.get("id") not in rejected:
+                    continue
+                subtask["status"] = "pending"
+                subtask.pop("completed_at", None)
+                subtask["updated_at"] = datetime.now(timezone.utc).isoformat()
+                changed = True
+        if changed:
+            plan["last_updated"] = datetime.now(timezone.utc).isoformat()
+        return changed
+
+    try:
+        return store.update(reject)
+    except (OSError, json.JSONDecodeError) as e:
+        logger.warning(f"Could not reject out-of-scope subtasks: {e}")
+        return False
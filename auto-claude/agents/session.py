@@ -7,6 +7,7 @@ memory updates, recovery tracking, and Linear integration.
 """
 
 import logging
+import time
 from pathlib import Path
 from typing import Any
 
@@ -15,6 +16,7 @@ try:
 except ImportError:
     ClaudeSDKClient = Any
 
+from core.profiling import profile_observe
 from insight_extractor import extract_session_insights
 from linear_updater import (
     linear_subtask_completed,
@@ -60,6 +62,7 @@ async def post_session_processing(
     linear_enabled: bool = False,
     status_manager: StatusManager | None = None,
     source_spec_dir: Path | None = None,
+    commits: list[str] | None = None,
 ) -> bool:
     """
     Process session results and update memory automatically.
@@ -77,6 +80,10 @@ async def post_session_processing(
         linear_enabled: Whether Linear integration is enabled
         status_manager: Optional status manager for ccstatusline
         source_spec_dir: Original spec directory (for syncing back from worktree)
+        commits: Commits made by this session, oldest first, when it ran
+            as one worker of a parallel batch and its commits were applied
+            alongside other workers' (default: everything after
+            commit_before)
 
     Returns:
         True if subtask was completed successfully
@@ -102,9 +109,12 @@ async def post_session_processing(
     subtask_status = subtask.get("status", "pending")
 
     # Check for new commits
-    commit_after = get_latest_commit(project_dir)
-    commit_count_after = get_commit_count(project_dir)
-    new_commits = commit_count_after - commit_count_before
+    if commits is not None:
+        commit_after = commits[-1] if commits else commit_before
+        new_commits = len(commits)
+    else:
+        commit_after = get_latest_commit(project_dir)
+        new_commits = get_commit_count(project_dir) - commit_count_before
 
     print_key_value("Subtask status", subtask_status)
     print_key_value("New commits", str(new_commits))
@@ -342,6 +352,9 @@ async def run_agent_session(
     # Get task logger for this spec
     task_logger = get_task_logger(spec_dir)
     current_tool = None
+    engine_name = type(client).__name__
+    query_start = time.perf_counter()
+    first_message = True
 
     try:
         # Send the query
@@ -351,6 +364,12 @@ async def run_agent_session(
         response_text = ""
         async for msg in client.receive_response():
             msg_type = type(msg).__name__
+            if first_message:
+                first_message = False
+                profile_observe(
+                    f"llm.ttft.{engine_name}",
+                    (time.perf_counter() - query_start) * 1000,
+                )
 
             # Handle AssistantMessage (text and tool use)
             if msg_type == "AssistantMessage" and hasattr(msg, "content"):
@@ -474,6 +493,9 @@ async def run_agent_session(
                         current_tool = None
 
         print("\n" + "-" * 70 + "\n")
+        profile_observe(
+            f"llm.session.{engine_name}", (time.perf_counter() - query_start) * 1000
+        )
 
         # Check if build is complete
         if is_build_complete(spec_dir):
@@ -486,3 +508,8 @@ async def run_agent_session(
         if task_logger:
             task_logger.log_error(f"Session error: {e}", phase)
         return "error", str(e)
+
+    finally:
+        # Make the session's log entries visible in task_logs.json right away
+        if task_logger:
+            task_logger.flush()
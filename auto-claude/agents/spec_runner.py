@@ -86,6 +86,12 @@ try:
 except ImportError:
     pass
 
+# Debug settings are resolved when debug is first imported; re-read them in
+# case that happened before the .env file above was loaded
+from debug import reload_debug_config
+
+reload_debug_config()
+
 from review import ReviewState
 from spec import SpecOrchestrator
 from ui import Icons, highlight, icon, muted, print_section, print_status
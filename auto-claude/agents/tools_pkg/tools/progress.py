@@ -5,10 +5,11 @@ Build Progress Tools
 Tools for tracking and reporting build progress.
 """
 
-import json
 from pathlib import Path
 from typing import Any
 
+from implementation_plan.store import get_plan_store
+
 try:
     from claude_agent_sdk import tool
 
@@ -57,8 +58,9 @@ def create_progress_tools(spec_dir: Path, project_dir: Path) -> list:
             }
 
         try:
-            with open(plan_file) as f:
-                plan = json.load(f)
+            plan = get_plan_store(spec_dir).read()
+            if plan is None:
+                raise ValueError("implementation_plan.json could not be parsed")
 
             stats = {
                 "total": 0,
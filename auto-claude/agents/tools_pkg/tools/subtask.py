@@ -10,6 +10,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any
 
+from implementation_plan.store import get_plan_store
+
 try:
     from claude_agent_sdk import tool
 
@@ -60,8 +62,8 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                 ]
             }
 
-        plan_file = spec_dir / "implementation_plan.json"
-        if not plan_file.exists():
+        store = get_plan_store(spec_dir)
+        if not store.plan_file.exists():
             return {
                 "content": [
                     {
@@ -71,12 +73,7 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                 ]
             }
 
-        try:
-            with open(plan_file) as f:
-                plan = json.load(f)
-
-            # Find and update the subtask
-            subtask_found = False
+        def set_status(plan: dict) -> bool:
             for phase in plan.get("phases", []):
                 for subtask in phase.get("subtasks", []):
                     if subtask.get("id") == subtask_id:
@@ -84,12 +81,13 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                         if notes:
                             subtask["notes"] = notes
                         subtask["updated_at"] = datetime.now(timezone.utc).isoformat()
-                        subtask_found = True
-                        break
-                if subtask_found:
-                    break
+                        plan["last_updated"] = datetime.now(timezone.utc).isoformat()
+                        return True
+            return False
 
-            if not subtask_found:
+        try:
+            # Locked read-modify-write, so parallel sessions don't lose updates
+            if not store.update(set_status):
                 return {
                     "content": [
                         {
@@ -99,12 +97,6 @@ def create_subtask_tools(spec_dir: Path, project_dir: Path) -> list:
                     ]
                 }
 
-            # Update plan metadata
-            plan["last_updated"] = datetime.now(timezone.utc).isoformat()
-
-            with open(plan_file, "w") as f:
-                json.dump(plan, f, indent=2)
-
             return {
                 "content": [
                     {
@@ -5,16 +5,19 @@ Utility Functions for Agent System
 Helper functions for git operations, plan management, and file syncing.
 """
 
-import json
 import logging
 import shutil
 import subprocess
 from pathlib import Path
 from typing import Optional
 
+from core.profiling import profiled
+from implementation_plan.store import get_plan_store
+
 logger = logging.getLogger(__name__)
 
 
+@profiled("git.rev_parse")
 def get_latest_commit(project_dir: Path) -> Optional[str]:
     """Get the hash of the latest git commit."""
     try:
@@ -30,6 +33,7 @@ def get_latest_commit(project_dir: Path) -> Optional[str]:
         return None
 
 
+@profiled("git.rev_list")
 def get_commit_count(project_dir: Path) -> int:
     """Get the total number of commits."""
     try:
@@ -46,15 +50,8 @@ def get_commit_count(project_dir: Path) -> int:
 
 
 def load_implementation_plan(spec_dir: Path) -> Optional[dict]:
-    """Load the implementation plan JSON."""
-    plan_file = spec_dir / "implementation_plan.json"
-    if not plan_file.exists():
-        return None
-    try:
-        with open(plan_file) as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError):
-        return None
+    """Load the implementation plan JSON (a private copy, safe to modify)."""
+    return get_plan_store(spec_dir).load()
 
 
 def find_subtask_in_plan(plan: dict, subtask_id: str) -> Optional[dict]:
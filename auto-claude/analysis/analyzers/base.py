@@ -9,35 +9,9 @@ import json
 from pathlib import Path
 from typing import Optional
 
-# Directories to skip during analysis
-SKIP_DIRS = {
-    "node_modules",
-    ".git",
-    "__pycache__",
-    ".venv",
-    "venv",
-    ".env",
-    "env",
-    "dist",
-    "build",
-    ".next",
-    ".nuxt",
-    "target",
-    "vendor",
-    ".idea",
-    ".vscode",
-    ".pytest_cache",
-    ".mypy_cache",
-    "coverage",
-    ".coverage",
-    "htmlcov",
-    "eggs",
-    "*.egg-info",
-    ".turbo",
-    ".cache",
-    ".worktrees",  # Skip git worktrees directory
-    ".auto-claude",  # Skip auto-claude metadata directory
-}
+# SKIP_DIRS (directories to skip during analysis) is shared with the project
+# detectors through the file inventory
+from project.file_inventory import SKIP_DIRS, get_inventory  # noqa: F401
 
 # Common service directory names
 SERVICE_INDICATORS = {
@@ -91,6 +65,13 @@ class BaseAnalyzer:
     def __init__(self, path: Path):
         self.path = path.resolve()
 
+    def _glob(self, pattern: str) -> list[Path]:
+        """Glob relative to the analyzer's path using the shared file inventory."""
+        inventory = getattr(self, "_inventory", None)
+        if inventory is None:
+            inventory = self._inventory = get_inventory(self.path)
+        return inventory.glob(pattern, self.path)
+
     def _exists(self, path: str) -> bool:
         """Check if a file exists relative to the analyzer's path."""
         return (self.path / path).exists()
@@ -119,7 +119,7 @@ class AuthDetector(BaseAnalyzer):
     def _find_auth_middleware(self) -> list[str]:
         """Detect auth middleware and decorators from Python files."""
         # Limit to first 20 files for performance
-        all_py_files = list(self.path.glob("**/*.py"))[:20]
+        all_py_files = list(self._glob("**/*.py"))[:20]
         auth_decorators = set()
 
         for py_file in all_py_files:
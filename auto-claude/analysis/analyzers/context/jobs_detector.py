@@ -41,8 +41,8 @@ class JobsDetector(BaseAnalyzer):
 
     def _detect_celery(self) -> dict[str, Any] | None:
         """Detect Celery (Python) task queue."""
-        celery_files = list(self.path.glob("**/celery.py")) + list(
-            self.path.glob("**/tasks.py")
+        celery_files = list(self._glob("**/celery.py")) + list(
+            self._glob("**/tasks.py")
         )
         if not celery_files:
             return None
@@ -66,7 +66,7 @@ class MigrationsDetector(BaseAnalyzer):
         if not self._exists("manage.py"):
             return None
 
-        migration_dirs = list(self.path.glob("**/migrations"))
+        migration_dirs = list(self._glob("**/migrations"))
         if not migration_dirs:
             return None
 
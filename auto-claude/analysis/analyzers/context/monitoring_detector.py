@@ -65,9 +65,7 @@ class MonitoringDetector(BaseAnalyzer):
     def _detect_prometheus(self) -> dict[str, str] | None:
         """Detect Prometheus metrics endpoint."""
         # Look for actual Prometheus imports/usage, not just keywords
-        all_files = (
-            list(self.path.glob("**/*.py"))[:30] + list(self.path.glob("**/*.js"))[:30]
-        )
+        all_files = list(self._glob("**/*.py"))[:30] + list(self._glob("**/*.js"))[:30]
 
         for file_path in all_files:
             # Skip analyzer files to avoid self-detection
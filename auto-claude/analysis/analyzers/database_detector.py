@@ -46,7 +46,7 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_sqlalchemy_models(self) -> dict:
         """Detect SQLAlchemy models."""
         models = {}
-        py_files = list(self.path.glob("**/*.py"))
+        py_files = list(self._glob("**/*.py"))
 
         for file_path in py_files:
             try:
@@ -111,8 +111,8 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_django_models(self) -> dict:
         """Detect Django models."""
         models = {}
-        model_files = list(self.path.glob("**/models.py")) + list(
-            self.path.glob("**/models/*.py")
+        model_files = list(self._glob("**/models.py")) + list(
+            self._glob("**/models/*.py")
         )
 
         for file_path in model_files:
@@ -208,8 +208,8 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_typeorm_models(self) -> dict:
         """Detect TypeORM entities."""
         models = {}
-        ts_files = list(self.path.glob("**/*.entity.ts")) + list(
-            self.path.glob("**/entities/*.ts")
+        ts_files = list(self._glob("**/*.entity.ts")) + list(
+            self._glob("**/entities/*.ts")
         )
 
         for file_path in ts_files:
@@ -257,8 +257,8 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_drizzle_models(self) -> dict:
         """Detect Drizzle ORM schemas."""
         models = {}
-        schema_files = list(self.path.glob("**/schema.ts")) + list(
-            self.path.glob("**/db/schema.ts")
+        schema_files = list(self._glob("**/schema.ts")) + list(
+            self._glob("**/db/schema.ts")
         )
 
         for file_path in schema_files:
@@ -287,8 +287,8 @@ class DatabaseDetector(BaseAnalyzer):
     def _detect_mongoose_models(self) -> dict:
         """Detect Mongoose models."""
         models = {}
-        model_files = list(self.path.glob("**/models/*.js")) + list(
-            self.path.glob("**/models/*.ts")
+        model_files = list(self._glob("**/models/*.js")) + list(
+            self._glob("**/models/*.ts")
         )
 
         for file_path in model_files:
@@ -8,6 +8,9 @@ Analyzes entire projects, detecting monorepo structures, services, infrastructur
 from pathlib import Path
 from typing import Any
 
+from core.profiling import profiled
+from project.file_inventory import shared_inventory
+
 from .base import SERVICE_INDICATORS, SERVICE_ROOT_FILES, SKIP_DIRS
 from .service_analyzer import ServiceAnalyzer
 
@@ -26,14 +29,21 @@ class ProjectAnalyzer:
             "files": [],
         }
 
+    @profiled("analyzer.project_index")
     def analyze(self) -> dict[str, Any]:
         """Run full project analysis."""
-        self._detect_project_type()
-        self._find_and_analyze_services()
-        self._analyze_infrastructure()
-        self._detect_conventions()
-        self._map_dependencies()
-        self._list_all_files()
+        # One walk of the project serves every service and detector. The
+        # inventory is persisted alongside the project index when the project
+        # has a .auto-claude directory.
+        persist = (self.project_dir / ".auto-claude").is_dir()
+        with shared_inventory(self.project_dir, persist=persist) as inventory:
+            self._inventory = inventory
+            self._detect_project_type()
+            self._find_and_analyze_services()
+            self._analyze_infrastructure()
+            self._detect_conventions()
+            self._map_dependencies()
+            self._list_all_files()
         return self.index
 
     def _detect_project_type(self) -> None:
@@ -286,24 +296,14 @@ class ProjectAnalyzer:
         return False
 
     def _list_all_files(self) -> None:
-        """Recursively list all project files, respecting skip directories."""
-        project_files = []
-        
-        def _walk(directory: Path):
-            try:
-                for item in directory.iterdir():
-                    if item.name in SKIP_DIRS or item.name.startswith('.'):
-                        continue
-                    
-                    if item.is_dir():
-                        _walk(item)
-                    else:
-                        rel_path = str(item.relative_to(self.project_dir))
-                        project_files.append(rel_path)
-            except OSError:
-                pass
-                
-        _walk(self.project_dir)
+        """List all project files, respecting skip directories."""
+        project_files = [
+            rel_path
+            for rel_path in self._inventory.relative_files()
+            if not any(
+                part in SKIP_DIRS or part.startswith(".") for part in rel_path.split("/")
+            )
+        ]
         self.index["files"] = sorted(project_files)
 
     def _read_file(self, path: str) -> str:
@@ -59,7 +59,7 @@ class RouteDetector(BaseAnalyzer):
         """Detect FastAPI routes."""
         routes = []
         files_to_check = [
-            f for f in self.path.glob("**/*.py") if self._should_include_file(f)
+            f for f in self._glob("**/*.py") if self._should_include_file(f)
         ]
 
         for file_path in files_to_check:
@@ -123,7 +123,7 @@ class RouteDetector(BaseAnalyzer):
         """Detect Flask routes."""
         routes = []
         files_to_check = [
-            f for f in self.path.glob("**/*.py") if self._should_include_file(f)
+            f for f in self._glob("**/*.py") if self._should_include_file(f)
         ]
 
         for file_path in files_to_check:
@@ -172,7 +172,7 @@ class RouteDetector(BaseAnalyzer):
         """Detect Django routes from urls.py files."""
         routes = []
         url_files = [
-            f for f in self.path.glob("**/urls.py") if self._should_include_file(f)
+            f for f in self._glob("**/urls.py") if self._should_include_file(f)
         ]
 
         for file_path in url_files:
@@ -207,12 +207,8 @@ class RouteDetector(BaseAnalyzer):
     def _detect_express_routes(self) -> list[dict]:
         """Detect Express/Fastify/Koa routes."""
         routes = []
-        js_files = [
-            f for f in self.path.glob("**/*.js") if self._should_include_file(f)
-        ]
-        ts_files = [
-            f for f in self.path.glob("**/*.ts") if self._should_include_file(f)
-        ]
+        js_files = [f for f in self._glob("**/*.js") if self._should_include_file(f)]
+        ts_files = [f for f in self._glob("**/*.ts") if self._should_include_file(f)]
         files_to_check = js_files + ts_files
         for file_path in files_to_check:
             try:
@@ -340,9 +336,7 @@ class RouteDetector(BaseAnalyzer):
     def _detect_go_routes(self) -> list[dict]:
         """Detect Go framework routes (Gin, Echo, Chi, Fiber)."""
         routes = []
-        go_files = [
-            f for f in self.path.glob("**/*.go") if self._should_include_file(f)
-        ]
+        go_files = [f for f in self._glob("**/*.go") if self._should_include_file(f)]
 
         for file_path in go_files:
             try:
@@ -376,9 +370,7 @@ class RouteDetector(BaseAnalyzer):
     def _detect_rust_routes(self) -> list[dict]:
         """Detect Rust framework routes (Axum, Actix)."""
         routes = []
-        rust_files = [
-            f for f in self.path.glob("**/*.rs") if self._should_include_file(f)
-        ]
+        rust_files = [f for f in self._glob("**/*.rs") if self._should_include_file(f)]
 
         for file_path in rust_files:
             try:
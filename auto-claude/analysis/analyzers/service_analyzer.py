@@ -10,6 +10,8 @@ import re
 from pathlib import Path
 from typing import Any
 
+from project.file_inventory import shared_inventory
+
 from .base import BaseAnalyzer
 from .context_analyzer import ContextAnalyzer
 from .database_detector import DatabaseDetector
@@ -33,24 +35,26 @@ class ServiceAnalyzer(BaseAnalyzer):
 
     def analyze(self) -> dict[str, Any]:
         """Run full analysis on this service."""
-        self._detect_language_and_framework()
-        self._detect_service_type()
-        self._find_key_directories()
-        self._find_entry_points()
-        self._detect_dependencies()
-        self._detect_testing()
-        self._find_dockerfile()
-
-        # Comprehensive context extraction
-        self._detect_environment_variables()
-        self._detect_api_routes()
-        self._detect_database_models()
-        self._detect_external_services()
-        self._detect_auth_patterns()
-        self._detect_migrations()
-        self._detect_background_jobs()
-        self._detect_api_documentation()
-        self._detect_monitoring()
+        # All detectors below share one walk of the service tree
+        with shared_inventory(self.path):
+            self._detect_language_and_framework()
+            self._detect_service_type()
+            self._find_key_directories()
+            self._find_entry_points()
+            self._detect_dependencies()
+            self._detect_testing()
+            self._find_dockerfile()
+
+            # Comprehensive context extraction
+            self._detect_environment_variables()
+            self._detect_api_routes()
+            self._detect_database_models()
+            self._detect_external_services()
+            self._detect_auth_patterns()
+            self._detect_migrations()
+            self._detect_background_jobs()
+            self._detect_api_documentation()
+            self._detect_monitoring()
 
         return self.analysis
 
@@ -23,7 +23,7 @@ from ui import (
     BuildState,
     Icons,
     MenuOption,
-    StatusManager,
+    MultiBuildStatusManager,
     bold,
     box,
     highlight,
@@ -334,7 +334,8 @@ def _handle_build_interrupt(
     print_paused_banner(spec_dir, spec_dir.name, has_worktree=bool(worktree_manager))
 
     # Update status file
-    status_manager = StatusManager(project_dir)
+    status_manager = MultiBuildStatusManager(project_dir)
+    status_manager.attach(spec_dir.name)
     status_manager.update(state=BuildState.PAUSED)
 
     # Offer to add human input with enhanced menu
@@ -443,7 +444,8 @@ def _handle_build_interrupt(
         # User pressed Ctrl+C again during input prompt - exit immediately
         print()
         print_status("Exiting...", "warning")
-        status_manager = StatusManager(project_dir)
+        status_manager = MultiBuildStatusManager(project_dir)
+        status_manager.attach(spec_dir.name)
         status_manager.set_inactive()
         sys.exit(0)
     except EOFError:
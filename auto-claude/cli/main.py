@@ -248,6 +248,13 @@ Environment Variables:
         help="Base branch for creating worktrees (default: auto-detect or current branch)",
     )
 
+    # Profiling
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Time hot paths: print the slowest spans at exit and write timings.json to the spec directory",
+    )
+
     return parser.parse_args()
 
 
@@ -318,6 +325,12 @@ def main() -> None:
 
     debug_success("run.py", "Spec found", spec_dir=str(spec_dir))
 
+    # Profiling (--profile or AUTO_CLAUDE_PROFILE=1) reports into the spec dir
+    from core.profiling import enable_profiling, is_profiling_enabled
+
+    if args.profile or is_profiling_enabled():
+        enable_profiling(spec_dir, print_at_exit=args.profile)
+
     # Handle build management commands
     if args.merge_preview:
         from cli.workspace_commands import handle_merge_preview_command
@@ -16,6 +16,7 @@ if str(_PARENT_DIR) not in sys.path:
     sys.path.insert(0, str(_PARENT_DIR))
 
 from core.auth import AUTH_TOKEN_ENV_VARS, get_auth_token, get_auth_token_source
+from core.debug import reload_debug_config
 try:
     from dotenv import load_dotenv
     DOTENV_AVAILABLE = True
@@ -65,6 +66,9 @@ def setup_environment() -> Path:
     else:
         print(f"No .env file found (checked {root_env_file}, {env_file}) or python-dotenv missing ({DOTENV_AVAILABLE})", file=sys.stderr)
 
+    # Debug settings were resolved at import, before .env was loaded
+    reload_debug_config()
+
     return script_dir
 
 
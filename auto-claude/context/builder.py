@@ -11,6 +11,8 @@ from dataclasses import asdict
 from pathlib import Path
 from typing import Optional
 
+from core.profiling import profiled
+
 from .categorizer import FileCategorizer
 from .graphiti_integration import fetch_graph_hints, is_graphiti_enabled
 from .keyword_extractor import KeywordExtractor
@@ -46,6 +48,7 @@ class ContextBuilder:
 
         return analyze_project(self.project_dir)
 
+    @profiled("context.build")
     def build_context(
         self,
         task: str,
@@ -138,6 +141,7 @@ class ContextBuilder:
             graph_hints=graph_hints,
         )
 
+    @profiled("context.build_async")
     async def build_context_async(
         self,
         task: str,
@@ -181,8 +185,11 @@ class ContextBuilder:
             if not service_path.is_absolute():
                 service_path = self.project_dir / service_path
 
-            # Search this service
-            matches = self.searcher.search_service(service_path, service_name, keywords)
+            # Search this service (index refresh does file I/O - keep it
+            # off the event loop)
+            matches = await asyncio.to_thread(
+                self.searcher.search_service, service_path, service_name, keywords
+            )
             all_matches.extend(matches)
 
             # Load or generate service context
@@ -0,0 +1,425 @@
+"""
+Persistent Search Index
+=======================
+
+On-disk inverted index (token -> file -> line numbers) used by CodeSearcher.
+
+The index lives in ``.auto-claude/context_index/``: ``manifest.json`` records
+each file's ID, mtime and size, and each file's postings are stored in one of
+SHARD_COUNT ``postings-XX.json`` shards (by file ID). Refreshing a service
+directory only stats files; a file is read and re-tokenized only when it is
+new or its mtime/size changed, and saving rewrites only the shards holding
+changed files plus the manifest.
+
+Tokens are runs of ``[a-z0-9_]`` in the lower-cased source. Keywords made of
+the same characters always fall inside a single token, so substring matches
+against the vocabulary give exactly the hits (and counts) of a full-text
+``keyword in content.lower()`` scan. Matching tokens are found through a
+trigram index over the vocabulary, built in memory on first lookup.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+from collections import Counter
+from collections.abc import Iterator
+from pathlib import Path
+
+from .constants import CODE_EXTENSIONS, SKIP_DIRS
+
+logger = logging.getLogger(__name__)
+
+INDEX_DIR = ".auto-claude"
+INDEX_NAME = "context_index"
+MANIFEST_FILE = "manifest.json"
+INDEX_VERSION = 2
+
+# Single-file index written by version 1 (removed on the next save)
+LEGACY_INDEX_FILE = "context_index.json"
+
+SHARD_COUNT = 64
+
+# Vocabulary n-gram length for substring lookups
+GRAM_SIZE = 3
+
+# Line numbers kept per (token, file) - search only reports the first 3 lines
+# per keyword
+MAX_LINES_PER_POSTING = 3
+
+TOKEN_RE = re.compile(r"[a-z0-9_]+")
+_KEYWORD_RE = re.compile(r"^[a-z0-9_]+$")
+
+
+def is_indexable_keyword(keyword: str) -> bool:
+    """Check whether a keyword can be answered from the token index."""
+    return bool(_KEYWORD_RE.match(keyword))
+
+
+def index_manifest(project_dir: Path) -> Path:
+    """Get the manifest file that marks a project's search index."""
+    return project_dir / INDEX_DIR / INDEX_NAME / MANIFEST_FILE
+
+
+def _grams(token: str) -> set[str]:
+    return {token[i : i + GRAM_SIZE] for i in range(len(token) - GRAM_SIZE + 1)}
+
+
+def _write_json(path: Path, data) -> None:
+    """Write JSON atomically (temp file + rename)."""
+    fd, tmp_path = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, separators=(",", ":"))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def scan_code_files(directory: Path) -> Iterator[tuple[Path, os.stat_result]]:
+    """
+    Walk a directory for code files, pruning SKIP_DIRS.
+
+    Args:
+        directory: Root directory to search
+
+    Yields:
+        (path, stat) tuples for code files
+    """
+    stack = [str(directory)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        subdirs = []
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in SKIP_DIRS:
+                        subdirs.append(entry.path)
+                elif (
+                    os.path.splitext(entry.name)[1] in CODE_EXTENSIONS
+                    and entry.is_file()
+                ):
+                    yield Path(entry.path), entry.stat()
+            except OSError:
+                continue
+        stack.extend(reversed(subdirs))
+
+
+def tokenize_file(content: str) -> dict[str, list[int]]:
+    """
+    Build the postings for one file.
+
+    Args:
+        content: File content
+
+    Returns:
+        Mapping of token to [count, first line numbers...]
+    """
+    counts: Counter[str] = Counter()
+    lines: dict[str, list[int]] = {}
+    for line_no, line in enumerate(content.split("\n"), 1):
+        line_tokens = TOKEN_RE.findall(line.lower())
+        if not line_tokens:
+            continue
+        counts.update(line_tokens)
+        for token in set(line_tokens):
+            token_lines = lines.setdefault(token, [])
+            if len(token_lines) < MAX_LINES_PER_POSTING:
+                token_lines.append(line_no)
+    return {token: [count, *lines[token]] for token, count in counts.items()}
+
+
+class SearchIndex:
+    """Incrementally maintained token index for a project."""
+
+    def __init__(self, project_dir: Path):
+        self.project_dir = project_dir.resolve()
+        self.index_dir = self.project_dir / INDEX_DIR / INDEX_NAME
+        self.manifest_file = self.index_dir / MANIFEST_FILE
+        # rel_path -> {"id": int, "mtime_ns": int, "size": int}
+        self._files: dict[str, dict] = {}
+        # shard -> {file id (str): {token: [count, line, ...]}}
+        self._shards: dict[int, dict[str, dict[str, list[int]]]] = {}
+        # token -> {file id (str): [count, line, ...]}
+        self._postings: dict[str, dict[str, list[int]]] = {}
+        # trigram -> tokens containing it (built on first lookup)
+        self._gram_index: dict[str, set[str]] | None = None
+        self._next_id = 0
+        self._loaded = False
+        self._load_lock = threading.Lock()
+        self._dirty_shards: set[int] = set()
+        self._manifest_dirty = False
+
+    def _shard_file(self, shard: int) -> Path:
+        return self.index_dir / f"postings-{shard:02x}.json"
+
+    def _load(self) -> None:
+        """Load the index from disk (once; lookups may share an instance)."""
+        if self._loaded:
+            return
+        with self._load_lock:
+            if not self._loaded:
+                self._read()
+                self._loaded = True
+
+    def _read(self) -> None:
+        try:
+            with open(self.manifest_file) as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return
+        if manifest.get("version") != INDEX_VERSION:
+            return
+        self._next_id = manifest.get("next_id", 0)
+
+        for rel_path, meta in manifest.get("files", {}).items():
+            self._files[rel_path] = meta
+        for shard in range(SHARD_COUNT):
+            try:
+                with open(self._shard_file(shard)) as f:
+                    self._shards[shard] = json.load(f)
+            except FileNotFoundError:
+                continue
+            except (OSError, json.JSONDecodeError):
+                # Files in an unreadable shard are re-read on the next refresh
+                self._dirty_shards.add(shard)
+
+        # Keep the manifest and shards consistent after an interrupted save
+        for rel_path, meta in list(self._files.items()):
+            file_id = str(meta["id"])
+            if file_id not in self._shards.get(int(file_id) % SHARD_COUNT, {}):
+                del self._files[rel_path]
+                self._manifest_dirty = True
+        known = {str(meta["id"]) for meta in self._files.values()}
+        for shard, files in self._shards.items():
+            for file_id in [fid for fid in files if fid not in known]:
+                del files[file_id]
+                self._dirty_shards.add(shard)
+            for file_id, tokens in files.items():
+                for token, posting in tokens.items():
+                    self._postings.setdefault(token, {})[file_id] = posting
+
+    def save(self) -> None:
+        """Persist changed shards and the manifest (temp file + rename each)."""
+        if not self._dirty_shards and not self._manifest_dirty:
+            return
+        try:
+            self.index_dir.mkdir(parents=True, exist_ok=True)
+            # Shards first: a manifest entry is only trusted with its postings
+            for shard in sorted(self._dirty_shards):
+                files = self._shards.get(shard)
+                if files:
+                    _write_json(self._shard_file(shard), files)
+                else:
+                    self._shard_file(shard).unlink(missing_ok=True)
+            self._dirty_shards.clear()
+            _write_json(
+                self.manifest_file,
+                {
+                    "version": INDEX_VERSION,
+                    "next_id": self._next_id,
+                    "files": self._files,
+                },
+            )
+            self._manifest_dirty = False
+            (self.project_dir / INDEX_DIR / LEGACY_INDEX_FILE).unlink(missing_ok=True)
+        except OSError as e:
+            # The index is only a cache - searching still works without it
+            logger.debug(f"Could not save search index: {e}")
+
+    def _add_file(self, file_id: str, tokens: dict[str, list[int]]) -> None:
+        shard = int(file_id) % SHARD_COUNT
+        self._shards.setdefault(shard, {})[file_id] = tokens
+        self._dirty_shards.add(shard)
+        for token, posting in tokens.items():
+            postings = self._postings.get(token)
+            if postings is None:
+                postings = self._postings[token] = {}
+                if self._gram_index is not None:
+                    for gram in _grams(token):
+                        self._gram_index.setdefault(gram, set()).add(token)
+            postings[file_id] = posting
+
+    def _remove_file(self, file_id: str) -> None:
+        shard = int(file_id) % SHARD_COUNT
+        tokens = self._shards.get(shard, {}).pop(file_id, {})
+        self._dirty_shards.add(shard)
+        for token in tokens:
+            postings = self._postings.get(token)
+            if postings is None:
+                continue
+            postings.pop(file_id, None)
+            if postings:
+                continue
+            del self._postings[token]
+            if self._gram_index is not None:
+                for gram in _grams(token):
+                    grams = self._gram_index.get(gram)
+                    if grams is not None:
+                        grams.discard(token)
+                        if not grams:
+                            del self._gram_index[gram]
+
+    def _matching_tokens(self, keyword: str) -> list[str]:
+        """Vocabulary tokens containing keyword."""
+        if len(keyword) < GRAM_SIZE:
+            return [token for token in self._postings if keyword in token]
+        if self._gram_index is None:
+            gram_index: dict[str, set[str]] = {}
+            for token in self._postings:
+                for gram in _grams(token):
+                    gram_index.setdefault(gram, set()).add(token)
+            self._gram_index = gram_index
+
+        candidates = None
+        for tokens in sorted(
+            (self._gram_index.get(gram, set()) for gram in _grams(keyword)), key=len
+        ):
+            candidates = tokens & candidates if candidates is not None else tokens
+            if not candidates:
+                return []
+        return [token for token in candidates if keyword in token]
+
+    def refresh(self, directory: Path) -> dict[str, str]:
+        """
+        Bring the index up to date for a directory.
+
+        Args:
+            directory: Directory to refresh (must be inside the project)
+
+        Returns:
+            Mapping of file ID to relative path for code files in the directory
+        """
+        self._load()
+        directory = directory.resolve()
+        prefix = directory.relative_to(self.project_dir).as_posix()
+        prefix = "" if prefix == "." else prefix + "/"
+
+        current: dict[str, str] = {}
+        changed = False
+
+        for file_path, st in scan_code_files(directory):
+            rel_path = file_path.relative_to(self.project_dir).as_posix()
+            meta = self._files.get(rel_path)
+            if (
+                meta is not None
+                and meta["mtime_ns"] == st.st_mtime_ns
+                and meta["size"] == st.st_size
+            ):
+                current[str(meta["id"])] = rel_path
+                continue
+
+            try:
+                content = file_path.read_text(errors="ignore")
+            except OSError:
+                continue
+            if meta is not None:
+                self._remove_file(str(meta["id"]))
+            file_id = str(self._next_id)
+            self._next_id += 1
+            self._files[rel_path] = {
+                "id": int(file_id),
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+            }
+            self._add_file(file_id, tokenize_file(content))
+            current[file_id] = rel_path
+            changed = True
+
+        # Files under this directory that disappeared since the last refresh
+        seen = set(current.values())
+        for rel_path in [
+            p for p in self._files if p.startswith(prefix) and p not in seen
+        ]:
+            self._remove_file(str(self._files.pop(rel_path)["id"]))
+            changed = True
+
+        if changed:
+            self._manifest_dirty = True
+        self.save()
+
+        return current
+
+    def files_containing(
+        self, keyword: str
+    ) -> tuple[dict[str, tuple[int, int]], set[str]]:
+        """
+        Look up a keyword without refreshing the index (read-only).
+
+        Args:
+            keyword: Indexable keyword (see is_indexable_keyword)
+
+        Returns:
+            Tuple of (rel_path -> (mtime_ns, size) for every indexed file,
+            rel paths whose indexed content contains keyword). Callers must
+            check mtime/size themselves before trusting an entry.
+        """
+        self._load()
+        ids = set()
+        for token in self._matching_tokens(keyword):
+            ids.update(self._postings[token])
+        indexed = {}
+        containing = set()
+        for rel_path, meta in self._files.items():
+            indexed[rel_path] = (meta["mtime_ns"], meta["size"])
+            if str(meta["id"]) in ids:
+                containing.add(rel_path)
+        return indexed, containing
+
+    def query(
+        self, file_ids: set[str], keywords: list[str]
+    ) -> dict[str, tuple[int, list[str], list[int]]]:
+        """
+        Score files against keywords.
+
+        Args:
+            file_ids: File IDs to consider (from refresh)
+            keywords: Indexable keywords (see is_indexable_keyword)
+
+        Returns:
+            Mapping of file ID to (score, matching keywords, matching line
+            numbers in keyword order, at most 3 per keyword)
+        """
+        self._load()
+        counts: dict[str, dict[str, int]] = {}
+        lines: dict[str, dict[str, set[int]]] = {}
+
+        for keyword in keywords:
+            for token in self._matching_tokens(keyword):
+                postings = self._postings[token]
+                per_token = token.count(keyword)
+                for file_id in file_ids.intersection(postings):
+                    count, *line_nos = postings[file_id]
+                    file_counts = counts.setdefault(file_id, {})
+                    file_counts[keyword] = (
+                        file_counts.get(keyword, 0) + count * per_token
+                    )
+                    lines.setdefault(file_id, {}).setdefault(keyword, set()).update(
+                        line_nos
+                    )
+
+        results = {}
+        for file_id, file_counts in counts.items():
+            matched = [k for k in keywords if k in file_counts]
+            score = sum(min(file_counts[k], 10) for k in matched)
+            line_nos = [
+                n
+                for k in matched
+                for n in sorted(lines[file_id][k])[:MAX_LINES_PER_POSTING]
+            ]
+            results[file_id] = (score, matched, line_nos)
+        return results
@@ -3,19 +3,23 @@ Code Search Functionality
 ==========================
 
 Search codebase for relevant files based on keywords.
+
+Keyword lookups are answered from a persistent token index (see index.py)
+so unchanged files are never re-read between context builds.
 """
 
 from pathlib import Path
 
-from .constants import CODE_EXTENSIONS, SKIP_DIRS
+from .index import SearchIndex, is_indexable_keyword, scan_code_files
 from .models import FileMatch
 
 
 class CodeSearcher:
     """Searches code files for relevant matches."""
 
-    def __init__(self, project_dir: Path):
+    def __init__(self, project_dir: Path, use_index: bool = True):
         self.project_dir = project_dir.resolve()
+        self.index = SearchIndex(self.project_dir) if use_index else None
 
     def search_service(
         self,
@@ -34,10 +38,63 @@ class CodeSearcher:
         Returns:
             List of FileMatch objects sorted by relevance
         """
-        matches = []
-
         if not service_path.exists():
-            return matches
+            return []
+
+        if self.index is not None and all(is_indexable_keyword(k) for k in keywords):
+            try:
+                return self._search_index(service_path, service_name, keywords)
+            except ValueError:
+                # Service lives outside the project - scan it directly
+                pass
+
+        return self._search_files(service_path, service_name, keywords)
+
+    def _search_index(
+        self,
+        service_path: Path,
+        service_name: str,
+        keywords: list[str],
+    ) -> list[FileMatch]:
+        """Answer a service search from the token index."""
+        files = self.index.refresh(service_path)
+        scored = self.index.query(set(files), keywords)
+
+        ranked = sorted(
+            ((file_id, *result) for file_id, result in scored.items() if result[0] > 0),
+            key=lambda r: (-r[1], files[r[0]]),
+        )[:20]  # Top 20 per service
+
+        matches = []
+        for file_id, score, matching_keywords, line_nos in ranked:
+            rel_path = files[file_id]
+            matches.append(
+                FileMatch(
+                    path=rel_path,
+                    service=service_name,
+                    reason=f"Contains: {', '.join(matching_keywords)}",
+                    relevance_score=score,
+                    matching_lines=self._read_lines(rel_path, line_nos[:5]),
+                )
+            )
+        return matches
+
+    def _read_lines(self, rel_path: str, line_nos: list[int]) -> list[tuple[int, str]]:
+        """Read the text of specific lines for a matched file."""
+        try:
+            lines = (self.project_dir / rel_path).read_text(errors="ignore").split("\n")
+        except OSError:
+            return []
+        return [(n, lines[n - 1].strip()[:100]) for n in line_nos if n <= len(lines)]
+
+    def _search_files(
+        self,
+        service_path: Path,
+        service_name: str,
+        keywords: list[str],
+    ) -> list[FileMatch]:
+        """Search a service by reading every code file."""
+        matches = []
 
         for file_path in self._iter_code_files(service_path):
             try:
@@ -48,6 +105,7 @@ class CodeSearcher:
                 score = 0
                 matching_keywords = []
                 matching_lines = []
+                lines = None
 
                 for keyword in keywords:
                     if keyword in content_lower:
@@ -57,12 +115,15 @@ class CodeSearcher:
                         matching_keywords.append(keyword)
 
                         # Find matching lines (first 3 per keyword)
-                        lines = content.split("\n")
+                        if lines is None:
+                            lines = content.split("\n")
                         found = 0
                         for i, line in enumerate(lines, 1):
-                            if keyword in line.lower() and found < 3:
+                            if keyword in line.lower():
                                 matching_lines.append((i, line.strip()[:100]))
                                 found += 1
+                                if found >= 3:
+                                    break
 
                 if score > 0:
                     rel_path = str(file_path.relative_to(self.project_dir))
@@ -93,9 +154,5 @@ class CodeSearcher:
         Yields:
             Path objects for code files
         """
-        for item in directory.rglob("*"):
-            if item.is_file() and item.suffix in CODE_EXTENSIONS:
-                # Check if in skip directory
-                parts = item.relative_to(directory).parts
-                if not any(part in SKIP_DIRS for part in parts):
-                    yield item
+        for item, _ in scan_code_files(directory):
+            yield item
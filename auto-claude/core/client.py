@@ -3,9 +3,17 @@ Claude SDK Client Configuration
 ===============================
 
 Functions for creating and configuring the Claude Agent SDK client.
+
+create_client() builds a fresh engine per call. EnginePool keeps engines
+warm across sessions of one build: options (security settings, MCP server
+config, allowed tools) are built once per configuration, and engines that
+support reset() keep their provider client and tool schemas between
+sessions.
 """
 
+import dataclasses
 import json
+import logging
 import os
 from pathlib import Path
 from typing import Dict, Optional
@@ -27,6 +35,20 @@ from .auth import get_sdk_env_vars, require_auth_token
 from linear_updater import is_linear_enabled
 from security import bash_security_hook
 
+logger = logging.getLogger(__name__)
+
+
+def _get_engine_pool_size() -> int:
+    """Get the idle engines kept per configuration (AUTO_CLAUDE_ENGINE_POOL_SIZE)."""
+    try:
+        return max(0, int(os.environ.get("AUTO_CLAUDE_ENGINE_POOL_SIZE", "4")))
+    except ValueError:
+        return 4
+
+
+# Idle engines kept per configuration by EnginePool
+ENGINE_POOL_MAX_IDLE = _get_engine_pool_size()
+
 
 def is_graphiti_mcp_enabled() -> bool:
     """
@@ -157,6 +179,47 @@ def create_client(
 
     Returns:
         Configured Agent Engine
+    """
+    options = build_agent_options(
+        project_dir,
+        spec_dir,
+        model,
+        agent_type=agent_type,
+        verbose=verbose,
+        cwd=cwd,
+        provider=provider,
+        project_name=project_name,
+    )
+    return create_engine(options)
+
+
+def build_agent_options(
+    project_dir: Path,
+    spec_dir: Path,
+    model: str,
+    agent_type: str = "coder",
+    verbose: bool = False,
+    cwd: Optional[Path] = None,
+    provider: Optional[str] = None,
+    project_name: Optional[str] = None,
+) -> AgentOptions:
+    """
+    Build engine options with multi-layered security.
+
+    Writes the security settings file and prints the security summary.
+
+    Args:
+        project_dir: Root directory for the project (working directory)
+        spec_dir: Directory containing the spec (for settings file)
+        model: Claude model to use
+        agent_type: Type of agent - 'planner', 'coder', 'qa_reviewer', or 'qa_fixer'
+                   This determines which custom auto-claude tools are available.
+        verbose: Whether to enable verbose logging
+        provider: Model provider to use
+        project_name: Name of the project (for kba-memory collection lookup)
+
+    Returns:
+        AgentOptions for create_engine()
 
     Security layers (defense in depth):
     1. Sandbox - OS-level bash command isolation prevents filesystem escape
@@ -324,6 +387,7 @@ def create_client(
         ),
         provider=provider_name,
         allowed_tools=get_allowed_tools(agent_type),
+        mcp_tools=[name for name in allowed_tools_list if name.startswith("mcp__")],
         mcp_servers=mcp_servers,
         hooks={
             "PreToolUse": [
@@ -338,8 +402,21 @@ def create_client(
         verbose=verbose,
         project_name=project_name or project_dir.name,  # Default to directory name
     )
+    return options
 
-    model_lower = model.lower()
+
+def create_engine(options: AgentOptions) -> BaseAgentEngine:
+    """
+    Create the engine for the options' provider (or model name).
+
+    Args:
+        options: Options from build_agent_options()
+
+    Returns:
+        Configured Agent Engine
+    """
+    provider_name = options.provider
+    model_lower = options.model.lower()
 
     # Provider-first dispatch
     if provider_name == "gemini":
@@ -356,3 +433,133 @@ def create_client(
         return OpenAIAgentEngine(options)
     else:
         return ClaudeAgentEngine(options)
+
+
+class EnginePool:
+    """
+    Reuses agent engines across the sessions of one build.
+
+    Engines are keyed by their configuration. On leaving ``async with``, a
+    reusable engine (see BaseAgentEngine.reusable) has its conversation
+    reset and is kept for the next acquire(); others are cleaned up as
+    usual, but their options are still built only once.
+
+    Example:
+        pool = EnginePool()
+        try:
+            client = pool.acquire(project_dir, spec_dir, model)
+            async with client:
+                ...
+        finally:
+            await pool.close()
+    """
+
+    def __init__(self, max_idle: int = ENGINE_POOL_MAX_IDLE):
+        """
+        Initialize the pool.
+
+        Args:
+            max_idle: Idle engines kept per configuration
+        """
+        self.max_idle = max_idle
+        self.created = 0
+        self.reused = 0
+        self._options: dict[tuple, AgentOptions] = {}
+        self._idle: dict[tuple, list[BaseAgentEngine]] = {}
+        self._keys: dict[int, tuple] = {}
+        self._closed = False
+
+    def acquire(
+        self,
+        project_dir: Path,
+        spec_dir: Path,
+        model: str,
+        agent_type: str = "coder",
+        verbose: bool = False,
+        cwd: Optional[Path] = None,
+        provider: Optional[str] = None,
+        project_name: Optional[str] = None,
+    ) -> BaseAgentEngine:
+        """
+        Get an engine with a fresh conversation (same arguments as create_client).
+
+        Returns:
+            An idle pooled engine, or a new one
+        """
+        key = (
+            str(project_dir.resolve()),
+            str(spec_dir.resolve()),
+            model,
+            agent_type,
+            verbose,
+            str(cwd.resolve()) if cwd else None,
+            (provider or "claude").lower(),
+            project_name,
+        )
+        idle = self._idle.get(key)
+        if idle:
+            self.reused += 1
+            return idle.pop()
+
+        options = self._options.get(key)
+        if options is None:
+            options = build_agent_options(
+                project_dir,
+                spec_dir,
+                model,
+                agent_type=agent_type,
+                verbose=verbose,
+                cwd=cwd,
+                provider=provider,
+                project_name=project_name,
+            )
+            self._options[key] = options
+
+        # Engines may change their options (e.g. the system prompt)
+        engine = create_engine(dataclasses.replace(options))
+        self.created += 1
+        if engine.reusable:
+            engine._pool = self
+            self._keys[id(engine)] = key
+        return engine
+
+    async def release(self, engine: BaseAgentEngine, failed: bool = False) -> None:
+        """
+        Return an engine after a session (called from its __aexit__).
+
+        Args:
+            engine: Engine obtained from acquire()
+            failed: Whether the session raised; such engines are discarded
+        """
+        key = self._keys.get(id(engine))
+        idle = self._idle.setdefault(key, []) if key is not None else None
+        if (
+            not failed
+            and not self._closed
+            and idle is not None
+            and len(idle) < self.max_idle
+        ):
+            try:
+                engine.reset()
+            except Exception as e:
+                logger.warning(f"Discarding engine that failed to reset: {e}")
+            else:
+                idle.append(engine)
+                return
+        await self._discard(engine)
+
+    async def _discard(self, engine: BaseAgentEngine) -> None:
+        self._keys.pop(id(engine), None)
+        engine._pool = None
+        try:
+            await engine.cleanup()
+        except Exception as e:
+            logger.warning(f"Engine cleanup failed: {e}")
+
+    async def close(self) -> None:
+        """Clean up idle engines; engines still in use are cleaned up on release."""
+        self._closed = True
+        idle, self._idle = self._idle, {}
+        for engines in idle.values():
+            for engine in engines:
+                await self._discard(engine)
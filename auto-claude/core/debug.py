@@ -7,7 +7,14 @@ Centralized debug logging for the Auto-Claude framework.
 Controlled via environment variables:
   - DEBUG=true          Enable debug mode
   - DEBUG_LEVEL=1|2|3   Log verbosity (1=basic, 2=detailed, 3=verbose)
-  - DEBUG_LOG_FILE=path Optional file output
+  - DEBUG_LOG_FILE=path Optional file output (written by a background thread)
+  - DEBUG_RING_BUFFER=N Keep the last N messages of every level in memory;
+                        dumped to DEBUG_CRASH_FILE (or <log file>.crash, or
+                        stderr) on an uncaught exception
+
+The environment is read once at import; call reload_debug_config() after
+changing it. When DEBUG is off every debug_* call returns after a single
+flag check, before any formatting.
 
 Usage:
     from debug import debug, debug_detailed, debug_verbose, is_debug_enabled
@@ -17,15 +24,22 @@ Usage:
     debug_verbose("client", "Full request payload", payload=data)
 """
 
+import atexit
 import json
 import os
+import queue
+import re
 import sys
+import threading
 import time
+from collections import deque
 from datetime import datetime
 from functools import wraps
 from pathlib import Path
 from typing import Any, Optional
 
+from .profiling import profile_span
+
 
 # ANSI color codes for terminal output
 class Colors:
@@ -67,18 +81,131 @@ def _get_log_file() -> Optional[Path]:
     return None
 
 
+def _get_ring_buffer_size() -> int:
+    """Get the crash ring buffer size in messages (0 = disabled)."""
+    try:
+        return max(0, int(os.environ.get("DEBUG_RING_BUFFER", "0")))
+    except ValueError:
+        return 0
+
+
+# Configuration is resolved once (see reload_debug_config). The hot path in
+# debug() only reads these module globals, so a disabled logger costs one
+# global lookup and a compare per call.
+_ENABLED = False
+_LEVEL = 1
+# Highest level recorded anywhere: _LEVEL, or 3 when the ring buffer keeps
+# verbose messages for crash dumps
+_CAPTURE_LEVEL = 0
+_LOG_FILE: Optional[Path] = None
+_RING: Optional[deque] = None
+_WRITER: Optional["_LogFileWriter"] = None
+
+_ANSI_RE = re.compile(r"\033\[[0-9;]*m")
+
+
+class Lazy:
+    """
+    A debug value computed only if the message is actually emitted.
+
+    Usage:
+        debug_verbose("merge", "Diff", diff=Lazy(lambda: render_diff(a, b)))
+    """
+
+    __slots__ = ("func",)
+
+    def __init__(self, func):
+        self.func = func
+
+
+class _LogFileWriter:
+    """Appends log lines to a file from a background thread."""
+
+    def __init__(self, path: Path):
+        self.path = path
+        self._queue: queue.Queue = queue.Queue()
+        self._thread = threading.Thread(
+            target=self._run, name="debug-log-writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, line: str) -> None:
+        self._queue.put(line)
+
+    def flush(self) -> None:
+        """Block until every queued line has been written."""
+        self._queue.join()
+
+    def close(self) -> None:
+        self._queue.put(None)
+        self._thread.join(timeout=2)
+
+    def _run(self) -> None:
+        handle = None
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            handle = open(self.path, "a", buffering=64 * 1024, encoding="utf-8")
+        except Exception:
+            pass  # Silently fail file logging (lines are still drained)
+
+        while True:
+            line = self._queue.get()
+            try:
+                if line is None:
+                    break
+                if handle is not None:
+                    handle.write(line + "\n")
+                    # Flush once the burst is over, not per line
+                    if self._queue.empty():
+                        handle.flush()
+            except Exception:
+                pass
+            finally:
+                self._queue.task_done()
+
+        if handle is not None:
+            try:
+                handle.close()
+            except Exception:
+                pass
+
+
+def reload_debug_config() -> None:
+    """Re-read DEBUG* environment variables (resolved once at import)."""
+    global _ENABLED, _LEVEL, _CAPTURE_LEVEL, _LOG_FILE, _RING, _WRITER
+
+    if _WRITER is not None:
+        _WRITER.close()
+        _WRITER = None
+
+    _ENABLED = _get_debug_enabled()
+    _LEVEL = _get_debug_level()
+    _LOG_FILE = _get_log_file() if _ENABLED else None
+    ring_size = _get_ring_buffer_size() if _ENABLED else 0
+    _RING = deque(maxlen=ring_size) if ring_size else None
+    _CAPTURE_LEVEL = (3 if _RING is not None else _LEVEL) if _ENABLED else 0
+    if _LOG_FILE is not None:
+        _WRITER = _LogFileWriter(_LOG_FILE)
+
+
 def is_debug_enabled() -> bool:
     """Check if debug mode is enabled."""
-    return _get_debug_enabled()
+    return _ENABLED
 
 
 def get_debug_level() -> int:
     """Get current debug level."""
-    return _get_debug_level()
+    return _LEVEL
 
 
 def _format_value(value: Any, max_length: int = 200) -> str:
     """Format a value for debug output, truncating if necessary."""
+    if isinstance(value, Lazy):
+        try:
+            value = value.func()
+        except Exception as e:
+            return f"<error: {e}>"
+
     if value is None:
         return "None"
 
@@ -97,23 +224,67 @@ def _format_value(value: Any, max_length: int = 200) -> str:
     return str_value
 
 
-def _write_log(message: str, to_file: bool = True) -> None:
-    """Write log message to stdout and optionally to file."""
-    print(message, file=sys.stderr)
+def _write_log(message: str, to_file: bool = True, level: int = 1) -> None:
+    """Write log message to stderr, the log file and the ring buffer."""
+    if level <= _LEVEL:
+        print(message, file=sys.stderr)
 
-    if to_file:
-        log_file = _get_log_file()
-        if log_file:
-            try:
-                log_file.parent.mkdir(parents=True, exist_ok=True)
-                # Strip ANSI codes for file output
-                import re
+        if to_file and _WRITER is not None:
+            # Strip ANSI codes for file output
+            _WRITER.write(_ANSI_RE.sub("", message))
+
+    if _RING is not None:
+        _RING.append(_ANSI_RE.sub("", message))
 
-                clean_message = re.sub(r"\033\[[0-9;]*m", "", message)
-                with open(log_file, "a") as f:
-                    f.write(clean_message + "\n")
-            except Exception:
-                pass  # Silently fail file logging
+
+def flush_debug_log() -> None:
+    """Wait until queued log lines have been written to DEBUG_LOG_FILE."""
+    if _WRITER is not None:
+        _WRITER.flush()
+
+
+def dump_debug_buffer(path: Optional[Path] = None) -> int:
+    """
+    Dump the in-memory ring buffer (DEBUG_RING_BUFFER=N).
+
+    Args:
+        path: File to write to (default: stderr)
+
+    Returns:
+        Number of messages dumped
+    """
+    if _RING is None:
+        return 0
+    lines = list(_RING)
+    text = "\n".join(lines) + "\n" if lines else ""
+    if path is None:
+        sys.stderr.write(text)
+    else:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        Path(path).write_text(text, encoding="utf-8")
+    return len(lines)
+
+
+def _crash_hook(exc_type, exc, tb) -> None:
+    """sys.excepthook: dump the ring buffer before the default report."""
+    try:
+        crash_file = os.environ.get("DEBUG_CRASH_FILE")
+        if not crash_file and _LOG_FILE is not None:
+            crash_file = f"{_LOG_FILE}.crash"
+        count = dump_debug_buffer(Path(crash_file) if crash_file else None)
+        if count and crash_file:
+            print(
+                f"Debug ring buffer ({count} messages) written to {crash_file}",
+                file=sys.stderr,
+            )
+    except Exception:
+        pass
+    _previous_excepthook(exc_type, exc, tb)
+
+
+def _close_writer() -> None:
+    if _WRITER is not None:
+        _WRITER.close()
 
 
 def debug(module: str, message: str, level: int = 1, **kwargs) -> None:
@@ -124,12 +295,10 @@ def debug(module: str, message: str, level: int = 1, **kwargs) -> None:
         module: Source module name (e.g., "run.py", "ideation_runner")
         message: Debug message
         level: Required debug level (1=basic, 2=detailed, 3=verbose)
-        **kwargs: Additional key-value pairs to log
+        **kwargs: Additional key-value pairs to log (wrap expensive values
+            in Lazy so they are only computed when emitted)
     """
-    if not _get_debug_enabled():
-        return
-
-    if _get_debug_level() < level:
+    if level > _CAPTURE_LEVEL:
         return
 
     timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
@@ -156,7 +325,7 @@ def debug(module: str, message: str, level: int = 1, **kwargs) -> None:
             else:
                 log_line += f"\n  {Colors.KEY}{key}{Colors.RESET}: {Colors.VALUE}{formatted_value}{Colors.RESET}"
 
-    _write_log(log_line)
+    _write_log(log_line, level=level)
 
 
 def debug_detailed(module: str, message: str, **kwargs) -> None:
@@ -171,7 +340,7 @@ def debug_verbose(module: str, message: str, **kwargs) -> None:
 
 def debug_success(module: str, message: str, **kwargs) -> None:
     """Log a success debug message."""
-    if not _get_debug_enabled():
+    if not _ENABLED:
         return
 
     timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
@@ -186,7 +355,7 @@ def debug_success(module: str, message: str, **kwargs) -> None:
 
 def debug_info(module: str, message: str, **kwargs) -> None:
     """Log an info debug message."""
-    if not _get_debug_enabled():
+    if not _ENABLED:
         return
 
     timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
@@ -201,7 +370,7 @@ def debug_info(module: str, message: str, **kwargs) -> None:
 
 def debug_error(module: str, message: str, **kwargs) -> None:
     """Log an error debug message (always shown if debug enabled)."""
-    if not _get_debug_enabled():
+    if not _ENABLED:
         return
 
     timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
@@ -216,7 +385,7 @@ def debug_error(module: str, message: str, **kwargs) -> None:
 
 def debug_warning(module: str, message: str, **kwargs) -> None:
     """Log a warning debug message."""
-    if not _get_debug_enabled():
+    if not _ENABLED:
         return
 
     timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
@@ -231,7 +400,7 @@ def debug_warning(module: str, message: str, **kwargs) -> None:
 
 def debug_section(module: str, title: str) -> None:
     """Log a section header for organizing debug output."""
-    if not _get_debug_enabled():
+    if not _ENABLED:
         return
 
     timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
@@ -247,6 +416,9 @@ def debug_timer(module: str):
     """
     Decorator to time function execution.
 
+    Every call is also recorded as a profiling span "<module>.<function>"
+    when profiling is enabled (see core/profiling.py).
+
     Usage:
         @debug_timer("run.py")
         def my_function():
@@ -256,30 +428,31 @@ def debug_timer(module: str):
     def decorator(func):
         @wraps(func)
         def wrapper(*args, **kwargs):
-            if not _get_debug_enabled():
-                return func(*args, **kwargs)
-
-            start = time.time()
-            debug_detailed(module, f"Starting {func.__name__}()")
-
-            try:
-                result = func(*args, **kwargs)
-                elapsed = time.time() - start
-                debug_success(
-                    module,
-                    f"Completed {func.__name__}()",
-                    elapsed_ms=f"{elapsed * 1000:.1f}ms",
-                )
-                return result
-            except Exception as e:
-                elapsed = time.time() - start
-                debug_error(
-                    module,
-                    f"Failed {func.__name__}()",
-                    error=str(e),
-                    elapsed_ms=f"{elapsed * 1000:.1f}ms",
-                )
-                raise
+            with profile_span(f"{module}.{func.__name__}"):
+                if not _ENABLED:
+                    return func(*args, **kwargs)
+
+                start = time.perf_counter()
+                debug_detailed(module, f"Starting {func.__name__}()")
+
+                try:
+                    result = func(*args, **kwargs)
+                    elapsed = time.perf_counter() - start
+                    debug_success(
+                        module,
+                        f"Completed {func.__name__}()",
+                        elapsed_ms=f"{elapsed * 1000:.1f}ms",
+                    )
+                    return result
+                except Exception as e:
+                    elapsed = time.perf_counter() - start
+                    debug_error(
+                        module,
+                        f"Failed {func.__name__}()",
+                        error=str(e),
+                        elapsed_ms=f"{elapsed * 1000:.1f}ms",
+                    )
+                    raise
 
         return wrapper
 
@@ -290,6 +463,9 @@ def debug_async_timer(module: str):
     """
     Decorator to time async function execution.
 
+    Every call is also recorded as a profiling span "<module>.<function>"
+    when profiling is enabled (see core/profiling.py).
+
     Usage:
         @debug_async_timer("ideation_runner")
         async def my_async_function():
@@ -299,30 +475,31 @@ def debug_async_timer(module: str):
     def decorator(func):
         @wraps(func)
         async def wrapper(*args, **kwargs):
-            if not _get_debug_enabled():
-                return await func(*args, **kwargs)
-
-            start = time.time()
-            debug_detailed(module, f"Starting {func.__name__}()")
-
-            try:
-                result = await func(*args, **kwargs)
-                elapsed = time.time() - start
-                debug_success(
-                    module,
-                    f"Completed {func.__name__}()",
-                    elapsed_ms=f"{elapsed * 1000:.1f}ms",
-                )
-                return result
-            except Exception as e:
-                elapsed = time.time() - start
-                debug_error(
-                    module,
-                    f"Failed {func.__name__}()",
-                    error=str(e),
-                    elapsed_ms=f"{elapsed * 1000:.1f}ms",
-                )
-                raise
+            with profile_span(f"{module}.{func.__name__}"):
+                if not _ENABLED:
+                    return await func(*args, **kwargs)
+
+                start = time.perf_counter()
+                debug_detailed(module, f"Starting {func.__name__}()")
+
+                try:
+                    result = await func(*args, **kwargs)
+                    elapsed = time.perf_counter() - start
+                    debug_success(
+                        module,
+                        f"Completed {func.__name__}()",
+                        elapsed_ms=f"{elapsed * 1000:.1f}ms",
+                    )
+                    return result
+                except Exception as e:
+                    elapsed = time.perf_counter() - start
+                    debug_error(
+                        module,
+                        f"Failed {func.__name__}()",
+                        error=str(e),
+                        elapsed_ms=f"{elapsed * 1000:.1f}ms",
+                    )
+                    raise
 
         return wrapper
 
@@ -331,7 +508,7 @@ def debug_async_timer(module: str):
 
 def debug_env_status() -> None:
     """Print debug environment status on startup."""
-    if not _get_debug_enabled():
+    if not _ENABLED:
         return
 
     debug_section("debug", "Debug Mode Enabled")
@@ -339,11 +516,18 @@ def debug_env_status() -> None:
         "debug",
         "Environment configuration",
         DEBUG=os.environ.get("DEBUG", "not set"),
-        DEBUG_LEVEL=_get_debug_level(),
+        DEBUG_LEVEL=_LEVEL,
         DEBUG_LOG_FILE=os.environ.get("DEBUG_LOG_FILE", "not set"),
+        DEBUG_RING_BUFFER=_RING.maxlen if _RING is not None else "off",
     )
 
 
+reload_debug_config()
+_previous_excepthook = sys.excepthook
+if _RING is not None:
+    sys.excepthook = _crash_hook
+atexit.register(_close_writer)
+
 # Print status on import if debug is enabled
-if _get_debug_enabled():
+if _ENABLED:
     debug_env_status()
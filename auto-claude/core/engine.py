@@ -16,6 +16,8 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, AsyncIterator, Dict, List, Optional, Union
 
+from .mcp_manager import MCPManager
+
 
 @dataclass
 class AgentMessage:
@@ -32,6 +34,9 @@ class AgentOptions:
     provider: Optional[str] = None
     spec_dir: Optional[str] = None
     allowed_tools: List[str] = field(default_factory=list)
+    # mcp__<server>__<tool> names the direct-API engines may expose (the
+    # Claude SDK engine handles MCP itself)
+    mcp_tools: list[str] = field(default_factory=list)
     mcp_servers: Dict[str, Any] = field(default_factory=dict)
     hooks: Dict[str, List[Any]] = field(default_factory=dict)
     max_turns: int = 1000
@@ -40,43 +45,44 @@ class AgentOptions:
     env: Optional[Dict[str, str]] = None
     verbose: bool = False
     project_name: Optional[str] = None  # For kba-memory collection lookup
-
-
-class MCPManager:
-    """Manages connections to multiple MCP servers."""
-    def __init__(self, servers_config: Dict[str, Any]):
-        self.configs = servers_config
-        self.clients = {}  # server_name -> mcp_client
-        self.tool_map = {}  # tool_name -> server_name
-        self._initialized = False
-
-    async def initialize(self):
-        """Connect to all configured MCP servers and discover tools."""
-        if self._initialized: return
-        
-        # NOTE: For now, we'll implement a simplified version that just maps
-        # external tool names if they are already known, or provides a framework
-        # for connecting to actual MCP servers.
-        # In a full implementation, we'd use mcp.StdioServerTransport etc.
-        self._initialized = True
-
-    async def list_tools(self) -> List[Dict[str, Any]]:
-        """Return a list of all tools from all servers."""
-        # Dummy implementation for now - in reality would query servers
-        return []
-
-    async def call_tool(self, server_name: str, tool_name: str, arguments: Dict[str, Any]) -> str:
-        """Call a tool on a specific MCP server."""
-        # Dummy implementation for now
-        return f"Error: MCP Server {server_name} not yet connected for tool {tool_name}"
+    history_manager: Optional[Any] = None  # core.history.HistoryManager (OpenAI engine)
 
 
 class BaseAgentEngine(ABC):
     """Abstract base class for all agent engines."""
 
+    # Whether reset() can start a fresh conversation on this instance, so an
+    # EnginePool (core/client.py) may hand it out again
+    reusable = False
+
     def __init__(self, options: AgentOptions):
         self.options = options
         self.history: List[Dict[str, Any]] = []
+        self._tool_executor = None
+        # Set by EnginePool.acquire; __aexit__ then returns the engine to it
+        self._pool = None
+
+    def _get_tool_executor(self):
+        """Executor for built-in tool calls (created on first use)."""
+        if self._tool_executor is None:
+            from .tools.executor import ToolExecutor
+            self._tool_executor = ToolExecutor(
+                cwd=self.options.cwd, mcp_manager=getattr(self, "mcp_manager", None)
+            )
+        return self._tool_executor
+
+    async def _get_mcp_tools(self) -> list[dict[str, Any]]:
+        """Allowed tools of the configured MCP servers (see core/mcp_manager.py)."""
+        manager = getattr(self, "mcp_manager", None)
+        if manager is None:
+            return []
+        allowed = set(self.options.mcp_tools)
+        return [tool for tool in await manager.list_tools() if tool["name"] in allowed]
+
+    def _shutdown_tool_executor(self) -> None:
+        if self._tool_executor is not None:
+            self._tool_executor.shutdown()
+            self._tool_executor = None
 
     @abstractmethod
     async def query(self, message: str) -> None:
@@ -97,11 +103,22 @@ class BaseAgentEngine(ABC):
         """Cleanup resources used by the engine."""
         pass
 
+    def reset(self) -> None:
+        """
+        Forget the conversation so the next query starts a fresh session.
+
+        Provider clients, tool schemas and MCP connections are kept.
+        """
+        raise NotImplementedError(f"{type(self).__name__} cannot be reused")
+
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.cleanup()
+        if self._pool is not None:
+            await self._pool.release(self, failed=exc_type is not None)
+        else:
+            await self.cleanup()
 
 
 class ClaudeAgentEngine(BaseAgentEngine):
@@ -151,6 +168,8 @@ class GeminiAgentEngine(BaseAgentEngine):
     Provides built-in tools and MCP client functionality.
     """
 
+    reusable = True
+
     def __init__(self, options: AgentOptions):
         super().__init__(options)
         import google.generativeai as genai
@@ -168,7 +187,7 @@ class GeminiAgentEngine(BaseAgentEngine):
         self.mcp_manager = MCPManager(options.mcp_servers)
         self.chat_session = self.model.start_chat(history=[])
         self._current_response = None
-        self._pending_tool_results = []
+        self._base_system_prompt = options.system_prompt
         
         # Prepare persistent debug log
         self._debug_log_path = Path.cwd() / "gemini_debug.txt"
@@ -277,10 +296,22 @@ class GeminiAgentEngine(BaseAgentEngine):
         # Restart chat session with new model and preserved history
         self.chat_session = self.model.start_chat(history=history)
 
+    def reset(self) -> None:
+        """Start a new chat, keeping the configured model and its tools."""
+        self.history = []
+        self._current_response = None
+        if self.options.system_prompt != self._base_system_prompt:
+            # A session changed the prompt; tools are re-registered on next query
+            self.options.system_prompt = self._base_system_prompt
+            self._initialize_model()
+            if hasattr(self, "_tools_configured"):
+                del self._tools_configured
+        self.chat_session = self.model.start_chat(history=[])
+
     async def query(self, message: str) -> None:
         # Check if we need to initialize tools
         if not hasattr(self, '_tools_configured'):
-            self._configure_tools()
+            self._configure_tools(await self._get_mcp_tools())
 
         # For Gemini, we handle the multi-turn loop manually
         self._current_response = await self.chat_session.send_message_async(message, stream=True)
@@ -289,8 +320,8 @@ class GeminiAgentEngine(BaseAgentEngine):
         # or we yield blocks from receive_response and handle execution there.
         # But existing code expects streaming text + tool use messages.
 
-    def _configure_tools(self):
-        """Register built-in tools with the Gemini model."""
+    def _configure_tools(self, mcp_tools: Optional[list[dict[str, Any]]] = None):
+        """Register built-in and MCP tools with the Gemini model."""
         import google.generativeai as genai
         
         # Define Gemini tools based on allowed_tools
@@ -376,6 +407,14 @@ class GeminiAgentEngine(BaseAgentEngine):
                         "required": ["command"]
                     }
                 ))
+
+        # 2. MCP server tools
+        for tool in mcp_tools or []:
+            gemini_tools.append(self._make_gemini_tool(
+                name=tool["name"],
+                description=tool["description"],
+                parameters=self._gemini_schema(tool["input_schema"]),
+            ))
             
         # Re-initialize model with tools if any
         if gemini_tools:
@@ -390,73 +429,37 @@ class GeminiAgentEngine(BaseAgentEngine):
             
         self._tools_configured = True
 
-    async def _handle_tool_calls(self, function_calls: List[Any]) -> bool:
-        """Execute tool calls and send results back to Gemini."""
-        from .tools.builtin import read_file, write_file, edit_file, glob_files, grep_files, execute_bash
-        
+    async def _handle_tool_calls(self, function_calls: List[Any]) -> AsyncIterator["UserMessage"]:
+        """Execute tool calls, yielding results as they complete, then send them back to Gemini."""
+        from .tools.executor import ToolCall
+
         if not function_calls:
-            return False
-            
-        tool_results = []
-        
-        # We'll store results to yield them in receive_response
-        self._pending_tool_results = []
-        
-        for fc in function_calls:
-            args = dict(fc.args)
-            
-            # Resolve paths relative to CWD
-            cwd = Path(self.options.cwd) if self.options.cwd else Path.cwd()
-            
-            if "file_path" in args:
-                # Handle safe path resolution
-                try:
-                    fp = Path(args["file_path"])
-                    if not fp.is_absolute():
-                        args["file_path"] = str(cwd / fp)
-                except Exception:
-                    pass  # Let tool handle invalid paths
-            
-            # Dispatch
-            result = ""
-            if fc.name == "Read":
-                result = read_file(**args)
-            elif fc.name == "Write":
-                result = write_file(**args)
-            elif fc.name == "Edit":
-                result = edit_file(**args)
-            elif fc.name == "Glob":
-                if "root_dir" not in args:
-                    args["root_dir"] = str(cwd)
-                result = glob_files(**args)
-            elif fc.name == "Grep":
-                if "root_dir" not in args:
-                    args["root_dir"] = str(cwd)
-                result = grep_files(**args)
-            elif fc.name == "Bash":
-                result = execute_bash(command=args.get("command"), cwd=self.options.cwd)
-            else:
-                result = f"Error: Tool {fc.name} not implemented."
-            
+            return
+
+        calls = [ToolCall(id="dummy_id", name=fc.name, args=dict(fc.args)) for fc in function_calls]
+        tool_results = [None] * len(calls)
+
+        async for done in self._get_tool_executor().run(calls):
             if self.options.verbose:
-                msg = f"\n[DEBUG] Tool {fc.name} called with {args}\n[DEBUG] Result (first 100 chars): {str(result)[:100]}...\n"
+                msg = f"\n[DEBUG] Tool {done.call.name} called with {done.call.args}\n[DEBUG] Result (first 100 chars): {str(done.result)[:100]}...\n"
                 sys.stderr.write(msg)
                 sys.stderr.flush()
                 with open(self._debug_log_path, "a") as f:
                     f.write(msg)
-            
-            tool_results.append({
+
+            # History keeps the order the calls were made in
+            tool_results[done.index] = {
                 "function_response": {
-                    "name": fc.name,
-                    "response": {"result": result}
+                    "name": done.call.name,
+                    "response": {"result": done.result}
                 }
-            })
-            
-            self._pending_tool_results.append(UserMessage("dummy_id", result))
-        
+            }
+
+            # Yield each result as soon as it is available so the UI can show it
+            yield UserMessage(done.call.id, done.result, is_error=done.is_error)
+
         # Send results back and update response
         self._current_response = await self.chat_session.send_message_async(tool_results, stream=True)
-        return True
 
     def _make_gemini_tool(self, name: str, description: str, parameters: Dict[str, Any]):
         """Create a tool definition for Gemini."""
@@ -468,6 +471,34 @@ class GeminiAgentEngine(BaseAgentEngine):
             }]
         }
 
+    # JSON Schema keywords Gemini's function declarations understand
+    _GEMINI_SCHEMA_KEYS = ("type", "description", "enum", "format", "nullable")
+
+    @classmethod
+    def _gemini_schema(cls, schema: dict[str, Any]) -> dict[str, Any]:
+        """Reduce an MCP tool's JSON Schema to the subset Gemini accepts."""
+        result = {k: schema[k] for k in cls._GEMINI_SCHEMA_KEYS if k in schema}
+        if isinstance(result.get("type"), list):
+            # ["string", "null"] -> "string", nullable
+            types = [t for t in result["type"] if t != "null"]
+            result["type"] = types[0] if types else "string"
+            if len(types) < len(schema["type"]):
+                result["nullable"] = True
+        result.setdefault("type", "object" if "properties" in schema else "string")
+        if isinstance(schema.get("properties"), dict):
+            result["properties"] = {
+                name: cls._gemini_schema(prop)
+                for name, prop in schema["properties"].items()
+                if isinstance(prop, dict)
+            }
+            if schema.get("required"):
+                result["required"] = list(schema["required"])
+        if isinstance(schema.get("items"), dict):
+            result["items"] = cls._gemini_schema(schema["items"])
+        elif result["type"] == "array":
+            result["items"] = {"type": "string"}
+        return result
+
     async def receive_response(self) -> AsyncIterator[Any]:
         if not self._current_response:
             return
@@ -494,20 +525,16 @@ class GeminiAgentEngine(BaseAgentEngine):
                 
             # Check for tool calls and handle them
             if collected_function_calls:
-                if await self._handle_tool_calls(collected_function_calls):
-                    # Yield the tool results first so the UI can show them
-                    if hasattr(self, '_pending_tool_results'):
-                        for res in self._pending_tool_results:
-                            # self._pending_tool_results already contains UserMessage objects
-                            yield res
-                        self._pending_tool_results = []
-                    # Then continue with the next stream from Gemini
-                    continue
+                # Yield the tool results first so the UI can show them
+                async for res in self._handle_tool_calls(collected_function_calls):
+                    yield res
+                # Then continue with the next stream from Gemini
+                continue
             
             break
 
     async def cleanup(self) -> None:
-        pass
+        self._shutdown_tool_executor()
 
 
 class AssistantMessage:
@@ -587,6 +614,8 @@ class OpenAIAgentEngine(BaseAgentEngine):
     Engine that communicates with OpenAI-compatible APIs (Ollama, GLM, etc).
     """
 
+    reusable = True
+
     def __init__(self, options: AgentOptions):
         super().__init__(options)
         try:
@@ -619,6 +648,17 @@ class OpenAIAgentEngine(BaseAgentEngine):
         self.system_prompt = options.system_prompt
         self.history = [] # List of {"role": "...", "content": "..."}
         self._set_system_prompt_msg()
+        self._openai_tools = None
+        self.mcp_manager = MCPManager(options.mcp_servers)
+
+        # Keeps the resent history within a token budget (see core/history.py)
+        from .history import create_history_manager
+        self.history_manager = options.history_manager or create_history_manager()
+
+    @property
+    def prompt_metrics(self):
+        """Per-request prompt sizes (core.history.PromptMetrics)."""
+        return list(self.history_manager.metrics)
 
     def _set_system_prompt_msg(self):
         # Initialize or update system prompt in history
@@ -633,14 +673,35 @@ class OpenAIAgentEngine(BaseAgentEngine):
         self.system_prompt = prompt
         self._set_system_prompt_msg()
 
+    def reset(self) -> None:
+        """Drop the conversation; the HTTP client and tool schemas are kept."""
+        self.system_prompt = self.options.system_prompt
+        self.history = []
+        self._set_system_prompt_msg()
+
     async def query(self, message: str) -> None:
         self.history.append({"role": "user", "content": message})
 
     async def receive_response(self) -> AsyncIterator[Any]:
-        # Define tools using OpenAI format
-        tools = self._get_openai_tools()
+        # Define tools using OpenAI format (built once per engine)
+        if self._openai_tools is None:
+            self._openai_tools = self._get_openai_tools() + [
+                {
+                    "type": "function",
+                    "function": {
+                        "name": tool["name"],
+                        "description": tool["description"],
+                        "parameters": tool["input_schema"],
+                    },
+                }
+                for tool in await self._get_mcp_tools()
+            ]
+        tools = self._openai_tools
         
         while True:
+            # Elide stale tool outputs before resending the history
+            self.history_manager.prepare(self.history)
+
             # Common arguments
             kwargs = {
                 "model": self.options.model,
@@ -707,54 +768,35 @@ class OpenAIAgentEngine(BaseAgentEngine):
                 break
 
     async def _handle_tool_calls(self, tool_calls):
-         from .tools.builtin import read_file, write_file, edit_file, glob_files, grep_files, execute_bash
+         from .tools.executor import ToolCall
          import json
 
+         calls = []
          for tc in tool_calls:
              func = tc["function"]
-             name = func["name"]
              try:
                  args = json.loads(func["arguments"])
              except:
                  args = {} 
-             
-             # Resolve paths (similar to Gemini engine)
-             cwd = Path(self.options.cwd) if self.options.cwd else Path.cwd()
-             if "file_path" in args:
-                 try:
-                     fp = Path(args["file_path"])
-                     if not fp.is_absolute():
-                         args["file_path"] = str(cwd / fp)
-                 except: pass
-
-             if "root_dir" in args: # For glob/grep
-                 pass # usually handled inside tool or needs implementing
-
-             # Dispatch
-             result = ""
-             if name == "Read": result = read_file(**args)
-             elif name == "Write": result = write_file(**args)
-             elif name == "Edit": result = edit_file(**args)
-             elif name == "Glob": 
-                  if "root_dir" not in args: args["root_dir"] = str(cwd)
-                  result = glob_files(**args)
-             elif name == "Grep":
-                  if "root_dir" not in args: args["root_dir"] = str(cwd)
-                  result = grep_files(**args)
-             elif name == "Bash": result = execute_bash(command=args.get("command"), cwd=self.options.cwd)
-             else: result = f"Error: Tool {name} not found"
-
-             # Append to history
-             self.history.append({
-                 "role": "tool",
-                 "tool_call_id": tc["id"],
-                 "name": name,
-                 "content": str(result)
-             })
+             calls.append(ToolCall(id=tc["id"], name=func["name"], args=args))
+
+         results = [None] * len(calls)
+         async for done in self._get_tool_executor().run(calls):
+             results[done.index] = done
 
              # We also yield these as UserMessage so the UI sees the tool execution
              # (This matches the interface expected by ReceiveResponse consumers)
-             yield UserMessage(tool_use_id=tc["id"], content=str(result))
+             yield UserMessage(tool_use_id=done.call.id, content=str(done.result), is_error=done.is_error)
+
+         # Append to history in call order (tool messages must follow the
+         # assistant message in the order of its tool_calls)
+         for done in results:
+             self.history.append({
+                 "role": "tool",
+                 "tool_call_id": done.call.id,
+                 "name": done.call.name,
+                 "content": str(done.result)
+             })
 
 
     def _get_openai_tools(self):
@@ -860,6 +902,7 @@ class OpenAIAgentEngine(BaseAgentEngine):
         return tools
 
     async def cleanup(self) -> None:
+        self._shutdown_tool_executor()
         if hasattr(self, 'client'):
             await self.client.close()
 
@@ -867,6 +910,8 @@ class OpenAIAgentEngine(BaseAgentEngine):
 class CustomCliAgentEngine(BaseAgentEngine):
     """Engine for custom CLI providers (e.g., Droid)."""
 
+    reusable = True
+
     def __init__(self, options: AgentOptions):
         super().__init__(options)
         self.prompt = ""
@@ -905,8 +950,8 @@ class CustomCliAgentEngine(BaseAgentEngine):
         # Inject kba-memory context if enabled and project name is set
         if self.kba_enabled and self.project_name:
             try:
-                from .kba_memory import search_project_knowledge, format_context_for_prompt
-                notes = search_project_knowledge(self.project_name, message, limit=5)
+                from .kba_memory import get_kba_client, format_context_for_prompt
+                notes = await get_kba_client().search_async(self.project_name, message, limit=5)
                 if notes:
                     context = format_context_for_prompt(notes, self.project_name)
                     message = context + message
@@ -919,6 +964,12 @@ class CustomCliAgentEngine(BaseAgentEngine):
     def set_system_prompt(self, prompt: str) -> None:
         pass
 
+    def reset(self) -> None:
+        """Clear the last prompt and output; the CLI session id is re-read."""
+        self.prompt = ""
+        self.collected_output = []
+        self._load_session_id()
+
     async def receive_response(self) -> AsyncIterator[Any]:
         # Get template from env or default to droid exec with stream-json
         template = os.environ.get("AUTO_CLAUDE_CUSTOM_CLI_TEMPLATE", 
@@ -1050,18 +1101,14 @@ class CustomCliAgentEngine(BaseAgentEngine):
             return
         
         try:
-            from .kba_memory import extract_insights_from_output, add_project_note
+            from .kba_memory import extract_insights_from_output, get_kba_client
             
             full_output = "\n".join(self.collected_output)
             insights = extract_insights_from_output(full_output)
             
-            for insight in insights:
-                success = add_project_note(
-                    self.project_name,
-                    insight["title"],
-                    insight["content"],
-                    insight.get("tags", [])
-                )
+            # Upload all insights concurrently over the pooled client
+            results = await get_kba_client().add_notes_async(self.project_name, insights)
+            for insight, success in zip(insights, results):
                 if success:
                     print(f"[KBA Memory] Stored insight: {insight['title']}")
         except Exception as e:
@@ -0,0 +1,288 @@
+"""
+Conversation History Management
+===============================
+
+History managers for engines that resend the whole conversation on every
+request (OpenAI-compatible endpoints such as Ollama or GLM).
+
+Every tool round-trip resends all earlier tool results (whole files from
+Read, full Grep output, ...), so long sessions grow quadratically and
+eventually overflow the context window. A history manager is given the
+message list before each request and may shrink it in place.
+
+- HistoryManager: no compaction, only records prompt-size metrics
+- TokenBudgetHistory: once the estimated prompt size passes a token budget,
+  elides stale tool outputs (and large Write/Edit arguments) oldest first,
+  keeping the system prompt, user messages and the most recent turns
+  verbatim. It compacts well below the budget (see
+  DEFAULT_COMPACTION_TARGET), so the rewritten prefix then stays unchanged
+  for many requests and provider prompt caching keeps working between
+  compactions
+
+Token counts are estimates (about four characters per token), cached per
+message.
+"""
+
+import json
+import logging
+import os
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Rough characters-per-token ratio for English text and code
+CHARS_PER_TOKEN = 4
+
+# Fixed per-message overhead (role, separators)
+MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def _get_history_budget_tokens() -> int:
+    """Get the prompt budget (AUTO_CLAUDE_HISTORY_BUDGET_TOKENS)."""
+    try:
+        return int(os.environ.get("AUTO_CLAUDE_HISTORY_BUDGET_TOKENS", "48000"))
+    except ValueError:
+        return 48000
+
+
+# Default prompt budget before compaction kicks in
+DEFAULT_HISTORY_BUDGET_TOKENS = _get_history_budget_tokens()
+
+# Once over budget, compact down to this fraction of it, leaving headroom
+# for the next turns before the prefix has to be rewritten again
+DEFAULT_COMPACTION_TARGET = 0.5
+
+# Most recent assistant turns (with their tool results) kept verbatim
+DEFAULT_KEEP_RECENT_TURNS = 2
+
+# Tool outputs shorter than this are never elided
+MIN_ELIDE_TOKENS = 200
+
+# Lines of an elided tool output kept as a preview
+ELIDED_PREVIEW_LINES = 8
+ELIDED_PREVIEW_CHARS = 400
+
+ELISION_MARKER = "[... tool output elided"
+
+# Number of per-request metrics kept
+MAX_METRICS = 1000
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate token count of a string."""
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+@dataclass
+class PromptMetrics:
+    """Size of one request's prompt."""
+
+    request: int
+    messages: int
+    tokens: int
+    tokens_before_compaction: int
+    elided_messages: int = 0
+
+
+class HistoryManager:
+    """Tracks prompt sizes without changing the history."""
+
+    def __init__(self):
+        self.metrics: deque[PromptMetrics] = deque(maxlen=MAX_METRICS)
+        self._token_cache: dict[int, tuple[Any, Any, int]] = {}
+        self._requests = 0
+
+    def message_tokens(self, message: dict[str, Any]) -> int:
+        """Estimated tokens of a message (cached until its content changes)."""
+        content = message.get("content")
+        tool_calls = message.get("tool_calls")
+        cached = self._token_cache.get(id(message))
+        if cached is not None and cached[0] is content and cached[1] is tool_calls:
+            return cached[2]
+
+        tokens = MESSAGE_OVERHEAD_TOKENS
+        if isinstance(content, str):
+            tokens += estimate_tokens(content)
+        elif content:
+            tokens += estimate_tokens(json.dumps(content))
+        for call in tool_calls or []:
+            function = call.get("function", {})
+            tokens += estimate_tokens(function.get("name", ""))
+            tokens += estimate_tokens(function.get("arguments", ""))
+        self._token_cache[id(message)] = (content, tool_calls, tokens)
+        return tokens
+
+    def count_tokens(self, messages: list[dict[str, Any]]) -> int:
+        """Estimated tokens of a whole prompt."""
+        return sum(self.message_tokens(m) for m in messages)
+
+    def compact(self, messages: list[dict[str, Any]]) -> int:
+        """Shrink messages in place; returns the number of messages changed."""
+        return 0
+
+    def prepare(self, messages: list[dict[str, Any]]) -> PromptMetrics:
+        """
+        Prepare the history for the next request.
+
+        Args:
+            messages: Conversation history (may be modified in place)
+
+        Returns:
+            Metrics for this request's prompt
+        """
+        self._requests += 1
+        before = self.count_tokens(messages)
+        elided = self.compact(messages)
+        after = self.count_tokens(messages) if elided else before
+
+        # Forget cached counts of messages that are no longer in the history
+        if len(self._token_cache) > 2 * len(messages) + 64:
+            live = {id(m) for m in messages}
+            self._token_cache = {
+                k: v for k, v in self._token_cache.items() if k in live
+            }
+
+        metrics = PromptMetrics(
+            request=self._requests,
+            messages=len(messages),
+            tokens=after,
+            tokens_before_compaction=before,
+            elided_messages=elided,
+        )
+        self.metrics.append(metrics)
+        logger.debug(
+            "Prompt %d: %d messages, ~%d tokens (~%d before compaction, %d elided)",
+            metrics.request,
+            metrics.messages,
+            metrics.tokens,
+            metrics.tokens_before_compaction,
+            metrics.elided_messages,
+        )
+        return metrics
+
+
+class TokenBudgetHistory(HistoryManager):
+    """Elides stale tool outputs once the prompt passes a token budget."""
+
+    def __init__(
+        self,
+        budget_tokens: int = DEFAULT_HISTORY_BUDGET_TOKENS,
+        keep_recent_turns: int = DEFAULT_KEEP_RECENT_TURNS,
+        compaction_target: float = DEFAULT_COMPACTION_TARGET,
+    ):
+        """
+        Initialize history manager.
+
+        Args:
+            budget_tokens: Estimated prompt size above which to compact
+            keep_recent_turns: Latest assistant turns never compacted
+            compaction_target: Fraction of the budget to compact down to
+        """
+        super().__init__()
+        self.budget_tokens = budget_tokens
+        self.keep_recent_turns = keep_recent_turns
+        self.target_tokens = int(budget_tokens * compaction_target)
+
+    def _protected_from(self, messages: list[dict[str, Any]]) -> int:
+        """Index of the first message belonging to the recent turns."""
+        seen = 0
+        for index in range(len(messages) - 1, -1, -1):
+            if messages[index].get("role") == "assistant":
+                seen += 1
+                if seen >= self.keep_recent_turns:
+                    return index
+        return 0
+
+    def compact(self, messages: list[dict[str, Any]]) -> int:
+        total = self.count_tokens(messages)
+        if total <= self.budget_tokens:
+            return 0
+
+        # Elide in one large chunk rather than just enough to fit: every
+        # compaction rewrites the prefix and invalidates the provider's
+        # prompt cache, so leave room for the next turns
+        elided = 0
+        for message in messages[: self._protected_from(messages)]:
+            if total <= self.target_tokens:
+                break
+            before = self.message_tokens(message)
+            if before < MIN_ELIDE_TOKENS:
+                continue
+            if message.get("role") == "tool":
+                changed = self._elide_tool_output(message)
+            elif message.get("role") == "assistant" and message.get("tool_calls"):
+                changed = self._elide_tool_arguments(message)
+            else:
+                # System prompt, user and assistant prose stay verbatim
+                continue
+            if changed:
+                elided += 1
+                total -= before - self.message_tokens(message)
+        return elided
+
+    @staticmethod
+    def _elide_tool_output(message: dict[str, Any]) -> bool:
+        content = message.get("content")
+        if not isinstance(content, str) or ELISION_MARKER in content:
+            return False
+        lines = content.splitlines()
+        preview = "\n".join(lines[:ELIDED_PREVIEW_LINES])[:ELIDED_PREVIEW_CHARS]
+        message["content"] = (
+            f"{preview}\n{ELISION_MARKER} to save context: {len(lines)} lines, "
+            f"~{estimate_tokens(content)} tokens. Re-run the tool if you need it again ...]"
+        )
+        return True
+
+    @staticmethod
+    def _elide_tool_arguments(message: dict[str, Any]) -> bool:
+        changed = False
+        new_calls = []
+        for call in message["tool_calls"]:
+            function = call.get("function", {})
+            arguments = function.get("arguments", "")
+            if estimate_tokens(arguments) < MIN_ELIDE_TOKENS:
+                new_calls.append(call)
+                continue
+            try:
+                args = json.loads(arguments)
+            except (json.JSONDecodeError, TypeError):
+                new_calls.append(call)
+                continue
+            if not isinstance(args, dict):
+                new_calls.append(call)
+                continue
+            # Keep short arguments (paths, commands); stub out file bodies
+            args = {
+                key: (
+                    f"{ELISION_MARKER}: {len(value)} characters ...]"
+                    if isinstance(value, str)
+                    and estimate_tokens(value) >= MIN_ELIDE_TOKENS
+                    else value
+                )
+                for key, value in args.items()
+            }
+            new_calls.append(
+                {**call, "function": {**function, "arguments": json.dumps(args)}}
+            )
+            changed = True
+        if changed:
+            message["tool_calls"] = new_calls
+        return changed
+
+
+def create_history_manager(budget_tokens: int | None = None) -> HistoryManager:
+    """
+    Create the default history manager.
+
+    Args:
+        budget_tokens: Prompt budget; 0 or less disables compaction
+
+    Returns:
+        TokenBudgetHistory, or a metrics-only HistoryManager when disabled
+    """
+    budget = DEFAULT_HISTORY_BUDGET_TOKENS if budget_tokens is None else budget_tokens
+    if budget <= 0:
+        return HistoryManager()
+    return TokenBudgetHistory(budget_tokens=budget)
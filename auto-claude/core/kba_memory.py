@@ -4,134 +4,403 @@ KBA Memory Client
 
 Client for interacting with the kba-memory server to provide
 project-specific knowledge context to AI agents.
+
+KBAClient keeps a small pool of keep-alive HTTP connections, caches the
+collection ID of each project (the collection list is fetched once, not on
+every query/insight), and keeps a bounded, short-lived cache of search
+results. Async wrappers run requests in worker threads so the event loop
+never blocks on the network, and notes can be uploaded concurrently.
+
+The module-level functions are kept for existing callers and use a shared
+client.
 """
 
+import asyncio
+import http.client
 import json
 import os
+import queue
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+from urllib.parse import quote, urlsplit
 
 KBA_API_URL = os.environ.get("KBA_API_URL", "http://localhost:3002")
 
+# Keep-alive connections kept open to the server
+KBA_POOL_SIZE = 4
+
+# Per-request timeout in seconds
+KBA_TIMEOUT = 10
+
+# Bounded cache of recent search results
+SEARCH_CACHE_SIZE = 128
+SEARCH_CACHE_TTL_SECONDS = 60.0
+
+# Errors meaning a pooled keep-alive connection was closed by the server
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine,
+    BrokenPipeError,
+    ConnectionResetError,
+)
+
+# Methods safe to resend when the response to the first attempt was lost
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "PUT", "DELETE", "OPTIONS"})
+
+
+class _ConnectionPool:
+    """Thread-safe pool of keep-alive HTTP(S) connections to one server."""
+
+    def __init__(self, base_url: str, size: int, timeout: float):
+        parts = urlsplit(base_url)
+        self._https = parts.scheme == "https"
+        self._host = parts.hostname or "localhost"
+        self._port = parts.port
+        self.prefix = parts.path.rstrip("/")
+        self._timeout = timeout
+        self._idle: queue.LifoQueue[http.client.HTTPConnection] = queue.LifoQueue()
+        self._slots = threading.BoundedSemaphore(size)
+
+    def _new_connection(self) -> http.client.HTTPConnection:
+        cls = http.client.HTTPSConnection if self._https else http.client.HTTPConnection
+        return cls(self._host, self._port, timeout=self._timeout)
+
+    def request(self, method: str, path: str, body: bytes | None) -> tuple[int, bytes]:
+        """Send a request over a pooled connection (at most size at once)."""
+        headers = {"Content-Type": "application/json", "Connection": "keep-alive"}
+        with self._slots:
+            try:
+                conn = self._idle.get_nowait()
+                reused = True
+            except queue.Empty:
+                conn = self._new_connection()
+                reused = False
+            try:
+                sent = False
+                try:
+                    conn.request(method, self.prefix + path, body=body, headers=headers)
+                    sent = True
+                    response = conn.getresponse()
+                except _STALE_CONNECTION_ERRORS:
+                    # Server closed the idle connection: retry once on a new
+                    # one, unless a non-idempotent request may already have
+                    # been processed (it failed after being sent)
+                    if not reused or (sent and method not in _IDEMPOTENT_METHODS):
+                        raise
+                    conn.close()
+                    conn = self._new_connection()
+                    conn.request(method, self.prefix + path, body=body, headers=headers)
+                    response = conn.getresponse()
+                data = response.read()
+            except Exception:
+                conn.close()
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._idle.put(conn)
+            return response.status, data
+
+    def close(self) -> None:
+        """Close all idle connections."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                return
+
+
+class KBAClient:
+    """Pooled kba-memory client with collection-ID and search caches."""
+
+    def __init__(
+        self,
+        base_url: str = KBA_API_URL,
+        pool_size: int = KBA_POOL_SIZE,
+        timeout: float = KBA_TIMEOUT,
+    ):
+        """
+        Initialize client (connections are opened on demand).
+
+        Args:
+            base_url: kba-memory server URL
+            pool_size: Maximum concurrent (and kept-alive) connections
+            timeout: Per-request timeout in seconds
+        """
+        self.base_url = base_url
+        self.pool_size = max(1, pool_size)
+        self._pool = _ConnectionPool(base_url, self.pool_size, timeout)
+        self._collections: dict[str, str] = {}
+        self._collection_lock = threading.Lock()
+        self._search_cache: OrderedDict[tuple, tuple[float, list]] = OrderedDict()
+        self._search_lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    def api_call(self, endpoint: str, method: str = "GET", data: dict | None = None) -> Any:
+        """Make an API call; errors are returned as {"success": False, ...}."""
+        body = json.dumps(data).encode() if data else None
+        try:
+            status, raw = self._pool.request(method, endpoint, body)
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+        if status >= 400:
+            return {"success": False, "error": f"HTTP Error {status}"}
+        try:
+            return json.loads(raw.decode())
+        except Exception as e:
+            return {"success": False, "error": str(e)}
+
+    # ------------------------------------------------------------------
+    # Collections
+    # ------------------------------------------------------------------
+
+    def get_or_create_collection(self, project_name: str) -> str | None:
+        """Get collection ID for a project, creating it if it doesn't exist."""
+        key = project_name.lower()
+        cached = self._collections.get(key)
+        if cached:
+            return cached
+
+        # Serialize lookups so concurrent callers don't create duplicates
+        with self._collection_lock:
+            cached = self._collections.get(key)
+            if cached:
+                return cached
+            collection_id = self._find_or_create_collection(project_name)
+            if collection_id:
+                self._collections[key] = collection_id
+            return collection_id
+
+    def _find_or_create_collection(self, project_name: str) -> str | None:
+        # Search for existing collection
+        result = self.api_call("/api/collections")
+
+        collections = []
+        if isinstance(result, list):
+            # API returns array directly
+            collections = result
+        elif result.get("success") and result.get("data"):
+            # API returns wrapped response
+            collections = result["data"]
+
+        for col in collections:
+            name = col.get("name", "")
+            if col.get("id"):
+                # Remember every collection seen, not just this project's
+                self._collections.setdefault(name.lower(), col["id"])
+            if name.lower() == project_name.lower():
+                return col.get("id")
+
+        # Create new collection
+        create_result = self.api_call("/api/collections", method="POST", data={
+            "name": project_name,
+            "description": f"Knowledge base for project: {project_name}"
+        })
+
+        if isinstance(create_result, dict):
+            # Check for direct ID or wrapped response
+            if create_result.get("id"):
+                return create_result.get("id")
+            if create_result.get("success") and create_result.get("data"):
+                return create_result["data"].get("id")
+
+        return None
+
+    # ------------------------------------------------------------------
+    # Notes
+    # ------------------------------------------------------------------
+
+    def search(self, project_name: str, query: str, limit: int = 5) -> list[dict[str, Any]]:
+        """Search for relevant notes in a project's collection."""
+        collection_id = self.get_or_create_collection(project_name)
+        if not collection_id:
+            return []
+
+        key = (collection_id, query, limit)
+        with self._search_lock:
+            hit = self._search_cache.get(key)
+            if hit is not None and time.monotonic() - hit[0] < SEARCH_CACHE_TTL_SECONDS:
+                self._search_cache.move_to_end(key)
+                return list(hit[1])
+
+        notes = self._search_uncached(collection_id, query, limit)
+
+        with self._search_lock:
+            self._search_cache[key] = (time.monotonic(), notes)
+            self._search_cache.move_to_end(key)
+            while len(self._search_cache) > SEARCH_CACHE_SIZE:
+                self._search_cache.popitem(last=False)
+        return list(notes)
+
+    def _search_uncached(self, collection_id: str, query: str, limit: int) -> list[dict[str, Any]]:
+        # Try semantic search first
+        endpoint = f"/api/notes/search?query={quote(query)}&collectionId={collection_id}&limit={limit}"
+        result = self.api_call(endpoint)
+
+        if isinstance(result, list) and len(result) > 0:
+            return result
+        elif isinstance(result, dict) and result.get("data"):
+            return result["data"]
+
+        # Fallback: list all notes in collection (basic filtering)
+        list_endpoint = f"/api/notes?collectionId={collection_id}&limit={limit}"
+        list_result = self.api_call(list_endpoint)
+
+        if isinstance(list_result, list):
+            # Simple keyword filter on title/content
+            query_lower = query.lower()
+            filtered = [
+                note for note in list_result
+                if query_lower in note.get("title", "").lower()
+                or query_lower in note.get("content", "").lower()
+            ]
+            return filtered[:limit] if filtered else list_result[:limit]
+
+        return []
+
+    def _invalidate_searches(self, collection_id: str) -> None:
+        with self._search_lock:
+            for key in [k for k in self._search_cache if k[0] == collection_id]:
+                del self._search_cache[key]
+
+    def _post_note(self, collection_id: str, note: dict[str, Any]) -> bool:
+        result = self.api_call("/api/notes", method="POST", data={
+            "collectionId": collection_id,
+            "title": note.get("title", ""),
+            "content": note.get("content", ""),
+            "tags": note.get("tags") or []
+        })
+
+        # Check for success in various response formats
+        if isinstance(result, dict):
+            if result.get("id"):
+                return True
+            if result.get("success"):
+                return True
+
+        return False
+
+    def add_note(self, project_name: str, title: str, content: str, tags: list[str] | None = None) -> bool:
+        """Add a note to a project's collection."""
+        return self.add_notes(
+            project_name, [{"title": title, "content": content, "tags": tags}]
+        )[0]
+
+    def add_notes(self, project_name: str, notes: list[dict[str, Any]]) -> list[bool]:
+        """
+        Add several notes to a project's collection.
+
+        The collection is resolved once and notes are uploaded concurrently
+        over the connection pool.
+
+        Args:
+            project_name: Project whose collection receives the notes
+            notes: Dicts with "title", "content" and optional "tags"
+
+        Returns:
+            Success flag per note, in input order
+        """
+        if not notes:
+            return []
+        collection_id = self.get_or_create_collection(project_name)
+        if not collection_id:
+            return [False] * len(notes)
+
+        try:
+            if len(notes) == 1:
+                return [self._post_note(collection_id, notes[0])]
+            return list(
+                self._get_executor().map(
+                    lambda note: self._post_note(collection_id, note), notes
+                )
+            )
+        finally:
+            self._invalidate_searches(collection_id)
+
+    # ------------------------------------------------------------------
+    # Async API
+    # ------------------------------------------------------------------
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.pool_size, thread_name_prefix="kba-memory"
+            )
+        return self._executor
+
+    async def search_async(self, project_name: str, query: str, limit: int = 5) -> list[dict[str, Any]]:
+        """search() without blocking the event loop."""
+        return await asyncio.to_thread(self.search, project_name, query, limit)
+
+    async def add_notes_async(self, project_name: str, notes: list[dict[str, Any]]) -> list[bool]:
+        """add_notes() without blocking the event loop."""
+        return await asyncio.to_thread(self.add_notes, project_name, notes)
+
+    def close(self) -> None:
+        """Close pooled connections and worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+        self._pool.close()
+
+
+# =============================================================================
+# SHARED CLIENT
+# =============================================================================
+
+_client: KBAClient | None = None
+_client_lock = threading.Lock()
+
+
+def get_kba_client() -> KBAClient:
+    """Get the shared client for KBA_API_URL."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = KBAClient(KBA_API_URL)
+    return _client
+
 
 def _api_call(endpoint: str, method: str = "GET", data: dict | None = None) -> dict:
     """Make a synchronous API call to kba-memory server."""
-    url = f"{KBA_API_URL}{endpoint}"
-    headers = {"Content-Type": "application/json"}
-    
-    body = json.dumps(data).encode() if data else None
-    req = Request(url, data=body, headers=headers, method=method)
-    
-    try:
-        with urlopen(req, timeout=10) as response:
-            return json.loads(response.read().decode())
-    except (URLError, HTTPError) as e:
-        return {"success": False, "error": str(e)}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+    return get_kba_client().api_call(endpoint, method, data)
 
 
 def get_or_create_collection(project_name: str) -> str | None:
     """Get collection ID for a project, creating it if it doesn't exist."""
-    # Search for existing collection
-    result = _api_call("/api/collections")
-    
-    if isinstance(result, list):
-        # API returns array directly
-        for col in result:
-            if col.get("name", "").lower() == project_name.lower():
-                return col.get("id")
-    elif result.get("success") and result.get("data"):
-        # API returns wrapped response
-        collections = result["data"]
-        for col in collections:
-            if col.get("name", "").lower() == project_name.lower():
-                return col.get("id")
-    
-    # Create new collection
-    create_result = _api_call("/api/collections", method="POST", data={
-        "name": project_name,
-        "description": f"Knowledge base for project: {project_name}"
-    })
-    
-    if isinstance(create_result, dict):
-        # Check for direct ID or wrapped response
-        if create_result.get("id"):
-            return create_result.get("id")
-        if create_result.get("success") and create_result.get("data"):
-            return create_result["data"].get("id")
-    
-    return None
+    return get_kba_client().get_or_create_collection(project_name)
 
 
 def search_project_knowledge(project_name: str, query: str, limit: int = 5) -> list[dict[str, Any]]:
     """Search for relevant notes in a project's collection."""
-    collection_id = get_or_create_collection(project_name)
-    if not collection_id:
-        return []
-    
-    # Try semantic search first
-    from urllib.parse import quote
-    endpoint = f"/api/notes/search?query={quote(query)}&collectionId={collection_id}&limit={limit}"
-    result = _api_call(endpoint)
-    
-    if isinstance(result, list) and len(result) > 0:
-        return result
-    elif isinstance(result, dict) and result.get("data"):
-        return result["data"]
-    
-    # Fallback: list all notes in collection (basic filtering)
-    list_endpoint = f"/api/notes?collectionId={collection_id}&limit={limit}"
-    list_result = _api_call(list_endpoint)
-    
-    if isinstance(list_result, list):
-        # Simple keyword filter on title/content
-        query_lower = query.lower()
-        filtered = [
-            note for note in list_result
-            if query_lower in note.get("title", "").lower()
-            or query_lower in note.get("content", "").lower()
-        ]
-        return filtered[:limit] if filtered else list_result[:limit]
-    
-    return []
+    return get_kba_client().search(project_name, query, limit)
 
 
 def add_project_note(project_name: str, title: str, content: str, tags: list[str] | None = None) -> bool:
     """Add a note to a project's collection."""
-    collection_id = get_or_create_collection(project_name)
-    if not collection_id:
-        return False
-    
-    result = _api_call("/api/notes", method="POST", data={
-        "collectionId": collection_id,
-        "title": title,
-        "content": content,
-        "tags": tags or []
-    })
-    
-    # Check for success in various response formats
-    if isinstance(result, dict):
-        if result.get("id"):
-            return True
-        if result.get("success"):
-            return True
-    
-    return False
+    return get_kba_client().add_note(project_name, title, content, tags)
 
 
 def format_context_for_prompt(notes: list[dict[str, Any]], project_name: str) -> str:
     """Format retrieved notes as context to prepend to prompts."""
     if not notes:
         return ""
-    
+
     lines = [
         f"[Project Knowledge Base: {project_name}]",
         f"Found {len(notes)} relevant notes from previous sessions:",
         ""
     ]
-    
+
     for i, note in enumerate(notes, 1):
         title = note.get("title", "Untitled")
         content = note.get("content", "")
@@ -141,17 +410,17 @@ def format_context_for_prompt(notes: list[dict[str, Any]], project_name: str) ->
         lines.append(f"### {i}. {title}")
         lines.append(content)
         lines.append("")
-    
+
     lines.append("[End Project Knowledge Base]")
     lines.append("")
-    
+
     return "\n".join(lines)
 
 
 def extract_insights_from_output(output: str) -> list[dict[str, str]]:
     """Extract notable insights from agent output for storage."""
     insights = []
-    
+
     # Look for patterns that indicate learnings
     patterns = [
         ("Important:", "important"),
@@ -162,7 +431,7 @@ def extract_insights_from_output(output: str) -> list[dict[str, str]]:
         ("Gotcha:", "gotcha"),
         ("Pattern:", "pattern"),
     ]
-    
+
     lines = output.split("\n")
     for i, line in enumerate(lines):
         for pattern, tag in patterns:
@@ -175,5 +444,5 @@ def extract_insights_from_output(output: str) -> list[dict[str, str]]:
                     "tags": [tag, "auto-captured"]
                 })
                 break
-    
+
     return insights
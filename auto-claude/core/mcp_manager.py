@@ -0,0 +1,493 @@
+"""
+MCP Connection Manager
+======================
+
+Client side of the Model Context Protocol for the direct API engines
+(Gemini, OpenAI-compatible). The Claude SDK engine talks to MCP servers
+itself.
+
+Stdio servers from the engine options ({"command": ..., "args": [...]})
+are spawned once per process and shared by every engine that configures
+the same command, so pooled and parallel sessions reuse the connections:
+
+- Requests are newline-delimited JSON-RPC 2.0 over the server's stdin and
+  stdout; each carries an id, so concurrent calls share one pipe
+- Tool listings are cached per server until the server restarts or sends
+  notifications/tools/list_changed
+- A server that exits is restarted on next use, with exponential backoff
+  while it keeps crashing
+
+Tools are exposed as ``mcp__<server>__<tool>``, the names used in
+allowed_tools. HTTP servers and in-process SDK servers are not supported
+and are skipped.
+"""
+
+import asyncio
+import atexit
+import json
+import logging
+import os
+import signal
+import time
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+MCP_PROTOCOL_VERSION = "2024-11-05"
+
+CLIENT_INFO = {"name": "auto-claude", "version": "1.0.0"}
+
+
+def _get_request_timeout() -> float:
+    """Get the tool call timeout in seconds (AUTO_CLAUDE_MCP_TIMEOUT)."""
+    try:
+        return float(os.environ.get("AUTO_CLAUDE_MCP_TIMEOUT", "120"))
+    except ValueError:
+        return 120.0
+
+
+# Seconds to wait for a tool call / for a server to start and initialize
+REQUEST_TIMEOUT_SECONDS = _get_request_timeout()
+STARTUP_TIMEOUT_SECONDS = 30.0
+
+# Restart backoff after a server exits: 1s, 2s, 4s, ... up to 30s
+RESTART_BACKOFF_SECONDS = 1.0
+MAX_RESTART_BACKOFF_SECONDS = 30.0
+
+# Largest single message read from a server (tool listings can be big)
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024
+
+TOOL_PREFIX = "mcp__"
+
+
+class MCPError(Exception):
+    """An MCP server could not be reached or returned an error."""
+
+
+def qualified_tool_name(server_name: str, tool_name: str) -> str:
+    """Name of an MCP tool as seen by the model (mcp__server__tool)."""
+    return f"{TOOL_PREFIX}{server_name}__{tool_name}"
+
+
+def split_tool_name(name: str) -> tuple[str, str] | None:
+    """Split mcp__server__tool into (server, tool); None for other names."""
+    if not name.startswith(TOOL_PREFIX):
+        return None
+    server, sep, tool = name[len(TOOL_PREFIX) :].partition("__")
+    if not sep or not server or not tool:
+        return None
+    return server, tool
+
+
+def is_stdio_config(config: Any) -> bool:
+    """Whether a server config describes a stdio server we can spawn."""
+    return (
+        isinstance(config, dict)
+        and bool(config.get("command"))
+        and config.get("type", "stdio") == "stdio"
+    )
+
+
+def format_tool_result(result: dict[str, Any]) -> str:
+    """Flatten a tools/call result into the string handed to the model."""
+    parts = []
+    for item in result.get("content") or []:
+        kind = item.get("type")
+        if kind == "text":
+            parts.append(item.get("text", ""))
+        elif kind == "resource":
+            resource = item.get("resource") or {}
+            parts.append(
+                resource.get("text") or f"[resource {resource.get('uri', '')}]"
+            )
+        else:
+            parts.append(f"[{kind} content omitted]")
+    text = "\n".join(parts)
+    if result.get("isError"):
+        return f"Error: {text}"
+    return text
+
+
+class StdioMCPServer:
+    """One spawned MCP server process and its JSON-RPC connection."""
+
+    def __init__(self, name: str, config: dict[str, Any]):
+        """
+        Initialize server handle (the process starts on first use).
+
+        Args:
+            name: Server name from the mcp_servers config
+            config: {"command": str, "args": [...], "env": {...}}
+        """
+        self.name = name
+        self.config = config
+        self.starts = 0
+        self.loop: asyncio.AbstractEventLoop | None = None
+        self._process: asyncio.subprocess.Process | None = None
+        self._reader_task: asyncio.Task | None = None
+        self._pending: dict[int, asyncio.Future] = {}
+        self._next_id = 0
+        self._start_lock: asyncio.Lock | None = None
+        self._write_lock: asyncio.Lock | None = None
+        self._tools: list[dict[str, Any]] | None = None
+        self._crashes = 0
+        self._retry_at = 0.0
+        self._closing = False
+
+    @property
+    def running(self) -> bool:
+        return self._process is not None and self._process.returncode is None
+
+    async def ensure_started(self) -> None:
+        """Start (or restart) the server unless it is running."""
+        if self.running:
+            return
+        if self._start_lock is None:
+            self._start_lock = asyncio.Lock()
+        async with self._start_lock:
+            if self.running:
+                return
+            wait = self._retry_at - time.monotonic()
+            if wait > 0:
+                raise MCPError(
+                    f"MCP server {self.name} exited; restarting in {wait:.1f}s"
+                )
+            try:
+                await asyncio.wait_for(self._start(), STARTUP_TIMEOUT_SECONDS)
+            except Exception as e:
+                self._kill()
+                if self._retry_at <= time.monotonic():
+                    # Not yet recorded by the reader (server still running)
+                    self._record_crash()
+                if isinstance(e, MCPError):
+                    raise
+                raise MCPError(f"MCP server {self.name} failed to start: {e}") from e
+
+    async def _start(self) -> None:
+        command = self.config["command"]
+        args = [str(a) for a in self.config.get("args", [])]
+        env = {**os.environ, **(self.config.get("env") or {})}
+
+        self.loop = asyncio.get_running_loop()
+        self._write_lock = asyncio.Lock()
+        self._tools = None
+        self._closing = False
+        self._process = await asyncio.create_subprocess_exec(
+            command,
+            *args,
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=env,
+            cwd=self.config.get("cwd"),
+            limit=MAX_MESSAGE_BYTES,
+        )
+        self.starts += 1
+        self._reader_task = asyncio.ensure_future(self._read_loop(self._process))
+        logger.debug(f"Started MCP server {self.name} (pid {self._process.pid})")
+
+        await self._request(
+            "initialize",
+            {
+                "protocolVersion": MCP_PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": CLIENT_INFO,
+            },
+        )
+        await self._send({"jsonrpc": "2.0", "method": "notifications/initialized"})
+
+    def _record_crash(self) -> None:
+        self._crashes += 1
+        backoff = RESTART_BACKOFF_SECONDS * 2 ** (self._crashes - 1)
+        self._retry_at = time.monotonic() + min(backoff, MAX_RESTART_BACKOFF_SECONDS)
+
+    async def _read_loop(self, process: asyncio.subprocess.Process) -> None:
+        try:
+            while True:
+                line = await process.stdout.readline()
+                if not line:
+                    break
+                try:
+                    message = json.loads(line)
+                except json.JSONDecodeError:
+                    logger.debug(
+                        f"MCP server {self.name}: ignoring output {line[:200]!r}"
+                    )
+                    continue
+                if isinstance(message, dict):
+                    await self._dispatch(message)
+        except Exception as e:
+            logger.debug(f"MCP server {self.name}: read failed: {e}")
+        finally:
+            if process.returncode is None:
+                process.kill()
+            # A reader cancelled by _kill() no longer owns the connection
+            if self._reader_task is asyncio.current_task():
+                self._reader_task = None
+                self._process = None
+                self._fail_pending(MCPError(f"MCP server {self.name} exited"))
+                if not self._closing:
+                    logger.warning(f"MCP server {self.name} exited unexpectedly")
+                    self._record_crash()
+
+    async def _dispatch(self, message: dict[str, Any]) -> None:
+        method = message.get("method")
+        if method is None:
+            future = self._pending.pop(message.get("id"), None)
+            if future is None or future.done():
+                return
+            if "error" in message:
+                error = message["error"] or {}
+                future.set_exception(
+                    MCPError(f"{self.name}: {error.get('message', 'request failed')}")
+                )
+            else:
+                future.set_result(message.get("result") or {})
+        elif "id" in message:
+            # Requests from the server: answer pings, decline the rest
+            reply: dict[str, Any] = {"jsonrpc": "2.0", "id": message["id"]}
+            if method == "ping":
+                reply["result"] = {}
+            else:
+                reply["error"] = {
+                    "code": -32601,
+                    "message": f"Method not found: {method}",
+                }
+            await self._send(reply)
+        elif method == "notifications/tools/list_changed":
+            self._tools = None
+
+    def _fail_pending(self, error: Exception) -> None:
+        pending, self._pending = self._pending, {}
+        for future in pending.values():
+            if not future.done():
+                future.set_exception(error)
+
+    async def _send(self, message: dict[str, Any]) -> None:
+        process = self._process
+        if process is None or process.stdin is None:
+            raise MCPError(f"MCP server {self.name} is not running")
+        data = json.dumps(message).encode() + b"\n"
+        async with self._write_lock:
+            try:
+                process.stdin.write(data)
+                await process.stdin.drain()
+            except (BrokenPipeError, ConnectionResetError) as e:
+                raise MCPError(f"MCP server {self.name} exited") from e
+
+    async def _request(
+        self,
+        method: str,
+        params: dict[str, Any],
+        timeout: float = REQUEST_TIMEOUT_SECONDS,
+    ) -> dict[str, Any]:
+        self._next_id += 1
+        request_id = self._next_id
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        try:
+            await self._send(
+                {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params}
+            )
+            return await asyncio.wait_for(future, timeout)
+        except asyncio.TimeoutError:
+            raise MCPError(f"MCP server {self.name}: {method} timed out") from None
+        finally:
+            self._pending.pop(request_id, None)
+
+    async def request(self, method: str, params: dict[str, Any]) -> dict[str, Any]:
+        """Send a request, starting the server if needed."""
+        await self.ensure_started()
+        result = await self._request(method, params)
+        self._crashes = 0
+        return result
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        """Tool definitions of this server (cached)."""
+        await self.ensure_started()
+        if self._tools is None:
+            tools: list[dict[str, Any]] = []
+            cursor = None
+            while True:
+                result = await self.request(
+                    "tools/list", {"cursor": cursor} if cursor else {}
+                )
+                tools.extend(result.get("tools") or [])
+                cursor = result.get("nextCursor")
+                if not cursor:
+                    break
+            self._tools = tools
+        return self._tools
+
+    async def call_tool(
+        self, tool_name: str, arguments: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Call a tool and return the raw tools/call result."""
+        return await self.request(
+            "tools/call", {"name": tool_name, "arguments": arguments}
+        )
+
+    def _kill(self) -> None:
+        self._closing = True
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+            self._reader_task = None
+        process, self._process = self._process, None
+        if process is not None and process.returncode is None:
+            try:
+                os.kill(
+                    process.pid,
+                    signal.SIGKILL if hasattr(signal, "SIGKILL") else signal.SIGTERM,
+                )
+            except OSError:
+                pass
+
+    async def stop(self) -> None:
+        """Terminate the server process."""
+        self._closing = True
+        self._fail_pending(MCPError(f"MCP server {self.name} stopped"))
+        process = self._process
+        if process is not None and process.returncode is None:
+            if process.stdin is not None:
+                process.stdin.close()
+            process.terminate()
+            try:
+                await asyncio.wait_for(process.wait(), 5)
+            except asyncio.TimeoutError:
+                pass
+        self._kill()
+
+
+# Process-wide servers: (name, command, args, env) -> server
+_servers: dict[str, StdioMCPServer] = {}
+
+
+def _server_key(name: str, config: dict[str, Any]) -> str:
+    return json.dumps(
+        [name, config.get("command"), config.get("args", []), config.get("env") or {}],
+        sort_keys=True,
+        default=str,
+    )
+
+
+def get_shared_server(name: str, config: dict[str, Any]) -> StdioMCPServer:
+    """
+    Get the process-wide server for a config, creating the handle if needed.
+
+    Servers started under an event loop that has since closed are replaced.
+    """
+    key = _server_key(name, config)
+    server = _servers.get(key)
+    if server is not None and server.loop is not None and server.loop.is_closed():
+        server._kill()
+        server = None
+    if server is None:
+        server = StdioMCPServer(name, config)
+        _servers[key] = server
+    return server
+
+
+@atexit.register
+def _kill_servers() -> None:
+    # Servers live for the whole process; don't leave them orphaned
+    for server in _servers.values():
+        server._kill()
+
+
+async def shutdown_mcp_servers() -> None:
+    """Stop every shared server (e.g. at the end of a build)."""
+    servers = list(_servers.values())
+    _servers.clear()
+    for server in servers:
+        if server.loop is asyncio.get_running_loop():
+            await server.stop()
+        else:
+            server._kill()
+
+
+class MCPManager:
+    """Manages connections to multiple MCP servers."""
+
+    def __init__(self, servers_config: dict[str, Any]):
+        """
+        Initialize manager (servers start on first use).
+
+        Args:
+            servers_config: mcp_servers from AgentOptions
+        """
+        self.configs = servers_config or {}
+        self.clients: dict[str, StdioMCPServer] = {}  # server_name -> server
+        self.tool_map: dict[str, str] = {}  # qualified tool name -> server_name
+        self._initialized = False
+
+    def _server(self, server_name: str) -> StdioMCPServer:
+        config = self.configs.get(server_name)
+        if not is_stdio_config(config):
+            raise MCPError(f"MCP server {server_name} is not a configured stdio server")
+        server = get_shared_server(server_name, config)
+        self.clients[server_name] = server
+        return server
+
+    async def initialize(self):
+        """Connect to all configured stdio MCP servers and discover tools."""
+        if self._initialized:
+            return
+        await self.list_tools()
+        self._initialized = True
+
+    async def list_tools(self) -> list[dict[str, Any]]:
+        """
+        Return the tools of all reachable servers.
+
+        Returns:
+            Dicts with name (mcp__server__tool), server, tool, description
+            and input_schema. Servers that fail to start are skipped.
+        """
+        names = [
+            name for name, config in self.configs.items() if is_stdio_config(config)
+        ]
+        skipped = [name for name in self.configs if name not in names]
+        if skipped:
+            logger.debug(f"Skipping non-stdio MCP servers: {', '.join(skipped)}")
+
+        listings = await asyncio.gather(
+            *(self._server(name).list_tools() for name in names),
+            return_exceptions=True,
+        )
+        tools = []
+        for server_name, listing in zip(names, listings):
+            if isinstance(listing, BaseException):
+                logger.warning(f"MCP server {server_name} unavailable: {listing}")
+                continue
+            for tool in listing:
+                name = qualified_tool_name(server_name, tool["name"])
+                self.tool_map[name] = server_name
+                tools.append(
+                    {
+                        "name": name,
+                        "server": server_name,
+                        "tool": tool["name"],
+                        "description": tool.get("description", ""),
+                        "input_schema": tool.get("inputSchema") or {"type": "object"},
+                    }
+                )
+        return tools
+
+    async def call_tool(
+        self, server_name: str, tool_name: str, arguments: dict[str, Any]
+    ) -> str:
+        """Call a tool on a specific MCP server."""
+        try:
+            result = await self._server(server_name).call_tool(tool_name, arguments)
+        except MCPError as e:
+            return f"Error: {e}"
+        return format_tool_result(result)
+
+    async def call(self, name: str, arguments: dict[str, Any]) -> str:
+        """Call a tool by its qualified mcp__server__tool name."""
+        parts = split_tool_name(name)
+        if parts is None:
+            return f"Error: {name} is not an MCP tool"
+        server_name = self.tool_map.get(name, parts[0])
+        tool_name = name[len(qualified_tool_name(server_name, "")) :]
+        return await self.call_tool(server_name, tool_name, arguments)
@@ -0,0 +1,372 @@
+#!/usr/bin/env python3
+"""
+Hot-Path Profiling
+==================
+
+In-memory timing of the work Auto-Claude does between LLM calls: named,
+nested spans plus counters and histograms, exported per build.
+
+Profiling is off unless enabled with ``--profile`` (which also prints the
+hottest spans at exit) or AUTO_CLAUDE_PROFILE=1. While off, every call below
+returns after a single flag check.
+
+Usage:
+    from core.profiling import profile_span, profiled, profile_count
+
+    with profile_span("merge.detect_conflicts"):
+        ...
+
+    @profiled("analyzer.project_index")
+    def analyze(self): ...
+
+    profile_count("git.calls")
+    profile_observe("llm.ttft.GeminiAgentEngine", elapsed_ms)
+
+Spans opened inside another span (in the same task or thread) are recorded
+under the joined path, e.g. ``merge.task/git.show``, with both total and
+self time: total minus the wall time during which at least one child span
+was open, so children running concurrently (asyncio.gather, worker threads)
+are not counted twice. debug_timer and
+debug_async_timer (core/debug.py) record a span for every decorated call.
+
+At exit the aggregate is written to ``timings.json`` in the spec directory
+given to enable_profiling().
+"""
+
+import asyncio
+import atexit
+import contextvars
+import json
+import os
+import threading
+import time
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from functools import wraps
+from pathlib import Path
+from typing import Any
+
+PROFILE_ENV = "AUTO_CLAUDE_PROFILE"
+TIMINGS_FILE = "timings.json"
+
+# Samples kept per span/histogram for percentiles (most recent)
+MAX_SAMPLES = 2048
+
+_NULL_SPAN = nullcontext()
+
+
+class _Stats:
+    """Running count/total/min/max plus recent samples of one metric."""
+
+    __slots__ = ("count", "total", "self_total", "min", "max", "samples")
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.self_total = 0.0
+        self.min = float("inf")
+        self.max = 0.0
+        self.samples: deque = deque(maxlen=MAX_SAMPLES)
+
+    def add(self, value: float, self_value: float | None = None) -> None:
+        self.count += 1
+        self.total += value
+        self.self_total += value if self_value is None else self_value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.samples.append(value)
+
+    def _percentile(self, ordered: list[float], pct: float) -> float:
+        index = min(len(ordered) - 1, int(round(pct * (len(ordered) - 1))))
+        return ordered[index]
+
+    def to_dict(self, with_self: bool = False) -> dict:
+        ordered = sorted(self.samples)
+        result = {
+            "count": self.count,
+            "total_ms": round(self.total, 3),
+            "mean_ms": round(self.total / self.count, 3) if self.count else 0.0,
+            "min_ms": round(self.min, 3) if self.count else 0.0,
+            "max_ms": round(self.max, 3),
+            "p50_ms": round(self._percentile(ordered, 0.5), 3) if ordered else 0.0,
+            "p95_ms": round(self._percentile(ordered, 0.95), 3) if ordered else 0.0,
+        }
+        if with_self:
+            result["self_ms"] = round(self.self_total, 3)
+        return result
+
+
+class _OpenSpan:
+    """
+    A span on the current task's stack.
+
+    Tracks the wall time covered by its children: the union of their
+    intervals, kept as a count of open children plus the time the current
+    run of overlapping children began.
+    """
+
+    __slots__ = ("path", "open_children", "covered_since", "covered")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.open_children = 0
+        self.covered_since = 0.0
+        self.covered = 0.0
+
+    def child_started(self, now: float) -> None:
+        if self.open_children == 0:
+            self.covered_since = now
+        self.open_children += 1
+
+    def child_finished(self, now: float) -> None:
+        self.open_children -= 1
+        if self.open_children == 0:
+            self.covered += now - self.covered_since
+
+    def covered_until(self, now: float) -> float:
+        """Seconds covered by children, counting any still open up to now."""
+        if self.open_children > 0:
+            return self.covered + (now - self.covered_since)
+        return self.covered
+
+
+_current_span: contextvars.ContextVar[_OpenSpan | None] = contextvars.ContextVar(
+    "auto_claude_profile_span", default=None
+)
+
+
+class Profiler:
+    """Aggregates spans, counters and histograms in memory."""
+
+    def __init__(self):
+        self.enabled = False
+        self.started_at = datetime.now().isoformat()
+        self._lock = threading.Lock()
+        self._spans: dict[str, _Stats] = {}
+        self._counters: dict[str, int] = {}
+        self._histograms: dict[str, _Stats] = {}
+
+    @contextmanager
+    def span(self, name: str) -> Iterator[None]:
+        """Time a block as a span nested under the current one."""
+        parent = _current_span.get()
+        span = _OpenSpan(f"{parent.path}/{name}" if parent else name)
+        token = _current_span.set(span)
+        start = time.perf_counter()
+        if parent is not None:
+            # Siblings may run in other tasks or threads
+            with self._lock:
+                parent.child_started(start)
+        try:
+            yield
+        finally:
+            end = time.perf_counter()
+            _current_span.reset(token)
+            elapsed = (end - start) * 1000
+            with self._lock:
+                if parent is not None:
+                    parent.child_finished(end)
+                children = span.covered_until(end) * 1000
+                stats = self._spans.get(span.path)
+                if stats is None:
+                    stats = self._spans[span.path] = _Stats()
+                stats.add(elapsed, elapsed - children)
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + n
+
+    def observe(self, name: str, value_ms: float) -> None:
+        """Add a sample (milliseconds) to a histogram."""
+        with self._lock:
+            stats = self._histograms.get(name)
+            if stats is None:
+                stats = self._histograms[name] = _Stats()
+            stats.add(value_ms)
+
+    def reset(self) -> None:
+        """Drop everything recorded so far."""
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+            self._histograms.clear()
+            self.started_at = datetime.now().isoformat()
+
+    def snapshot(self) -> dict[str, Any]:
+        """Aggregated timings as a JSON-serializable dict."""
+        with self._lock:
+            return {
+                "started_at": self.started_at,
+                "exported_at": datetime.now().isoformat(),
+                "spans": {
+                    path: stats.to_dict(with_self=True)
+                    for path, stats in sorted(self._spans.items())
+                },
+                "counters": dict(sorted(self._counters.items())),
+                "histograms": {
+                    name: stats.to_dict()
+                    for name, stats in sorted(self._histograms.items())
+                },
+            }
+
+    def hot_spans(self, top: int = 15) -> list[tuple[str, dict]]:
+        """Spans with the most self time, hottest first."""
+        spans = self.snapshot()["spans"]
+        ranked = sorted(
+            spans.items(), key=lambda item: item[1]["self_ms"], reverse=True
+        )
+        return ranked[:top]
+
+    def export(self, path: Path) -> None:
+        """Write the snapshot to path (temp file + rename)."""
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(f".{path.name}.tmp")
+        tmp_path.write_text(json.dumps(self.snapshot(), indent=2))
+        os.replace(tmp_path, path)
+
+
+_profiler = Profiler()
+_profiler.enabled = os.environ.get(PROFILE_ENV, "").lower() in (
+    "true",
+    "1",
+    "yes",
+    "on",
+)
+_exit_hook_registered = False
+_export_dir: Path | None = None
+_print_at_exit = False
+
+
+def get_profiler() -> Profiler:
+    """Get the process-wide profiler."""
+    return _profiler
+
+
+def is_profiling_enabled() -> bool:
+    """Check if profiling is enabled."""
+    return _profiler.enabled
+
+
+def profile_span(name: str):
+    """Context manager timing a block (no-op while profiling is off)."""
+    if not _profiler.enabled:
+        return _NULL_SPAN
+    return _profiler.span(name)
+
+
+def profile_count(name: str, n: int = 1) -> None:
+    """Increment a counter (no-op while profiling is off)."""
+    if _profiler.enabled:
+        _profiler.count(name, n)
+
+
+def profile_observe(name: str, value_ms: float) -> None:
+    """Add a histogram sample in milliseconds (no-op while profiling is off)."""
+    if _profiler.enabled:
+        _profiler.observe(name, value_ms)
+
+
+def profiled(name: str | None = None):
+    """
+    Decorator recording every call of a function (sync or async) as a span.
+
+    Args:
+        name: Span name (default: module.qualname of the function)
+    """
+
+    def decorator(func):
+        span_name = name or f"{func.__module__}.{func.__qualname__}"
+
+        if asyncio.iscoroutinefunction(func):
+
+            @wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not _profiler.enabled:
+                    return await func(*args, **kwargs)
+                with _profiler.span(span_name):
+                    return await func(*args, **kwargs)
+
+            return async_wrapper
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _profiler.enabled:
+                return func(*args, **kwargs)
+            with _profiler.span(span_name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def format_hot_spans(top: int = 15) -> str:
+    """Table of the hottest spans by self time."""
+    rows = _profiler.hot_spans(top)
+    if not rows:
+        return "No profiled spans recorded."
+    width = min(60, max(len(path) for path, _ in rows))
+    lines = [
+        f"{'span':<{width}}  {'calls':>7}  {'self ms':>10}  {'total ms':>10}  {'p95 ms':>9}"
+    ]
+    for path, stats in rows:
+        label = path if len(path) <= width else "..." + path[-(width - 3) :]
+        lines.append(
+            f"{label:<{width}}  {stats['count']:>7}  {stats['self_ms']:>10.1f}  "
+            f"{stats['total_ms']:>10.1f}  {stats['p95_ms']:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def export_timings(spec_dir: Path) -> Path | None:
+    """
+    Write timings.json to a spec directory.
+
+    Returns:
+        Path written, or None if profiling is off or the write failed
+    """
+    if not _profiler.enabled:
+        return None
+    path = Path(spec_dir) / TIMINGS_FILE
+    try:
+        _profiler.export(path)
+    except OSError:
+        return None
+    return path
+
+
+def _at_exit() -> None:
+    if _export_dir is not None:
+        path = export_timings(_export_dir)
+        if path and _print_at_exit:
+            print(f"\nTimings written to {path}")
+    if _print_at_exit:
+        print("\nHot spans (by self time):")
+        print(format_hot_spans())
+
+
+def enable_profiling(spec_dir: Path | None = None, print_at_exit: bool = False) -> None:
+    """
+    Turn profiling on for the rest of the process.
+
+    Args:
+        spec_dir: Spec directory to write timings.json to at exit
+        print_at_exit: Print the hottest spans at exit (--profile)
+    """
+    global _exit_hook_registered, _export_dir, _print_at_exit
+    _profiler.enabled = True
+    if spec_dir is not None:
+        _export_dir = Path(spec_dir)
+    _print_at_exit = _print_at_exit or print_at_exit
+    if not _exit_hook_registered:
+        atexit.register(_at_exit)
+        _exit_hook_registered = True
+
+
+def disable_profiling() -> None:
+    """Turn profiling off (recorded data is kept until reset)."""
+    _profiler.enabled = False
@@ -6,12 +6,18 @@ Functions for tracking and displaying progress of the autonomous coding agent.
 Uses subtask-based implementation plans (implementation_plan.json).
 
 Enhanced with colored output, icons, and better visual formatting.
+
+The plan is read through the shared PlanStore, so the many calls per coder
+iteration parse implementation_plan.json only when it has changed, and
+(except for get_next_subtask) handled as a typed ImplementationPlan.
 """
 
-import json
+import copy
 from pathlib import Path
 from typing import Optional
 
+from implementation_plan import SubtaskStatus
+from implementation_plan.store import get_plan_store
 from ui import (
     Icons,
     bold,
@@ -37,27 +43,19 @@ def count_subtasks(spec_dir: Path) -> tuple[int, int]:
     Returns:
         (completed_count, total_count)
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
+    plan = get_plan_store(spec_dir).plan()
+    if plan is None:
         return 0, 0
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
+    total = 0
+    completed = 0
 
-        total = 0
-        completed = 0
+    for phase in plan.phases:
+        done, count = phase.get_progress()
+        completed += done
+        total += count
 
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                total += 1
-                if subtask.get("status") == "completed":
-                    completed += 1
-
-        return completed, total
-    except (OSError, json.JSONDecodeError):
-        return 0, 0
+    return completed, total
 
 
 def count_subtasks_detailed(spec_dir: Path) -> dict:
@@ -67,8 +65,6 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
     Returns:
         Dict with completed, in_progress, pending, failed counts
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
     result = {
         "completed": 0,
         "in_progress": 0,
@@ -77,25 +73,20 @@ def count_subtasks_detailed(spec_dir: Path) -> dict:
         "total": 0,
     }
 
-    if not plan_file.exists():
+    plan = get_plan_store(spec_dir).plan()
+    if plan is None:
         return result
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
+    for phase in plan.phases:
+        for subtask in phase.subtasks:
+            result["total"] += 1
+            status = subtask.status.value
+            if status in result:
+                result[status] += 1
+            else:
+                result["pending"] += 1
 
-        for phase in plan.get("phases", []):
-            for subtask in phase.get("subtasks", []):
-                result["total"] += 1
-                status = subtask.get("status", "pending")
-                if status in result:
-                    result[status] += 1
-                else:
-                    result["pending"] += 1
-
-        return result
-    except (OSError, json.JSONDecodeError):
-        return result
+    return result
 
 
 def is_build_complete(spec_dir: Path) -> bool:
@@ -166,9 +157,10 @@ def print_session_header(
 
 def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
     """Print a summary of current progress with enhanced formatting."""
+    plan = get_plan_store(spec_dir).plan()
     completed, total = count_subtasks(spec_dir)
 
-    if total > 0:
+    if plan is not None and total > 0:
         print()
         # Progress bar
         print(f"Progress: {progress_bar(completed, total, width=40)}")
@@ -181,57 +173,41 @@ def print_progress_summary(spec_dir: Path, show_next: bool = True) -> None:
             print_status(f"{remaining} subtasks remaining", "info")
 
         # Phase summary
-        try:
-            with open(spec_dir / "implementation_plan.json") as f:
-                plan = json.load(f)
-
-            print("\nPhases:")
-            for phase in plan.get("phases", []):
-                phase_subtasks = phase.get("subtasks", [])
-                phase_completed = sum(
-                    1 for s in phase_subtasks if s.get("status") == "completed"
+        print("\nPhases:")
+        for phase in plan.phases:
+            phase_completed, phase_total = phase.get_progress()
+
+            if phase_completed == phase_total:
+                status = "complete"
+            elif phase_completed > 0 or any(
+                s.status == SubtaskStatus.IN_PROGRESS for s in phase.subtasks
+            ):
+                status = "in_progress"
+            else:
+                # Check if blocked by dependencies
+                all_deps_complete = True
+                for dep_id in phase.depends_on:
+                    for p in plan.phases:
+                        if p.id == dep_id or p.phase == dep_id:
+                            if not p.is_complete():
+                                all_deps_complete = False
+                            break
+                status = "pending" if all_deps_complete else "blocked"
+
+            print_phase_status(phase.name, phase_completed, phase_total, status)
+
+        # Show next subtask if requested
+        if show_next and completed < total:
+            next_subtask = get_next_subtask(spec_dir)
+            if next_subtask:
+                print()
+                next_id = next_subtask.get("id", "unknown")
+                next_desc = next_subtask.get("description", "")
+                if len(next_desc) > 60:
+                    next_desc = next_desc[:57] + "..."
+                print(
+                    f"  {icon(Icons.ARROW_RIGHT)} Next: {highlight(next_id)} - {next_desc}"
                 )
-                phase_total = len(phase_subtasks)
-                phase_name = phase.get("name", phase.get("id", "Unknown"))
-
-                if phase_completed == phase_total:
-                    status = "complete"
-                elif phase_completed > 0 or any(
-                    s.get("status") == "in_progress" for s in phase_subtasks
-                ):
-                    status = "in_progress"
-                else:
-                    # Check if blocked by dependencies
-                    deps = phase.get("depends_on", [])
-                    all_deps_complete = True
-                    for dep_id in deps:
-                        for p in plan.get("phases", []):
-                            if p.get("id") == dep_id or p.get("phase") == dep_id:
-                                p_subtasks = p.get("subtasks", [])
-                                if not all(
-                                    s.get("status") == "completed" for s in p_subtasks
-                                ):
-                                    all_deps_complete = False
-                                break
-                    status = "pending" if all_deps_complete else "blocked"
-
-                print_phase_status(phase_name, phase_completed, phase_total, status)
-
-            # Show next subtask if requested
-            if show_next and completed < total:
-                next_subtask = get_next_subtask(spec_dir)
-                if next_subtask:
-                    print()
-                    next_id = next_subtask.get("id", "unknown")
-                    next_desc = next_subtask.get("description", "")
-                    if len(next_desc) > 60:
-                        next_desc = next_desc[:57] + "..."
-                    print(
-                        f"  {icon(Icons.ARROW_RIGHT)} Next: {highlight(next_id)} - {next_desc}"
-                    )
-
-        except (OSError, json.JSONDecodeError):
-            pass
     else:
         print()
         print_status("No implementation subtasks yet - planner needs to run", "pending")
@@ -287,9 +263,9 @@ def get_plan_summary(spec_dir: Path) -> dict:
     Returns:
         Dictionary with plan statistics
     """
-    plan_file = spec_dir / "implementation_plan.json"
+    plan = get_plan_store(spec_dir).plan()
 
-    if not plan_file.exists():
+    if plan is None:
         return {
             "workflow_type": None,
             "total_phases": 0,
@@ -301,103 +277,76 @@ def get_plan_summary(spec_dir: Path) -> dict:
             "phases": [],
         }
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
+    summary = {
+        "workflow_type": plan.workflow_type.value,
+        "total_phases": len(plan.phases),
+        "total_subtasks": 0,
+        "completed_subtasks": 0,
+        "pending_subtasks": 0,
+        "in_progress_subtasks": 0,
+        "failed_subtasks": 0,
+        "phases": [],
+    }
 
-        summary = {
-            "workflow_type": plan.get("workflow_type"),
-            "total_phases": len(plan.get("phases", [])),
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
+    for phase in plan.phases:
+        phase_info = {
+            "id": phase.id,
+            "phase": phase.phase,
+            "name": phase.name,
+            "depends_on": list(phase.depends_on),
+            "subtasks": [],
+            "completed": 0,
+            "total": 0,
         }
 
-        for phase in plan.get("phases", []):
-            phase_info = {
-                "id": phase.get("id"),
-                "phase": phase.get("phase"),
-                "name": phase.get("name"),
-                "depends_on": phase.get("depends_on", []),
-                "subtasks": [],
-                "completed": 0,
-                "total": 0,
-            }
+        for subtask in phase.subtasks:
+            status = subtask.status.value
+            summary["total_subtasks"] += 1
+            phase_info["total"] += 1
+
+            if status == "completed":
+                summary["completed_subtasks"] += 1
+                phase_info["completed"] += 1
+            elif status == "in_progress":
+                summary["in_progress_subtasks"] += 1
+            elif status == "failed":
+                summary["failed_subtasks"] += 1
+            else:
+                summary["pending_subtasks"] += 1
+
+            phase_info["subtasks"].append(
+                {
+                    "id": subtask.id,
+                    "description": subtask.description,
+                    "status": status,
+                    "service": subtask.service,
+                }
+            )
 
-            for subtask in phase.get("subtasks", []):
-                status = subtask.get("status", "pending")
-                summary["total_subtasks"] += 1
-                phase_info["total"] += 1
-
-                if status == "completed":
-                    summary["completed_subtasks"] += 1
-                    phase_info["completed"] += 1
-                elif status == "in_progress":
-                    summary["in_progress_subtasks"] += 1
-                elif status == "failed":
-                    summary["failed_subtasks"] += 1
-                else:
-                    summary["pending_subtasks"] += 1
-
-                phase_info["subtasks"].append(
-                    {
-                        "id": subtask.get("id"),
-                        "description": subtask.get("description"),
-                        "status": status,
-                        "service": subtask.get("service"),
-                    }
-                )
+        summary["phases"].append(phase_info)
 
-            summary["phases"].append(phase_info)
-
-        return summary
-
-    except (OSError, json.JSONDecodeError):
-        return {
-            "workflow_type": None,
-            "total_phases": 0,
-            "total_subtasks": 0,
-            "completed_subtasks": 0,
-            "pending_subtasks": 0,
-            "in_progress_subtasks": 0,
-            "failed_subtasks": 0,
-            "phases": [],
-        }
+    return summary
 
 
 def get_current_phase(spec_dir: Path) -> Optional[dict]:
     """Get the current phase being worked on."""
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
+    plan = get_plan_store(spec_dir).plan()
+    if plan is None:
         return None
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
-
-        for phase in plan.get("phases", []):
-            subtasks = phase.get("subtasks", [])
-            # Phase is current if it has incomplete subtasks and dependencies are met
-            has_incomplete = any(s.get("status") != "completed" for s in subtasks)
-            if has_incomplete:
-                return {
-                    "id": phase.get("id"),
-                    "phase": phase.get("phase"),
-                    "name": phase.get("name"),
-                    "completed": sum(
-                        1 for s in subtasks if s.get("status") == "completed"
-                    ),
-                    "total": len(subtasks),
-                }
-
-        return None
+    for phase in plan.phases:
+        # Phase is current if it has incomplete subtasks and dependencies are met
+        if not phase.is_complete():
+            completed, total = phase.get_progress()
+            return {
+                "id": phase.id,
+                "phase": phase.phase,
+                "name": phase.name,
+                "completed": completed,
+                "total": total,
+            }
 
-    except (OSError, json.JSONDecodeError):
-        return None
+    return None
 
 
 def get_next_subtask(spec_dir: Path) -> Optional[dict]:
@@ -410,50 +359,43 @@ def get_next_subtask(spec_dir: Path) -> Optional[dict]:
     Returns:
         The next subtask dict to work on, or None if all complete
     """
-    plan_file = spec_dir / "implementation_plan.json"
-
-    if not plan_file.exists():
+    # Raw dict, not the typed plan: the subtask is handed to the coder
+    # prompt with every field the planner wrote, not just the modelled ones
+    plan = get_plan_store(spec_dir).read()
+    if plan is None:
         return None
 
-    try:
-        with open(plan_file) as f:
-            plan = json.load(f)
-
-        phases = plan.get("phases", [])
-
-        # Build a map of phase completion
-        phase_complete = {}
-        for phase in phases:
-            phase_id = phase.get("id") or phase.get("phase")
-            subtasks = phase.get("subtasks", [])
-            phase_complete[phase_id] = all(
-                s.get("status") == "completed" for s in subtasks
-            )
-
-        # Find next available subtask
-        for phase in phases:
-            phase_id = phase.get("id") or phase.get("phase")
-            depends_on = phase.get("depends_on", [])
-
-            # Check if dependencies are satisfied
-            deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
-            if not deps_satisfied:
-                continue
-
-            # Find first pending subtask in this phase
-            for subtask in phase.get("subtasks", []):
-                if subtask.get("status") == "pending":
-                    return {
-                        "phase_id": phase_id,
-                        "phase_name": phase.get("name"),
-                        "phase_num": phase.get("phase"),
-                        **subtask,
-                    }
-
-        return None
+    phases = plan.get("phases", [])
+
+    # Build a map of phase completion
+    phase_complete = {}
+    for phase in phases:
+        phase_id = phase.get("id") or phase.get("phase")
+        subtasks = phase.get("subtasks", [])
+        phase_complete[phase_id] = all(s.get("status") == "completed" for s in subtasks)
+
+    # Find next available subtask
+    for phase in phases:
+        phase_id = phase.get("id") or phase.get("phase")
+        depends_on = phase.get("depends_on", [])
+
+        # Check if dependencies are satisfied
+        deps_satisfied = all(phase_complete.get(dep, False) for dep in depends_on)
+        if not deps_satisfied:
+            continue
+
+        # Find first pending subtask in this phase
+        for subtask in phase.get("subtasks", []):
+            if subtask.get("status") == "pending":
+                # Copy: the cached plan is shared with other readers
+                return {
+                    "phase_id": phase_id,
+                    "phase_name": phase.get("name"),
+                    "phase_num": phase.get("phase"),
+                    **copy.deepcopy(subtask),
+                }
 
-    except (OSError, json.JSONDecodeError):
-        return None
+    return None
 
 
 def format_duration(seconds: float) -> str:
@@ -7,8 +7,6 @@ Compatible with direct LLM integrations (e.g., Gemini API).
 """
 
 import os
-import re
-import fnmatch
 import subprocess
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
@@ -69,34 +67,17 @@ def edit_file(file_path: Union[str, Path], target_content: str, replacement_cont
 
 
 def glob_files(pattern: str, root_dir: Union[str, Path] = ".") -> List[str]:
-    """Search for files matching a pattern."""
-    root = Path(root_dir)
-    matches = []
-    for p in root.rglob(pattern):
-        if p.is_file():
-            matches.append(str(p.relative_to(root)))
-    return matches
+    """Search for files matching a pattern (skips SKIP_DIRS and .gitignored files)."""
+    from .search import search_glob
+
+    return search_glob(pattern, root_dir)
 
 
 def grep_files(query: str, pattern: str = "*", root_dir: Union[str, Path] = ".") -> str:
-    """Search for a string in files matching a pattern."""
-    root = Path(root_dir)
-    results = []
-    
-    # Use re.escape for literal search, or pass as is for regex
-    regex = re.compile(query, re.IGNORECASE)
-    
-    for p in root.rglob(pattern):
-        if p.is_file():
-            try:
-                with open(p, 'r', encoding='utf-8') as f:
-                    for i, line in enumerate(f, 1):
-                        if regex.search(line):
-                            results.append(f"{p.relative_to(root)}:{i}: {line.strip()}")
-            except (UnicodeDecodeError, PermissionError):
-                continue
-                
-    return "\n".join(results) if results else "No matches found."
+    """Search for a string in files matching a pattern (capped, skips binaries)."""
+    from .search import search_grep
+
+    return search_grep(query, pattern, root_dir)
 
 
 def execute_bash(command: str, cwd: Optional[str] = None) -> str:
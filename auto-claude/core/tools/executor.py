@@ -0,0 +1,241 @@
+"""
+Tool Executor
+=============
+
+Runs the built-in tool calls of one model turn for the direct API engines
+(Gemini, OpenAI-compatible).
+
+Models often emit several independent calls per turn (e.g. six Read/Grep
+calls). Calls run in a thread pool, off the event loop, and concurrently
+unless they conflict:
+
+- Read touches one path; Glob/Grep read the whole tree
+- Write/Edit modify one path; Bash may modify anything
+- A call waits for every earlier call in the turn whose footprint conflicts
+  with its own (at least one of the two writes what the other touches)
+
+So reads run in parallel, writes to the same path keep their order, and Bash
+runs alone, exactly as if the turn had been executed sequentially.
+
+MCP tools (mcp__server__tool) are sent to the engine's MCPManager on the
+event loop; calls to the same server keep their order.
+
+Results are yielded as they complete; each carries its index in the turn so
+callers can keep conversation history in call order.
+"""
+
+import asyncio
+import os
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from ..mcp_manager import split_tool_name
+from .builtin import (
+    edit_file,
+    execute_bash,
+    glob_files,
+    grep_files,
+    read_file,
+    write_file,
+)
+
+
+def _get_max_tool_workers() -> int:
+    """Get the tool-call concurrency cap (AUTO_CLAUDE_TOOL_WORKERS, >= 1)."""
+    try:
+        return max(1, int(os.environ.get("AUTO_CLAUDE_TOOL_WORKERS", "8")))
+    except ValueError:
+        return 8
+
+
+# Maximum number of tool calls running at once
+MAX_TOOL_WORKERS = _get_max_tool_workers()
+
+# Footprint marker for "the whole tree"
+_ALL = frozenset({"*"})
+
+
+@dataclass
+class ToolCall:
+    """A single tool call requested by the model."""
+
+    id: str
+    name: str
+    args: dict[str, Any]
+
+
+@dataclass
+class ToolCallResult:
+    """Outcome of a tool call, tagged with its position in the turn."""
+
+    index: int
+    call: ToolCall
+    result: Any
+    is_error: bool = False
+
+
+@dataclass
+class _Footprint:
+    reads: frozenset[str]
+    writes: frozenset[str]
+
+    def conflicts_with(self, other: "_Footprint") -> bool:
+        return _overlaps(self.writes, other.reads | other.writes) or _overlaps(
+            other.writes, self.reads
+        )
+
+
+def _overlaps(a: frozenset[str], b: frozenset[str]) -> bool:
+    if not a or not b:
+        return False
+    return "*" in a or "*" in b or not a.isdisjoint(b)
+
+
+class ToolExecutor:
+    """Executes a turn's tool calls concurrently where that is safe."""
+
+    def __init__(
+        self,
+        cwd: Optional[str] = None,
+        max_workers: int = MAX_TOOL_WORKERS,
+        mcp_manager: Optional[Any] = None,
+    ):
+        """
+        Initialize executor.
+
+        Args:
+            cwd: Working directory tools resolve relative paths against
+            max_workers: Maximum concurrently running calls
+            mcp_manager: core.mcp_manager.MCPManager for mcp__ tools
+        """
+        self.cwd = cwd
+        self.max_workers = max(1, max_workers)
+        self.mcp_manager = mcp_manager
+        self._pool: Optional[ThreadPoolExecutor] = None
+
+    @property
+    def _root(self) -> Path:
+        return Path(self.cwd) if self.cwd else Path.cwd()
+
+    def _resolve_path(self, file_path: Any) -> Any:
+        try:
+            fp = Path(file_path)
+            if not fp.is_absolute():
+                return str(self._root / fp)
+        except Exception:
+            pass  # Let tool handle invalid paths
+        return file_path
+
+    def prepare(self, call: ToolCall) -> Callable[[], Any]:
+        """
+        Resolve a call to a zero-argument function running the tool.
+
+        Relative file paths are resolved against cwd, and Glob/Grep default
+        to searching from cwd. MCP calls are awaited in run() instead.
+        """
+        if self._is_mcp(call):
+            return lambda: None
+        name = call.name
+        args = dict(call.args)
+        if "file_path" in args:
+            args["file_path"] = self._resolve_path(args["file_path"])
+        call.args = args
+
+        if name == "Read":
+            return lambda: read_file(**args)
+        if name == "Write":
+            return lambda: write_file(**args)
+        if name == "Edit":
+            return lambda: edit_file(**args)
+        if name in ("Glob", "Grep"):
+            args.setdefault("root_dir", str(self._root))
+            tool = glob_files if name == "Glob" else grep_files
+            return lambda: tool(**args)
+        if name == "Bash":
+            return lambda: execute_bash(command=args.get("command"), cwd=self.cwd)
+        return lambda: f"Error: Tool {name} not implemented."
+
+    def _is_mcp(self, call: ToolCall) -> bool:
+        return self.mcp_manager is not None and split_tool_name(call.name) is not None
+
+    def footprint(self, call: ToolCall) -> _Footprint:
+        """What a (prepared) call reads and writes."""
+        if self._is_mcp(call):
+            # Side effects live in the server (browser, memory, ...)
+            server = split_tool_name(call.name)[0]
+            return _Footprint(reads=frozenset(), writes=frozenset({f"mcp:{server}"}))
+        path = call.args.get("file_path")
+        key = frozenset({os.path.normpath(str(path))}) if path else _ALL
+        if call.name == "Read":
+            return _Footprint(reads=key, writes=frozenset())
+        if call.name in ("Write", "Edit"):
+            return _Footprint(reads=frozenset(), writes=key)
+        if call.name in ("Glob", "Grep"):
+            return _Footprint(reads=_ALL, writes=frozenset())
+        if call.name == "Bash":
+            return _Footprint(reads=_ALL, writes=_ALL)
+        # Unknown tools only produce an error message
+        return _Footprint(reads=frozenset(), writes=frozenset())
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        if self._pool is None:
+            self._pool = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="agent-tool"
+            )
+        return self._pool
+
+    async def run(self, calls: list[ToolCall]) -> AsyncIterator[ToolCallResult]:
+        """
+        Execute calls, yielding each result as soon as it completes.
+
+        Args:
+            calls: Tool calls in the order the model emitted them
+
+        Yields:
+            ToolCallResult per call, in completion order
+        """
+        loop = asyncio.get_running_loop()
+        pool = self._get_pool()
+        prepared = [(call, self.prepare(call)) for call in calls]
+        footprints = [self.footprint(call) for call, _ in prepared]
+        tasks: list[asyncio.Task] = []
+
+        async def run_one(index: int, deps: list[asyncio.Task]) -> ToolCallResult:
+            if deps:
+                await asyncio.wait(deps)
+            call, func = prepared[index]
+            try:
+                if self._is_mcp(call):
+                    result = await self.mcp_manager.call(call.name, call.args)
+                else:
+                    result = await loop.run_in_executor(pool, func)
+                return ToolCallResult(index, call, result)
+            except Exception as e:
+                return ToolCallResult(
+                    index, call, f"Error: Tool {call.name} failed: {e}", is_error=True
+                )
+
+        for index, fp in enumerate(footprints):
+            deps = [
+                tasks[earlier]
+                for earlier in range(index)
+                if fp.conflicts_with(footprints[earlier])
+            ]
+            tasks.append(asyncio.ensure_future(run_one(index, deps)))
+
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # Consumer stopped early: don't leave queued calls behind
+            for task in tasks:
+                task.cancel()
+
+    def shutdown(self) -> None:
+        """Release the worker threads (running calls finish in background)."""
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
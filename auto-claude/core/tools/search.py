@@ -0,0 +1,494 @@
+"""
+File Search
+===========
+
+Search engine behind the built-in Glob and Grep tools used by the direct API
+engines (Gemini, OpenAI-compatible).
+
+- File listing honours .gitignore: ``git ls-files`` inside a git checkout,
+  otherwise a parallel directory walk that applies the root .gitignore.
+  Either way SKIP_DIRS (shared with the project analyzers) is pruned.
+- Grep skips binary files (NUL byte in the first block), scans large files
+  through mmap, and only decodes the lines that match. Literal queries use a
+  plain substring check before any regex runs. Files are scanned in a thread
+  pool, in path order, so output is deterministic.
+- When the project has a context search index (.auto-claude/context_index/)
+  and the query is a plain identifier, files the index proves cannot match
+  are not read at all. The loaded index is reused until it is rewritten.
+- Results are capped (MAX_GLOB_RESULTS / MAX_GREP_MATCHES) with a
+  truncation notice.
+"""
+
+import logging
+import mmap
+import os
+import re
+import subprocess
+import threading
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from pathlib import Path
+from re import Pattern
+
+from project.file_inventory import SKIP_DIRS, match_glob_parts
+
+logger = logging.getLogger(__name__)
+
+# Result caps
+MAX_GLOB_RESULTS = 1000
+MAX_GREP_MATCHES = 500
+MAX_LINE_CHARS = 300
+
+# Files at least this large are scanned through mmap instead of read()
+MMAP_THRESHOLD_BYTES = 1024 * 1024
+
+# Files larger than this are not searched
+MAX_GREP_FILE_BYTES = 64 * 1024 * 1024
+
+# Bytes inspected for a NUL byte to detect binary files
+BINARY_SNIFF_BYTES = 8192
+
+# Threads used to walk directories and scan files
+SEARCH_WORKERS = min(8, (os.cpu_count() or 1) + 4)
+
+# Files scanned per batch (results are collected in path order per batch)
+GREP_BATCH_SIZE = 64
+
+_SKIP_NAMES = frozenset(d for d in SKIP_DIRS if "*" not in d)
+_SKIP_PATTERNS = tuple(d for d in SKIP_DIRS if "*" in d)
+_REGEX_META = frozenset(".^$*+?{}[]\\|()")
+
+
+# Loaded context search indexes by project directory (see _find_search_index)
+_index_cache: dict[Path, tuple[tuple[int, int], object]] = {}
+_index_cache_lock = threading.Lock()
+
+
+def _skip_dir(name: str) -> bool:
+    return name in _SKIP_NAMES or any(fnmatchcase(name, p) for p in _SKIP_PATTERNS)
+
+
+def _path_key(rel: str) -> list[str]:
+    return rel.split("/")
+
+
+# =============================================================================
+# FILE LISTING
+# =============================================================================
+
+
+class _GitIgnore:
+    """Minimal matcher for a root .gitignore (used when git is unavailable)."""
+
+    def __init__(self, root: Path):
+        self._rules: list[tuple[bool, list[str]]] = []
+        try:
+            lines = (root / ".gitignore").read_text(errors="ignore").splitlines()
+        except OSError:
+            return
+        for line in lines:
+            line = line.strip()
+            if not line or line.startswith("#") or line.startswith("!"):
+                continue
+            dir_only = line.endswith("/")
+            line = line.strip("/")
+            # Patterns containing a slash are anchored at the root
+            parts = line.split("/") if "/" in line else ["**", line]
+            self._rules.append((dir_only, parts))
+
+    def ignored(self, rel: str, is_dir: bool) -> bool:
+        parts = rel.split("/")
+        for dir_only, pattern in self._rules:
+            if dir_only and not is_dir:
+                continue
+            if match_glob_parts(pattern, parts):
+                return True
+        return False
+
+
+def _git_files(root: Path) -> list[str] | None:
+    """Tracked and untracked, non-ignored files under root (None if not a git checkout)."""
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root,
+            capture_output=True,
+            timeout=30,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    if result.returncode != 0:
+        return None
+    files = []
+    seen = set()
+    for raw in result.stdout.split(b"\0"):
+        if not raw:
+            continue
+        rel = raw.decode("utf-8", errors="surrogateescape")
+        if rel in seen or any(_skip_dir(part) for part in rel.split("/")[:-1]):
+            continue
+        seen.add(rel)
+        files.append(rel)
+    return files
+
+
+def _walk_subtree(root: str, rel_dir: str, ignore: _GitIgnore) -> list[str]:
+    files = []
+    stack = [rel_dir]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(os.path.join(root, current)) as it:
+                entries = list(it)
+        except OSError:
+            continue
+        for entry in entries:
+            rel = f"{current}/{entry.name}"
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if not _skip_dir(entry.name) and not ignore.ignored(rel, True):
+                        stack.append(rel)
+                elif entry.is_file() and not ignore.ignored(rel, False):
+                    files.append(rel)
+            except OSError:
+                continue
+    return files
+
+
+def _walk_files(root: Path, workers: int = SEARCH_WORKERS) -> list[str]:
+    """Walk root with top-level directories walked in parallel."""
+    ignore = _GitIgnore(root)
+    files: list[str] = []
+    subdirs: list[str] = []
+    try:
+        with os.scandir(root) as it:
+            entries = list(it)
+    except OSError:
+        return []
+    for entry in entries:
+        try:
+            if entry.is_dir(follow_symlinks=False):
+                if not _skip_dir(entry.name) and not ignore.ignored(entry.name, True):
+                    subdirs.append(entry.name)
+            elif entry.is_file() and not ignore.ignored(entry.name, False):
+                files.append(entry.name)
+        except OSError:
+            continue
+
+    if len(subdirs) <= 1 or workers <= 1:
+        for rel_dir in subdirs:
+            files.extend(_walk_subtree(str(root), rel_dir, ignore))
+    else:
+        with ThreadPoolExecutor(max_workers=min(workers, len(subdirs))) as pool:
+            for subtree in pool.map(
+                lambda d: _walk_subtree(str(root), d, ignore), subdirs
+            ):
+                files.extend(subtree)
+    return files
+
+
+def list_files(root: str | Path) -> list[str]:
+    """
+    List searchable files under root.
+
+    Args:
+        root: Directory to list
+
+    Returns:
+        POSIX paths relative to root, sorted
+    """
+    root = Path(root)
+    files = _git_files(root)
+    if files is None:
+        files = _walk_files(root)
+    files.sort(key=_path_key)
+    return files
+
+
+def _glob_predicate(pattern: str) -> Callable[[str], bool]:
+    """Predicate matching rel paths like ``Path.rglob(pattern)``."""
+    parts = [p for p in pattern.split("/") if p not in ("", ".")]
+    if not parts or parts == ["**"]:
+        return lambda rel: True
+    if len(parts) == 1:
+        name = parts[0]
+        return lambda rel: fnmatchcase(rel.rpartition("/")[2], name)
+    full = ["**"] + parts
+    return lambda rel: match_glob_parts(full, rel.split("/"))
+
+
+def search_glob(
+    pattern: str, root: str | Path = ".", max_results: int = MAX_GLOB_RESULTS
+) -> list[str]:
+    """
+    Find files matching a pattern at any depth (like ``Path.rglob``).
+
+    Args:
+        pattern: Glob pattern, e.g. "*.py" or "src/**/test_*.py"
+        root: Directory to search
+        max_results: Maximum paths returned
+
+    Returns:
+        Matching paths relative to root, sorted; a final truncation notice
+        is appended when more than max_results matched
+    """
+    root = Path(root)
+    matches = _glob_predicate(pattern)
+    found = [
+        str(Path(rel))
+        for rel in list_files(root)
+        if matches(rel) and os.path.isfile(os.path.join(root, rel))
+    ]
+    if len(found) > max_results:
+        extra = len(found) - max_results
+        found = found[:max_results]
+        found.append(
+            f"[... {extra} more files not shown; use a more specific pattern ...]"
+        )
+    return found
+
+
+# =============================================================================
+# GREP
+# =============================================================================
+
+
+def _bytes_safe(query: str) -> bool:
+    """
+    Check whether a query means the same on raw UTF-8 bytes as on text.
+
+    Only ASCII queries made of literals, anchors, groups, alternation and
+    quantifiers qualify. ``.``, character classes and escapes such as ``\\w``
+    or ``\\b`` match single bytes (or only ASCII) in bytes mode and would miss
+    lines with multi-byte characters; ``$`` must also match before CRLF line
+    endings, which only the per-line scan does.
+    """
+    if not query.isascii():
+        return False
+    escaped = False
+    for char in query:
+        if escaped:
+            # \. is a literal; \w, \b, \d, \x.., \1 ... are not byte-safe
+            if char.isalnum():
+                return False
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in ".[$":
+            return False
+    return True
+
+
+class _Matcher:
+    """Compiled query: file-level prefilter plus per-line verification."""
+
+    def __init__(self, query: str):
+        self.line_regex: Pattern[str] = re.compile(query, re.IGNORECASE)
+        self.literal = not (_REGEX_META & set(query))
+        self.buffer_regex: Pattern[bytes] | None = None
+        self.needle: bytes | None = None
+        if _bytes_safe(query):
+            try:
+                self.buffer_regex = re.compile(
+                    query.encode(), re.IGNORECASE | re.MULTILINE
+                )
+            except re.error:
+                self.buffer_regex = None
+            if self.buffer_regex is not None and self.literal and query:
+                self.needle = query.lower().encode()
+
+    def might_match(self, data: bytes | mmap.mmap) -> bool:
+        if self.needle is not None and isinstance(data, bytes):
+            return self.needle in data.lower()
+        if self.buffer_regex is not None:
+            return self.buffer_regex.search(data) is not None
+        return True
+
+    def matching_lines(
+        self, data: bytes | mmap.mmap, limit: int
+    ) -> list[tuple[int, str]]:
+        if self.buffer_regex is None:
+            return self._scan_decoded(data, limit)
+
+        results = []
+        pos = 0
+        line_no = 1
+        counted_to = 0
+        size = len(data)
+        while pos < size and len(results) < limit:
+            found = self.buffer_regex.search(data, pos)
+            if found is None:
+                break
+            start = data.rfind(b"\n", 0, found.start()) + 1
+            end = data.find(b"\n", found.start())
+            if end == -1:
+                end = size
+            # mmap has no count(); slicing copies only the skipped region
+            line_no += data[counted_to:start].count(b"\n")
+            counted_to = start
+            # A buffer match may span lines; confirm it on the line itself
+            line = bytes(data[start:end]).decode("utf-8", errors="replace").rstrip("\r")
+            if self.line_regex.search(line):
+                results.append((line_no, line))
+            pos = end + 1
+        return results
+
+    def _scan_decoded(
+        self, data: bytes | mmap.mmap, limit: int
+    ) -> list[tuple[int, str]]:
+        text = bytes(data).decode("utf-8", errors="replace")
+        results = []
+        for line_no, line in enumerate(text.splitlines(), 1):
+            if self.line_regex.search(line):
+                results.append((line_no, line))
+                if len(results) >= limit:
+                    break
+        return results
+
+
+def _grep_file(path: str, matcher: _Matcher, limit: int) -> list[tuple[int, str]]:
+    try:
+        with open(path, "rb") as f:
+            head = f.read(BINARY_SNIFF_BYTES)
+            if b"\0" in head:
+                return []
+            size = os.fstat(f.fileno()).st_size
+            if size > MAX_GREP_FILE_BYTES:
+                return []
+            if size < MMAP_THRESHOLD_BYTES:
+                data = head + f.read()
+                if not matcher.might_match(data):
+                    return []
+                return matcher.matching_lines(data, limit)
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if not matcher.might_match(mm):
+                    return []
+                return matcher.matching_lines(mm, limit)
+    except (OSError, ValueError):
+        return []
+
+
+def _find_search_index(root: Path):
+    """The context search index covering root, if one was built."""
+    from context.index import SearchIndex, index_manifest
+
+    for directory in (root, *root.parents):
+        try:
+            st = index_manifest(directory).stat()
+        except OSError:
+            continue
+        # Reuse the loaded index until its manifest is rewritten
+        version = (st.st_mtime_ns, st.st_size)
+        with _index_cache_lock:
+            cached = _index_cache.get(directory)
+            if cached is None or cached[0] != version:
+                cached = (version, SearchIndex(directory))
+                _index_cache[directory] = cached
+        return directory, cached[1]
+    return None
+
+
+def _index_excluded(root: Path, files: list[str], query: str) -> set[str]:
+    """Files the persistent index proves cannot contain a literal query."""
+    from context.index import is_indexable_keyword
+
+    keyword = query.lower()
+    if not is_indexable_keyword(keyword):
+        return set()
+    found = _find_search_index(root)
+    if found is None:
+        return set()
+    index_root, index = found
+    try:
+        indexed, containing = index.files_containing(keyword)
+    except Exception as e:
+        logger.debug(f"Could not use search index: {e}")
+        return set()
+
+    prefix = root.relative_to(index_root).as_posix()
+    prefix = "" if prefix == "." else prefix + "/"
+    excluded = set()
+    for rel in files:
+        index_rel = prefix + rel
+        meta = indexed.get(index_rel)
+        if meta is None or index_rel in containing:
+            continue
+        try:
+            st = os.stat(root / rel)
+        except OSError:
+            continue
+        # Only trust entries for files unchanged since they were indexed
+        if (st.st_mtime_ns, st.st_size) == meta:
+            excluded.add(rel)
+    return excluded
+
+
+def search_grep(
+    query: str,
+    pattern: str = "*",
+    root: str | Path = ".",
+    max_matches: int = MAX_GREP_MATCHES,
+    use_index: bool = True,
+) -> str:
+    """
+    Search file contents for a regex (case-insensitive).
+
+    Args:
+        query: Regular expression (plain text is matched literally)
+        pattern: Glob restricting which files are searched
+        root: Directory to search
+        max_matches: Maximum matching lines reported
+        use_index: Consult the project's context search index if present
+
+    Returns:
+        "path:line: text" lines, "No matches found.", or an error message
+    """
+    root = Path(root).resolve()
+    try:
+        matcher = _Matcher(query)
+    except re.error as e:
+        return f"Error: Invalid regex {query!r}: {e}"
+
+    matches = _glob_predicate(pattern)
+    files = [rel for rel in list_files(root) if matches(rel)]
+    if use_index and matcher.literal:
+        excluded = _index_excluded(root, files, query)
+        if excluded:
+            files = [rel for rel in files if rel not in excluded]
+
+    results: list[str] = []
+    truncated = False
+    with ThreadPoolExecutor(max_workers=SEARCH_WORKERS) as pool:
+        for start in range(0, len(files), GREP_BATCH_SIZE):
+            batch = files[start : start + GREP_BATCH_SIZE]
+            limit = max_matches - len(results) + 1
+            scanned = pool.map(
+                lambda rel, limit=limit: _grep_file(
+                    os.path.join(root, rel), matcher, limit
+                ),
+                batch,
+            )
+            for rel, lines in zip(batch, scanned):
+                display = str(Path(rel))
+                for line_no, line in lines:
+                    if len(results) >= max_matches:
+                        truncated = True
+                        break
+                    text = line.strip()
+                    if len(text) > MAX_LINE_CHARS:
+                        text = text[:MAX_LINE_CHARS] + "..."
+                    results.append(f"{display}:{line_no}: {text}")
+                if truncated:
+                    break
+            if truncated:
+                break
+
+    if not results:
+        return "No matches found."
+    if truncated:
+        results.append(
+            f"[... results truncated at {max_matches} matches; "
+            "narrow the query or file pattern ...]"
+        )
+    return "\n".join(results)
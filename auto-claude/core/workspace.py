@@ -17,7 +17,10 @@ This module has been refactored for better maintainability:
 Public API is exported via workspace/__init__.py for backward compatibility.
 """
 
+import asyncio
+import re
 import subprocess
+from collections.abc import Awaitable, Callable
 from pathlib import Path
 from typing import Optional
 
@@ -81,9 +84,15 @@ from core.workspace.display import (
     show_build_summary,
 )
 from core.workspace.git_utils import (
+    AI_MERGE_TIMEOUT_SECONDS,
+    MAX_FILE_LINES_FOR_AI,
+    MAX_PARALLEL_AI_MERGES,
     _is_auto_claude_file,
     get_existing_build_worktree,
 )
+from core.workspace.git_utils import (
+    create_conflict_file_with_git as _create_conflict_file_with_git,
+)
 from core.workspace.git_utils import (
     get_changed_files_from_branch as _get_changed_files_from_branch,
 )
@@ -93,17 +102,30 @@ from core.workspace.git_utils import (
 from core.workspace.git_utils import (
     is_lock_file as _is_lock_file,
 )
+from core.workspace.git_utils import (
+    validate_merged_syntax as _validate_merged_syntax,
+)
 
 # Import from refactored modules in core/workspace/
 from core.workspace.models import (
     MergeLock,
     MergeLockError,
+    ParallelMergeResult,
     ParallelMergeTask,
 )
 from merge import (
     FileTimelineTracker,
     MergeOrchestrator,
 )
+from merge.ai_resolver.claude_client import query_claude
+from merge.ai_resolver.language_utils import infer_language
+from merge.prompts import (
+    build_conflict_only_prompt,
+    build_simple_merge_prompt,
+    extract_conflict_resolutions,
+    parse_conflict_markers,
+    reassemble_with_resolutions,
+)
 
 MODULE = "workspace"
 
@@ -828,19 +850,9 @@ def _resolve_git_conflicts_with_ai(
 
         start_time = time.time()
 
-        # Run parallel merges
-        # TODO: _run_parallel_merges not yet implemented - see line 140
-        # parallel_results = asyncio.run(_run_parallel_merges(
-        #     tasks=files_needing_ai_merge,
-        #     project_dir=project_dir,
-        #     max_concurrent=MAX_PARALLEL_AI_MERGES,
-        # ))
-        parallel_results = []  # Placeholder until function is implemented
-
-        elapsed = time.time() - start_time
-
-        # Process results
-        for result in parallel_results:
+        def apply_result(result: ParallelMergeResult) -> None:
+            """Write and stage each file as soon as its merge finishes."""
+            nonlocal auto_merged_count, ai_merged_count
             if result.success:
                 target_path = project_dir / result.file_path
                 target_path.parent.mkdir(parents=True, exist_ok=True)
@@ -868,6 +880,18 @@ def _resolve_git_conflicts_with_ai(
                     }
                 )
 
+        # Run parallel merges (git 3-way first, AI only for real conflicts)
+        asyncio.run(
+            _run_parallel_merges(
+                tasks=files_needing_ai_merge,
+                project_dir=project_dir,
+                max_concurrent=MAX_PARALLEL_AI_MERGES,
+                on_result=apply_result,
+            )
+        )
+
+        elapsed = time.time() - start_time
+
         # Print summary
         print()
         print(muted(f"  Parallel merge completed in {elapsed:.1f}s"))
@@ -961,6 +985,196 @@ def _resolve_git_conflicts_with_ai(
     return result
 
 
+AI_MERGE_SYSTEM_PROMPT = (
+    "You are an expert code merge assistant. You resolve git merge conflicts "
+    "so that the changes from BOTH branches are preserved. Output only code "
+    "in the requested format, with no explanations."
+)
+
+AICallFunction = Callable[[str, str], Awaitable[str]]
+
+
+def _extract_code_block(response: str) -> str | None:
+    """Extract the first fenced code block from an AI response."""
+    match = re.search(r"```[\w+-]*\n(.*?)```", response, re.DOTALL)
+    return match.group(1) if match else None
+
+
+async def _merge_file_with_ai_async(
+    task: ParallelMergeTask,
+    project_dir: Path,
+    conflict_content: str | None,
+    ai_call_fn: AICallFunction,
+) -> ParallelMergeResult:
+    """
+    Resolve a single conflicting file with AI.
+
+    When git produced conflict markers, only the conflict regions are sent
+    to the AI and the answers are spliced back into the file. Otherwise the
+    full three-way merge prompt is used (subject to MAX_FILE_LINES_FOR_AI).
+    The merged result must pass syntax validation.
+    """
+    language = infer_language(task.file_path)
+    conflicts: list[dict] = []
+    if conflict_content:
+        conflicts, _ = parse_conflict_markers(conflict_content)
+
+    if conflicts:
+        prompt = build_conflict_only_prompt(
+            file_path=task.file_path,
+            conflicts=conflicts,
+            spec_name=task.spec_name,
+            language=language,
+        )
+        response = await ai_call_fn(AI_MERGE_SYSTEM_PROMPT, prompt)
+        resolutions = extract_conflict_resolutions(response, conflicts, language)
+        if len(resolutions) < len(conflicts):
+            return ParallelMergeResult(
+                file_path=task.file_path,
+                merged_content=None,
+                success=False,
+                error=f"AI resolved {len(resolutions)}/{len(conflicts)} conflict regions",
+            )
+        # Conflict regions end after the marker's newline; resolutions don't
+        merged_content = reassemble_with_resolutions(
+            conflict_content,
+            conflicts,
+            {cid: code + "\n" for cid, code in resolutions.items()},
+        )
+    else:
+        longest = max(task.main_content.count("\n"), task.worktree_content.count("\n"))
+        if longest > MAX_FILE_LINES_FOR_AI:
+            return ParallelMergeResult(
+                file_path=task.file_path,
+                merged_content=None,
+                success=False,
+                error=f"File too large for AI merge ({longest} lines)",
+            )
+        prompt = build_simple_merge_prompt(
+            file_path=task.file_path,
+            main_content=task.main_content,
+            worktree_content=task.worktree_content,
+            base_content=task.base_content,
+            spec_name=task.spec_name,
+            language=language,
+        )
+        response = await ai_call_fn(AI_MERGE_SYSTEM_PROMPT, prompt)
+        merged_content = _extract_code_block(response)
+        if merged_content is None:
+            return ParallelMergeResult(
+                file_path=task.file_path,
+                merged_content=None,
+                success=False,
+                error="AI response did not contain merged code",
+            )
+
+    is_valid, syntax_error = await asyncio.to_thread(
+        _validate_merged_syntax, task.file_path, merged_content, project_dir
+    )
+    if not is_valid:
+        return ParallelMergeResult(
+            file_path=task.file_path,
+            merged_content=None,
+            success=False,
+            error=syntax_error,
+        )
+
+    return ParallelMergeResult(
+        file_path=task.file_path,
+        merged_content=merged_content,
+        success=True,
+    )
+
+
+async def _run_parallel_merges(
+    tasks: list[ParallelMergeTask],
+    project_dir: Path,
+    max_concurrent: int = MAX_PARALLEL_AI_MERGES,
+    timeout: float = AI_MERGE_TIMEOUT_SECONDS,
+    ai_call_fn: AICallFunction | None = None,
+    on_result: Callable[[ParallelMergeResult], None] | None = None,
+) -> list[ParallelMergeResult]:
+    """
+    Merge conflicting files concurrently.
+
+    Every file first gets a cheap ``git merge-file`` three-way merge; clean
+    results are returned with ``was_auto_merged=True``. Only files that still
+    have conflicts are sent to the AI resolver, at most ``max_concurrent`` at
+    a time and each bounded by ``timeout`` seconds.
+
+    Args:
+        tasks: Files to merge
+        project_dir: Project root (cwd for git and syntax validation)
+        max_concurrent: Maximum simultaneous AI merges
+        timeout: Per-file AI merge timeout in seconds
+        ai_call_fn: Async ``(system, user) -> response`` function
+            (defaults to a Claude Agent SDK call)
+        on_result: Called with each result as soon as it is available
+
+    Returns:
+        Results in the same order as ``tasks``
+    """
+    if not tasks:
+        return []
+
+    ai_call_fn = ai_call_fn or query_claude
+    semaphore = asyncio.Semaphore(max(1, max_concurrent))
+
+    def emit(result: ParallelMergeResult) -> ParallelMergeResult:
+        if on_result:
+            try:
+                on_result(result)
+            except Exception as e:
+                debug_error(MODULE, f"Failed to apply merge of {result.file_path}: {e}")
+        return result
+
+    async def merge_one(task: ParallelMergeTask) -> ParallelMergeResult:
+        merged, had_conflicts = await asyncio.to_thread(
+            _create_conflict_file_with_git,
+            task.main_content,
+            task.worktree_content,
+            task.base_content,
+            project_dir,
+        )
+        if merged is not None and not had_conflicts:
+            debug(MODULE, f"  {task.file_path}: git auto-merged")
+            return emit(
+                ParallelMergeResult(
+                    file_path=task.file_path,
+                    merged_content=merged,
+                    success=True,
+                    was_auto_merged=True,
+                )
+            )
+
+        async with semaphore:
+            debug(MODULE, f"  {task.file_path}: AI merge started")
+            try:
+                result = await asyncio.wait_for(
+                    _merge_file_with_ai_async(
+                        task, project_dir, merged if had_conflicts else None, ai_call_fn
+                    ),
+                    timeout=timeout,
+                )
+            except asyncio.TimeoutError:
+                result = ParallelMergeResult(
+                    file_path=task.file_path,
+                    merged_content=None,
+                    success=False,
+                    error=f"AI merge timed out after {timeout:.0f}s",
+                )
+            except Exception as e:
+                result = ParallelMergeResult(
+                    file_path=task.file_path,
+                    merged_content=None,
+                    success=False,
+                    error=f"AI merge failed: {e}",
+                )
+        return emit(result)
+
+    return await asyncio.gather(*(merge_one(task) for task in tasks))
+
+
 # Note: All constants, classes and helper functions are imported from the refactored modules above
 # - Constants from git_utils (MAX_FILE_LINES_FOR_AI, BINARY_EXTENSIONS, etc.)
 # - Models from workspace/models.py (MergeLock, MergeLockError, etc.)
@@ -14,6 +14,7 @@ from typing import Optional
 # Constants for merge limits
 MAX_FILE_LINES_FOR_AI = 5000  # Skip AI for files larger than this
 MAX_PARALLEL_AI_MERGES = 5  # Limit concurrent AI merge operations
+AI_MERGE_TIMEOUT_SECONDS = 180  # Per-file limit for a single AI merge
 
 # Lock files that should NEVER go through AI merge
 # These are auto-generated and should just take the worktree version
@@ -379,7 +380,8 @@ def create_conflict_file_with_git(
 
         try:
             # git merge-file <current> <base> <other>
-            # Exit codes: 0 = clean merge, 1 = conflicts, >1 = error
+            # Exits with the number of conflicts (capped at 127); errors exit
+            # negative, which the shell reports as 255
             result = subprocess.run(
                 ["git", "merge-file", "-p", main_path, base_path, wt_path],
                 cwd=project_dir,
@@ -387,11 +389,14 @@ def create_conflict_file_with_git(
                 text=True,
             )
 
+            if result.returncode < 0 or result.returncode > 127:
+                return None, False
+
             # Read the merged content
             merged_content = result.stdout
 
             # Check for conflicts
-            had_conflicts = result.returncode == 1
+            had_conflicts = result.returncode > 0
 
             return merged_content, had_conflicts
 
@@ -23,6 +23,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Optional
 
+from core.profiling import profile_span
+
 
 class WorktreeError(Exception):
     """Error during worktree operations."""
@@ -128,14 +130,15 @@ class WorktreeManager:
         self, args: list[str], cwd: Optional[Path] = None
     ) -> subprocess.CompletedProcess:
         """Run a git command and return the result."""
-        return subprocess.run(
-            ["git"] + args,
-            cwd=cwd or self.project_dir,
-            capture_output=True,
-            text=True,
-            encoding="utf-8",
-            errors="replace",
-        )
+        with profile_span(f"git.{args[0]}"):
+            return subprocess.run(
+                ["git"] + args,
+                cwd=cwd or self.project_dir,
+                capture_output=True,
+                text=True,
+                encoding="utf-8",
+                errors="replace",
+            )
 
     def _unstage_gitignored_files(self) -> None:
         """
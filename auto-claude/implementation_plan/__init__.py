@@ -23,6 +23,7 @@ Package Structure:
 - phase.py: Phase model grouping subtasks with dependencies
 - plan.py: ImplementationPlan model for complete feature plans
 - factories.py: Factory functions for creating different plan types
+- store.py: PlanStore - cached reads and locked, atomic writes of the plan file
 """
 
 # Export all public types and functions for backwards compatibility
@@ -40,6 +41,7 @@ from .factories import (
 )
 from .phase import Phase
 from .plan import ImplementationPlan
+from .store import PlanStore, get_plan_store
 from .subtask import Chunk, Subtask  # Chunk is backwards compatibility alias
 from .verification import Verification
 
@@ -58,6 +60,9 @@ __all__ = [
     "create_feature_plan",
     "create_investigation_plan",
     "create_refactor_plan",
+    # Plan file access
+    "PlanStore",
+    "get_plan_store",
     # Backwards compatibility
     "Chunk",
     "ChunkStatus",
@@ -22,6 +22,7 @@ class Phase:
     subtasks: list[Subtask] = field(default_factory=list)
     depends_on: list[int] = field(default_factory=list)
     parallel_safe: bool = False  # Can subtasks in this phase run in parallel?
+    id: str | None = None  # Planner's phase id (e.g. "phase-1-backend")
 
     # Backwards compatibility: chunks is an alias for subtasks
     @property
@@ -48,6 +49,8 @@ class Phase:
             result["depends_on"] = self.depends_on
         if self.parallel_safe:
             result["parallel_safe"] = True
+        if self.id:
+            result["id"] = self.id
         return result
 
     @classmethod
@@ -62,6 +65,7 @@ class Phase:
             subtasks=[Subtask.from_dict(s) for s in subtask_data],
             depends_on=data.get("depends_on", []),
             parallel_safe=data.get("parallel_safe", False),
+            id=data.get("id"),
         )
 
     def is_complete(self) -> bool:
@@ -100,7 +100,16 @@ class ImplementationPlan:
         )
 
     def save(self, path: Path):
-        """Save plan to JSON file."""
+        """Save plan to JSON file (atomically, via temp file + rename)."""
+        self.touch()
+
+        from .store import write_plan_atomic
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_plan_atomic(path, self.to_dict(), ensure_ascii=False)
+
+    def touch(self):
+        """Stamp the timestamps and sync status before the plan is written."""
         self.updated_at = datetime.now().isoformat()
         if not self.created_at:
             self.created_at = self.updated_at
@@ -108,10 +117,6 @@ class ImplementationPlan:
         # Auto-update status based on subtask completion
         self.update_status_from_subtasks()
 
-        path.parent.mkdir(parents=True, exist_ok=True)
-        with open(path, "w", encoding="utf-8") as f:
-            json.dump(self.to_dict(), f, indent=2, ensure_ascii=False)
-
     def update_status_from_subtasks(self):
         """Update overall status and planStatus based on subtask completion state.
 
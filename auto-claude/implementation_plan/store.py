@@ -0,0 +1,295 @@
+#!/usr/bin/env python3
+"""
+Implementation Plan Store
+=========================
+
+Shared, in-process access to a spec's implementation_plan.json.
+
+The coder loop, QA and the progress helpers all read the plan several times
+per iteration. A PlanStore parses the file once and serves the parsed plan
+until the file's (inode, mtime, size) changes, so repeated reads cost one
+stat():
+
+    store = get_plan_store(spec_dir)
+    plan = store.read()          # shared dict - do not mutate
+    plan = store.load()          # private copy, safe to modify
+    typed = store.plan()         # ImplementationPlan (shared, cached)
+
+Writes take an exclusive advisory lock next to the plan and go through a
+temp file + rename, so readers never see torn JSON and concurrent writers
+(parallel coder sessions, the subtask MCP tool) never lose each other's
+updates when they use update() or its typed twin update_plan():
+
+    store.update(lambda plan: mark_done(plan))
+    store.update_plan(lambda plan: plan.reset_for_followup())
+"""
+
+import copy
+import dataclasses
+import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+from .plan import ImplementationPlan
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+PLAN_FILE = "implementation_plan.json"
+PLAN_LOCK_FILE = ".implementation_plan.lock"
+
+# A file modified this recently may be rewritten again within the same mtime
+# tick without changing size, so it isn't cached yet (git's "racy clean")
+RACY_WINDOW_NS = 100_000_000
+
+# Plan-level keys owned by ImplementationPlan; update_plan() keeps the rest
+_MODEL_KEYS = frozenset(f.name for f in dataclasses.fields(ImplementationPlan))
+
+
+@contextmanager
+def plan_lock(spec_dir: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on the implementation plan.
+
+    Uses an advisory lock file next to the plan. On platforms without fcntl
+    this degrades to a no-op (the atomic rename still prevents torn files).
+    """
+    if fcntl is None:
+        yield
+        return
+
+    lock_path = Path(spec_dir) / PLAN_LOCK_FILE
+    with open(lock_path, "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def write_plan_atomic(plan_file: Path, plan: dict, ensure_ascii: bool = True) -> None:
+    """
+    Write the plan via temp file + rename so readers never see torn JSON.
+
+    Args:
+        plan_file: Destination path
+        plan: Plan dictionary
+        ensure_ascii: Escape non-ASCII characters (json.dump semantics)
+    """
+    fd, tmp_path = tempfile.mkstemp(
+        dir=plan_file.parent, prefix=".implementation_plan.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(plan, f, indent=2, ensure_ascii=ensure_ascii)
+        os.replace(tmp_path, plan_file)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class PlanStore:
+    """Cached reader and locked, atomic writer for one implementation plan."""
+
+    def __init__(self, spec_dir: Path):
+        """
+        Initialize store.
+
+        Args:
+            spec_dir: Spec directory containing implementation_plan.json
+        """
+        self.spec_dir = Path(spec_dir)
+        self.plan_file = self.spec_dir / PLAN_FILE
+        self._lock = threading.Lock()
+        self._stamp: Optional[tuple[int, int, int]] = None
+        self._data: Optional[dict] = None
+        self._typed: Optional[ImplementationPlan] = None
+
+    def _stat(self) -> Optional[tuple[int, int, int]]:
+        try:
+            st = self.plan_file.stat()
+        except OSError:
+            return None
+        return st.st_ino, st.st_mtime_ns, st.st_size
+
+    @staticmethod
+    def _cacheable(stamp: tuple[int, int, int]) -> bool:
+        return time.time_ns() - stamp[1] > RACY_WINDOW_NS
+
+    def _parse(self) -> dict:
+        with open(self.plan_file, encoding="utf-8") as f:
+            return json.load(f)
+
+    def read(self) -> Optional[dict]:
+        """
+        Get the parsed plan, re-reading only if the file changed.
+
+        The returned dict is shared with every other reader in the process
+        and must not be modified; use load() or update() for that.
+
+        Returns:
+            Plan dictionary, or None if the file is missing or invalid
+        """
+        stamp = self._stat()
+        if stamp is None:
+            return None
+        with self._lock:
+            if stamp == self._stamp:
+                return self._data
+            try:
+                data = self._parse()
+            except (OSError, json.JSONDecodeError, UnicodeDecodeError):
+                return None
+            if not isinstance(data, dict):
+                return None
+            # Stat again after parsing so a concurrent rewrite isn't cached
+            # under the new stamp with the old content
+            if self._cacheable(stamp) and self._stat() == stamp:
+                self._stamp, self._data, self._typed = stamp, data, None
+            return data
+
+    def load(self) -> Optional[dict]:
+        """Get a private copy of the plan that the caller may modify."""
+        data = self.read()
+        return copy.deepcopy(data) if data is not None else None
+
+    def plan(self) -> Optional[ImplementationPlan]:
+        """
+        Get the plan as a typed ImplementationPlan (cached, shared).
+
+        Returns:
+            ImplementationPlan, or None if the file is missing, invalid or
+            doesn't match the plan schema
+        """
+        data = self.read()
+        if data is None:
+            return None
+        with self._lock:
+            if self._data is data and self._typed is not None:
+                return self._typed
+            try:
+                typed = ImplementationPlan.from_dict(data)
+            except (KeyError, TypeError, ValueError):
+                return None
+            if self._data is data:
+                self._typed = typed
+            return typed
+
+    def invalidate(self) -> None:
+        """Drop the cached plan (next read re-parses the file)."""
+        with self._lock:
+            self._stamp, self._data, self._typed = None, None, None
+
+    def write(self, plan: dict, ensure_ascii: bool = True) -> None:
+        """
+        Replace the plan on disk (locked, atomic).
+
+        Args:
+            plan: Complete plan dictionary
+            ensure_ascii: Escape non-ASCII characters (json.dump semantics)
+        """
+        with plan_lock(self.spec_dir):
+            write_plan_atomic(self.plan_file, plan, ensure_ascii=ensure_ascii)
+        self.invalidate()
+
+    def update(self, mutate: Callable[[dict], bool], create: bool = False) -> bool:
+        """
+        Read-modify-write the plan under the plan lock.
+
+        The plan is re-read from disk inside the lock, so updates made by
+        other sessions since this process last read it are never lost.
+
+        Args:
+            mutate: Modifies the plan in place; returns True if it changed
+                anything (nothing is written otherwise)
+            create: Start from an empty plan if the file doesn't exist
+
+        Returns:
+            True if the plan was changed (and written)
+
+        Raises:
+            FileNotFoundError: If the plan does not exist (and not create)
+            json.JSONDecodeError: If the plan is not valid JSON
+        """
+        with plan_lock(self.spec_dir):
+            try:
+                plan = self._parse()
+            except FileNotFoundError:
+                if not create:
+                    raise
+                plan = {}
+            changed = bool(mutate(plan))
+            if changed:
+                write_plan_atomic(self.plan_file, plan)
+                stamp = self._stat()
+                with self._lock:
+                    # We own this dict now: serve it to readers directly
+                    self._stamp, self._data, self._typed = stamp, plan, None
+        return changed
+
+    def update_plan(self, mutate: Callable[[ImplementationPlan], bool]) -> bool:
+        """
+        Read-modify-write the plan as a typed ImplementationPlan.
+
+        Same locking as update(). Timestamps and status are refreshed as in
+        ImplementationPlan.save(), and plan-level keys the model doesn't
+        know about (QA history and stats) are kept.
+
+        Args:
+            mutate: Modifies the plan in place; returns True if it changed
+                anything (nothing is written otherwise)
+
+        Returns:
+            True if the plan was changed (and written)
+
+        Raises:
+            FileNotFoundError: If the plan does not exist
+            json.JSONDecodeError: If the plan is not valid JSON
+        """
+
+        def apply(data: dict) -> bool:
+            plan = ImplementationPlan.from_dict(data)
+            if not mutate(plan):
+                return False
+            plan.touch()
+            for key in _MODEL_KEYS:
+                data.pop(key, None)
+            data.update(plan.to_dict())
+            return True
+
+        return self.update(apply)
+
+
+# Process-wide stores: resolved spec dir -> PlanStore
+_stores: dict[str, PlanStore] = {}
+_stores_lock = threading.Lock()
+
+
+def get_plan_store(spec_dir: Path) -> PlanStore:
+    """
+    Get the shared PlanStore for a spec directory.
+
+    Args:
+        spec_dir: Spec directory containing implementation_plan.json
+
+    Returns:
+        The process-wide PlanStore for that directory
+    """
+    key = os.path.abspath(spec_dir)
+    with _stores_lock:
+        store = _stores.get(key)
+        if store is None:
+            store = PlanStore(Path(key))
+            _stores[key] = store
+        return store
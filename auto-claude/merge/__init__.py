@@ -25,6 +25,7 @@ Usage:
 
 from .ai_resolver import AIResolver, create_claude_resolver
 from .auto_merger import AutoMerger
+from .blob_store import BlobStore, MissingBlobError, collect_garbage
 from .compatibility_rules import CompatibilityRule
 from .conflict_detector import ConflictDetector
 from .conflict_resolver import ConflictResolver
@@ -96,6 +97,8 @@ __all__ = [
     "ConflictResolver",
     "MergePipeline",
     "MergeOrchestrator",
+    "BlobStore",
+    "MissingBlobError",
     # Utilities
     "find_worktree",
     "get_file_from_branch",
@@ -104,6 +107,7 @@ __all__ = [
     "find_import_end",
     "extract_location_content",
     "apply_ai_merge",
+    "collect_garbage",
     # File Timeline (Intent-Aware Merge System)
     "FileTimelineTracker",
     "FileTimeline",
@@ -21,23 +21,23 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def create_claude_resolver() -> AIResolver:
-    """
-    Create an AIResolver configured to use Claude via the Agent SDK.
+MERGE_MODEL = "sonnet"
 
-    Uses the same OAuth token pattern as the rest of the auto-claude framework.
+
+def _load_claude_sdk():
+    """
+    Get the Agent SDK client classes, if auth and the SDK are available.
 
     Returns:
-        Configured AIResolver instance
+        (ClaudeAgentOptions, ClaudeSDKClient), or None when AI resolution is
+        unavailable (the reason is logged)
     """
     # Import here to avoid circular dependency
     from core.auth import ensure_claude_code_oauth_token, get_auth_token
 
-    from .resolver import AIResolver
-
     if not get_auth_token():
         logger.warning("No authentication token found, AI resolution unavailable")
-        return AIResolver()
+        return None
 
     # Ensure SDK can find the token
     ensure_claude_code_oauth_token()
@@ -46,39 +46,77 @@ def create_claude_resolver() -> AIResolver:
         from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
     except ImportError:
         logger.warning("claude_agent_sdk not installed, AI resolution unavailable")
+        return None
+
+    return ClaudeAgentOptions, ClaudeSDKClient
+
+
+async def query_claude(system: str, user: str, sdk=None) -> str:
+    """
+    Make a single tool-less Claude call for merge resolution.
+
+    Args:
+        system: System prompt
+        user: User prompt
+        sdk: Result of _load_claude_sdk() (loaded on demand if omitted)
+
+    Returns:
+        The response text, or an empty string if AI resolution is
+        unavailable, so callers can treat it as "AI could not resolve"
+    """
+    sdk = sdk or _load_claude_sdk()
+    if sdk is None:
+        return ""
+    options_cls, client_cls = sdk
+
+    # Create a minimal client for merge resolution
+    client = client_cls(
+        options=options_cls(
+            model=MERGE_MODEL,
+            system_prompt=system,
+            allowed_tools=[],  # No tools needed for merge
+            max_turns=1,
+        )
+    )
+
+    # Use async context manager to handle connect/disconnect
+    # This is the standard pattern used throughout the codebase
+    async with client:
+        await client.query(user)
+
+        response_text = ""
+        async for msg in client.receive_response():
+            msg_type = type(msg).__name__
+            if msg_type == "AssistantMessage" and hasattr(msg, "content"):
+                for block in msg.content:
+                    if hasattr(block, "text"):
+                        response_text += block.text
+
+    logger.info(f"AI merge response: {len(response_text)} chars")
+    return response_text
+
+
+def create_claude_resolver() -> AIResolver:
+    """
+    Create an AIResolver configured to use Claude via the Agent SDK.
+
+    Uses the same OAuth token pattern as the rest of the auto-claude framework.
+
+    Returns:
+        Configured AIResolver instance
+    """
+    from .resolver import AIResolver
+
+    sdk = _load_claude_sdk()
+    if sdk is None:
         return AIResolver()
 
     def call_claude(system: str, user: str) -> str:
         """Call Claude using the Agent SDK for merge resolution."""
 
         async def _run_merge() -> str:
-            # Create a minimal client for merge resolution
-            client = ClaudeSDKClient(
-                options=ClaudeAgentOptions(
-                    model="sonnet",
-                    system_prompt=system,
-                    allowed_tools=[],  # No tools needed for merge
-                    max_turns=1,
-                )
-            )
-
             try:
-                # Use async context manager to handle connect/disconnect
-                # This is the standard pattern used throughout the codebase
-                async with client:
-                    await client.query(user)
-
-                    response_text = ""
-                    async for msg in client.receive_response():
-                        msg_type = type(msg).__name__
-                        if msg_type == "AssistantMessage" and hasattr(msg, "content"):
-                            for block in msg.content:
-                                if hasattr(block, "text"):
-                                    response_text += block.text
-
-                    logger.info(f"AI merge response: {len(response_text)} chars")
-                    return response_text
-
+                return await query_claude(system, user, sdk)
             except Exception as e:
                 logger.error(f"Claude SDK call failed: {e}")
                 print(f"    [ERROR] Claude SDK error: {e}", file=sys.stderr)
@@ -0,0 +1,218 @@
+"""
+Content-Addressed Blob Store
+============================
+
+Shared storage for file contents captured by the merge system.
+
+File timelines (branch points, main-branch events, worktree states) and
+evolution baselines used to embed full file text in their JSON, one copy
+per task per file. They now keep only a SHA-256 key into this store:
+
+    .auto-claude/blobs/ab/cdef0123...   (zlib-compressed UTF-8)
+
+Identical content is stored once, however many tasks and timelines refer
+to it. Blobs that nothing references any more are removed by
+collect_garbage(), which runs when a task is cleaned up or abandoned.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import tempfile
+import time
+import zlib
+from collections.abc import Iterator
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+BLOBS_DIR = "blobs"
+
+# Prefix marking a blob key in fields that used to hold a file path
+BLOB_REF_PREFIX = "blob:"
+
+# Blobs younger than this are never collected: another process may have
+# stored one and not yet saved the timeline/evolution data referring to it
+GC_GRACE_SECONDS = 15 * 60
+
+COMPRESSION_LEVEL = 6
+
+
+class MissingBlobError(Exception):
+    """Saved data refers to a blob that is missing or corrupt."""
+
+    def __init__(self, blob_hash: str):
+        super().__init__(f"Blob {blob_hash} is missing or corrupt")
+        self.blob_hash = blob_hash
+
+
+def blob_ref(blob_hash: str) -> str:
+    """Format a blob key for a path-style field (e.g. baseline_snapshot_path)."""
+    return f"{BLOB_REF_PREFIX}{blob_hash}"
+
+
+def parse_blob_ref(ref: str) -> str | None:
+    """Get the blob key from a blob_ref() string, or None for a plain path."""
+    if ref and ref.startswith(BLOB_REF_PREFIX):
+        return ref[len(BLOB_REF_PREFIX) :]
+    return None
+
+
+class BlobStore:
+    """SHA-256 keyed, zlib-compressed, deduplicated text storage."""
+
+    def __init__(self, root: Path):
+        """
+        Initialize the blob store.
+
+        Args:
+            root: Directory holding the blobs (e.g., .auto-claude/blobs)
+        """
+        self.root = Path(root)
+
+    def _path(self, blob_hash: str) -> Path:
+        return self.root / blob_hash[:2] / blob_hash[2:]
+
+    @staticmethod
+    def hash_content(content: str) -> str:
+        """Compute the key content is stored under."""
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def put(self, content: str) -> str:
+        """
+        Store content (once) and return its key.
+
+        Args:
+            content: Text to store
+
+        Returns:
+            SHA-256 hex digest of the content
+        """
+        data = content.encode("utf-8")
+        blob_hash = hashlib.sha256(data).hexdigest()
+        path = self._path(blob_hash)
+
+        if path.exists():
+            # Refresh the mtime so a concurrent collect_garbage() treats the
+            # blob as newly written
+            try:
+                os.utime(path)
+            except OSError:
+                pass
+            return blob_hash
+
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(zlib.compress(data, COMPRESSION_LEVEL))
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+        return blob_hash
+
+    def get(self, blob_hash: str) -> str | None:
+        """
+        Read content by key.
+
+        Args:
+            blob_hash: Key returned by put()
+
+        Returns:
+            The stored text, or None if the blob is missing or unreadable
+        """
+        try:
+            data = self._path(blob_hash).read_bytes()
+        except OSError:
+            return None
+        try:
+            return zlib.decompress(data).decode("utf-8")
+        except (zlib.error, UnicodeDecodeError) as e:
+            logger.warning(f"Corrupt blob {blob_hash}: {e}")
+            return None
+
+    def contains(self, blob_hash: str) -> bool:
+        """Check if a blob is stored."""
+        return self._path(blob_hash).exists()
+
+    def iter_hashes(self) -> Iterator[str]:
+        """Yield the key of every stored blob."""
+        if not self.root.exists():
+            return
+        for fanout in self.root.iterdir():
+            if not fanout.is_dir() or len(fanout.name) != 2:
+                continue
+            for blob in fanout.iterdir():
+                if not blob.name.startswith("."):
+                    yield fanout.name + blob.name
+
+    def gc(self, referenced: set[str], grace_seconds: float | None = None) -> int:
+        """
+        Delete blobs that are not referenced.
+
+        Args:
+            referenced: Keys that must be kept
+            grace_seconds: Keep blobs modified more recently than this
+                (default: GC_GRACE_SECONDS)
+
+        Returns:
+            Number of blobs deleted
+        """
+        if grace_seconds is None:
+            grace_seconds = GC_GRACE_SECONDS
+        cutoff = time.time() - grace_seconds
+        removed = 0
+        for blob_hash in list(self.iter_hashes()):
+            if blob_hash in referenced:
+                continue
+            path = self._path(blob_hash)
+            try:
+                if path.stat().st_mtime > cutoff:
+                    continue
+                path.unlink()
+                removed += 1
+            except OSError:
+                continue
+        return removed
+
+
+def collect_garbage(storage_dir: Path, grace_seconds: float | None = None) -> int:
+    """
+    Delete blobs referenced by neither file timelines nor evolution baselines.
+
+    References are read from what is saved on disk, so callers should persist
+    their own data first.
+
+    Args:
+        storage_dir: Merge storage directory (e.g., .auto-claude/)
+        grace_seconds: Keep blobs modified more recently than this
+            (default: GC_GRACE_SECONDS)
+
+    Returns:
+        Number of blobs deleted
+    """
+    from .file_evolution.storage import referenced_blobs as evolution_blobs
+    from .timeline_persistence import referenced_blobs as timeline_blobs
+
+    storage_dir = Path(storage_dir)
+    store = BlobStore(storage_dir / BLOBS_DIR)
+    if not store.root.exists():
+        return 0
+
+    try:
+        referenced = timeline_blobs(storage_dir) | evolution_blobs(storage_dir)
+    except Exception as e:
+        # Never delete anything based on a partial view of the references
+        logger.warning(f"Skipping blob garbage collection: {e}")
+        return 0
+
+    removed = store.gc(referenced, grace_seconds=grace_seconds)
+    if removed:
+        logger.debug(f"Removed {removed} unreferenced blobs")
+    return removed
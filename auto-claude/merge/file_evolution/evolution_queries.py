@@ -282,7 +282,8 @@ class EvolutionQueries:
                 ts for ts in evolution.task_snapshots if ts.task_id != task_id
             ]
 
-        # Remove baseline directory if requested
+        # Remove the legacy per-task baseline copies (blob-store baselines are
+        # garbage-collected by the tracker once evolutions are saved)
         if remove_baselines:
             baseline_dir = self.storage.baselines_dir / task_id
             if baseline_dir.exists():
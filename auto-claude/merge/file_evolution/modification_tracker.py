@@ -14,11 +14,14 @@ from typing import Optional
 import logging
 import os
 import subprocess
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+from ..git_utils import GitBlobReader, get_changed_files_with_diffs
 from ..semantic_analyzer import SemanticAnalyzer
-from ..types import FileEvolution, TaskSnapshot, compute_content_hash
+from ..types import FileAnalysis, FileEvolution, TaskSnapshot, compute_content_hash
 from .storage import EvolutionStorage
 
 # Import debug utilities
@@ -36,6 +39,10 @@ except ImportError:
 logger = logging.getLogger(__name__)
 MODULE = "merge.file_evolution.modification_tracker"
 
+# Below this many files, semantic analysis runs inline (pool startup isn't worth it)
+PARALLEL_ANALYSIS_THRESHOLD = 8
+MAX_ANALYSIS_WORKERS = min(8, os.cpu_count() or 1)
+
 
 class ModificationTracker:
     """
@@ -70,6 +77,7 @@ class ModificationTracker:
         new_content: str,
         evolutions: dict[str, FileEvolution],
         raw_diff: Optional[str] = None,
+        analysis: FileAnalysis | None = None,
     ) -> TaskSnapshot | None:
         """
         Record a file modification by a task.
@@ -81,6 +89,7 @@ class ModificationTracker:
             new_content: File content after modification
             evolutions: Current evolution data (will be updated)
             raw_diff: Optional unified diff for reference
+            analysis: Precomputed semantic analysis (computed if omitted)
 
         Returns:
             Updated TaskSnapshot, or None if file not being tracked
@@ -114,7 +123,10 @@ class ModificationTracker:
             )
 
         # Analyze semantic changes
-        analysis = self.analyzer.analyze_diff(rel_path, old_content, new_content)
+        if analysis is None:
+            analysis = self.analyzer.analyze_diff(
+                rel_path, old_content, new_content, task_id=task_id
+            )
         semantic_changes = analysis.changes
 
         # Update snapshot
@@ -149,6 +161,29 @@ class ModificationTracker:
             worktree_path: Path to the task's worktree
             evolutions: Current evolution data (will be updated)
         """
+        modifications = self.read_worktree_changes(task_id, worktree_path)
+        if modifications is not None:
+            self.record_worktree_changes(task_id, modifications, evolutions)
+
+    def read_worktree_changes(
+        self,
+        task_id: str,
+        worktree_path: Path,
+    ) -> list[tuple[str, str, str, str]] | None:
+        """
+        Read what a task changed in its worktree, without recording anything.
+
+        Only runs git and reads files, so it is safe to call for several
+        tasks at once from different threads.
+
+        Args:
+            task_id: The task identifier
+            worktree_path: Path to the task's worktree
+
+        Returns:
+            (file_path, old_content, new_content, raw_diff) tuples, or None
+            if git failed
+        """
         debug(
             MODULE,
             f"refresh_from_git() for task {task_id}",
@@ -157,20 +192,11 @@ class ModificationTracker:
         )
 
         try:
-            # Get list of files changed in the worktree
-            # Use GIT_PAGER to prevent git from waiting for pager input
-            git_env = {**os.environ, "GIT_PAGER": "cat", "PAGER": "cat"}
-            
-            result = subprocess.run(
-                ["git", "diff", "--name-only", "main...HEAD"],
-                cwd=worktree_path,
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=30,
-                env=git_env,
+            # One name listing + one full diff instead of two git calls per file
+            file_diffs = get_changed_files_with_diffs(
+                worktree_path, "main...HEAD", timeout=30
             )
-            changed_files = [f for f in result.stdout.strip().split("\n") if f]
+            changed_files = list(file_diffs)
 
             debug(
                 MODULE,
@@ -180,67 +206,113 @@ class ModificationTracker:
                 else changed_files,
             )
 
-            for file_path in changed_files:
-                # Get the diff for this file
-                try:
-                    diff_result = subprocess.run(
-                        ["git", "diff", "main...HEAD", "--", file_path],
-                        cwd=worktree_path,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                        timeout=10,
-                        env=git_env,
-                    )
-                    raw_diff = diff_result.stdout
-                except (subprocess.CalledProcessError, subprocess.TimeoutExpired) as e:
-                    logger.warning(f"Failed to get diff for {file_path}: {e}")
-                    raw_diff = ""
-
-                # Get content before (from main) and after (current)
-                try:
-                    show_result = subprocess.run(
-                        ["git", "show", f"main:{file_path}"],
-                        cwd=worktree_path,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                        timeout=10,
-                        env=git_env,
-                    )
-                    old_content = show_result.stdout
-                except (subprocess.CalledProcessError, subprocess.TimeoutExpired):
-                    # File is new or timed out
-                    old_content = ""
-
-                current_file = worktree_path / file_path
-                if current_file.exists():
-                    try:
-                        new_content = current_file.read_text(encoding="utf-8")
-                    except Exception:
+            # Baselines from main come through a single cat-file process
+            modifications: list[tuple[str, str, str, str]] = []
+            with GitBlobReader(worktree_path) as reader:
+                for file_path, raw_diff in file_diffs.items():
+                    # Missing on main means the file is new
+                    old_content = reader.read("main", file_path) or ""
+
+                    current_file = worktree_path / file_path
+                    if current_file.exists():
+                        try:
+                            new_content = current_file.read_text(encoding="utf-8")
+                        except Exception:
+                            new_content = ""
+                    else:
+                        # File was deleted
                         new_content = ""
-                else:
-                    # File was deleted
-                    new_content = ""
-
-                # Record the modification
-                self.record_modification(
-                    task_id=task_id,
-                    file_path=file_path,
-                    old_content=old_content,
-                    new_content=new_content,
-                    evolutions=evolutions,
-                    raw_diff=raw_diff,
-                )
-
-            logger.info(
-                f"Refreshed {len(changed_files)} files from worktree for task {task_id}"
-            )
+
+                    modifications.append(
+                        (file_path, old_content, new_content, raw_diff)
+                    )
+
+            return modifications
 
         except subprocess.CalledProcessError as e:
             logger.error(f"Failed to refresh from git: {e}")
         except subprocess.TimeoutExpired as e:
             logger.error(f"Git command timed out: {e}")
+        return None
+
+    def record_worktree_changes(
+        self,
+        task_id: str,
+        modifications: list[tuple[str, str, str, str]],
+        evolutions: dict[str, FileEvolution],
+    ) -> None:
+        """
+        Analyze and record changes returned by read_worktree_changes().
+
+        Args:
+            task_id: The task identifier
+            modifications: (file_path, old_content, new_content, raw_diff) tuples
+            evolutions: Current evolution data (will be updated)
+        """
+        analyses = self._analyze_modifications(modifications, task_id)
+
+        for (file_path, old_content, new_content, raw_diff), analysis in zip(
+            modifications, analyses
+        ):
+            # Record the modification
+            self.record_modification(
+                task_id=task_id,
+                file_path=file_path,
+                old_content=old_content,
+                new_content=new_content,
+                evolutions=evolutions,
+                raw_diff=raw_diff,
+                analysis=analysis,
+            )
+
+        logger.info(
+            f"Refreshed {len(modifications)} files from worktree for task {task_id}"
+        )
+
+    def _analyze_modifications(
+        self,
+        modifications: list[tuple[str, str, str, str]],
+        task_id: str | None = None,
+    ) -> list[FileAnalysis]:
+        """
+        Run semantic analysis for many files, using a worker pool when worthwhile.
+
+        Parsers are not thread-safe, so each worker thread gets its own
+        SemanticAnalyzer. Custom analyzers injected by callers are always
+        run inline.
+
+        Args:
+            modifications: (file_path, old_content, new_content, raw_diff) tuples
+            task_id: Task that made the modifications (lets the shared
+                analyzer re-parse its files incrementally)
+
+        Returns:
+            One FileAnalysis per modification, in input order
+        """
+        items = [
+            (self.storage.get_relative_path(file_path), old, new)
+            for file_path, old, new, _ in modifications
+        ]
+
+        if (
+            len(items) < PARALLEL_ANALYSIS_THRESHOLD
+            or MAX_ANALYSIS_WORKERS < 2
+            or type(self.analyzer) is not SemanticAnalyzer
+        ):
+            return [
+                self.analyzer.analyze_diff(*item, task_id=task_id) for item in items
+            ]
+
+        local = threading.local()
+
+        def analyze(item: tuple[str, str, str]) -> FileAnalysis:
+            analyzer = getattr(local, "analyzer", None)
+            if analyzer is None:
+                analyzer = local.analyzer = SemanticAnalyzer()
+            return analyzer.analyze_diff(*item)
+
+        with ThreadPoolExecutor(max_workers=MAX_ANALYSIS_WORKERS) as pool:
+            return list(pool.map(analyze, items))
 
     def mark_task_completed(
         self,
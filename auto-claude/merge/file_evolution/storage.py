@@ -4,7 +4,7 @@ Storage and Persistence Module
 
 Handles file system operations for evolution tracking:
 - Loading/saving evolution data from JSON
-- Storing baseline content snapshots
+- Storing baseline content snapshots (in the shared blob store)
 - Reading file contents from disk
 """
 
@@ -15,10 +15,39 @@ import json
 import logging
 from pathlib import Path
 
+from ..blob_store import BLOBS_DIR, BlobStore, blob_ref, parse_blob_ref
 from ..types import FileEvolution
 
 logger = logging.getLogger(__name__)
 
+EVOLUTION_FILE = "file_evolution.json"
+
+
+def referenced_blobs(storage_dir: Path) -> set[str]:
+    """
+    Collect the blob keys referenced by saved evolution baselines.
+
+    Args:
+        storage_dir: Evolution storage directory (e.g., .auto-claude/)
+
+    Returns:
+        Set of blob keys
+
+    Raises:
+        OSError, ValueError: If the evolution file cannot be read
+    """
+    evolution_file = Path(storage_dir) / EVOLUTION_FILE
+    if not evolution_file.exists():
+        return set()
+    with open(evolution_file) as f:
+        data = json.load(f)
+    hashes = {
+        parse_blob_ref(evolution.get("baseline_snapshot_path", ""))
+        for evolution in data.values()
+    }
+    hashes.discard(None)
+    return hashes
+
 
 class EvolutionStorage:
     """
@@ -44,12 +73,13 @@ class EvolutionStorage:
         """
         self.project_dir = Path(project_dir).resolve()
         self.storage_dir = Path(storage_dir).resolve()
+        # Per-task .baseline copies written before the blob store existed
         self.baselines_dir = self.storage_dir / "baselines"
-        self.evolution_file = self.storage_dir / "file_evolution.json"
+        self.evolution_file = self.storage_dir / EVOLUTION_FILE
+        self.blobs = BlobStore(self.storage_dir / BLOBS_DIR)
 
         # Ensure directories exist
         self.storage_dir.mkdir(parents=True, exist_ok=True)
-        self.baselines_dir.mkdir(parents=True, exist_ok=True)
 
     def load_evolutions(self) -> dict[str, FileEvolution]:
         """
@@ -104,7 +134,9 @@ class EvolutionStorage:
         task_id: str,
     ) -> str:
         """
-        Store baseline content to disk.
+        Store baseline content in the blob store.
+
+        Identical content captured by several tasks is stored once.
 
         Args:
             file_path: Relative path to the file
@@ -112,29 +144,27 @@ class EvolutionStorage:
             task_id: Task identifier
 
         Returns:
-            Path to the stored baseline file (relative to storage_dir)
+            Blob reference to save as baseline_snapshot_path
         """
-        from ..types import sanitize_path_for_storage
-
-        safe_name = sanitize_path_for_storage(file_path)
-        baseline_path = self.baselines_dir / task_id / f"{safe_name}.baseline"
-        baseline_path.parent.mkdir(parents=True, exist_ok=True)
-
-        with open(baseline_path, "w", encoding="utf-8") as f:
-            f.write(content)
-
-        return str(baseline_path.relative_to(self.storage_dir))
+        return blob_ref(self.blobs.put(content))
 
     def read_baseline_content(self, baseline_snapshot_path: str) -> Optional[str]:
         """
-        Read baseline content from disk.
+        Read baseline content.
 
         Args:
-            baseline_snapshot_path: Path to baseline file (relative to storage_dir)
+            baseline_snapshot_path: Blob reference, or (for data saved before
+                the blob store) a path relative to storage_dir
 
         Returns:
             Baseline content, or None if not available
         """
+        if not baseline_snapshot_path:
+            return None
+        blob_hash = parse_blob_ref(baseline_snapshot_path)
+        if blob_hash is not None:
+            return self.blobs.get(blob_hash)
+
         baseline_path = self.storage_dir / baseline_snapshot_path
         if baseline_path.exists():
             try:
@@ -13,8 +13,10 @@ from __future__ import annotations
 from typing import Optional
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+from ..blob_store import collect_garbage
 from ..semantic_analyzer import SemanticAnalyzer
 from ..types import FileEvolution, TaskSnapshot
 from .baseline_capture import DEFAULT_EXTENSIONS, BaselineCapture
@@ -37,6 +39,9 @@ except ImportError:
 logger = logging.getLogger(__name__)
 MODULE = "merge.file_evolution"
 
+# Worktrees read at once by refresh_tasks_from_git (each runs its own git processes)
+MAX_REFRESH_WORKERS = 8
+
 
 class FileEvolutionTracker:
     """
@@ -44,7 +49,7 @@ class FileEvolutionTracker:
 
     This class manages:
     - Baseline capture when worktrees are created
-    - File content snapshots in .auto-claude/baselines/
+    - File content snapshots in .auto-claude/blobs/ (shared blob store)
     - Task modification tracking with semantic analysis
     - Persistence of evolution data
 
@@ -273,6 +278,7 @@ class FileEvolutionTracker:
         Args:
             task_id: The task identifier
             remove_baselines: Whether to remove stored baseline files
+                (blobs no longer referenced by any evolution or timeline)
         """
         self._evolutions = self.queries.cleanup_task(
             task_id=task_id,
@@ -280,6 +286,8 @@ class FileEvolutionTracker:
             remove_baselines=remove_baselines,
         )
         self._save_evolutions()
+        if remove_baselines:
+            collect_garbage(self.storage.storage_dir)
 
     def get_active_tasks(self) -> set[str]:
         """
@@ -344,3 +352,33 @@ class FileEvolutionTracker:
             evolutions=self._evolutions,
         )
         self._save_evolutions()
+
+    def refresh_tasks_from_git(self, tasks: list[tuple[str, Path]]) -> None:
+        """
+        Refresh several tasks from their worktrees.
+
+        Worktrees are read concurrently. Changes are then analyzed and
+        recorded in the given order, and evolution data is saved once.
+
+        Args:
+            tasks: (task_id, worktree_path) pairs
+        """
+        if not tasks:
+            return
+
+        def read(task: tuple[str, Path]):
+            return self.modification_tracker.read_worktree_changes(*task)
+
+        if len(tasks) == 1:
+            changes = [read(tasks[0])]
+        else:
+            workers = min(len(tasks), MAX_REFRESH_WORKERS)
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                changes = list(pool.map(read, tasks))
+
+        for (task_id, _), modifications in zip(tasks, changes):
+            if modifications is not None:
+                self.modification_tracker.record_worktree_changes(
+                    task_id, modifications, self._evolutions
+                )
+        self._save_evolutions()
@@ -7,16 +7,31 @@ Helper functions for git operations used in merge orchestration.
 This module provides utilities for:
 - Finding git worktrees
 - Getting file content from branches
+- Batched blob reads via a long-lived ``git cat-file --batch`` process
+- Splitting a single multi-file diff into per-file patches
 - Working with git repositories
 """
 
 from __future__ import annotations
 from typing import Optional
 
+import os
 import subprocess
 from pathlib import Path
 
+try:
+    from core.profiling import profiled
+except ImportError:
 
+    def profiled(name=None):
+        return lambda func: func
+
+
+# Environment for non-interactive git calls (never wait on a pager)
+GIT_ENV = {**os.environ, "GIT_PAGER": "cat", "PAGER": "cat"}
+
+
+@profiled("git.worktree_list")
 def find_worktree(project_dir: Path, task_id: str) -> Optional[Path]:
     """
     Find the worktree path for a task.
@@ -54,6 +69,7 @@ def find_worktree(project_dir: Path, task_id: str) -> Optional[Path]:
     return None
 
 
+@profiled("git.show")
 def get_file_from_branch(project_dir: Path, file_path: str, branch: str) -> Optional[str]:
     """
     Get file content from a specific git branch.
@@ -77,3 +93,247 @@ def get_file_from_branch(project_dir: Path, file_path: str, branch: str) -> Opti
         return result.stdout
     except subprocess.CalledProcessError:
         return None
+
+
+class GitBlobReader:
+    """
+    Read many blobs through one long-lived ``git cat-file --batch`` process.
+
+    Spawning ``git show <rev>:<path>`` per file costs a process per read;
+    this keeps a single process open and streams requests through it.
+
+    Usage:
+        with GitBlobReader(repo_dir) as reader:
+            content = reader.read("main", "src/app.py")
+    """
+
+    def __init__(self, repo_dir: Path):
+        self.repo_dir = Path(repo_dir)
+        self._process: subprocess.Popen | None = None
+
+    def __enter__(self) -> GitBlobReader:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
+    def _ensure_process(self) -> subprocess.Popen:
+        if self._process is None or self._process.poll() is not None:
+            self._process = subprocess.Popen(
+                ["git", "cat-file", "--batch"],
+                cwd=self.repo_dir,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                env=GIT_ENV,
+            )
+        return self._process
+
+    @profiled("git.cat_file")
+    def read_bytes(self, rev: str, file_path: str) -> bytes | None:
+        """
+        Read a blob as raw bytes.
+
+        Args:
+            rev: Commit-ish (branch, tag, SHA)
+            file_path: Path relative to the repository root
+
+        Returns:
+            Blob content, or None if the path does not exist at ``rev``
+        """
+        if "\n" in file_path:
+            # Not expressible in the batch protocol - fall back to git show
+            try:
+                result = subprocess.run(
+                    ["git", "show", f"{rev}:{file_path}"],
+                    cwd=self.repo_dir,
+                    capture_output=True,
+                    check=True,
+                    env=GIT_ENV,
+                )
+                return result.stdout
+            except subprocess.CalledProcessError:
+                return None
+
+        process = self._ensure_process()
+        try:
+            process.stdin.write(f"{rev}:{file_path}\n".encode())
+            process.stdin.flush()
+            header = process.stdout.readline().decode(errors="replace").rstrip("\n")
+        except (BrokenPipeError, OSError):
+            self.close()
+            return None
+
+        # "<sha> <type> <size>" or "<object> missing" / "<object> ambiguous"
+        if header.endswith((" missing", " ambiguous")):
+            return None
+        parts = header.split()
+        if len(parts) != 3 or not parts[2].isdigit():
+            # Out of sync with the protocol - restart on next read
+            self.close()
+            return None
+
+        size = int(parts[2])
+        content = process.stdout.read(size)
+        process.stdout.read(1)  # Trailing newline after each object
+        if parts[1] != "blob":
+            return None
+        return content
+
+    def read(self, rev: str, file_path: str) -> str | None:
+        """Read a blob decoded as UTF-8 (undecodable bytes are replaced)."""
+        content = self.read_bytes(rev, file_path)
+        if content is None:
+            return None
+        return content.decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        """Terminate the cat-file process."""
+        if self._process is None:
+            return
+        try:
+            if self._process.stdin:
+                self._process.stdin.close()
+            self._process.wait(timeout=5)
+        except (OSError, subprocess.TimeoutExpired):
+            self._process.kill()
+        finally:
+            if self._process.stdout:
+                self._process.stdout.close()
+            self._process = None
+
+
+_GIT_ESCAPES = {
+    "a": 7,
+    "b": 8,
+    "t": 9,
+    "n": 10,
+    "v": 11,
+    "f": 12,
+    "r": 13,
+    '"': 34,
+    "\\": 92,
+}
+
+
+def _unquote_git_path(path: str) -> str:
+    """Undo git's C-style quoting of unusual paths (e.g. ``"a\\tb"``)."""
+    if not (len(path) >= 2 and path[0] == '"' and path[-1] == '"'):
+        return path
+
+    body = path[1:-1]
+    out = bytearray()
+    i = 0
+    while i < len(body):
+        char = body[i]
+        if char == "\\" and i + 1 < len(body):
+            octal = body[i + 1 : i + 4]
+            if len(octal) == 3 and all(c in "01234567" for c in octal):
+                out.append(int(octal, 8))
+                i += 4
+                continue
+            if body[i + 1] in _GIT_ESCAPES:
+                out.append(_GIT_ESCAPES[body[i + 1]])
+                i += 2
+                continue
+        out += char.encode("utf-8")
+        i += 1
+    return out.decode("utf-8", errors="replace")
+
+
+def _patch_path(patch: str) -> str | None:
+    """Extract the file path from one ``diff --git`` section."""
+    new_path = old_path = None
+    for line in patch.split("\n", 8)[:8]:
+        if line.startswith("+++ "):
+            new_path = line[4:]
+        elif line.startswith("--- "):
+            old_path = line[4:]
+    for candidate, prefix in ((new_path, "b/"), (old_path, "a/")):
+        if candidate and candidate != "/dev/null":
+            candidate = _unquote_git_path(candidate.rstrip("\t"))
+            return (
+                candidate[len(prefix) :] if candidate.startswith(prefix) else candidate
+            )
+
+    # Binary or mode-only changes have no ---/+++ lines; without renames
+    # the header is "diff --git a/<p> b/<p>" with both paths identical
+    header = patch.split("\n", 1)[0][len("diff --git ") :]
+    if header.startswith("a/") and len(header) % 2 == 1:
+        half = (len(header) - 1) // 2
+        if header[2:half] == header[half + 3 :]:
+            return header[2:half]
+    return None
+
+
+@profiled("git.diff")
+def get_changed_files_with_diffs(
+    repo_dir: Path, diff_range: str, timeout: int = 60
+) -> dict[str, str]:
+    """
+    Get every changed file and its patch using two git calls in total.
+
+    ``git diff --name-only -z`` provides exact path names and one full
+    ``git diff`` is split into per-file patches. Files whose patch can't be
+    matched to a name (exotic quoting) map to an empty string.
+
+    Args:
+        repo_dir: Repository or worktree directory
+        diff_range: Revision range, e.g. ``"main...HEAD"``
+        timeout: Timeout for each git call in seconds
+
+    Returns:
+        Ordered mapping of file path -> unified diff
+
+    Raises:
+        subprocess.CalledProcessError / subprocess.TimeoutExpired on git failure
+    """
+    names = subprocess.run(
+        ["git", "diff", "--name-only", "-z", "--no-renames", diff_range],
+        cwd=repo_dir,
+        capture_output=True,
+        check=True,
+        timeout=timeout,
+        env=GIT_ENV,
+    )
+    changed = [
+        name
+        for name in names.stdout.decode("utf-8", errors="replace").split("\0")
+        if name
+    ]
+    if not changed:
+        return {}
+
+    full = subprocess.run(
+        [
+            "git",
+            "-c",
+            "core.quotePath=false",
+            "diff",
+            "--no-color",
+            "--no-ext-diff",
+            "--no-renames",
+            diff_range,
+        ],
+        cwd=repo_dir,
+        capture_output=True,
+        check=True,
+        timeout=timeout,
+        env=GIT_ENV,
+    )
+    output = full.stdout.decode("utf-8", errors="replace")
+
+    patches: dict[str, str] = {}
+    starts = [0] if output.startswith("diff --git ") else []
+    pos = output.find("\ndiff --git ")
+    while pos != -1:
+        starts.append(pos + 1)
+        pos = output.find("\ndiff --git ", pos + 1)
+    for i, start in enumerate(starts):
+        end = starts[i + 1] if i + 1 < len(starts) else len(output)
+        patch = output[start:end]
+        path = _patch_path(patch)
+        if path is not None:
+            patches[path] = patch
+
+    return {name: patches.get(name, "") for name in changed}
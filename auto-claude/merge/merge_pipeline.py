@@ -9,12 +9,14 @@ This module handles the pipeline for merging a single file:
 - Detecting conflicts
 - Determining merge strategy (single task vs. multi-task)
 - Coordinating conflict resolution
+- Merging chunks of files in worker processes (merge_file_chunk)
 """
 
 from __future__ import annotations
 
 import logging
 
+from .auto_merger import AutoMerger
 from .conflict_detector import ConflictDetector
 from .conflict_resolver import ConflictResolver
 from .file_merger import apply_single_task_changes, combine_non_conflicting_changes
@@ -28,6 +30,9 @@ from .types import (
 
 logger = logging.getLogger(__name__)
 
+# Pipeline reused by every chunk a worker process merges
+_worker_pipeline: MergePipeline | None = None
+
 
 class MergePipeline:
     """
@@ -146,3 +151,33 @@ class MergePipeline:
             analyses[snapshot.task_id] = analysis
 
         return analyses
+
+
+def merge_file_chunk(
+    jobs: list[tuple[str, str, list[TaskSnapshot]]],
+) -> list[MergeResult]:
+    """
+    Merge a chunk of files in a worker process.
+
+    Conflicts are resolved deterministically only (no AI resolver), so
+    results with unresolved medium/high severity conflicts may still need
+    an AI pass in the parent process.
+
+    Args:
+        jobs: (file_path, baseline_content, task_snapshots) per file
+
+    Returns:
+        One MergeResult per job, in input order
+    """
+    global _worker_pipeline
+    if _worker_pipeline is None:
+        _worker_pipeline = MergePipeline(
+            conflict_detector=ConflictDetector(),
+            conflict_resolver=ConflictResolver(
+                auto_merger=AutoMerger(), ai_resolver=None, enable_ai=False
+            ),
+        )
+    return [
+        _worker_pipeline.merge_file(file_path, baseline_content, task_snapshots)
+        for file_path, baseline_content, task_snapshots in jobs
+    ]
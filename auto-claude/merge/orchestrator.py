@@ -19,6 +19,9 @@ with maximum automation and minimum AI token usage.
 from __future__ import annotations
 
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -28,16 +31,19 @@ from .auto_merger import AutoMerger
 from .conflict_detector import ConflictDetector
 from .conflict_resolver import ConflictResolver
 from .file_evolution import FileEvolutionTracker
-from .git_utils import find_worktree, get_file_from_branch
-from .merge_pipeline import MergePipeline
+from .git_utils import GitBlobReader, find_worktree, get_file_from_branch
+from .merge_pipeline import MergePipeline, merge_file_chunk
 
 # Re-export models for backwards compatibility
 from .models import MergeReport, MergeStats, TaskMergeRequest
 from .semantic_analyzer import SemanticAnalyzer
 from .types import (
     ConflictRegion,
+    ConflictSeverity,
     FileAnalysis,
     MergeDecision,
+    MergeResult,
+    TaskSnapshot,
 )
 
 # Import debug utilities
@@ -79,9 +85,27 @@ except ImportError:
         return False
 
 
+try:
+    from core.profiling import profile_span, profiled
+except ImportError:
+    from contextlib import nullcontext
+
+    def profile_span(name):
+        return nullcontext()
+
+    def profiled(name=None):
+        return lambda func: func
+
+
 logger = logging.getLogger(__name__)
 MODULE = "merge.orchestrator"
 
+# Below this many files, merge_tasks() merges in-process (pool startup isn't worth it)
+PARALLEL_MERGE_THRESHOLD = 200
+MAX_MERGE_WORKERS = min(8, os.cpu_count() or 1)
+# Files sent to a worker process at a time
+MERGE_CHUNK_SIZE = 16
+
 # Export all public classes for backwards compatibility
 __all__ = [
     "MergeOrchestrator",
@@ -203,6 +227,7 @@ class MergeOrchestrator:
             )
         return self._merge_pipeline
 
+    @profiled("merge.task")
     def merge_task(
         self,
         task_id: str,
@@ -246,10 +271,12 @@ class MergeOrchestrator:
 
             # Ensure evolution data is up to date
             debug(MODULE, "Refreshing evolution data from git...")
-            self.evolution_tracker.refresh_from_git(task_id, worktree_path)
+            with profile_span("merge.refresh"):
+                self.evolution_tracker.refresh_from_git(task_id, worktree_path)
 
             # Get files modified by this task
-            modifications = self.evolution_tracker.get_task_modifications(task_id)
+            with profile_span("merge.collect"):
+                modifications = self.evolution_tracker.get_task_modifications(task_id)
             debug(
                 MODULE,
                 f"Found {len(modifications) if modifications else 0} modified files",
@@ -310,6 +337,7 @@ class MergeOrchestrator:
 
         return report
 
+    @profiled("merge.tasks")
     def merge_tasks(
         self,
         requests: list[TaskMergeRequest],
@@ -338,38 +366,52 @@ class MergeOrchestrator:
             # Sort by priority (higher first)
             requests = sorted(requests, key=lambda r: -r.priority)
 
-            # Refresh evolution data for all tasks
-            for request in requests:
-                if request.worktree_path and request.worktree_path.exists():
-                    self.evolution_tracker.refresh_from_git(
-                        request.task_id, request.worktree_path
-                    )
+            # Refresh evolution data for all tasks (worktrees read concurrently)
+            with profile_span("merge.refresh"):
+                self.evolution_tracker.refresh_tasks_from_git(
+                    [
+                        (request.task_id, request.worktree_path)
+                        for request in requests
+                        if request.worktree_path and request.worktree_path.exists()
+                    ]
+                )
 
             # Find all files modified by any task
             task_ids = [r.task_id for r in requests]
-            file_tasks = self.evolution_tracker.get_files_modified_by_tasks(task_ids)
-
-            # Process each file
-            for file_path, modifying_tasks in file_tasks.items():
-                # Get snapshots from all tasks that modified this file
-                evolution = self.evolution_tracker.get_file_evolution(file_path)
-                if not evolution:
-                    continue
-
-                snapshots = [
-                    evolution.get_task_snapshot(tid)
-                    for tid in modifying_tasks
-                    if evolution.get_task_snapshot(tid)
-                ]
-
-                if not snapshots:
-                    continue
+            with profile_span("merge.collect"):
+                file_tasks = self.evolution_tracker.get_files_modified_by_tasks(
+                    task_ids
+                )
 
-                result = self._merge_file(
-                    file_path=file_path,
-                    task_snapshots=snapshots,
-                    target_branch=target_branch,
+                # Get snapshots from all tasks that modified each file
+                file_snapshots: list[tuple[str, list[TaskSnapshot]]] = []
+                for file_path, modifying_tasks in file_tasks.items():
+                    evolution = self.evolution_tracker.get_file_evolution(file_path)
+                    if not evolution:
+                        continue
+
+                    snapshots = [
+                        evolution.get_task_snapshot(tid)
+                        for tid in modifying_tasks
+                        if evolution.get_task_snapshot(tid)
+                    ]
+                    if snapshots:
+                        file_snapshots.append((file_path, snapshots))
+
+            with profile_span("merge.baseline"):
+                baselines = self._prefetch_baselines(
+                    [file_path for file_path, _ in file_snapshots], target_branch
                 )
+
+            jobs = [
+                (file_path, baselines[file_path], snapshots)
+                for file_path, snapshots in file_snapshots
+            ]
+            with profile_span("merge.files"):
+                results = self._merge_files(jobs)
+
+            # Aggregate in file order, however the files were merged
+            for (file_path, _, _), result in zip(jobs, results):
                 report.file_results[file_path] = result
                 self._update_stats(report.stats, result)
 
@@ -392,6 +434,110 @@ class MergeOrchestrator:
 
         return report
 
+    def _prefetch_baselines(
+        self,
+        file_paths: list[str],
+        target_branch: str,
+    ) -> dict[str, str]:
+        """
+        Get the baseline content of many files at once.
+
+        Files without a captured baseline are read from the target branch
+        through a single cat-file process; files missing there too are new
+        and get an empty baseline.
+
+        Args:
+            file_paths: Files to get baselines for
+            target_branch: Branch to read uncaptured baselines from
+
+        Returns:
+            Dictionary mapping file path to baseline content
+        """
+        baselines: dict[str, str] = {}
+        missing: list[str] = []
+        for file_path in file_paths:
+            content = self.evolution_tracker.get_baseline_content(file_path)
+            if content is None:
+                missing.append(file_path)
+            else:
+                baselines[file_path] = content
+
+        if missing:
+            with GitBlobReader(self.project_dir) as reader:
+                for file_path in missing:
+                    baselines[file_path] = reader.read(target_branch, file_path) or ""
+
+        return baselines
+
+    def _merge_files(
+        self,
+        jobs: list[tuple[str, str, list[TaskSnapshot]]],
+    ) -> list[MergeResult]:
+        """
+        Run the merge pipeline for many files, in worker processes when worthwhile.
+
+        Workers resolve conflicts deterministically only. Files they leave
+        with conflicts the AI resolver would take are merged again here,
+        so results match an in-process merge. Custom conflict detectors or
+        auto-mergers set on the orchestrator always run in-process.
+
+        Args:
+            jobs: (file_path, baseline_content, task_snapshots) per file
+
+        Returns:
+            One MergeResult per job, in input order
+        """
+        if (
+            len(jobs) < PARALLEL_MERGE_THRESHOLD
+            or MAX_MERGE_WORKERS < 2
+            or type(self.conflict_detector) is not ConflictDetector
+            or type(self.auto_merger) is not AutoMerger
+        ):
+            return [self._merge_job(*job) for job in jobs]
+
+        chunks = [
+            jobs[i : i + MERGE_CHUNK_SIZE]
+            for i in range(0, len(jobs), MERGE_CHUNK_SIZE)
+        ]
+        try:
+            with ProcessPoolExecutor(max_workers=MAX_MERGE_WORKERS) as pool:
+                results = [
+                    result
+                    for batch in pool.map(merge_file_chunk, chunks)
+                    for result in batch
+                ]
+        except (BrokenProcessPool, OSError) as e:
+            debug_warning(
+                MODULE, "Merge worker pool failed, merging in-process", error=str(e)
+            )
+            return [self._merge_job(*job) for job in jobs]
+
+        if self.enable_ai:
+            ai_severities = {ConflictSeverity.MEDIUM, ConflictSeverity.HIGH}
+            for i, result in enumerate(results):
+                if any(
+                    conflict.severity in ai_severities
+                    for conflict in result.conflicts_remaining
+                ):
+                    results[i] = self._merge_job(*jobs[i])
+
+        return results
+
+    @profiled("merge.file")
+    def _merge_job(
+        self,
+        file_path: str,
+        baseline_content: str,
+        task_snapshots: list[TaskSnapshot],
+    ) -> MergeResult:
+        """Run the merge pipeline for one file with a known baseline."""
+        return self.merge_pipeline.merge_file(
+            file_path=file_path,
+            baseline_content=baseline_content,
+            task_snapshots=task_snapshots,
+        )
+
+    @profiled("merge.file")
     def _merge_file(
         self,
         file_path: str,
@@ -418,12 +564,13 @@ class MergeOrchestrator:
         )
 
         # Get baseline content
-        baseline_content = self.evolution_tracker.get_baseline_content(file_path)
-        if baseline_content is None:
-            # Try to get from target branch
-            baseline_content = get_file_from_branch(
-                self.project_dir, file_path, target_branch
-            )
+        with profile_span("merge.baseline"):
+            baseline_content = self.evolution_tracker.get_baseline_content(file_path)
+            if baseline_content is None:
+                # Try to get from target branch
+                baseline_content = get_file_from_branch(
+                    self.project_dir, file_path, target_branch
+                )
 
         if baseline_content is None:
             # File is new - created by task(s)
@@ -13,8 +13,14 @@ When tree-sitter is not available, falls back to regex-based heuristics.
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from bisect import bisect_left
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass, replace
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Any
 
 from .types import ChangeType, FileAnalysis
@@ -92,6 +98,14 @@ if TREE_SITTER_AVAILABLE:
     except ImportError:
         pass
 
+# Parsed versions kept per analyzer. Every task's changes to a file are
+# analyzed against the same baseline, so its tree is reused across tasks.
+PARSE_CACHE_SIZE = 64
+
+# Last parsed version per (task, file), the starting point for incremental
+# re-parsing when that task changes the file again.
+TASK_TREE_CACHE_SIZE = 256
+
 # Import our modular components
 from .semantic_analysis.comparison import compare_elements
 from .semantic_analysis.models import ExtractedElement
@@ -102,6 +116,76 @@ if TREE_SITTER_AVAILABLE:
     from .semantic_analysis.python_analyzer import extract_python_elements
 
 
+def _line_lookup(source_bytes: bytes) -> Callable[[int], int]:
+    """
+    Build a byte offset -> line number (1-indexed) function for a source.
+
+    tree-sitter reports byte offsets into the UTF-8 encoding, so newlines
+    are located in the same encoding. Lookups are a bisect over the
+    newline offsets instead of a rescan from the start of the file.
+    """
+    newlines: list[int] = []
+    pos = source_bytes.find(b"\n")
+    while pos != -1:
+        newlines.append(pos)
+        pos = source_bytes.find(b"\n", pos + 1)
+
+    def get_line(byte_pos: int) -> int:
+        return bisect_left(newlines, byte_pos) + 1
+
+    return get_line
+
+
+def _point(source_bytes: bytes, get_line: Callable[[int], int], byte_pos: int):
+    """tree-sitter (row, column) point of a byte offset; columns are in bytes."""
+    line_start = source_bytes.rfind(b"\n", 0, byte_pos) + 1
+    return (get_line(byte_pos) - 1, byte_pos - line_start)
+
+
+def _edit_range(old: bytes, new: bytes) -> tuple[int, int, int]:
+    """
+    Find the single edit turning old into new.
+
+    Returns:
+        (start_byte, old_end_byte, new_end_byte): old[start:old_end] was
+        replaced by new[start:new_end]
+    """
+    old_view, new_view = memoryview(old), memoryview(new)
+    limit = min(len(old), len(new))
+
+    # Longest common prefix, by bisecting over slice comparisons (memcmp)
+    lo, hi = 0, limit
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old_view[:mid] == new_view[:mid]:
+            lo = mid
+        else:
+            hi = mid - 1
+    start = lo
+
+    # Longest common suffix not overlapping the prefix
+    lo, hi = 0, limit - start
+    while lo < hi:
+        mid = (lo + hi + 1) // 2
+        if old_view[len(old) - mid :] == new_view[len(new) - mid :]:
+            lo = mid
+        else:
+            hi = mid - 1
+
+    return start, len(old) - lo, len(new) - lo
+
+
+@dataclass
+class _ParsedSource:
+    """A parsed version of a file and the elements extracted from it."""
+
+    tree: Tree
+    elements: dict[str, ExtractedElement]
+    # (start_byte, end_byte) of each top-level node -> elements found in it
+    spans: dict[tuple[int, int], dict[str, ExtractedElement]]
+    get_line: Callable[[int], int]
+
+
 class SemanticAnalyzer:
     """
     Analyzes code changes at a semantic level.
@@ -119,6 +203,12 @@ class SemanticAnalyzer:
     def __init__(self):
         """Initialize the analyzer with available parsers."""
         self._parsers: dict[str, Parser] = {}
+        # (ext, content hash) -> parsed version, least recent first
+        self._parse_cache: OrderedDict[tuple[str, bytes], _ParsedSource] = OrderedDict()
+        # (task_id, file_path) -> (source bytes, parsed version)
+        self._task_versions: OrderedDict[
+            tuple[str, str], tuple[bytes, _ParsedSource]
+        ] = OrderedDict()
 
         debug(
             MODULE,
@@ -150,11 +240,16 @@ class SemanticAnalyzer:
         """
         Analyze the semantic differences between two versions of a file.
 
+        When a task_id is given, the task's previous version of the file is
+        kept and the next call for the same task and file re-parses
+        incrementally: only the edited range is re-parsed and only the
+        top-level nodes it touches are re-extracted.
+
         Args:
             file_path: Path to the file being analyzed
             before: Content before changes
             after: Content after changes
-            task_id: Optional task ID for context
+            task_id: Optional task ID (enables incremental re-parsing)
 
         Returns:
             FileAnalysis containing semantic changes
@@ -174,7 +269,9 @@ class SemanticAnalyzer:
         # Use tree-sitter if available for this language
         if ext in self._parsers:
             debug_detailed(MODULE, f"Using tree-sitter parser for {ext}")
-            analysis = self._analyze_with_tree_sitter(file_path, before, after, ext)
+            analysis = self._analyze_with_tree_sitter(
+                file_path, before, after, ext, task_id
+            )
         else:
             debug_detailed(MODULE, f"Using regex fallback for {ext}")
             analysis = analyze_with_regex(file_path, before, after, ext)
@@ -207,16 +304,14 @@ class SemanticAnalyzer:
         before: str,
         after: str,
         ext: str,
+        task_id: str | None = None,
     ) -> FileAnalysis:
         """Analyze using tree-sitter AST parsing."""
-        parser = self._parsers[ext]
-
-        tree_before = parser.parse(bytes(before, "utf-8"))
-        tree_after = parser.parse(bytes(after, "utf-8"))
-
         # Extract structural elements from both versions
-        elements_before = self._extract_elements(tree_before, before, ext)
-        elements_after = self._extract_elements(tree_after, after, ext)
+        elements_before = self._parse(before, ext).elements
+        elements_after = self._parse(
+            after, ext, version_key=(task_id, file_path) if task_id else None
+        ).elements
 
         # Compare and generate semantic changes
         changes = compare_elements(elements_before, elements_after, ext)
@@ -247,30 +342,164 @@ class SemanticAnalyzer:
 
         return analysis
 
-    def _extract_elements(
+    def _parse(
         self,
-        tree: Tree,
         source: str,
         ext: str,
-    ) -> dict[str, ExtractedElement]:
-        """Extract structural elements from a syntax tree."""
-        elements: dict[str, ExtractedElement] = {}
+        version_key: tuple[str, str] | None = None,
+    ) -> _ParsedSource:
+        """
+        Parse a source and extract its elements, reusing earlier results.
+
+        Identical content is served from the parse cache. Otherwise, if
+        version_key names a (task, file) seen before, its last version is
+        edited and re-parsed incrementally.
+
+        Returned elements are shared with the caches and must not be mutated.
+        """
         source_bytes = bytes(source, "utf-8")
+        key = (ext, hashlib.sha1(source_bytes).digest())
 
-        def get_text(node: Node) -> str:
-            return source_bytes[node.start_byte : node.end_byte].decode("utf-8")
+        parsed = self._parse_cache.get(key)
+        if parsed is not None:
+            self._parse_cache.move_to_end(key)
+            debug_verbose(MODULE, "Parse cache hit", extension=ext)
+        else:
+            previous = self._task_versions.get(version_key) if version_key else None
+            if previous is not None:
+                parsed = self._parse_incremental(previous, source_bytes, ext)
+            if parsed is None:
+                tree = self._parsers[ext].parse(source_bytes)
+                parsed = self._extract(
+                    tree, source_bytes, ext, _line_lookup(source_bytes)
+                )
+
+            self._parse_cache[key] = parsed
+            if len(self._parse_cache) > PARSE_CACHE_SIZE:
+                self._parse_cache.popitem(last=False)
+
+        if version_key:
+            self._task_versions[version_key] = (source_bytes, parsed)
+            self._task_versions.move_to_end(version_key)
+            if len(self._task_versions) > TASK_TREE_CACHE_SIZE:
+                self._task_versions.popitem(last=False)
+
+        return parsed
+
+    def _parse_incremental(
+        self,
+        previous: tuple[bytes, _ParsedSource],
+        source_bytes: bytes,
+        ext: str,
+    ) -> _ParsedSource | None:
+        """
+        Re-parse a new version of a file from its previous tree.
+
+        Top-level nodes outside the edited (and syntactically changed)
+        range keep the elements extracted from the previous version, with
+        line numbers shifted.
+
+        Returns:
+            The parsed version, or None if incremental parsing failed
+        """
+        old_bytes, old = previous
+        get_line = _line_lookup(source_bytes)
+        start, old_end, new_end = _edit_range(old_bytes, source_bytes)
+
+        try:
+            edited = old.tree.copy()
+            edited.edit(
+                start_byte=start,
+                old_end_byte=old_end,
+                new_end_byte=new_end,
+                start_point=_point(old_bytes, old.get_line, start),
+                old_end_point=_point(old_bytes, old.get_line, old_end),
+                new_end_point=_point(source_bytes, get_line, new_end),
+            )
+            tree = self._parsers[ext].parse(source_bytes, edited)
+            changed_ranges = edited.changed_ranges(tree)
+        except Exception as e:
+            debug_error(
+                MODULE, "Incremental parse failed, parsing in full", error=str(e)
+            )
+            return None
+
+        # New-version byte range whose top-level nodes must be re-extracted
+        lo, hi = start, new_end
+        for changed in changed_ranges:
+            lo = min(lo, changed.start_byte)
+            hi = max(hi, changed.end_byte)
+        shift = new_end - old_end
+
+        def reuse(node: Node) -> dict[str, ExtractedElement] | None:
+            if node.start_byte <= hi and node.end_byte >= lo:
+                return None
+            offset = 0 if node.end_byte < lo else shift
+            old_span = (node.start_byte - offset, node.end_byte - offset)
+            found = old.spans.get(old_span)
+            if found is None:
+                return None
+            line_delta = get_line(node.start_byte) - old.get_line(old_span[0])
+            if not line_delta:
+                return found
+            return {
+                key: replace(
+                    element,
+                    start_line=element.start_line + line_delta,
+                    end_line=element.end_line + line_delta,
+                )
+                for key, element in found.items()
+            }
+
+        debug_verbose(
+            MODULE,
+            "Incremental re-parse",
+            edit_start=start,
+            old_end=old_end,
+            new_end=new_end,
+        )
+        return self._extract(tree, source_bytes, ext, get_line, reuse)
+
+    def _extract(
+        self,
+        tree: Tree,
+        source_bytes: bytes,
+        ext: str,
+        get_line: Callable[[int], int],
+        reuse: Callable[[Node], dict[str, ExtractedElement] | None] | None = None,
+    ) -> _ParsedSource:
+        """
+        Extract structural elements from a syntax tree, per top-level node.
 
-        def get_line(byte_pos: int) -> int:
-            # Convert byte position to line number (1-indexed)
-            return source[:byte_pos].count("\n") + 1
+        Args:
+            tree: Parsed syntax tree
+            source_bytes: The UTF-8 source the tree was parsed from
+            ext: File extension
+            get_line: Byte offset -> line number lookup for the source
+            reuse: Optional callback returning already-extracted elements
+                for a top-level node (None to extract it)
+        """
 
-        # Language-specific extraction
-        if ext == ".py":
-            extract_python_elements(tree.root_node, elements, get_text, get_line)
-        elif ext in {".js", ".jsx", ".ts", ".tsx"}:
-            extract_js_elements(tree.root_node, elements, get_text, get_line, ext)
+        def get_text(node: Node) -> str:
+            return source_bytes[node.start_byte : node.end_byte].decode("utf-8")
 
-        return elements
+        elements: dict[str, ExtractedElement] = {}
+        spans: dict[tuple[int, int], dict[str, ExtractedElement]] = {}
+
+        for child in tree.root_node.children:
+            found = reuse(child) if reuse else None
+            if found is None:
+                found = {}
+                # Extractors walk the children of the node they are given
+                group = SimpleNamespace(children=[child])
+                if ext == ".py":
+                    extract_python_elements(group, found, get_text, get_line)
+                elif ext in {".js", ".jsx", ".ts", ".tsx"}:
+                    extract_js_elements(group, found, get_text, get_line, ext)
+            spans[(child.start_byte, child.end_byte)] = found
+            elements.update(found)
+
+        return _ParsedSource(tree, elements, spans, get_line)
 
     def analyze_file(self, file_path: str, content: str) -> FileAnalysis:
         """
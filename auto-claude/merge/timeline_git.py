@@ -18,6 +18,8 @@ import logging
 import subprocess
 from pathlib import Path
 
+from .git_utils import GitBlobReader
+
 logger = logging.getLogger(__name__)
 
 # Import debug utilities
@@ -35,6 +37,14 @@ except ImportError:
         pass
 
 
+try:
+    from core.profiling import profiled
+except ImportError:
+
+    def profiled(name=None):
+        return lambda func: func
+
+
 MODULE = "merge.timeline_git"
 
 
@@ -54,6 +64,7 @@ class TimelineGitHelper:
         """
         self.project_path = Path(project_path).resolve()
 
+    @profiled("git.rev_parse")
     def get_current_main_commit(self) -> str:
         """Get the current HEAD commit on main branch."""
         try:
@@ -68,6 +79,7 @@ class TimelineGitHelper:
         except subprocess.CalledProcessError:
             return "unknown"
 
+    @profiled("git.show")
     def get_file_content_at_commit(
         self, file_path: str, commit_hash: str
     ) -> Optional[str]:
@@ -94,6 +106,27 @@ class TimelineGitHelper:
         except Exception:
             return None
 
+    def get_files_content_at_commit(
+        self, file_paths: list[str], commit_hash: str
+    ) -> dict[str, str | None]:
+        """
+        Get the content of many files at one commit.
+
+        Reads every blob through a single ``git cat-file --batch`` process
+        instead of one ``git show`` per file.
+
+        Args:
+            file_paths: Paths relative to project root
+            commit_hash: Git commit hash
+
+        Returns:
+            Dictionary mapping each path to its content (None if the file
+            doesn't exist at that commit)
+        """
+        with GitBlobReader(self.project_path) as reader:
+            return {path: reader.read(commit_hash, path) for path in file_paths}
+
+    @profiled("git.diff_tree")
     def get_files_changed_in_commit(self, commit_hash: str) -> list[str]:
         """
         Get list of files changed in a commit.
@@ -123,9 +156,10 @@ class TimelineGitHelper:
         except subprocess.CalledProcessError:
             return []
 
+    @profiled("git.log")
     def get_commit_info(self, commit_hash: str) -> dict:
         """
-        Get commit metadata.
+        Get commit metadata (one git call).
 
         Args:
             commit_hash: Git commit hash
@@ -135,39 +169,27 @@ class TimelineGitHelper:
         """
         info = {}
         try:
-            # Get commit message
             result = subprocess.run(
-                ["git", "log", "-1", "--format=%s", commit_hash],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                info["message"] = result.stdout.strip()
-
-            # Get author
-            result = subprocess.run(
-                ["git", "log", "-1", "--format=%an", commit_hash],
-                cwd=self.project_path,
-                capture_output=True,
-                text=True,
-            )
-            if result.returncode == 0:
-                info["author"] = result.stdout.strip()
-
-            # Get diff stat
-            result = subprocess.run(
-                ["git", "diff-tree", "--stat", "--no-commit-id", commit_hash],
+                [
+                    "git",
+                    "log",
+                    "-1",
+                    "--format=%an%x00%s",
+                    "--shortstat",
+                    commit_hash,
+                ],
                 cwd=self.project_path,
                 capture_output=True,
                 text=True,
             )
             if result.returncode == 0:
-                info["diff_summary"] = (
-                    result.stdout.strip().split("\n")[-1]
-                    if result.stdout.strip()
-                    else None
-                )
+                # "<author>\0<subject>" then, after a blank line, the
+                # " N files changed, ..." summary (absent for empty commits)
+                lines = result.stdout.strip().split("\n")
+                author, _, message = lines[0].partition("\0")
+                info["author"] = author
+                info["message"] = message
+                info["diff_summary"] = lines[-1].strip() if len(lines) > 1 else None
 
         except Exception:
             pass
@@ -195,6 +217,7 @@ class TimelineGitHelper:
             return worktree_path.read_text(encoding="utf-8")
         return ""
 
+    @profiled("git.diff")
     def get_changed_files_in_worktree(self, worktree_path: Path) -> list[str]:
         """
         Get all changed files in a worktree vs main.
@@ -222,6 +245,7 @@ class TimelineGitHelper:
             logger.error(f"Failed to get changed files in worktree: {e}")
             return []
 
+    @profiled("git.merge_base")
     def get_branch_point(self, worktree_path: Path) -> Optional[str]:
         """
         Get the branch point (merge-base with main) for a worktree.
@@ -250,6 +274,7 @@ class TimelineGitHelper:
             logger.error(f"Failed to get branch point: {e}")
             return None
 
+    @profiled("git.rev_list")
     def count_commits_between(self, from_commit: str, to_commit: str) -> int:
         """
         Count commits between two points.
@@ -9,15 +9,81 @@ These models represent the complete evolution of a file from multiple sources:
 - Task worktree modifications (AI agent changes)
 - Task branch points and intent
 - Pending task awareness for forward-compatible merges
+
+File contents (branch points, main events, worktree states) are saved as
+keys into the shared BlobStore and read back on first access of
+``.content``, which raises MissingBlobError if the blob is gone.
 """
 
 from __future__ import annotations
 
+import logging
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional, Literal
+from typing import TYPE_CHECKING, Optional, Literal
+
+from .blob_store import MissingBlobError
+
+if TYPE_CHECKING:
+    from .blob_store import BlobStore
 
+logger = logging.getLogger(__name__)
 
+
+def _blob_backed(cls):
+    """
+    Back a dataclass's ``content`` field with the blob store.
+
+    ``content`` still reads and writes like a plain attribute. A model loaded
+    with a blob store holds only the key and fetches the text on first read;
+    if that blob is missing or corrupt, reading raises MissingBlobError
+    rather than passing an empty file on to a merge.
+    """
+
+    def get_content(self) -> str:
+        content = self.__dict__.get("_content")
+        if content is None:
+            blob_hash = self.__dict__.get("_content_hash")
+            blobs = self.__dict__.get("_blobs")
+            if blob_hash and blobs is not None:
+                content = blobs.get(blob_hash)
+                if content is None:
+                    logger.error(
+                        f"{type(self).__name__} content blob {blob_hash} is "
+                        "missing or corrupt"
+                    )
+                    raise MissingBlobError(blob_hash)
+            self._content = content = content or ""
+        return content
+
+    def set_content(self, value: str) -> None:
+        self._content = value
+        self._content_hash = None
+
+    cls.content = property(get_content, set_content)
+    return cls
+
+
+def _content_fields(model, blobs: BlobStore | None) -> dict:
+    """Serialize ``content``: the text itself, or its blob key if blobs is given."""
+    if blobs is None:
+        return {"content": model.content}
+    blob_hash = model.__dict__.get("_content_hash")
+    if blob_hash is None or model.__dict__.get("_blobs") is not blobs:
+        blob_hash = blobs.put(model.content)
+        model._content_hash, model._blobs = blob_hash, blobs
+    return {"content_hash": blob_hash}
+
+
+def _bind_content(model, data: dict, blobs: BlobStore | None):
+    """Attach the blob key from saved data (content is loaded lazily)."""
+    if "content" not in data:
+        model._content_hash = data.get("content_hash")
+        model._blobs = blobs
+    return model
+
+
+@_blob_backed
 @dataclass
 class MainBranchEvent:
     """
@@ -45,11 +111,11 @@ class MainBranchEvent:
     author: Optional[str] = None
     diff_summary: Optional[str] = None  # e.g., "+15 -3 lines"
 
-    def to_dict(self) -> dict:
+    def to_dict(self, blobs: BlobStore | None = None) -> dict:
         return {
             "commit_hash": self.commit_hash,
             "timestamp": self.timestamp.isoformat(),
-            "content": self.content,
+            **_content_fields(self, blobs),
             "source": self.source,
             "merged_from_task": self.merged_from_task,
             "commit_message": self.commit_message,
@@ -58,19 +124,21 @@ class MainBranchEvent:
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> MainBranchEvent:
-        return cls(
+    def from_dict(cls, data: dict, blobs: BlobStore | None = None) -> MainBranchEvent:
+        event = cls(
             commit_hash=data["commit_hash"],
             timestamp=datetime.fromisoformat(data["timestamp"]),
-            content=data["content"],
+            content=data.get("content"),
             source=data["source"],
             merged_from_task=data.get("merged_from_task"),
             commit_message=data.get("commit_message", ""),
             author=data.get("author"),
             diff_summary=data.get("diff_summary"),
         )
+        return _bind_content(event, data, blobs)
 
 
+@_blob_backed
 @dataclass
 class BranchPoint:
     """The exact point a task branched from main."""
@@ -79,22 +147,24 @@ class BranchPoint:
     content: str
     timestamp: datetime
 
-    def to_dict(self) -> dict:
+    def to_dict(self, blobs: BlobStore | None = None) -> dict:
         return {
             "commit_hash": self.commit_hash,
-            "content": self.content,
+            **_content_fields(self, blobs),
             "timestamp": self.timestamp.isoformat(),
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> BranchPoint:
-        return cls(
+    def from_dict(cls, data: dict, blobs: BlobStore | None = None) -> BranchPoint:
+        branch_point = cls(
             commit_hash=data["commit_hash"],
-            content=data["content"],
+            content=data.get("content"),
             timestamp=datetime.fromisoformat(data["timestamp"]),
         )
+        return _bind_content(branch_point, data, blobs)
 
 
+@_blob_backed
 @dataclass
 class WorktreeState:
     """Current state of a file in a task's worktree."""
@@ -102,18 +172,19 @@ class WorktreeState:
     content: str
     last_modified: datetime
 
-    def to_dict(self) -> dict:
+    def to_dict(self, blobs: BlobStore | None = None) -> dict:
         return {
-            "content": self.content,
+            **_content_fields(self, blobs),
             "last_modified": self.last_modified.isoformat(),
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> WorktreeState:
-        return cls(
-            content=data["content"],
+    def from_dict(cls, data: dict, blobs: BlobStore | None = None) -> WorktreeState:
+        state = cls(
+            content=data.get("content"),
             last_modified=datetime.fromisoformat(data["last_modified"]),
         )
+        return _bind_content(state, data, blobs)
 
 
 @dataclass
@@ -167,11 +238,11 @@ class TaskFileView:
     status: Literal["active", "merged", "abandoned"] = "active"
     merged_at: datetime | None = None
 
-    def to_dict(self) -> dict:
+    def to_dict(self, blobs: BlobStore | None = None) -> dict:
         return {
             "task_id": self.task_id,
-            "branch_point": self.branch_point.to_dict(),
-            "worktree_state": self.worktree_state.to_dict()
+            "branch_point": self.branch_point.to_dict(blobs),
+            "worktree_state": self.worktree_state.to_dict(blobs)
             if self.worktree_state
             else None,
             "task_intent": self.task_intent.to_dict(),
@@ -181,11 +252,11 @@ class TaskFileView:
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> TaskFileView:
+    def from_dict(cls, data: dict, blobs: BlobStore | None = None) -> TaskFileView:
         return cls(
             task_id=data["task_id"],
-            branch_point=BranchPoint.from_dict(data["branch_point"]),
-            worktree_state=WorktreeState.from_dict(data["worktree_state"])
+            branch_point=BranchPoint.from_dict(data["branch_point"], blobs),
+            worktree_state=WorktreeState.from_dict(data["worktree_state"], blobs)
             if data.get("worktree_state")
             else None,
             task_intent=TaskIntent.from_dict(data["task_intent"])
@@ -260,27 +331,42 @@ class FileTimeline:
             return self.main_branch_history[-1]
         return None
 
-    def to_dict(self) -> dict:
+    def to_dict(self, blobs: BlobStore | None = None) -> dict:
+        """
+        Serialize the timeline.
+
+        Args:
+            blobs: If given, file contents are stored there and saved as keys
+        """
         return {
             "file_path": self.file_path,
-            "main_branch_history": [e.to_dict() for e in self.main_branch_history],
-            "task_views": {k: v.to_dict() for k, v in self.task_views.items()},
+            "main_branch_history": [e.to_dict(blobs) for e in self.main_branch_history],
+            "task_views": {k: v.to_dict(blobs) for k, v in self.task_views.items()},
             "created_at": self.created_at.isoformat(),
             "last_updated": self.last_updated.isoformat(),
         }
 
     @classmethod
-    def from_dict(cls, data: dict) -> FileTimeline:
+    def from_dict(cls, data: dict, blobs: BlobStore | None = None) -> FileTimeline:
+        """
+        Deserialize a timeline.
+
+        Args:
+            data: Output of to_dict()
+            blobs: Store to read ``content_hash`` entries from (lazily)
+        """
         timeline = cls(
             file_path=data["file_path"],
             created_at=datetime.fromisoformat(data["created_at"]),
             last_updated=datetime.fromisoformat(data["last_updated"]),
         )
         timeline.main_branch_history = [
-            MainBranchEvent.from_dict(e) for e in data.get("main_branch_history", [])
+            MainBranchEvent.from_dict(e, blobs)
+            for e in data.get("main_branch_history", [])
         ]
         timeline.task_views = {
-            k: TaskFileView.from_dict(v) for k, v in data.get("task_views", {}).items()
+            k: TaskFileView.from_dict(v, blobs)
+            for k, v in data.get("task_views", {}).items()
         }
         return timeline
 
@@ -5,19 +5,33 @@ Timeline Persistence Layer
 Storage and persistence for file timelines.
 
 This module handles:
-- Saving/loading timelines to/from disk
-- Managing the timeline index
+- Saving/loading timelines to/from disk, one file at a time
+- Managing the timeline index (tracked files and the tasks touching them)
 - File path encoding for safe storage
+- Keeping file contents in the shared blob store (timelines hold keys)
+
+Layout under .auto-claude/file-timelines/:
+
+    index.json                    {"files": {"src/App.tsx": ["task-001"]}}
+    3f/src_App.tsx.json           one timeline, sharded by path hash
+
+Timelines saved flat (file-timelines/src_App.tsx.json) by older versions,
+and indexes holding a plain file list, are still read.
 """
 
 from __future__ import annotations
 
+import hashlib
 import json
 import logging
+import os
+import tempfile
 from datetime import datetime
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+from .blob_store import BLOBS_DIR, BlobStore
+
 if TYPE_CHECKING:
     from .timeline_models import FileTimeline
 
@@ -34,12 +48,70 @@ except ImportError:
 
 MODULE = "merge.timeline_persistence"
 
+TIMELINES_DIR = "file-timelines"
+INDEX_FILE = "index.json"
+
+
+def _content_hashes(data: dict) -> set[str]:
+    """Blob keys referenced by one saved timeline."""
+    hashes = set()
+    for event in data.get("main_branch_history", []):
+        hashes.add(event.get("content_hash"))
+    for view in data.get("task_views", {}).values():
+        hashes.add((view.get("branch_point") or {}).get("content_hash"))
+        hashes.add((view.get("worktree_state") or {}).get("content_hash"))
+    hashes.discard(None)
+    return hashes
+
+
+def referenced_blobs(storage_path: Path) -> set[str]:
+    """
+    Collect the blob keys referenced by all saved timelines.
+
+    Args:
+        storage_path: Timeline storage directory (e.g., .auto-claude/)
+
+    Returns:
+        Set of blob keys
+
+    Raises:
+        OSError, ValueError: If a timeline file cannot be read
+    """
+    hashes: set[str] = set()
+    timelines_dir = Path(storage_path) / TIMELINES_DIR
+    if not timelines_dir.exists():
+        return hashes
+    index_path = timelines_dir / INDEX_FILE
+    for timeline_file in timelines_dir.rglob("*.json"):
+        if timeline_file == index_path:
+            continue
+        with open(timeline_file) as f:
+            hashes |= _content_hashes(json.load(f))
+    return hashes
+
+
+def _write_json_atomic(path: Path, data: dict) -> None:
+    """Write JSON via temp file + rename so readers never see a torn file."""
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=".", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class TimelinePersistence:
     """
     Handles persistence of file timelines to disk.
 
-    Timelines are stored as JSON files with an index for quick lookup.
+    Timelines are stored as one JSON file each, sharded by path hash, with
+    an index of tracked files for quick lookup; the file contents they
+    capture live in the blob store.
     """
 
     def __init__(self, storage_path: Path):
@@ -50,42 +122,78 @@ class TimelinePersistence:
             storage_path: Directory for timeline storage (e.g., .auto-claude/)
         """
         self.storage_path = Path(storage_path).resolve()
-        self.timelines_dir = self.storage_path / "file-timelines"
+        self.timelines_dir = self.storage_path / TIMELINES_DIR
+        self.index_path = self.timelines_dir / INDEX_FILE
+        self.blobs = BlobStore(self.storage_path / BLOBS_DIR)
 
         # Ensure storage directory exists
         self.timelines_dir.mkdir(parents=True, exist_ok=True)
 
-    def load_all_timelines(self) -> dict[str, FileTimeline]:
+    def load_index(self) -> dict[str, list[str] | None]:
         """
-        Load all timelines from disk on startup.
+        Load the index of tracked files.
 
         Returns:
-            Dictionary mapping file_path to FileTimeline objects
+            Dictionary mapping file_path to the IDs of the tasks in its
+            timeline (None if unknown - index written by an older version)
         """
-        from .timeline_models import FileTimeline
+        if not self.index_path.exists():
+            return {}
 
-        timelines = {}
-        index_path = self.timelines_dir / "index.json"
+        try:
+            with open(self.index_path) as f:
+                files = json.load(f).get("files", {})
+        except Exception as e:
+            logger.error(f"Failed to load timeline index: {e}")
+            return {}
 
-        if not index_path.exists():
-            return timelines
+        if isinstance(files, list):
+            return {file_path: None for file_path in files}
+        return dict(files)
 
-        try:
-            with open(index_path) as f:
-                index = json.load(f)
+    def load_timeline(self, file_path: str) -> FileTimeline | None:
+        """
+        Load one timeline from disk.
 
-            for file_path in index.get("files", []):
-                timeline_file = self._get_timeline_file_path(file_path)
-                if timeline_file.exists():
-                    with open(timeline_file) as f:
-                        data = json.load(f)
-                    timelines[file_path] = FileTimeline.from_dict(data)
+        File contents are not read until accessed.
+
+        Args:
+            file_path: The file path (used as key)
 
-            debug(MODULE, f"Loaded {len(timelines)} timelines from storage")
+        Returns:
+            FileTimeline, or None if it is not stored or unreadable
+        """
+        from .timeline_models import FileTimeline
 
-        except Exception as e:
-            logger.error(f"Failed to load timelines: {e}")
+        for timeline_file in (
+            self._get_timeline_file_path(file_path),
+            self._get_legacy_timeline_file_path(file_path),
+        ):
+            if timeline_file is None or not timeline_file.exists():
+                continue
+            try:
+                with open(timeline_file) as f:
+                    data = json.load(f)
+                return FileTimeline.from_dict(data, self.blobs)
+            except Exception as e:
+                logger.error(f"Failed to load timeline for {file_path}: {e}")
+                return None
+        return None
 
+    def load_all_timelines(self) -> dict[str, FileTimeline]:
+        """
+        Load every indexed timeline from disk.
+
+        Returns:
+            Dictionary mapping file_path to FileTimeline objects
+        """
+        timelines = {}
+        for file_path in self.load_index():
+            timeline = self.load_timeline(file_path)
+            if timeline is not None:
+                timelines[file_path] = timeline
+
+        debug(MODULE, f"Loaded {len(timelines)} timelines from storage")
         return timelines
 
     def save_timeline(self, file_path: str, timeline: FileTimeline) -> None:
@@ -97,36 +205,40 @@ class TimelinePersistence:
             timeline: The FileTimeline object to save
         """
         try:
-            # Save timeline file
             timeline_file = self._get_timeline_file_path(file_path)
             timeline_file.parent.mkdir(parents=True, exist_ok=True)
+            _write_json_atomic(timeline_file, timeline.to_dict(self.blobs))
 
-            with open(timeline_file, "w") as f:
-                json.dump(timeline.to_dict(), f, indent=2)
+            # Migrate: drop the copy saved in the pre-sharding layout
+            legacy_file = self._get_legacy_timeline_file_path(file_path)
+            if legacy_file is not None and legacy_file.exists():
+                legacy_file.unlink()
 
         except Exception as e:
             logger.error(f"Failed to persist timeline for {file_path}: {e}")
 
-    def update_index(self, file_paths: list[str]) -> None:
+    def update_index(self, files: list[str] | dict[str, list[str] | None]) -> None:
         """
         Update the index file with all tracked files.
 
         Args:
-            file_paths: List of all file paths being tracked
+            files: Tracked file paths, or a mapping of file path to the IDs
+                of the tasks in its timeline
         """
-        index_path = self.timelines_dir / "index.json"
+        if isinstance(files, list):
+            files = {file_path: None for file_path in files}
         index = {
-            "files": file_paths,
+            "files": files,
             "last_updated": datetime.now().isoformat(),
         }
-        with open(index_path, "w") as f:
-            json.dump(index, f, indent=2)
+        _write_json_atomic(self.index_path, index)
 
     def _get_timeline_file_path(self, file_path: str) -> Path:
         """
         Get the storage path for a file's timeline.
 
-        Encodes the file path to create a safe filename.
+        Encodes the file path to create a safe filename, in a subdirectory
+        chosen by path hash so no directory grows to thousands of entries.
 
         Args:
             file_path: The original file path
@@ -134,6 +246,14 @@ class TimelinePersistence:
         Returns:
             Path to the timeline JSON file
         """
-        # Encode path: src/App.tsx -> src_App.tsx.json
+        # Encode path: src/App.tsx -> <shard>/src_App.tsx.json
+        safe_name = file_path.replace("/", "_").replace("\\", "_")
+        shard = hashlib.sha1(file_path.encode("utf-8")).hexdigest()[:2]
+        return self.timelines_dir / shard / f"{safe_name}.json"
+
+    def _get_legacy_timeline_file_path(self, file_path: str) -> Path | None:
+        """Get where versions before sharding saved a file's timeline."""
         safe_name = file_path.replace("/", "_").replace("\\", "_")
-        return self.timelines_dir / f"{safe_name}.json"
+        legacy_file = self.timelines_dir / f"{safe_name}.json"
+        # A file named "index" would have collided with the index itself
+        return legacy_file if legacy_file != self.index_path else None
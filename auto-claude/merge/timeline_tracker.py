@@ -8,15 +8,23 @@ This service is the "brain" of the intent-aware merge system. It:
 - Creates and manages FileTimeline objects
 - Handles events from git hooks and task lifecycle
 - Provides merge context to the AI resolver
+
+Only the index is read at startup; a file's timeline is loaded the first
+time it is needed. Changed timelines are written behind: each event handler
+collects its writes and flushes them (and the index, if the set of files or
+tasks changed) once when it returns.
 """
 
 from __future__ import annotations
 from typing import Optional
 
 import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
 
+from .blob_store import MissingBlobError, collect_garbage
 from .timeline_git import TimelineGitHelper
 from .timeline_models import (
     BranchPoint,
@@ -75,18 +83,60 @@ class FileTimelineTracker:
         self.git = TimelineGitHelper(self.project_path)
         self.persistence = TimelinePersistence(self.storage_path)
 
-        # In-memory cache of timelines
+        # Tracked files -> IDs of the tasks in their timelines (None until
+        # known, for indexes written by older versions)
+        self._index: dict[str, set[str] | None] = {
+            file_path: set(task_ids) if task_ids is not None else None
+            for file_path, task_ids in self.persistence.load_index().items()
+        }
+
+        # Timelines loaded so far
         self._timelines: dict[str, FileTimeline] = {}
 
-        # Load existing timelines
-        self._timelines = self.persistence.load_all_timelines()
+        # Write-behind state: timelines and index changes not yet on disk
+        self._dirty: set[str] = set()
+        self._index_dirty = False
+        self._batch_depth = 0
 
         debug_success(
             MODULE,
             "FileTimelineTracker initialized",
-            timelines_loaded=len(self._timelines),
+            timelines_indexed=len(self._index),
         )
 
+    @contextmanager
+    def batch_updates(self) -> Iterator[None]:
+        """
+        Coalesce timeline and index writes until the outermost batch ends.
+
+        Event handlers batch their own work; wrap several calls (e.g. many
+        on_task_worktree_change calls) to write each timeline only once.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self.flush()
+
+    def flush(self) -> None:
+        """Write pending timeline and index changes to disk."""
+        for file_path in sorted(self._dirty):
+            timeline = self._timelines.get(file_path)
+            if timeline is not None:
+                self.persistence.save_timeline(file_path, timeline)
+        self._dirty.clear()
+
+        if self._index_dirty:
+            self.persistence.update_index(
+                {
+                    file_path: sorted(task_ids) if task_ids is not None else None
+                    for file_path, task_ids in self._index.items()
+                }
+            )
+            self._index_dirty = False
+
     # =========================================================================
     # EVENT HANDLERS
     # =========================================================================
@@ -128,37 +178,38 @@ class FileTimelineTracker:
 
         timestamp = datetime.now()
 
-        for file_path in files_to_modify:
-            # Get or create timeline for this file
-            timeline = self._get_or_create_timeline(file_path)
+        # Read every branch-point file through one git process
+        contents = self.git.get_files_content_at_commit(
+            files_to_modify, branch_point_commit
+        )
+
+        with self.batch_updates():
+            for file_path in files_to_modify:
+                # Get or create timeline for this file
+                timeline = self._get_or_create_timeline(file_path)
 
-            # Get file content at branch point
-            content = self.git.get_file_content_at_commit(
-                file_path, branch_point_commit
-            )
-            if content is None:
                 # File doesn't exist at this commit - might be created by task
-                content = ""
-
-            # Create task file view
-            task_view = TaskFileView(
-                task_id=task_id,
-                branch_point=BranchPoint(
-                    commit_hash=branch_point_commit,
-                    content=content,
-                    timestamp=timestamp,
-                ),
-                task_intent=TaskIntent(
-                    title=task_title or task_id,
-                    description=task_intent,
-                    from_plan=bool(task_intent),
-                ),
-                commits_behind_main=0,
-                status="active",
-            )
+                content = contents.get(file_path) or ""
+
+                # Create task file view
+                task_view = TaskFileView(
+                    task_id=task_id,
+                    branch_point=BranchPoint(
+                        commit_hash=branch_point_commit,
+                        content=content,
+                        timestamp=timestamp,
+                    ),
+                    task_intent=TaskIntent(
+                        title=task_title or task_id,
+                        description=task_intent,
+                        from_plan=bool(task_intent),
+                    ),
+                    commits_behind_main=0,
+                    status="active",
+                )
 
-            timeline.add_task_view(task_view)
-            self._persist_timeline(file_path)
+                timeline.add_task_view(task_view)
+                self._persist_timeline(file_path)
 
         debug_success(
             MODULE, f"Task {task_id} registered with {len(files_to_modify)} files"
@@ -176,42 +227,42 @@ class FileTimelineTracker:
         """
         debug(MODULE, f"on_main_branch_commit: {commit_hash}")
 
-        # Get list of files changed in this commit
+        # Get list of files changed in this commit, keeping only tracked
+        # ones (we don't create new timelines for random files)
         changed_files = self.git.get_files_changed_in_commit(commit_hash)
+        tracked_files = [f for f in changed_files if f in self._index]
 
-        for file_path in changed_files:
-            # Only update existing timelines (we don't create new ones for random files)
-            if file_path not in self._timelines:
-                continue
-
-            timeline = self._timelines[file_path]
-
-            # Get file content at this commit
-            content = self.git.get_file_content_at_commit(file_path, commit_hash)
-            if content is None:
-                continue
-
-            # Get commit metadata
+        if tracked_files:
+            # One git process for all contents, one call for the metadata
+            contents = self.git.get_files_content_at_commit(tracked_files, commit_hash)
             commit_info = self.git.get_commit_info(commit_hash)
-
-            # Create main branch event
-            event = MainBranchEvent(
-                commit_hash=commit_hash,
-                timestamp=datetime.now(),
-                content=content,
-                source="human",
-                commit_message=commit_info.get("message", ""),
-                author=commit_info.get("author"),
-                diff_summary=commit_info.get("diff_summary"),
-            )
-
-            timeline.add_main_event(event)
-            self._persist_timeline(file_path)
+            timestamp = datetime.now()
+
+            with self.batch_updates():
+                for file_path in tracked_files:
+                    timeline = self._get_timeline(file_path)
+                    content = contents.get(file_path)
+                    if timeline is None or content is None:
+                        continue
+
+                    # Create main branch event
+                    event = MainBranchEvent(
+                        commit_hash=commit_hash,
+                        timestamp=timestamp,
+                        content=content,
+                        source="human",
+                        commit_message=commit_info.get("message", ""),
+                        author=commit_info.get("author"),
+                        diff_summary=commit_info.get("diff_summary"),
+                    )
+
+                    timeline.add_main_event(event)
+                    self._persist_timeline(file_path)
 
         debug_success(
             MODULE,
             f"Processed main commit {commit_hash[:8]}",
-            files_updated=len(changed_files),
+            files_updated=len(tracked_files),
         )
 
     def on_task_worktree_change(
@@ -233,10 +284,8 @@ class FileTimelineTracker:
         """
         debug(MODULE, f"on_task_worktree_change: {task_id} -> {file_path}")
 
-        timeline = self._timelines.get(file_path)
-        if not timeline:
-            # Create timeline if it doesn't exist
-            timeline = self._get_or_create_timeline(file_path)
+        # Create timeline if it doesn't exist
+        timeline = self._get_or_create_timeline(file_path)
 
         task_view = timeline.get_task_view(task_id)
         if not task_view:
@@ -267,34 +316,36 @@ class FileTimelineTracker:
 
         # Get list of files this task modified
         task_files = self.get_files_for_task(task_id)
-
-        for file_path in task_files:
-            timeline = self._timelines.get(file_path)
-            if not timeline:
-                continue
-
-            task_view = timeline.get_task_view(task_id)
-            if not task_view:
-                continue
-
-            # Mark task as merged
-            task_view.status = "merged"
-            task_view.merged_at = datetime.now()
-
-            # Add main branch event for the merge
-            content = self.git.get_file_content_at_commit(file_path, merge_commit)
-            if content:
-                event = MainBranchEvent(
-                    commit_hash=merge_commit,
-                    timestamp=datetime.now(),
-                    content=content,
-                    source="merged_task",
-                    merged_from_task=task_id,
-                    commit_message=f"Merged from {task_id}",
-                )
-                timeline.add_main_event(event)
-
-            self._persist_timeline(file_path)
+        contents = self.git.get_files_content_at_commit(task_files, merge_commit)
+
+        with self.batch_updates():
+            for file_path in task_files:
+                timeline = self._get_timeline(file_path)
+                if not timeline:
+                    continue
+
+                task_view = timeline.get_task_view(task_id)
+                if not task_view:
+                    continue
+
+                # Mark task as merged
+                task_view.status = "merged"
+                task_view.merged_at = datetime.now()
+
+                # Add main branch event for the merge
+                content = contents.get(file_path)
+                if content:
+                    event = MainBranchEvent(
+                        commit_hash=merge_commit,
+                        timestamp=datetime.now(),
+                        content=content,
+                        source="merged_task",
+                        merged_from_task=task_id,
+                        commit_message=f"Merged from {task_id}",
+                    )
+                    timeline.add_main_event(event)
+
+                self._persist_timeline(file_path)
 
         debug_success(MODULE, f"Task {task_id} marked as merged")
 
@@ -302,6 +353,9 @@ class FileTimelineTracker:
         """
         Called if a task is cancelled/abandoned.
 
+        The task's worktree snapshots will never be merged, so they are
+        dropped and blobs no longer referenced are garbage-collected.
+
         Args:
             task_id: Unique task identifier
         """
@@ -309,16 +363,22 @@ class FileTimelineTracker:
 
         task_files = self.get_files_for_task(task_id)
 
-        for file_path in task_files:
-            timeline = self._timelines.get(file_path)
-            if not timeline:
-                continue
+        with self.batch_updates():
+            for file_path in task_files:
+                timeline = self._get_timeline(file_path)
+                if not timeline:
+                    continue
+
+                task_view = timeline.get_task_view(task_id)
+                if task_view:
+                    task_view.status = "abandoned"
+                    task_view.worktree_state = None
 
-            task_view = timeline.get_task_view(task_id)
-            if task_view:
-                task_view.status = "abandoned"
+                self._persist_timeline(file_path)
 
-            self._persist_timeline(file_path)
+        # Timelines are on disk now, so the collector sees current references
+        removed = collect_garbage(self.storage_path)
+        debug(MODULE, f"Task {task_id} abandoned", blobs_removed=removed)
 
     # =========================================================================
     # QUERY METHODS
@@ -336,11 +396,12 @@ class FileTimelineTracker:
             file_path: Path to the file (relative to project root)
 
         Returns:
-            MergeContext object with complete merge information, or None if not found
+            MergeContext object with complete merge information, or None if not
+            found or its saved file content is missing (the file is skipped)
         """
         debug(MODULE, f"get_merge_context: {task_id} -> {file_path}")
 
-        timeline = self._timelines.get(file_path)
+        timeline = self._get_timeline(file_path)
         if not timeline:
             debug_warning(MODULE, f"No timeline found for {file_path}")
             return None
@@ -359,9 +420,19 @@ class FileTimelineTracker:
 
         # Get current main state
         current_main = timeline.get_current_main_state()
-        current_main_content = (
-            current_main.content if current_main else task_view.branch_point.content
-        )
+        # Load saved contents up front: skip the file if any blob is missing
+        # rather than merging against an empty file
+        try:
+            branch_point_content = task_view.branch_point.content
+            current_main_content = (
+                current_main.content if current_main else branch_point_content
+            )
+            worktree_state_content = (
+                task_view.worktree_state.content if task_view.worktree_state else None
+            )
+        except MissingBlobError as e:
+            debug_warning(MODULE, f"Skipping {file_path}: {e}")
+            return None
         current_main_commit = (
             current_main.commit_hash
             if current_main
@@ -370,8 +441,8 @@ class FileTimelineTracker:
 
         # Get task's worktree content
         worktree_content = ""
-        if task_view.worktree_state:
-            worktree_content = task_view.worktree_state.content
+        if worktree_state_content is not None:
+            worktree_content = worktree_state_content
         else:
             # Try to get from worktree path
             worktree_content = self.git.get_worktree_file_content(task_id, file_path)
@@ -424,8 +495,13 @@ class FileTimelineTracker:
             List of file paths
         """
         files = []
+        for file_path in list(self._index):
+            task_ids = self._index_task_ids(file_path)
+            if task_ids is not None and task_id in task_ids:
+                files.append(file_path)
+        # Timelines created in memory but not saved yet
         for file_path, timeline in self._timelines.items():
-            if task_id in timeline.task_views:
+            if file_path not in self._index and task_id in timeline.task_views:
                 files.append(file_path)
         return files
 
@@ -439,7 +515,7 @@ class FileTimelineTracker:
         Returns:
             List of TaskFileView objects
         """
-        timeline = self._timelines.get(file_path)
+        timeline = self._get_timeline(file_path)
         if not timeline:
             return []
         return timeline.get_active_tasks()
@@ -455,8 +531,9 @@ class FileTimelineTracker:
             Dictionary mapping file_path to commits_behind_main count
         """
         drift = {}
-        for file_path, timeline in self._timelines.items():
-            task_view = timeline.get_task_view(task_id)
+        for file_path in self.get_files_for_task(task_id):
+            timeline = self._get_timeline(file_path)
+            task_view = timeline.get_task_view(task_id) if timeline else None
             if task_view and task_view.status == "active":
                 drift[file_path] = task_view.commits_behind_main
         return drift
@@ -471,7 +548,16 @@ class FileTimelineTracker:
         Returns:
             True if timeline exists
         """
-        return file_path in self._timelines
+        return file_path in self._index or file_path in self._timelines
+
+    def get_tracked_files(self) -> list[str]:
+        """
+        Return every file with a timeline (without loading the timelines).
+
+        Returns:
+            Sorted list of file paths
+        """
+        return sorted(set(self._index) | set(self._timelines))
 
     def get_timeline(self, file_path: str) -> FileTimeline | None:
         """
@@ -483,7 +569,7 @@ class FileTimelineTracker:
         Returns:
             FileTimeline object, or None if not found
         """
-        return self._timelines.get(file_path)
+        return self._get_timeline(file_path)
 
     # =========================================================================
     # CAPTURE METHODS (for integration with existing code)
@@ -504,11 +590,12 @@ class FileTimelineTracker:
         try:
             changed_files = self.git.get_changed_files_in_worktree(worktree_path)
 
-            for file_path in changed_files:
-                full_path = worktree_path / file_path
-                if full_path.exists():
-                    content = full_path.read_text(encoding="utf-8")
-                    self.on_task_worktree_change(task_id, file_path, content)
+            with self.batch_updates():
+                for file_path in changed_files:
+                    full_path = worktree_path / file_path
+                    if full_path.exists():
+                        content = full_path.read_text(encoding="utf-8")
+                        self.on_task_worktree_change(task_id, file_path, content)
 
             debug_success(MODULE, f"Captured {len(changed_files)} files from worktree")
 
@@ -547,27 +634,28 @@ class FileTimelineTracker:
             if not changed_files:
                 return
 
-            # Register task for these files
-            self.on_task_start(
-                task_id=task_id,
-                files_to_modify=changed_files,
-                branch_point_commit=branch_point,
-                task_intent=task_intent,
-                task_title=task_title,
-            )
+            with self.batch_updates():
+                # Register task for these files
+                self.on_task_start(
+                    task_id=task_id,
+                    files_to_modify=changed_files,
+                    branch_point_commit=branch_point,
+                    task_intent=task_intent,
+                    task_title=task_title,
+                )
 
-            # Capture current worktree state
-            self.capture_worktree_state(task_id, worktree_path)
-
-            # Calculate drift (commits behind main)
-            drift = self.git.count_commits_between(branch_point, "main")
-            for file_path in changed_files:
-                timeline = self._timelines.get(file_path)
-                if timeline:
-                    task_view = timeline.get_task_view(task_id)
-                    if task_view:
-                        task_view.commits_behind_main = drift
-                    self._persist_timeline(file_path)
+                # Capture current worktree state
+                self.capture_worktree_state(task_id, worktree_path)
+
+                # Calculate drift (commits behind main)
+                drift = self.git.count_commits_between(branch_point, "main")
+                for file_path in changed_files:
+                    timeline = self._get_timeline(file_path)
+                    if timeline:
+                        task_view = timeline.get_task_view(task_id)
+                        if task_view:
+                            task_view.commits_behind_main = drift
+                        self._persist_timeline(file_path)
 
             debug_success(
                 MODULE,
@@ -583,17 +671,44 @@ class FileTimelineTracker:
     # INTERNAL HELPERS
     # =========================================================================
 
+    def _get_timeline(self, file_path: str) -> FileTimeline | None:
+        """Get a timeline, loading it from disk on first access."""
+        timeline = self._timelines.get(file_path)
+        if timeline is None and file_path in self._index:
+            timeline = self.persistence.load_timeline(file_path)
+            if timeline is not None:
+                self._timelines[file_path] = timeline
+        return timeline
+
     def _get_or_create_timeline(self, file_path: str) -> FileTimeline:
         """Get existing timeline or create new one."""
-        if file_path not in self._timelines:
-            self._timelines[file_path] = FileTimeline(file_path=file_path)
-        return self._timelines[file_path]
+        timeline = self._get_timeline(file_path)
+        if timeline is None:
+            timeline = self._timelines[file_path] = FileTimeline(file_path=file_path)
+        return timeline
+
+    def _index_task_ids(self, file_path: str) -> set[str] | None:
+        """Task IDs in a file's timeline, loading it if the index doesn't say."""
+        task_ids = self._index.get(file_path)
+        if task_ids is None:
+            timeline = self._get_timeline(file_path)
+            if timeline is None:
+                return None
+            task_ids = self._index[file_path] = set(timeline.task_views)
+            self._index_dirty = True
+        return task_ids
 
     def _persist_timeline(self, file_path: str) -> None:
-        """Save a single timeline to disk."""
+        """Queue a timeline (and index changes) for writing."""
         timeline = self._timelines.get(file_path)
         if not timeline:
             return
 
-        self.persistence.save_timeline(file_path, timeline)
-        self.persistence.update_index(list(self._timelines.keys()))
+        task_ids = set(timeline.task_views)
+        if self._index.get(file_path) != task_ids:
+            self._index[file_path] = task_ids
+            self._index_dirty = True
+
+        self._dirty.add(file_path)
+        if self._batch_depth == 0:
+            self.flush()
@@ -133,13 +133,15 @@ def cmd_list_files(args):
 
     print("\n=== Tracked Files ===\n")
 
-    # Access internal _timelines
-    if not tracker._timelines:
+    tracked_files = tracker.get_tracked_files()
+    if not tracked_files:
         print("No files currently tracked.")
         return
 
-    for file_path in sorted(tracker._timelines.keys()):
-        timeline = tracker._timelines[file_path]
+    for file_path in tracked_files:
+        timeline = tracker.get_timeline(file_path)
+        if timeline is None:
+            continue
         active_tasks = len(
             [tv for tv in timeline.task_views.values() if tv.status == "active"]
         )
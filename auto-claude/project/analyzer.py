@@ -12,6 +12,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from core.profiling import profiled
+
 from .command_registry import (
     BASE_COMMANDS,
     CLOUD_COMMANDS,
@@ -24,6 +26,7 @@ from .command_registry import (
     VERSION_MANAGER_COMMANDS,
 )
 from .config_parser import ConfigParser
+from .file_inventory import get_inventory, shared_inventory
 from .framework_detector import FrameworkDetector
 from .models import SecurityProfile
 from .stack_detector import StackDetector
@@ -129,9 +132,13 @@ class ProjectAnalyzer:
         # If no config files found, hash the project directory structure
         # to at least detect when files are added/removed
         if files_found == 0:
-            # Count Python, JS, and other source files as a proxy for project structure
+            # Count Python, JS, and other source files as a proxy for project structure.
+            # SKIP_DIRS are pruned, so these counts (and the hash) differ from
+            # older versions that walked node_modules etc.; profiles of such
+            # projects are re-analyzed once after upgrading.
+            inventory = get_inventory(self.project_dir)
             for ext in ["*.py", "*.js", "*.ts", "*.go", "*.rs"]:
-                count = len(list(self.project_dir.glob(f"**/{ext}")))
+                count = len(inventory.glob(f"**/{ext}", self.project_dir))
                 hasher.update(f"{ext}:{count}".encode())
             # Also include the project directory name for uniqueness
             hasher.update(self.project_dir.name.encode())
@@ -143,6 +150,7 @@ class ProjectAnalyzer:
         current_hash = self.compute_project_hash()
         return current_hash != profile.project_hash
 
+    @profiled("analyzer.security_profile")
     def analyze(self, force: bool = False) -> SecurityProfile:
         """
         Perform full project analysis.
@@ -166,17 +174,18 @@ class ProjectAnalyzer:
         self.profile.base_commands = BASE_COMMANDS.copy()
         self.profile.project_dir = str(self.project_dir)
 
-        # Run detection
-        self._detect_stack()
-        self._detect_frameworks()
-        self._detect_structure()
+        # Run detection (all detectors share one walk of the project)
+        with shared_inventory(self.project_dir):
+            self._detect_stack()
+            self._detect_frameworks()
+            self._detect_structure()
 
-        # Build stack commands from detected technologies
-        self._build_stack_commands()
+            # Build stack commands from detected technologies
+            self._build_stack_commands()
 
-        # Finalize
-        self.profile.created_at = datetime.now().isoformat()
-        self.profile.project_hash = self.compute_project_hash()
+            # Finalize
+            self.profile.created_at = datetime.now().isoformat()
+            self.profile.project_hash = self.compute_project_hash()
 
         # Save
         self.save_profile(self.profile)
@@ -11,6 +11,8 @@ import sys
 from pathlib import Path
 from typing import Optional
 
+from .file_inventory import FileInventory, get_inventory
+
 # tomllib is only available in Python 3.11+, use tomli as fallback
 if sys.version_info >= (3, 11):
     import tomllib
@@ -32,6 +34,14 @@ class ConfigParser:
             project_dir: Root directory of the project
         """
         self.project_dir = Path(project_dir).resolve()
+        self._inventory: FileInventory | None = None
+
+    @property
+    def inventory(self) -> FileInventory:
+        """File inventory used to answer glob patterns (walked once)."""
+        if self._inventory is None:
+            self._inventory = get_inventory(self.project_dir)
+        return self._inventory
 
     def read_json(self, filename: str) -> Optional[dict]:
         """Read a JSON file from project root."""
@@ -64,7 +74,7 @@ class ConfigParser:
         for p in paths:
             # Handle glob patterns
             if "*" in p:
-                if list(self.project_dir.glob(p)):
+                if self.inventory.exists(p, self.project_dir):
                     return True
             else:
                 if (self.project_dir / p).exists():
@@ -73,4 +83,4 @@ class ConfigParser:
 
     def glob_files(self, pattern: str) -> list[Path]:
         """Find files matching a pattern."""
-        return list(self.project_dir.glob(pattern))
+        return self.inventory.glob(pattern, self.project_dir)
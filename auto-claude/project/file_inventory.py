@@ -0,0 +1,397 @@
+"""
+File Inventory
+==============
+
+Single-walk inventory of a project's files, shared by all detectors.
+
+One pruned ``os.scandir`` walk (honouring SKIP_DIRS) indexes every file by
+extension, basename and directory. Detectors answer glob-style questions
+("any **/*.py?", "all **/models/*.py") from memory instead of walking the
+tree again.
+
+A detector looks up the inventory with ``get_inventory(path)``. Inside a
+``shared_inventory(root)`` block every detector under ``root`` shares the
+same walk; outside one, each caller gets a private inventory that is walked
+lazily on first use.
+
+Inventories can be persisted and are invalidated by directory mtimes (adding,
+removing or renaming an entry changes its parent directory's mtime).
+"""
+
+import json
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+# Directories to skip during analysis
+SKIP_DIRS = {
+    "node_modules",
+    ".git",
+    "__pycache__",
+    ".venv",
+    "venv",
+    ".env",
+    "env",
+    "dist",
+    "build",
+    ".next",
+    ".nuxt",
+    "target",
+    "vendor",
+    ".idea",
+    ".vscode",
+    ".pytest_cache",
+    ".mypy_cache",
+    "coverage",
+    ".coverage",
+    "htmlcov",
+    "eggs",
+    "*.egg-info",
+    ".turbo",
+    ".cache",
+    ".worktrees",  # Skip git worktrees directory
+    ".auto-claude",  # Skip auto-claude metadata directory
+}
+
+# Where a persisted inventory lives, relative to the project root
+INVENTORY_CACHE_FILE = ".auto-claude/file_inventory.json"
+
+INVENTORY_VERSION = 1
+
+_active_inventories: ContextVar[tuple["FileInventory", ...]] = ContextVar(
+    "active_file_inventories", default=()
+)
+
+
+def match_glob_parts(pattern: list[str], parts: list[str]) -> bool:
+    """Match path parts against glob pattern parts (``**`` = any depth)."""
+    if not pattern:
+        return not parts
+    head = pattern[0]
+    if head == "**":
+        return any(
+            match_glob_parts(pattern[1:], parts[i:]) for i in range(len(parts) + 1)
+        )
+    if not parts or not fnmatchcase(parts[0], head):
+        return False
+    return match_glob_parts(pattern[1:], parts[1:])
+
+
+class FileInventory:
+    """In-memory index of the files under a project root."""
+
+    def __init__(self, root: Path, skip_dirs: Iterable[str] = SKIP_DIRS):
+        """
+        Initialize inventory (the walk happens lazily on first query).
+
+        Args:
+            root: Directory to inventory
+            skip_dirs: Directory names (or fnmatch patterns) to prune
+        """
+        self.root = Path(root).resolve()
+        skip_dirs = set(skip_dirs)
+        self._skip_names = frozenset(d for d in skip_dirs if "*" not in d)
+        self._skip_patterns = tuple(d for d in skip_dirs if "*" in d)
+        self._scanned = False
+
+        # Relative POSIX paths, sorted
+        self.files: list[str] = []
+        self.dirs: list[str] = []
+        self._dir_set: set[str] = set()
+        self._by_ext: dict[str, list[str]] = {}
+        self._by_name: dict[str, list[str]] = {}
+        self._by_dir: dict[str, list[str]] = {}
+        self._dir_mtimes: dict[str, int] = {}
+
+    # ------------------------------------------------------------------
+    # Walking
+    # ------------------------------------------------------------------
+
+    def _skip(self, name: str) -> bool:
+        return name in self._skip_names or any(
+            fnmatchcase(name, p) for p in self._skip_patterns
+        )
+
+    def _ensure_scanned(self) -> None:
+        if not self._scanned:
+            self.scan()
+
+    def scan(self) -> None:
+        """Walk the tree once and rebuild all indexes."""
+        files: list[str] = []
+        dirs: list[str] = []
+        mtimes: dict[str, int] = {}
+
+        stack = [""]
+        while stack:
+            rel_dir = stack.pop()
+            abs_dir = os.path.join(self.root, rel_dir) if rel_dir else str(self.root)
+            try:
+                mtimes[rel_dir] = os.stat(abs_dir).st_mtime_ns
+                with os.scandir(abs_dir) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+
+            prefix = f"{rel_dir}/" if rel_dir else ""
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if not self._skip(entry.name):
+                            dirs.append(prefix + entry.name)
+                            stack.append(prefix + entry.name)
+                    elif entry.is_file():
+                        files.append(prefix + entry.name)
+                except OSError:
+                    continue
+
+        self._build(sorted(files, key=_path_key), sorted(dirs, key=_path_key), mtimes)
+
+    def _build(self, files: list[str], dirs: list[str], mtimes: dict[str, int]) -> None:
+        self.files = files
+        self.dirs = dirs
+        self._dir_set = set(dirs)
+        self._dir_mtimes = mtimes
+        self._by_ext = {}
+        self._by_name = {}
+        self._by_dir = {}
+        for rel in files:
+            rel_dir, _, name = rel.rpartition("/")
+            self._by_name.setdefault(name, []).append(rel)
+            self._by_dir.setdefault(rel_dir, []).append(name)
+            ext = os.path.splitext(name)[1]
+            if ext:
+                self._by_ext.setdefault(ext, []).append(rel)
+        self._scanned = True
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def _relative(self, base: Path | None) -> str | None:
+        """Relative POSIX path of base inside the walked tree (None if not)."""
+        if base is None:
+            return ""
+        try:
+            rel = Path(base).resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        if rel == ".":
+            return ""
+        self._ensure_scanned()
+        return rel if rel in self._dir_set else None
+
+    def covers(self, path: Path) -> bool:
+        """Check whether a directory was included in this inventory's walk."""
+        return self._relative(path) is not None
+
+    def glob(self, pattern: str, base: Path | None = None) -> list[Path]:
+        """
+        Match a pathlib-style glob against the inventory.
+
+        Args:
+            pattern: Glob relative to base (``*``, ``?``, ``[...]``, ``**``)
+            base: Directory the pattern is relative to (default: root)
+
+        Returns:
+            Matching files and directories, sorted
+        """
+        self._ensure_scanned()
+        rel_base = self._relative(base)
+        if rel_base is None:
+            return FileInventory(base).glob(pattern)
+
+        prefix = f"{rel_base}/" if rel_base else ""
+        parts = [p for p in pattern.split("/") if p not in ("", ".")]
+
+        # Fast paths for the common "**/*.ext" and "**/name" shapes
+        if len(parts) == 2 and parts[0] == "**":
+            name = parts[1]
+            candidates = None
+            if (
+                name.startswith("*.")
+                and not _is_magic(name[1:])
+                and "." not in name[2:]
+            ):
+                candidates = self._by_ext.get(name[1:], [])
+            elif not _is_magic(name):
+                candidates = self._by_name.get(name, [])
+            if candidates is not None:
+                matches = [r for r in candidates if r.startswith(prefix)]
+                matches += self._match_dirs(parts, prefix)
+                return self._to_paths(matches)
+        if len(parts) == 1:
+            names = self._by_dir.get(rel_base, [])
+            matches = [prefix + n for n in names if fnmatchcase(n, parts[0])]
+            matches += self._match_dirs(parts, prefix)
+            return self._to_paths(matches)
+
+        matches = [
+            rel
+            for rel in self.files
+            if rel.startswith(prefix)
+            and match_glob_parts(parts, rel[len(prefix) :].split("/"))
+        ]
+        matches += self._match_dirs(parts, prefix)
+        return self._to_paths(matches)
+
+    def _match_dirs(self, parts: list[str], prefix: str) -> list[str]:
+        return [
+            rel
+            for rel in self.dirs
+            if rel.startswith(prefix)
+            and match_glob_parts(parts, rel[len(prefix) :].split("/"))
+        ]
+
+    def _to_paths(self, rels: list[str]) -> list[Path]:
+        return [self.root / rel for rel in sorted(rels, key=_path_key)]
+
+    def exists(self, pattern: str, base: Path | None = None) -> bool:
+        """Check whether any file or directory matches a glob."""
+        return bool(self.glob(pattern, base))
+
+    def files_with_suffix(self, suffix: str, base: Path | None = None) -> list[Path]:
+        """All files with an extension (e.g. ".py") under base."""
+        return self.glob(f"**/*{suffix}", base)
+
+    def relative_files(self, base: Path | None = None) -> list[str]:
+        """All files under base as POSIX paths relative to base."""
+        self._ensure_scanned()
+        rel_base = self._relative(base)
+        if rel_base is None:
+            return FileInventory(base).relative_files()
+        if not rel_base:
+            return list(self.files)
+        prefix = rel_base + "/"
+        return [r[len(prefix) :] for r in self.files if r.startswith(prefix)]
+
+    # ------------------------------------------------------------------
+    # Persistence
+    # ------------------------------------------------------------------
+
+    def save(self, cache_file: Path) -> None:
+        """Persist the inventory (temp file + rename)."""
+        try:
+            # Create the cache directory before walking so creating it does
+            # not immediately invalidate the recorded directory mtimes
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+        except OSError:
+            return
+        self._ensure_scanned()
+        data = {
+            "version": INVENTORY_VERSION,
+            "root": str(self.root),
+            "files": self.files,
+            "dirs": self.dirs,
+            "dir_mtimes": self._dir_mtimes,
+        }
+        try:
+            fd, tmp_path = tempfile.mkstemp(
+                dir=cache_file.parent, prefix=".file_inventory.", suffix=".tmp"
+            )
+            with os.fdopen(fd, "w") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, cache_file)
+        except OSError:
+            # Persistence is only an optimization
+            pass
+
+    @classmethod
+    def load(cls, root: Path, cache_file: Path) -> "FileInventory | None":
+        """
+        Load a persisted inventory if no directory changed since it was saved.
+
+        Args:
+            root: Project root
+            cache_file: File written by save()
+
+        Returns:
+            FileInventory, or None if missing or stale
+        """
+        inventory = cls(root)
+        try:
+            with open(cache_file) as f:
+                data = json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if data.get("version") != INVENTORY_VERSION or data.get("root") != str(
+            inventory.root
+        ):
+            return None
+
+        mtimes = data.get("dir_mtimes", {})
+        for rel_dir, mtime in mtimes.items():
+            try:
+                current = os.stat(inventory.root / rel_dir).st_mtime_ns
+            except OSError:
+                return None
+            if current != mtime:
+                return None
+
+        inventory._build(data.get("files", []), data.get("dirs", []), mtimes)
+        return inventory
+
+
+def _path_key(rel: str) -> list[str]:
+    """Sort key giving the same order as sorting Path objects."""
+    return rel.split("/")
+
+
+def _is_magic(text: str) -> bool:
+    return any(c in text for c in "*?[")
+
+
+def get_inventory(path: Path) -> FileInventory:
+    """
+    Get the inventory to use for a directory.
+
+    Args:
+        path: Directory a detector is working on
+
+    Returns:
+        The innermost active shared inventory covering path, or a new
+        private inventory rooted at path
+    """
+    path = Path(path).resolve()
+    for inventory in reversed(_active_inventories.get()):
+        if inventory.covers(path):
+            return inventory
+    return FileInventory(path)
+
+
+@contextmanager
+def shared_inventory(root: Path, persist: bool = False) -> Iterator[FileInventory]:
+    """
+    Share one inventory with every detector running under root.
+
+    Args:
+        root: Project or service root
+        persist: Load/save the inventory at INVENTORY_CACHE_FILE
+
+    Yields:
+        The shared FileInventory
+    """
+    root = Path(root).resolve()
+    for inventory in _active_inventories.get():
+        if inventory.covers(root):
+            # An enclosing walk already covers this directory
+            yield inventory
+            return
+
+    cache_file = root / INVENTORY_CACHE_FILE
+    inventory = FileInventory.load(root, cache_file) if persist else None
+    if inventory is None:
+        inventory = FileInventory(root)
+        if persist:
+            inventory.scan()
+            inventory.save(cache_file)
+
+    token = _active_inventories.set(_active_inventories.get() + (inventory,))
+    try:
+        yield inventory
+    finally:
+        _active_inventories.reset(token)
@@ -6,6 +6,7 @@ Core data structures for representing technology stacks,
 custom scripts, and security profiles.
 """
 
+import hashlib
 from dataclasses import asdict, dataclass, field
 
 
@@ -53,14 +54,54 @@ class SecurityProfile:
     created_at: str = ""
     project_hash: str = ""
 
+    def __post_init__(self) -> None:
+        self._frozen_key: tuple | None = None
+        self._allowed: frozenset[str] = frozenset()
+        self._fingerprint = ""
+        self._freeze()
+
+    def _freeze(self) -> None:
+        """
+        Precompute the frozen allow-set and its fingerprint.
+
+        Keyed on the contents of the command sets, so both replaced sets and
+        in-place edits (even ones that keep the size, like discard + add)
+        are picked up. The union and the sha1 are only recomputed when the
+        contents change.
+        """
+        key = (
+            frozenset(self.base_commands),
+            frozenset(self.stack_commands),
+            frozenset(self.script_commands),
+            frozenset(self.custom_commands),
+            frozenset(self.custom_scripts.shell_scripts),
+        )
+        if key == self._frozen_key:
+            return
+
+        self._allowed = frozenset().union(*key[:4])
+        hasher = hashlib.sha1()
+        for commands in key:
+            hasher.update("\0".join(sorted(commands)).encode())
+            hasher.update(b"\1")
+        self._fingerprint = hasher.hexdigest()
+        self._frozen_key = key
+
+    @property
+    def allowed_commands(self) -> frozenset[str]:
+        """Frozen set of all allowed commands (cached)."""
+        self._freeze()
+        return self._allowed
+
+    @property
+    def fingerprint(self) -> str:
+        """Hash of everything that affects command decisions."""
+        self._freeze()
+        return self._fingerprint
+
     def get_all_allowed_commands(self) -> set[str]:
         """Get the complete set of allowed commands."""
-        return (
-            self.base_commands
-            | self.stack_commands
-            | self.script_commands
-            | self.custom_commands
-        )
+        return set(self.allowed_commands)
 
     def to_dict(self) -> dict:
         """Convert to JSON-serializable dict."""
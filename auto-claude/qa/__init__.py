@@ -33,6 +33,7 @@ from .criteria import (
     save_implementation_plan,
     should_run_fixes,
     should_run_qa,
+    update_implementation_plan,
 )
 from .fixer import (
     load_qa_fixer_prompt,
@@ -76,6 +77,7 @@ __all__ = [
     # Criteria & status
     "load_implementation_plan",
     "save_implementation_plan",
+    "update_implementation_plan",
     "get_qa_signoff_status",
     "is_qa_approved",
     "is_qa_rejected",
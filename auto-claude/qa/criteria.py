@@ -5,10 +5,11 @@ QA Acceptance Criteria Handling
 Manages acceptance criteria validation and status tracking.
 """
 
-import json
+from collections.abc import Callable
 from pathlib import Path
 from typing import Optional
 
+from implementation_plan.store import get_plan_store
 from progress import is_build_complete
 
 # =============================================================================
@@ -17,28 +18,42 @@ from progress import is_build_complete
 
 
 def load_implementation_plan(spec_dir: Path) -> Optional[dict]:
-    """Load the implementation plan JSON."""
-    plan_file = spec_dir / "implementation_plan.json"
-    if not plan_file.exists():
-        return None
-    try:
-        with open(plan_file) as f:
-            return json.load(f)
-    except (OSError, json.JSONDecodeError):
-        return None
+    """Load the implementation plan JSON (a private copy, safe to modify)."""
+    return get_plan_store(spec_dir).load()
 
 
 def save_implementation_plan(spec_dir: Path, plan: dict) -> bool:
-    """Save the implementation plan JSON."""
-    plan_file = spec_dir / "implementation_plan.json"
+    """
+    Replace the implementation plan JSON (locked, atomic).
+
+    This overwrites whatever is on disk; to change part of the plan use
+    update_implementation_plan() so concurrent writers aren't lost.
+    """
     try:
-        with open(plan_file, "w") as f:
-            json.dump(plan, f, indent=2)
+        get_plan_store(spec_dir).write(plan)
         return True
     except OSError:
         return False
 
 
+def update_implementation_plan(spec_dir: Path, mutate: Callable[[dict], bool]) -> bool:
+    """
+    Read-modify-write the implementation plan under the plan lock.
+
+    Args:
+        spec_dir: Spec directory
+        mutate: Modifies the plan in place (an empty dict if there is no
+            plan yet); returns True if it changed anything
+
+    Returns:
+        True if the plan was changed and saved
+    """
+    try:
+        return get_plan_store(spec_dir).update(mutate, create=True)
+    except (OSError, ValueError):
+        return False
+
+
 # =============================================================================
 # QA SIGN-OFF STATUS
 # =============================================================================
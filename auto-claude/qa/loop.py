@@ -10,6 +10,7 @@ import time as time_module
 from pathlib import Path
 
 from client import create_client
+from core.mcp_manager import shutdown_mcp_servers
 from linear_updater import (
     LinearTaskState,
     is_linear_enabled,
@@ -84,6 +85,30 @@ async def run_qa_validation_loop(
     Returns:
         True if QA approved, False otherwise
     """
+    try:
+        return await _run_qa_iterations(
+            project_dir,
+            spec_dir,
+            model,
+            provider=provider,
+            verbose=verbose,
+            is_simple_task=is_simple_task,
+        )
+    finally:
+        # MCP servers are shared across QA sessions; stop them with the loop
+        await shutdown_mcp_servers()
+
+
+async def _run_qa_iterations(
+    project_dir: Path,
+    spec_dir: Path,
+    model: str,
+    *,
+    provider: str | None,
+    verbose: bool,
+    is_simple_task: bool,
+) -> bool:
+    """Body of run_qa_validation_loop."""
     # Get max iterations from config
     max_iterations = get_max_qa_iterations(project_dir, is_simple_task)
 
@@ -13,7 +13,7 @@ from difflib import SequenceMatcher
 from pathlib import Path
 from typing import Any
 
-from .criteria import load_implementation_plan, save_implementation_plan
+from .criteria import load_implementation_plan, update_implementation_plan
 
 # Configuration
 RECURRING_ISSUE_THRESHOLD = 3  # Escalate if same issue appears this many times
@@ -58,13 +58,6 @@ def record_iteration(
     Returns:
         True if recorded successfully
     """
-    plan = load_implementation_plan(spec_dir)
-    if not plan:
-        plan = {}
-
-    if "qa_iteration_history" not in plan:
-        plan["qa_iteration_history"] = []
-
     record = {
         "iteration": iteration,
         "status": status,
@@ -74,25 +67,31 @@ def record_iteration(
     if duration_seconds is not None:
         record["duration_seconds"] = round(duration_seconds, 2)
 
-    plan["qa_iteration_history"].append(record)
+    # Re-read under the plan lock so concurrent plan updates aren't lost
+    def add_record(plan: dict) -> bool:
+        if "qa_iteration_history" not in plan:
+            plan["qa_iteration_history"] = []
+
+        plan["qa_iteration_history"].append(record)
 
-    # Update summary stats
-    if "qa_stats" not in plan:
-        plan["qa_stats"] = {}
+        # Update summary stats
+        if "qa_stats" not in plan:
+            plan["qa_stats"] = {}
 
-    plan["qa_stats"]["total_iterations"] = len(plan["qa_iteration_history"])
-    plan["qa_stats"]["last_iteration"] = iteration
-    plan["qa_stats"]["last_status"] = status
+        plan["qa_stats"]["total_iterations"] = len(plan["qa_iteration_history"])
+        plan["qa_stats"]["last_iteration"] = iteration
+        plan["qa_stats"]["last_status"] = status
 
-    # Count issues by type
-    issue_types = Counter()
-    for rec in plan["qa_iteration_history"]:
-        for issue in rec.get("issues", []):
-            issue_type = issue.get("type", "unknown")
-            issue_types[issue_type] += 1
-    plan["qa_stats"]["issues_by_type"] = dict(issue_types)
+        # Count issues by type
+        issue_types = Counter()
+        for rec in plan["qa_iteration_history"]:
+            for issue in rec.get("issues", []):
+                issue_type = issue.get("type", "unknown")
+                issue_types[issue_type] += 1
+        plan["qa_stats"]["issues_by_type"] = dict(issue_types)
+        return True
 
-    return save_implementation_plan(spec_dir, plan)
+    return update_implementation_plan(spec_dir, add_record)
 
 
 # =============================================================================
@@ -24,6 +24,12 @@ try:
 except ImportError:
     pass
 
+# Debug settings are resolved when debug is first imported; re-read them in
+# case that happened before the .env file above was loaded
+from debug import reload_debug_config
+
+reload_debug_config()
+
 try:
     from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 
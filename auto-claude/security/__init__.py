@@ -16,7 +16,8 @@ Main functions:
 - bash_security_hook: Pre-tool-use hook for command validation
 - validate_command: Standalone validation function for testing
 - get_security_profile: Get or create security profile for a project
-- reset_profile_cache: Reset cached security profile
+- reset_profile_cache: Reset cached security profiles
+- reset_decision_cache: Reset memoized command decisions
 
 Command parsing:
 - extract_commands: Extract command names from shell strings
@@ -35,7 +36,7 @@ from project_analyzer import (
     needs_validation,
 )
 
-from .hooks import bash_security_hook, validate_command
+from .hooks import bash_security_hook, reset_decision_cache, validate_command
 
 # Command parsing utilities
 from .parser import (
@@ -75,6 +76,7 @@ __all__ = [
     "validate_command",
     "get_security_profile",
     "reset_profile_cache",
+    "reset_decision_cache",
     # Parsing utilities
     "extract_commands",
     "split_command_segments",
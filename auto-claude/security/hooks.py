@@ -4,19 +4,118 @@ Security Hooks
 
 Pre-tool-use hooks that validate bash commands for security.
 Main enforcement point for the security system.
+
+Decisions are memoized per (profile fingerprint, command) in a bounded LRU,
+since agents issue the same handful of commands thousands of times per
+build. Validators listed in STATEFUL_VALIDATORS are re-run on every call.
 """
 
 import os
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Any
 
+from core.profiling import profiled
 from project_analyzer import BASE_COMMANDS, SecurityProfile, is_command_allowed
 
 from .parser import extract_commands, get_command_for_validation, split_command_segments
 from .profile import get_security_profile
-from .validator import VALIDATORS
+from .validator import STATEFUL_VALIDATORS, VALIDATORS
+
+# Maximum number of memoized command decisions
+DECISION_CACHE_SIZE = 4096
+
+# A decision plan is an ordered list of steps. (None, reason) blocks with
+# reason; (validator, segment) runs a stateful validator on the segment.
+# An empty plan allows the command; None means it could not be parsed.
+DecisionPlan = tuple[tuple[str | None, str], ...] | None
+
+_decision_cache: "OrderedDict[tuple[str, str], DecisionPlan]" = OrderedDict()
+_decision_lock = threading.Lock()
+
+
+def _plan_command(command: str, profile: SecurityProfile) -> DecisionPlan:
+    """
+    Run every check that depends only on the command string and profile.
+
+    Args:
+        command: Full command string
+        profile: Security profile
+
+    Returns:
+        Decision plan (see DecisionPlan)
+    """
+    commands = extract_commands(command)
+    if not commands:
+        return None
+
+    # Split into segments for per-command validation
+    segments = split_command_segments(command)
+    steps: list[tuple[str | None, str]] = []
+
+    for cmd in commands:
+        # Check if command is allowed
+        is_allowed, reason = is_command_allowed(cmd, profile)
+        if not is_allowed:
+            steps.append((None, reason))
+            break
+
+        # Additional validation for sensitive commands
+        if cmd in VALIDATORS:
+            cmd_segment = get_command_for_validation(cmd, segments)
+            if not cmd_segment:
+                cmd_segment = command
+
+            if cmd in STATEFUL_VALIDATORS:
+                steps.append((cmd, cmd_segment))
+                continue
+
+            allowed, reason = VALIDATORS[cmd](cmd_segment)
+            if not allowed:
+                steps.append((None, reason))
+                break
+
+    return tuple(steps)
+
+
+def _get_decision_plan(command: str, profile: SecurityProfile) -> DecisionPlan:
+    """Get the decision plan for a command, memoized per profile."""
+    key = (profile.fingerprint, command.strip())
+
+    with _decision_lock:
+        if key in _decision_cache:
+            _decision_cache.move_to_end(key)
+            return _decision_cache[key]
+
+    plan = _plan_command(command, profile)
+
+    with _decision_lock:
+        _decision_cache[key] = plan
+        while len(_decision_cache) > DECISION_CACHE_SIZE:
+            _decision_cache.popitem(last=False)
+
+    return plan
+
+
+def _run_decision_plan(plan: tuple[tuple[str | None, str], ...]) -> tuple[bool, str]:
+    """Apply a parsed decision plan, running any stateful validators."""
+    for validator_name, arg in plan:
+        if validator_name is None:
+            return False, arg
+        allowed, reason = VALIDATORS[validator_name](arg)
+        if not allowed:
+            return False, reason
+    return True, ""
+
+
+def reset_decision_cache() -> None:
+    """Reset memoized command decisions (useful for testing)."""
+    with _decision_lock:
+        _decision_cache.clear()
 
 
+@profiled("security.bash_hook")
 async def bash_security_hook(
     input_data: dict[str, Any],
     tool_use_id: str | None = None,
@@ -62,43 +161,18 @@ async def bash_security_hook(
         profile = SecurityProfile()
         profile.base_commands = BASE_COMMANDS.copy()
 
-    # Extract all commands from the command string
-    commands = extract_commands(command)
+    plan = _get_decision_plan(command, profile)
 
-    if not commands:
+    if plan is None:
         # Could not parse - fail safe by blocking
         return {
             "decision": "block",
             "reason": f"Could not parse command for security validation: {command}",
         }
 
-    # Split into segments for per-command validation
-    segments = split_command_segments(command)
-
-    # Get all allowed commands
-    allowed = profile.get_all_allowed_commands()
-
-    # Check each command against the allowlist
-    for cmd in commands:
-        # Check if command is allowed
-        is_allowed, reason = is_command_allowed(cmd, profile)
-
-        if not is_allowed:
-            return {
-                "decision": "block",
-                "reason": reason,
-            }
-
-        # Additional validation for sensitive commands
-        if cmd in VALIDATORS:
-            cmd_segment = get_command_for_validation(cmd, segments)
-            if not cmd_segment:
-                cmd_segment = command
-
-            validator = VALIDATORS[cmd]
-            allowed, reason = validator(cmd_segment)
-            if not allowed:
-                return {"decision": "block", "reason": reason}
+    allowed, reason = _run_decision_plan(plan)
+    if not allowed:
+        return {"decision": "block", "reason": reason}
 
     return {}
 
@@ -121,26 +195,9 @@ def validate_command(
         project_dir = Path.cwd()
 
     profile = get_security_profile(project_dir)
-    commands = extract_commands(command)
+    plan = _get_decision_plan(command, profile)
 
-    if not commands:
+    if plan is None:
         return False, "Could not parse command"
 
-    segments = split_command_segments(command)
-
-    for cmd in commands:
-        is_allowed_result, reason = is_command_allowed(cmd, profile)
-        if not is_allowed_result:
-            return False, reason
-
-        if cmd in VALIDATORS:
-            cmd_segment = get_command_for_validation(cmd, segments)
-            if not cmd_segment:
-                cmd_segment = command
-
-            validator = VALIDATORS[cmd]
-            allowed, reason = validator(cmd_segment)
-            if not allowed:
-                return False, reason
-
-    return True, ""
+    return _run_decision_plan(plan)
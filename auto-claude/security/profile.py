@@ -4,22 +4,53 @@ Security Profile Management
 
 Manages security profiles for projects, including caching and validation.
 Uses project_analyzer to create dynamic security profiles based on detected stacks.
+
+Profiles are kept in a small LRU keyed by project directory, so switching
+between the main project and its .worktrees/<spec> checkouts (or running
+several worktrees at once) never evicts a warm profile. Each worktree is
+still analyzed as its own project, since its stack can diverge from the
+parent's. Cached profiles are revalidated against the project hash at most
+once per PROFILE_REVALIDATE_SECONDS.
+
+Analysis runs under a per-key lock, so a slow analysis of one project never
+blocks lookups for another.
 """
 
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 
 from project_analyzer import (
+    ProjectAnalyzer,
     SecurityProfile,
     get_or_create_profile,
 )
 
+# Maximum number of projects/specs with a cached profile
+PROFILE_CACHE_SIZE = 16
+
+# Minimum time between project hash checks for a cached profile
+PROFILE_REVALIDATE_SECONDS = 30.0
+
+
+@dataclass
+class _CachedProfile:
+    profile: SecurityProfile
+    checked_at: float
+
+
 # =============================================================================
 # GLOBAL STATE
 # =============================================================================
 
-# Cache the security profile to avoid re-analyzing on every command
-_cached_profile: SecurityProfile | None = None
-_cached_project_dir: Path | None = None
+# Cache security profiles to avoid re-analyzing on every command
+_profile_cache: "OrderedDict[tuple[Path, Path | None], _CachedProfile]" = OrderedDict()
+# Guards _profile_cache and _key_locks; never held during analysis
+_cache_lock = threading.Lock()
+# One lock per cache key, held while that project is analyzed
+_key_locks: dict[tuple[Path, Path | None], threading.Lock] = {}
 
 
 def get_security_profile(
@@ -35,23 +66,48 @@ def get_security_profile(
     Returns:
         SecurityProfile for the project
     """
-    global _cached_profile, _cached_project_dir
-
     project_dir = Path(project_dir).resolve()
+    spec_dir = Path(spec_dir).resolve() if spec_dir else None
+    key = (project_dir, spec_dir)
+
+    with _cache_lock:
+        cached = _profile_cache.get(key)
+        if cached is not None:
+            _profile_cache.move_to_end(key)
+            if time.monotonic() - cached.checked_at < PROFILE_REVALIDATE_SECONDS:
+                return cached.profile
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        # Another thread may have refreshed this key while we waited
+        with _cache_lock:
+            cached = _profile_cache.get(key)
+        now = time.monotonic()
+        if cached is not None:
+            if now - cached.checked_at < PROFILE_REVALIDATE_SECONDS:
+                return cached.profile
+
+            # Throttled revalidation: only re-analyze if the project changed
+            analyzer = ProjectAnalyzer(project_dir, spec_dir)
+            if not analyzer.should_reanalyze(cached.profile):
+                cached.checked_at = now
+                return cached.profile
 
-    # Return cached profile if same project
-    if _cached_profile is not None and _cached_project_dir == project_dir:
-        return _cached_profile
+        # Analyze and cache
+        profile = get_or_create_profile(project_dir, spec_dir)
 
-    # Analyze and cache
-    _cached_profile = get_or_create_profile(project_dir, spec_dir)
-    _cached_project_dir = project_dir
+        with _cache_lock:
+            _profile_cache[key] = _CachedProfile(profile, time.monotonic())
+            _profile_cache.move_to_end(key)
+            while len(_profile_cache) > PROFILE_CACHE_SIZE:
+                evicted, _ = _profile_cache.popitem(last=False)
+                _key_locks.pop(evicted, None)
 
-    return _cached_profile
+        return profile
 
 
 def reset_profile_cache() -> None:
-    """Reset the cached profile (useful for testing or re-analysis)."""
-    global _cached_profile, _cached_project_dir
-    _cached_profile = None
-    _cached_project_dir = None
+    """Reset the cached profiles (useful for testing or re-analysis)."""
+    with _cache_lock:
+        _profile_cache.clear()
+        _key_locks.clear()
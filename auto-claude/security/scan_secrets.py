@@ -9,6 +9,12 @@ Designed to prevent accidental exposure of API keys, tokens, and credentials.
 Usage:
     python scan_secrets.py [--staged-only] [--all-files] [--path PATH]
 
+All patterns are compiled once into a combined scanner that walks each file
+buffer in a single pass; only lines it flags are checked against the
+individual patterns. --all-files mode scans across a process pool and
+caches results by git blob SHA in .auto-claude/, so unchanged files are
+never rescanned.
+
 Exit codes:
     0 - No secrets detected
     1 - Potential secrets found (commit should be blocked)
@@ -16,10 +22,17 @@ Exit codes:
 """
 
 import argparse
+import bisect
+import functools
+import hashlib
+import json
+import os
 import re
 import subprocess
 import sys
-from dataclasses import dataclass
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import astuple, dataclass
 from pathlib import Path
 
 # =============================================================================
@@ -251,6 +264,48 @@ FALSE_POSITIVE_PATTERNS = [
 ]
 
 
+# =============================================================================
+# COMPILED PATTERNS
+# =============================================================================
+
+
+def _compile_patterns(
+    patterns: list[tuple[str, str]],
+) -> list[tuple[re.Pattern, str]]:
+    """Compile secret patterns once, dropping any invalid regex."""
+    compiled = []
+    for pattern, pattern_name in patterns:
+        try:
+            compiled.append((re.compile(pattern, re.IGNORECASE), pattern_name))
+        except re.error:
+            continue
+    return compiled
+
+
+def _combine(patterns: list[str], flags: int = 0) -> re.Pattern:
+    """Compile a list of regexes into one alternation."""
+    return re.compile("|".join(f"(?:{p})" for p in patterns), flags)
+
+
+_COMPILED_PATTERNS = _compile_patterns(ALL_PATTERNS)
+
+# Candidate scanner: matches wherever any secret pattern matches. It runs over
+# the whole buffer, so it may also flag spans that cross a line break - those
+# lines are then rejected by the per-line patterns.
+_CANDIDATE_RE = _combine([p.pattern for p, _ in _COMPILED_PATTERNS], re.IGNORECASE)
+
+_DEFAULT_IGNORE_RE = _combine(DEFAULT_IGNORE_PATTERNS)
+_FALSE_POSITIVE_RE = _combine(FALSE_POSITIVE_PATTERNS)
+_TYPE_HINT_RE = re.compile(r"^[a-z_]+:\s*str\s*$", re.IGNORECASE)
+_LONG_KEY_RE = re.compile(r"[a-zA-Z0-9_-]{40,}")
+
+
+@functools.lru_cache(maxsize=32)
+def _compile_ignores(custom_ignores: tuple[str, ...]) -> tuple[re.Pattern, ...]:
+    """Compile .secretsignore patterns (cached per pattern set)."""
+    return tuple(re.compile(pattern) for pattern in custom_ignores)
+
+
 # =============================================================================
 # CORE FUNCTIONS
 # =============================================================================
@@ -285,13 +340,12 @@ def should_skip_file(file_path: str, custom_ignores: list[str]) -> bool:
         return True
 
     # Check default ignore patterns
-    for pattern in DEFAULT_IGNORE_PATTERNS:
-        if re.search(pattern, file_path):
-            return True
+    if _DEFAULT_IGNORE_RE.search(file_path):
+        return True
 
     # Check custom ignore patterns
-    for pattern in custom_ignores:
-        if re.search(pattern, file_path):
+    for pattern in _compile_ignores(tuple(custom_ignores)):
+        if pattern.search(file_path):
             return True
 
     return False
@@ -299,14 +353,11 @@ def should_skip_file(file_path: str, custom_ignores: list[str]) -> bool:
 
 def is_false_positive(line: str, matched_text: str) -> bool:
     """Check if a match is likely a false positive."""
-    line_lower = line.lower()
-
-    for pattern in FALSE_POSITIVE_PATTERNS:
-        if re.search(pattern, line_lower):
-            return True
+    if _FALSE_POSITIVE_RE.search(line.lower()):
+        return True
 
     # Check if it's just a variable name or type hint
-    if re.match(r"^[a-z_]+:\s*str\s*$", line.strip(), re.IGNORECASE):
+    if _TYPE_HINT_RE.match(line.strip()):
         return True
 
     # Check if it's in a comment
@@ -317,7 +368,7 @@ def is_false_positive(line: str, matched_text: str) -> bool:
         or stripped.startswith("*")
     ):
         # But still flag if there's an actual long key-like string
-        if not re.search(r"[a-zA-Z0-9_-]{40,}", matched_text):
+        if not _LONG_KEY_RE.search(matched_text):
             return True
 
     return False
@@ -330,33 +381,64 @@ def mask_secret(text: str, visible_chars: int = 8) -> str:
     return text[:visible_chars] + "***"
 
 
+def _candidate_lines(buffer: str, line_starts: list[int]) -> list[int]:
+    """
+    Find the lines of a buffer that may contain a secret.
+
+    After each candidate the search resumes at the start of the next line, so
+    every line with a per-line match is reported.
+
+    Args:
+        buffer: Lines joined with newlines
+        line_starts: Offset of each line in the buffer
+
+    Returns:
+        Zero-based indexes of candidate lines
+    """
+    candidates = []
+    pos = 0
+    while True:
+        match = _CANDIDATE_RE.search(buffer, pos)
+        if match is None:
+            return candidates
+        line_index = bisect.bisect_right(line_starts, match.start()) - 1
+        candidates.append(line_index)
+        if line_index + 1 >= len(line_starts):
+            return candidates
+        pos = line_starts[line_index + 1]
+
+
 def scan_content(content: str, file_path: str) -> list[SecretMatch]:
     """Scan file content for potential secrets."""
     matches = []
     lines = content.splitlines()
-
-    for line_num, line in enumerate(lines, 1):
-        for pattern, pattern_name in ALL_PATTERNS:
-            try:
-                for match in re.finditer(pattern, line, re.IGNORECASE):
-                    matched_text = match.group(0)
-
-                    # Skip false positives
-                    if is_false_positive(line, matched_text):
-                        continue
-
-                    matches.append(
-                        SecretMatch(
-                            file_path=file_path,
-                            line_number=line_num,
-                            pattern_name=pattern_name,
-                            matched_text=matched_text,
-                            line_content=line.strip()[:100],  # Truncate long lines
-                        )
+    buffer = "\n".join(lines)
+
+    line_starts = []
+    offset = 0
+    for line in lines:
+        line_starts.append(offset)
+        offset += len(line) + 1
+
+    for line_index in _candidate_lines(buffer, line_starts):
+        line = lines[line_index]
+        for pattern, pattern_name in _COMPILED_PATTERNS:
+            for match in pattern.finditer(line):
+                matched_text = match.group(0)
+
+                # Skip false positives
+                if is_false_positive(line, matched_text):
+                    continue
+
+                matches.append(
+                    SecretMatch(
+                        file_path=file_path,
+                        line_number=line_index + 1,
+                        pattern_name=pattern_name,
+                        matched_text=matched_text,
+                        line_content=line.strip()[:100],  # Truncate long lines
                     )
-            except re.error:
-                # Invalid regex, skip
-                continue
+                )
 
     return matches
 
@@ -391,16 +473,149 @@ def get_all_tracked_files() -> list[str]:
         return []
 
 
+# =============================================================================
+# SCAN CACHE
+# =============================================================================
+
+CACHE_FILE = ".auto-claude/secret_scan_cache.json"
+
+# Files per process-pool task
+SCAN_CHUNK_SIZE = 64
+
+# Cache entries are only valid for the exact pattern set that produced them
+_PATTERNS_FINGERPRINT = hashlib.sha1(
+    json.dumps([ALL_PATTERNS, FALSE_POSITIVE_PATTERNS]).encode()
+).hexdigest()
+
+
+def git_blob_sha(data: bytes) -> str:
+    """Compute the git blob SHA of some content (same as git hash-object)."""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+def get_index_blob_shas(project_dir: Path) -> dict[str, str]:
+    """
+    Get blob SHAs for tracked files whose working copy matches the index.
+
+    Args:
+        project_dir: Repository root
+
+    Returns:
+        Mapping of path to blob SHA (modified files are omitted)
+    """
+    try:
+        staged = subprocess.run(
+            ["git", "ls-files", "-s", "-z"],
+            cwd=project_dir,
+            capture_output=True,
+            check=True,
+        ).stdout.decode("utf-8", errors="surrogateescape")
+        modified = subprocess.run(
+            ["git", "diff", "--name-only", "--relative", "-z"],
+            cwd=project_dir,
+            capture_output=True,
+            check=True,
+        ).stdout.decode("utf-8", errors="surrogateescape")
+    except (OSError, subprocess.CalledProcessError):
+        return {}
+
+    dirty = set(modified.split("\0"))
+    shas = {}
+    for record in staged.split("\0"):
+        # "<mode> <sha> <stage>\t<path>"
+        meta, _, path = record.partition("\t")
+        parts = meta.split()
+        if len(parts) == 3 and parts[2] == "0" and path not in dirty:
+            shas[path] = parts[1]
+    return shas
+
+
+def _load_scan_cache(project_dir: Path) -> dict[str, list]:
+    """Load cached scan results keyed by blob SHA."""
+    try:
+        with open(project_dir / CACHE_FILE) as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+    if data.get("fingerprint") != _PATTERNS_FINGERPRINT:
+        return {}
+    return data.get("results", {})
+
+
+def _save_scan_cache(project_dir: Path, results: dict[str, list]) -> None:
+    """Persist scan results (temp file + rename)."""
+    cache_file = project_dir / CACHE_FILE
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            dir=cache_file.parent, prefix=".secret_scan_cache.", suffix=".tmp"
+        )
+        with os.fdopen(fd, "w") as f:
+            json.dump({"fingerprint": _PATTERNS_FINGERPRINT, "results": results}, f)
+        os.replace(tmp_path, cache_file)
+    except OSError:
+        # The cache is an optimization only
+        pass
+
+
+def _scan_file(
+    full_path: str, file_path: str, known_sha: str | None
+) -> tuple[str | None, list[SecretMatch]]:
+    """
+    Read and scan a single file.
+
+    Returns:
+        (blob SHA of the scanned content, matches). The SHA is None when the
+        file could not be read.
+    """
+    try:
+        data = Path(full_path).read_bytes()
+    except OSError:
+        return None, []
+    content = data.decode("utf-8", errors="ignore")
+    return known_sha or git_blob_sha(data), scan_content(content, file_path)
+
+
+def _scan_chunk(
+    chunk: list[tuple[str, str, str | None]],
+) -> list[tuple[str | None, list[SecretMatch]]]:
+    """Process-pool entry point: scan a batch of files."""
+    return [_scan_file(*item) for item in chunk]
+
+
+# =============================================================================
+# FILE SCANNING
+# =============================================================================
+
+
 def scan_files(
     files: list[str],
     project_dir: Path | None = None,
+    workers: int = 1,
+    use_cache: bool = False,
 ) -> list[SecretMatch]:
-    """Scan a list of files for secrets."""
+    """
+    Scan a list of files for secrets.
+
+    Args:
+        files: Paths relative to project_dir
+        project_dir: Repository root (defaults to cwd)
+        workers: Number of scanner processes (1 = scan in this process)
+        use_cache: Reuse/store results keyed by git blob SHA
+
+    Returns:
+        Matches in input file order
+    """
     if project_dir is None:
         project_dir = Path.cwd()
 
     custom_ignores = load_secretsignore(project_dir)
-    all_matches = []
+    index_shas = get_index_blob_shas(project_dir) if use_cache else {}
+    cache = _load_scan_cache(project_dir) if use_cache else {}
+
+    results: dict[str, list[SecretMatch]] = {}
+    live_cache: dict[str, list] = {}
+    pending: list[tuple[str, str, str | None]] = []
 
     for file_path in files:
         # Skip files based on ignore patterns
@@ -413,14 +628,40 @@ def scan_files(
         if not full_path.exists() or full_path.is_dir():
             continue
 
-        try:
-            content = full_path.read_text(encoding="utf-8", errors="ignore")
-            matches = scan_content(content, file_path)
-            all_matches.extend(matches)
-        except (OSError, UnicodeDecodeError):
-            # Skip files that can't be read
+        sha = index_shas.get(file_path)
+        if sha is not None and sha in cache:
+            live_cache[sha] = cache[sha]
+            results[file_path] = [
+                SecretMatch(file_path, *cached) for cached in cache[sha]
+            ]
             continue
 
+        pending.append((str(full_path), file_path, sha))
+
+    if workers > 1 and len(pending) > SCAN_CHUNK_SIZE:
+        chunks = [
+            pending[i : i + SCAN_CHUNK_SIZE]
+            for i in range(0, len(pending), SCAN_CHUNK_SIZE)
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            scanned = [
+                item for batch in pool.map(_scan_chunk, chunks) for item in batch
+            ]
+    else:
+        scanned = _scan_chunk(pending)
+
+    for (_, file_path, _), (sha, matches) in zip(pending, scanned):
+        results[file_path] = matches
+        if sha is not None:
+            live_cache[sha] = [astuple(m)[1:] for m in matches]
+
+    # Only blobs seen in this scan are kept, so the cache tracks the tree
+    if use_cache and (pending or len(live_cache) != len(cache)):
+        _save_scan_cache(project_dir, live_cache)
+
+    all_matches = []
+    for file_path in files:
+        all_matches.extend(results.get(file_path, []))
     return all_matches
 
 
@@ -469,8 +710,6 @@ def print_results(matches: list[SecretMatch]) -> None:
 
 def print_json_results(matches: list[SecretMatch]) -> None:
     """Print scan results as JSON (for programmatic use)."""
-    import json
-
     results = {
         "secrets_found": len(matches) > 0,
         "count": len(matches),
@@ -544,8 +783,14 @@ def main() -> int:
     if not args.quiet and not args.json:
         print(f"Scanning {len(files)} file(s) for secrets...")
 
-    # Scan files
-    matches = scan_files(files, project_dir)
+    # Scan files (full-repo scans fan out across processes and reuse
+    # results for unchanged blobs)
+    if args.all_files and not args.path:
+        matches = scan_files(
+            files, project_dir, workers=os.cpu_count() or 1, use_cache=True
+        )
+    else:
+        matches = scan_files(files, project_dir)
 
     # Output results
     if args.json:
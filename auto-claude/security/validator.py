@@ -40,7 +40,7 @@ from .process_validators import (
     validate_pkill_command,
 )
 from .validation_models import ValidationResult, ValidatorFunction
-from .validator_registry import VALIDATORS, get_validator
+from .validator_registry import STATEFUL_VALIDATORS, VALIDATORS, get_validator
 
 # Define __all__ for explicit exports
 __all__ = [
@@ -49,6 +49,7 @@ __all__ = [
     "ValidatorFunction",
     # Registry
     "VALIDATORS",
+    "STATEFUL_VALIDATORS",
     "get_validator",
     # Process validators
     "validate_pkill_command",
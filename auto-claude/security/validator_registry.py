@@ -54,6 +54,10 @@ VALIDATORS: dict[str, ValidatorFunction] = {
     "mongo": validate_mongosh_command,  # Legacy mongo shell
 }
 
+# Validators whose result depends on more than the command string (git commit
+# scans the staged files) - their decisions are never memoized
+STATEFUL_VALIDATORS: frozenset[str] = frozenset({"git"})
+
 
 def get_validator(command_name: str) -> ValidatorFunction | None:
     """
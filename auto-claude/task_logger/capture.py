@@ -33,6 +33,7 @@ class StreamingLogCapture:
                 self.current_tool, success=exc_type is None, phase=self.phase
             )
             self.current_tool = None
+        self.logger.flush()
         return False
 
     def process_text(self, text: str) -> None:
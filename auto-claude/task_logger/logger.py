@@ -36,7 +36,7 @@ class TaskLogger:
 
         Args:
             spec_dir: Path to the spec directory
-            emit_markers: Whether to emit streaming markers to stdout
+            emit_markers: Whether to emit streaming markers for the UI
         """
         self.spec_dir = Path(spec_dir)
         self.log_file = self.spec_dir / self.LOG_FILE
@@ -56,7 +56,7 @@ class TaskLogger:
         return datetime.now(timezone.utc).isoformat()
 
     def _emit(self, marker_type: str, data: dict) -> None:
-        """Emit a streaming marker to stdout for UI consumption."""
+        """Emit a streaming marker for UI consumption."""
         emit_marker(marker_type, data, self.emit_markers)
 
     def _add_entry(self, entry: LogEntry) -> None:
@@ -426,6 +426,10 @@ class TaskLogger:
             else:
                 print(f"   [{status}]", flush=True)
 
+    def flush(self) -> None:
+        """Write any journaled entries into the task_logs.json snapshot."""
+        self.storage.flush()
+
     def get_logs(self) -> dict:
         """Get all logs."""
         return self._data
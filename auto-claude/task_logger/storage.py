@@ -1,79 +1,310 @@
 """
 Storage functionality for task logs.
+
+Logs are persisted in two files inside the spec directory:
+
+- ``task_logs.json``: compacted snapshot in the shape the UI consumes
+- ``task_logs.jsonl``: append-only journal of changes made since the snapshot
+
+Adding an entry appends one journal line instead of rewriting the whole
+snapshot. The snapshot is rewritten (compacted) periodically, on explicit
+``save()`` calls and at phase boundaries, after which the journal is reset.
+A background timer compacts records that would otherwise wait for the next
+entry (e.g. during a long LLM call), and pending records are compacted at
+interpreter exit. Readers rebuild the current state from snapshot + journal
+tail.
+
+Journal records are numbered, and the snapshot stores the number of the
+last record it includes (``journal_seq``). A reader that sees the new
+snapshot before the old journal is removed skips the records it already
+holds instead of applying them twice.
 """
 
+import atexit
 import json
+import os
 import sys
+import threading
+import time
+import weakref
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import IO, Optional
 
 from .models import LogEntry, LogPhase
 
 
+def _new_log_data(spec_id: str, timestamp: str) -> dict:
+    """Create an empty log structure."""
+    return {
+        "spec_id": spec_id,
+        "created_at": timestamp,
+        "updated_at": timestamp,
+        "phases": {
+            LogPhase.PLANNING.value: {
+                "phase": LogPhase.PLANNING.value,
+                "status": "pending",
+                "started_at": None,
+                "completed_at": None,
+                "entries": [],
+            },
+            LogPhase.CODING.value: {
+                "phase": LogPhase.CODING.value,
+                "status": "pending",
+                "started_at": None,
+                "completed_at": None,
+                "entries": [],
+            },
+            LogPhase.VALIDATION.value: {
+                "phase": LogPhase.VALIDATION.value,
+                "status": "pending",
+                "started_at": None,
+                "completed_at": None,
+                "entries": [],
+            },
+        },
+    }
+
+
+def _apply_record(data: dict, record: dict) -> None:
+    """
+    Apply a single journal record to the log data in place.
+
+    Args:
+        data: Log data dictionary (snapshot shape)
+        record: Journal record with an "op" key
+    """
+    op = record.get("op")
+    phases = data.setdefault("phases", {})
+    if "seq" in record:
+        data["journal_seq"] = record["seq"]
+
+    if op == "entry":
+        entry = record.get("entry", {})
+        phase_key = entry.get("phase")
+        if phase_key not in phases:
+            # Create phase if it doesn't exist
+            phases[phase_key] = {
+                "phase": phase_key,
+                "status": "active",
+                "started_at": record.get("ts"),
+                "completed_at": None,
+                "entries": [],
+            }
+        phases[phase_key]["entries"].append(entry)
+    elif op == "phase":
+        phase_data = phases.get(record.get("phase"))
+        if phase_data is not None:
+            phase_data.update(record.get("fields", {}))
+
+    if record.get("ts"):
+        data["updated_at"] = record["ts"]
+
+
+def _replay_journal(data: dict, journal_file: Path) -> int:
+    """
+    Replay journal records on top of snapshot data.
+
+    A torn trailing line (e.g. from a crash mid-write) is ignored, as are
+    records the snapshot already includes.
+
+    Args:
+        data: Snapshot data to update in place
+        journal_file: Path to the journal file
+
+    Returns:
+        Number of records applied
+    """
+    if not journal_file.exists():
+        return 0
+
+    applied = 0
+    included = data.get("journal_seq", 0)
+    try:
+        with open(journal_file, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if record.get("seq", included + 1) <= included:
+                    continue
+                _apply_record(data, record)
+                applied += 1
+    except OSError:
+        pass
+    return applied
+
+
+# Storages with journal records not yet compacted, flushed at exit
+_live_storages: "weakref.WeakSet[LogStorage]" = weakref.WeakSet()
+
+
+@atexit.register
+def _flush_live_storages() -> None:
+    for storage in list(_live_storages):
+        storage.flush()
+
+
 class LogStorage:
     """Handles persistent storage of task logs."""
 
     LOG_FILE = "task_logs.json"
+    JOURNAL_FILE = "task_logs.jsonl"
+
+    # Compact the journal into the snapshot after this many records...
+    COMPACT_EVERY_RECORDS = 500
+    # ...or once the oldest uncompacted record is this old (keeps the UI fresh)
+    COMPACT_EVERY_SECONDS = 2.0
 
-    def __init__(self, spec_dir: Path):
+    def __init__(self, spec_dir: Path, use_journal: bool = True):
         """
         Initialize log storage.
 
         Args:
             spec_dir: Path to the spec directory
+            use_journal: Append entries to a JSONL journal instead of
+                rewriting the snapshot on every entry
         """
         self.spec_dir = Path(spec_dir)
         self.log_file = self.spec_dir / self.LOG_FILE
+        self.journal_file = self.spec_dir / self.JOURNAL_FILE
+        self.use_journal = use_journal
+        self._journal_handle: IO[str] | None = None
+        # Guards state shared with the flush timer thread
+        self._lock = threading.RLock()
+        self._flush_timer: threading.Timer | None = None
+        self._pending_records = 0
+        self._last_compact = time.monotonic()
         self._data: dict = self._load_or_create()
 
+        # Fold any journal left over from a previous run into the snapshot
+        if self._pending_records:
+            self.save()
+
     def _load_or_create(self) -> dict:
-        """Load existing logs or create new structure."""
+        """Load existing logs (snapshot + journal tail) or create new structure."""
         if self.log_file.exists():
             try:
                 with open(self.log_file, encoding="utf-8") as f:
-                    return json.load(f)
+                    data = json.load(f)
+                self._pending_records = _replay_journal(data, self.journal_file)
+                return data
             except (OSError, json.JSONDecodeError):
                 pass
 
-        return {
-            "spec_id": self.spec_dir.name,
-            "created_at": self._timestamp(),
-            "updated_at": self._timestamp(),
-            "phases": {
-                LogPhase.PLANNING.value: {
-                    "phase": LogPhase.PLANNING.value,
-                    "status": "pending",
-                    "started_at": None,
-                    "completed_at": None,
-                    "entries": [],
-                },
-                LogPhase.CODING.value: {
-                    "phase": LogPhase.CODING.value,
-                    "status": "pending",
-                    "started_at": None,
-                    "completed_at": None,
-                    "entries": [],
-                },
-                LogPhase.VALIDATION.value: {
-                    "phase": LogPhase.VALIDATION.value,
-                    "status": "pending",
-                    "started_at": None,
-                    "completed_at": None,
-                    "entries": [],
-                },
-            },
-        }
+        data = _new_log_data(self.spec_dir.name, self._timestamp())
+        self._pending_records = _replay_journal(data, self.journal_file)
+        return data
 
     def save(self) -> None:
-        """Save logs to file."""
-        self._data["updated_at"] = self._timestamp()
-        try:
-            self.spec_dir.mkdir(parents=True, exist_ok=True)
-            with open(self.log_file, "w", encoding="utf-8") as f:
-                json.dump(self._data, f, indent=2, ensure_ascii=False)
-        except OSError as e:
-            print(f"Warning: Failed to save task logs: {e}", file=sys.stderr)
+        """
+        Save logs to file.
+
+        Writes a full snapshot atomically (temp file + rename) and resets
+        the journal, since everything in it is now part of the snapshot.
+        """
+        with self._lock:
+            self._cancel_flush_timer()
+            self._data["updated_at"] = self._timestamp()
+            self._close_journal()
+            tmp_file = self.log_file.with_name(self.log_file.name + ".tmp")
+            try:
+                self.spec_dir.mkdir(parents=True, exist_ok=True)
+                with open(tmp_file, "w", encoding="utf-8") as f:
+                    json.dump(self._data, f, indent=2, ensure_ascii=False)
+                os.replace(tmp_file, self.log_file)
+                if self.journal_file.exists():
+                    self.journal_file.unlink()
+            except OSError as e:
+                print(f"Warning: Failed to save task logs: {e}", file=sys.stderr)
+                return
+
+            self._pending_records = 0
+            self._last_compact = time.monotonic()
+            _live_storages.discard(self)
+
+    def flush(self) -> None:
+        """Compact pending journal records into the snapshot, if any."""
+        with self._lock:
+            if self._pending_records:
+                self.save()
+
+    def _schedule_flush(self) -> None:
+        """Compact pending records once COMPACT_EVERY_SECONDS have passed."""
+        if self._flush_timer is not None:
+            return
+        delay = max(
+            0.0, self.COMPACT_EVERY_SECONDS - (time.monotonic() - self._last_compact)
+        )
+        self._flush_timer = threading.Timer(delay, self._on_flush_timer)
+        self._flush_timer.daemon = True
+        self._flush_timer.start()
+
+    def _on_flush_timer(self) -> None:
+        with self._lock:
+            self._flush_timer = None
+            self.flush()
+
+    def _cancel_flush_timer(self) -> None:
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+
+    def _close_journal(self) -> None:
+        """Close the journal file handle if open."""
+        if self._journal_handle is not None:
+            try:
+                self._journal_handle.close()
+            except OSError:
+                pass
+            self._journal_handle = None
+
+    def _record(self, record: dict) -> None:
+        """
+        Apply a change and persist it.
+
+        In journal mode the record is appended as a single line; the snapshot
+        is only rewritten when compaction is due, at the latest
+        COMPACT_EVERY_SECONDS after the record (via a timer). Otherwise the
+        full snapshot is rewritten immediately (legacy behaviour).
+        """
+        with self._lock:
+            record["seq"] = self._data.get("journal_seq", 0) + 1
+            _apply_record(self._data, record)
+
+            if not self.use_journal:
+                self.save()
+                return
+
+            try:
+                if self._journal_handle is None:
+                    self.spec_dir.mkdir(parents=True, exist_ok=True)
+                    self._journal_handle = open(
+                        self.journal_file, "a", encoding="utf-8"
+                    )
+                self._journal_handle.write(
+                    json.dumps(record, ensure_ascii=False, separators=(",", ":")) + "\n"
+                )
+                self._journal_handle.flush()
+            except OSError as e:
+                print(f"Warning: Failed to append task log: {e}", file=sys.stderr)
+                self._close_journal()
+                self.save()
+                return
+
+            self._pending_records += 1
+            if (
+                self._pending_records >= self.COMPACT_EVERY_RECORDS
+                or time.monotonic() - self._last_compact >= self.COMPACT_EVERY_SECONDS
+            ):
+                self.save()
+            else:
+                _live_storages.add(self)
+                self._schedule_flush()
 
     def _timestamp(self) -> str:
         """Get current timestamp in ISO format."""
@@ -86,19 +317,7 @@ class LogStorage:
         Args:
             entry: The log entry to add
         """
-        phase_key = entry.phase
-        if phase_key not in self._data["phases"]:
-            # Create phase if it doesn't exist
-            self._data["phases"][phase_key] = {
-                "phase": phase_key,
-                "status": "active",
-                "started_at": self._timestamp(),
-                "completed_at": None,
-                "entries": [],
-            }
-
-        self._data["phases"][phase_key]["entries"].append(entry.to_dict())
-        self.save()
+        self._record({"op": "entry", "ts": self._timestamp(), "entry": entry.to_dict()})
 
     def update_phase_status(
         self, phase: str, status: str, completed_at: Optional[str] = None
@@ -112,9 +331,10 @@ class LogStorage:
             completed_at: Optional completion timestamp
         """
         if phase in self._data["phases"]:
-            self._data["phases"][phase]["status"] = status
+            fields = {"status": status}
             if completed_at:
-                self._data["phases"][phase]["completed_at"] = completed_at
+                fields["completed_at"] = completed_at
+            self._record({"op": "phase", "phase": phase, "fields": fields})
 
     def set_phase_started(self, phase: str, started_at: str) -> None:
         """
@@ -125,7 +345,9 @@ class LogStorage:
             started_at: Start timestamp
         """
         if phase in self._data["phases"]:
-            self._data["phases"][phase]["started_at"] = started_at
+            self._record(
+                {"op": "phase", "phase": phase, "fields": {"started_at": started_at}}
+            )
 
     def get_data(self) -> dict:
         """Get all log data."""
@@ -144,11 +366,27 @@ class LogStorage:
         """
         self._data["spec_id"] = new_spec_id
 
+    def update_spec_dir(self, new_spec_dir: Path) -> None:
+        """
+        Point storage at a new spec directory (e.g. after a rename).
+
+        Args:
+            new_spec_dir: New path to the spec directory
+        """
+        with self._lock:
+            self._close_journal()
+            self.spec_dir = Path(new_spec_dir)
+            self.log_file = self.spec_dir / self.LOG_FILE
+            self.journal_file = self.spec_dir / self.JOURNAL_FILE
+
 
 def load_task_logs(spec_dir: Path) -> Optional[dict]:
     """
     Load task logs from a spec directory.
 
+    Rebuilds the current state from the snapshot plus any journal records
+    that have not been compacted yet.
+
     Args:
         spec_dir: Path to the spec directory
 
@@ -156,15 +394,23 @@ def load_task_logs(spec_dir: Path) -> Optional[dict]:
         Logs dictionary or None if not found
     """
     log_file = spec_dir / LogStorage.LOG_FILE
+    journal_file = spec_dir / LogStorage.JOURNAL_FILE
     if not log_file.exists():
-        return None
+        if not journal_file.exists():
+            return None
+        data = _new_log_data(spec_dir.name, datetime.now(timezone.utc).isoformat())
+        _replay_journal(data, journal_file)
+        return data
 
     try:
         with open(log_file, encoding="utf-8") as f:
-            return json.load(f)
+            data = json.load(f)
     except (OSError, json.JSONDecodeError):
         return None
 
+    _replay_journal(data, journal_file)
+    return data
+
 
 def get_active_phase(spec_dir: Path) -> Optional[str]:
     """
@@ -1,13 +1,328 @@
 """
 Streaming marker functionality for real-time UI updates.
+
+Markers are printed to stdout as ``__TASK_LOG_<TYPE>__:{json}`` lines by
+default. When the UI sets AUTO_CLAUDE_EVENT_SOCKET to the path of a Unix
+domain socket (or a Windows named pipe) it is listening on, markers are sent
+there instead as length-prefixed JSON frames, so they no longer have to be
+flushed and regex-parsed out of the agent's stdout.
+
+Frame format: 4-byte big-endian payload length, then the UTF-8 JSON payload
+``{"type": "<TYPE>", "data": {...}}``. Marker types are the same as on
+stdout. High-frequency TEXT markers are buffered and written in batches
+(up to TEXT_BATCH_SIZE frames or TEXT_FLUSH_SECONDS old); any other marker
+flushes the buffer first, so frame order always matches emission order.
+
+If the listener is missing or goes away, emission falls back to stdout
+markers (including any frames that were still buffered). Payload values JSON
+can't represent are sent as ``str()``; a marker that still can't be encoded
+is dropped on its own without affecting the channel.
+
+Consumer status: nothing sets AUTO_CLAUDE_EVENT_SOCKET yet, so this channel
+is inert and markers go to stdout exactly as before. The desktop UI
+(auto-claude-ui) has no socket listener; it shows task logs by polling
+task_logs.json (TaskLogService) and forwards the agent's stdout as plain log
+text. The channel only takes effect once a listener exists (for example
+AgentProcessManager.spawnProcess opening one, passing its path in
+AUTO_CLAUDE_EVENT_SOCKET and decoding frames as decode_frames() does) or
+when another tool sets the variable itself.
 """
 
+import atexit
 import json
+import os
+import socket
+import struct
+import threading
+import time
+from typing import BinaryIO
+
+# Environment variable holding the socket/pipe path of the UI's listener
+EVENT_SOCKET_ENV = "AUTO_CLAUDE_EVENT_SOCKET"
+
+# Marker types that are buffered and written in batches
+BATCHED_MARKERS = frozenset({"TEXT"})
+
+# Flush buffered markers once this many are pending...
+TEXT_BATCH_SIZE = 64
+
+# ...or once the oldest has waited this long
+TEXT_FLUSH_SECONDS = 0.05
+
+# Give up on a listener that stops reading for this long
+SEND_TIMEOUT_SECONDS = 5.0
+
+_FRAME_HEADER = struct.Struct(">I")
+
+
+def format_marker(marker_type: str, data: dict) -> str:
+    """Format a marker as the stdout line the UI parses."""
+    return f"__TASK_LOG_{marker_type.upper()}__:{json.dumps(data, default=str)}"
+
+
+def encode_frame(marker_type: str, data: dict) -> bytes:
+    """Encode a marker as a length-prefixed JSON frame."""
+    payload = json.dumps(
+        {"type": marker_type.upper(), "data": data}, default=str
+    ).encode("utf-8")
+    return _FRAME_HEADER.pack(len(payload)) + payload
+
+
+def decode_frames(buffer: bytes) -> tuple[list[tuple[str, dict]], bytes]:
+    """
+    Decode complete frames from a receive buffer.
+
+    Args:
+        buffer: Bytes read from the event channel so far
+
+    Returns:
+        Tuple of ([(marker_type, data), ...], unconsumed remainder)
+    """
+    events = []
+    offset = 0
+    while len(buffer) - offset >= _FRAME_HEADER.size:
+        (length,) = _FRAME_HEADER.unpack_from(buffer, offset)
+        end = offset + _FRAME_HEADER.size + length
+        if end > len(buffer):
+            break
+        message = json.loads(buffer[offset + _FRAME_HEADER.size : end])
+        events.append((message["type"], message["data"]))
+        offset = end
+    return events, buffer[offset:]
+
+
+def _print_marker(marker_type: str, data: dict) -> None:
+    try:
+        print(format_marker(marker_type, data), flush=True)
+    except Exception:
+        pass  # Don't let marker emission break logging
+
+
+class EventChannel:
+    """
+    Structured marker channel to a local UI listener.
+
+    Frames are buffered and written by whichever thread fills the batch, by
+    the next non-batched marker, or by a background flusher once the oldest
+    buffered frame is TEXT_FLUSH_SECONDS old.
+    """
+
+    def __init__(self, address: str):
+        """
+        Initialize the channel (connects lazily on first send).
+
+        Args:
+            address: Unix socket path, or ``\\\\.\\pipe\\<name>`` on Windows
+        """
+        self.address = address
+        self.broken = False
+        self._sock: socket.socket | None = None
+        self._pipe: BinaryIO | None = None
+        self._pending: list[tuple[str, dict]] = []
+        self._pending_since = 0.0
+        self._lock = threading.Lock()
+        self._wakeup = threading.Condition(self._lock)
+        self._flusher: threading.Thread | None = None
+        self._closed = False
+
+    def _connect(self) -> None:
+        if self.address.startswith("\\\\.\\pipe\\"):
+            self._pipe = open(self.address, "wb", buffering=0)
+            return
+        if not hasattr(socket, "AF_UNIX"):
+            raise OSError("Unix domain sockets are not supported on this platform")
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(SEND_TIMEOUT_SECONDS)
+        try:
+            sock.connect(self.address)
+        except OSError:
+            sock.close()
+            raise
+        self._sock = sock
+
+    def _write(self, data: bytes) -> int:
+        """
+        Write data to the listener.
+
+        Returns:
+            Number of bytes delivered - less than len(data) if the listener
+            went away partway through
+        """
+        view = memoryview(data)
+        sent = 0
+        try:
+            while sent < len(data):
+                if self._sock is not None:
+                    written = self._sock.send(view[sent:])
+                else:
+                    written = self._pipe.write(view[sent:])
+                if not written:
+                    break
+                sent += written
+        except (OSError, ValueError):
+            pass
+        return sent
+
+    def _flush_locked(self) -> None:
+        """Write all pending frames (caller holds the lock)."""
+        if not self._pending:
+            return
+        pending, self._pending = self._pending, []
+        frames = []
+        for marker_type, data in pending:
+            try:
+                frames.append((marker_type, data, encode_frame(marker_type, data)))
+            except (TypeError, ValueError):
+                # Unencodable even as str() (e.g. circular data): drop
+                # just this marker
+                continue
+        buffer = b"".join(frame for _, _, frame in frames)
+        sent = self._write(buffer)
+        if sent == len(buffer):
+            return
+
+        # Listener gone: fall back to stdout for the frames it didn't
+        # fully receive (a truncated frame is undecodable) and everything
+        # after them
+        self._mark_broken_locked()
+        offset = 0
+        for marker_type, data, frame in frames:
+            offset += len(frame)
+            if offset > sent:
+                _print_marker(marker_type, data)
+
+    def _mark_broken_locked(self) -> None:
+        self.broken = True
+        self._close_transport_locked()
+        self._wakeup.notify_all()
+
+    def _close_transport_locked(self) -> None:
+        for transport in (self._sock, self._pipe):
+            if transport is not None:
+                try:
+                    transport.close()
+                except OSError:
+                    pass
+        self._sock = None
+        self._pipe = None
+
+    def _ensure_flusher_locked(self) -> None:
+        if self._flusher is None:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="task-log-events", daemon=True
+            )
+            self._flusher.start()
+
+    def _flush_loop(self) -> None:
+        with self._lock:
+            while not self._closed and not self.broken:
+                if not self._pending:
+                    self._wakeup.wait()
+                    continue
+                remaining = self._pending_since + TEXT_FLUSH_SECONDS - time.monotonic()
+                if remaining > 0:
+                    self._wakeup.wait(remaining)
+                    continue
+                self._flush_locked()
+
+    def send(self, marker_type: str, data: dict) -> bool:
+        """
+        Queue a marker for the listener.
+
+        Args:
+            marker_type: Marker type (e.g., "TEXT", "TOOL_END")
+            data: Marker payload
+
+        Returns:
+            False if the channel is unusable and the caller should fall back
+            to stdout, True otherwise
+        """
+        with self._lock:
+            if self.broken or self._closed:
+                return False
+            if self._sock is None and self._pipe is None:
+                try:
+                    self._connect()
+                except OSError:
+                    # No listener attached
+                    self._mark_broken_locked()
+                    return False
+            if not self._pending:
+                self._pending_since = time.monotonic()
+            self._pending.append((marker_type, data))
+
+            if marker_type in BATCHED_MARKERS and len(self._pending) < TEXT_BATCH_SIZE:
+                self._ensure_flusher_locked()
+                self._wakeup.notify()
+                return True
+
+            self._flush_locked()
+            return True
+
+    def flush(self) -> None:
+        """Write any buffered markers now."""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self) -> None:
+        """Flush buffered markers and close the connection."""
+        with self._lock:
+            if self._closed:
+                return
+            self._flush_locked()
+            self._closed = True
+            self._close_transport_locked()
+            self._wakeup.notify_all()
+
+
+# =============================================================================
+# GLOBAL STATE
+# =============================================================================
+
+_channel: EventChannel | None = None
+_channel_address: str | None = None
+_channel_lock = threading.Lock()
+
+
+def get_event_channel() -> EventChannel | None:
+    """
+    Get the event channel configured by AUTO_CLAUDE_EVENT_SOCKET.
+
+    Returns:
+        The shared EventChannel, or None if no listener is configured
+    """
+    global _channel, _channel_address
+    address = os.environ.get(EVENT_SOCKET_ENV) or None
+    if address == _channel_address:
+        return _channel
+    with _channel_lock:
+        if address != _channel_address:
+            if _channel is not None:
+                _channel.close()
+            _channel = EventChannel(address) if address is not None else None
+            _channel_address = address
+        return _channel
+
+
+def close_event_channel() -> None:
+    """Flush and close the shared event channel (it reopens on next use)."""
+    global _channel, _channel_address
+    with _channel_lock:
+        if _channel is not None:
+            _channel.close()
+        _channel = None
+        _channel_address = None
+
+
+atexit.register(close_event_channel)
 
 
 def emit_marker(marker_type: str, data: dict, enabled: bool = True) -> None:
     """
-    Emit a streaming marker to stdout for UI consumption.
+    Emit a streaming marker for UI consumption.
+
+    Sent over the event channel when a listener is configured, otherwise
+    printed to stdout.
 
     Args:
         marker_type: Type of marker (e.g., "PHASE_START", "TOOL_END")
@@ -16,8 +331,8 @@ def emit_marker(marker_type: str, data: dict, enabled: bool = True) -> None:
     """
     if not enabled:
         return
-    try:
-        marker = f"__TASK_LOG_{marker_type.upper()}__:{json.dumps(data)}"
-        print(marker, flush=True)
-    except Exception:
-        pass  # Don't let marker emission break logging
+    marker_type = marker_type.upper()
+    channel = get_event_channel()
+    if channel is not None and channel.send(marker_type, data):
+        return
+    _print_marker(marker_type, data)
@@ -30,6 +30,8 @@ def get_task_logger(
         return _current_logger
 
     if _current_logger is None or _current_logger.spec_dir != spec_dir:
+        if _current_logger is not None:
+            _current_logger.flush()
         _current_logger = TaskLogger(spec_dir, emit_markers)
 
     return _current_logger
@@ -38,6 +40,8 @@ def get_task_logger(
 def clear_task_logger() -> None:
     """Clear the global task logger."""
     global _current_logger
+    if _current_logger is not None:
+        _current_logger.flush()
     _current_logger = None
 
 
@@ -59,6 +63,7 @@ def update_task_logger_path(new_spec_dir: Path) -> None:
     # Update the logger's internal paths
     _current_logger.spec_dir = Path(new_spec_dir)
     _current_logger.log_file = _current_logger.spec_dir / TaskLogger.LOG_FILE
+    _current_logger.storage.update_spec_dir(_current_logger.spec_dir)
 
     # Update spec_id in the storage
     _current_logger.storage.update_spec_id(new_spec_dir.name)
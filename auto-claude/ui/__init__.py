@@ -48,7 +48,13 @@ from .icons import Icons, icon
 from .menu import MenuOption, select_menu
 from .progress import progress_bar
 from .spinner import Spinner
-from .status import BuildState, BuildStatus, StatusManager
+from .status import (
+    BuildState,
+    BuildStatus,
+    MultiBuildStatusManager,
+    StatusManager,
+    get_status_flush_interval_ms,
+)
 
 # For backward compatibility
 _FANCY_UI = FANCY_UI
@@ -95,6 +101,8 @@ __all__ = [
     "BuildState",
     "BuildStatus",
     "StatusManager",
+    "MultiBuildStatusManager",
+    "get_status_flush_interval_ms",
     # Formatters
     "print_header",
     "print_section",
@@ -62,7 +62,12 @@ from ui.progress import progress_bar
 from ui.spinner import Spinner
 
 # Status management
-from ui.status import BuildState, BuildStatus, StatusManager
+from ui.status import (
+    BuildState,
+    BuildStatus,
+    MultiBuildStatusManager,
+    StatusManager,
+)
 
 # For backward compatibility, expose private capability variables
 _FANCY_UI = FANCY_UI
@@ -108,6 +113,7 @@ __all__ = [
     "BuildState",
     "BuildStatus",
     "StatusManager",
+    "MultiBuildStatusManager",
     # Formatters
     "print_header",
     "print_section",
@@ -3,16 +3,99 @@ Status Management
 ==================
 
 Build status tracking and status file management for ccstatusline integration.
+
+The status file is re-read by the status line at the terminal's refresh
+rate, so it is always replaced atomically (temp file + rename) and readers
+never see torn JSON. With a flush interval, setters only mark the status
+dirty and back-to-back updates are coalesced into at most one write per
+interval; state changes and explicit flush() calls are written at once.
+
+MultiBuildStatusManager lets several concurrent builds in one project share
+the file: each build's status is kept under "builds", and the top-level
+fields show the most recently updated active build.
 """
 
 import json
+import os
+import tempfile
+import threading
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
+from typing import Optional
 
 from .colors import warning
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+STATUS_FILE = ".auto-claude-status"
+# The lock and temp files live in the (gitignored) .auto-claude directory,
+# not next to the status file in the project root
+STATUS_WORK_DIR = ".auto-claude"
+STATUS_LOCK_FILE = "status.lock"
+
+# Coalescing interval for the coder loop (0 = write through)
+STATUS_FLUSH_ENV = "AUTO_CLAUDE_STATUS_FLUSH_MS"
+DEFAULT_STATUS_FLUSH_MS = 250
+
+
+def get_status_flush_interval_ms() -> int:
+    """
+    Get the configured status write-coalescing interval.
+
+    Returns:
+        Interval in milliseconds (0 disables coalescing)
+    """
+    try:
+        return max(0, int(os.environ.get(STATUS_FLUSH_ENV, DEFAULT_STATUS_FLUSH_MS)))
+    except ValueError:
+        return DEFAULT_STATUS_FLUSH_MS
+
+
+@contextmanager
+def status_lock(project_dir: Path) -> Iterator[None]:
+    """
+    Hold an exclusive lock on the status file.
+
+    Uses an advisory lock file in .auto-claude/; a no-op on platforms without
+    fcntl (the atomic rename still prevents torn files).
+    """
+    if fcntl is None:
+        yield
+        return
+
+    work_dir = Path(project_dir) / STATUS_WORK_DIR
+    work_dir.mkdir(parents=True, exist_ok=True)
+    with open(work_dir / STATUS_LOCK_FILE, "a") as lock_file:
+        fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _write_json_atomic(path: Path, data: dict, tmp_dir: Path) -> None:
+    """Replace path with data via a temp file in tmp_dir + rename."""
+    tmp_dir.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=tmp_dir, prefix=f"{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
 
 class BuildState(Enum):
     """Build state enumeration."""
@@ -102,58 +185,115 @@ class BuildStatus:
 
 
 class StatusManager:
-    """Manages the .auto-claude-status file for ccstatusline integration."""
+    """
+    Manages the .auto-claude-status file for ccstatusline integration.
+
+    Each write replaces the whole file; builds that may run alongside others
+    in the same project use MultiBuildStatusManager instead.
+    """
+
+    def __init__(self, project_dir: Path, flush_interval_ms: int = 0):
+        """
+        Initialize status manager.
 
-    def __init__(self, project_dir: Path):
+        Args:
+            project_dir: Project root holding the status file
+            flush_interval_ms: Coalesce setter writes to at most one per
+                interval (0 writes on every change)
+        """
         self.project_dir = Path(project_dir)
-        self.status_file = self.project_dir / ".auto-claude-status"
+        self.status_file = self.project_dir / STATUS_FILE
+        self.work_dir = self.project_dir / STATUS_WORK_DIR
+        self.flush_interval = max(0, flush_interval_ms) / 1000
         self._status = BuildStatus()
+        self._lock = threading.RLock()
+        self._dirty = False
+        self._last_flush = 0.0
+        self._timer: Optional[threading.Timer] = None
 
     def read(self) -> BuildStatus:
         """Read current status from file."""
-        if not self.status_file.exists():
+        data = self._read_file()
+        if data is None:
             return BuildStatus()
+        try:
+            self._status = BuildStatus.from_dict(data)
+        except ValueError:
+            return BuildStatus()
+        return self._status
 
+    def _read_file(self) -> Optional[dict]:
         try:
             with open(self.status_file) as f:
                 data = json.load(f)
-            self._status = BuildStatus.from_dict(data)
-            return self._status
         except (OSError, json.JSONDecodeError):
-            return BuildStatus()
+            return None
+        return data if isinstance(data, dict) else None
+
+    def _write_file(self, status: dict) -> None:
+        _write_json_atomic(self.status_file, status, self.work_dir)
 
     def write(self, status: BuildStatus = None) -> None:
-        """Write status to file."""
-        if status:
-            self._status = status
-        self._status.last_update = datetime.now().isoformat()
+        """Write status to file now (a flush checkpoint)."""
+        with self._lock:
+            if status:
+                self._status = status
+            self._status.last_update = datetime.now().isoformat()
+            self._cancel_timer()
+            self._dirty = False
+            self._last_flush = time.monotonic()
+            try:
+                self._write_file(self._status.to_dict())
+            except OSError as e:
+                print(warning(f"Could not write status file: {e}"))
 
-        try:
-            with open(self.status_file, "w") as f:
-                json.dump(self._status.to_dict(), f, indent=2)
-        except OSError as e:
-            print(warning(f"Could not write status file: {e}"))
+    def flush(self) -> None:
+        """Write pending changes, if any."""
+        with self._lock:
+            if self._dirty:
+                self.write()
+
+    def _changed(self, checkpoint: bool = False) -> None:
+        """Record a change: write now, or schedule a coalesced write."""
+        with self._lock:
+            self._dirty = True
+            wait = self._last_flush + self.flush_interval - time.monotonic()
+            if checkpoint or wait <= 0:
+                self.write()
+            elif self._timer is None:
+                self._timer = threading.Timer(wait, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def _cancel_timer(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
 
     def update(self, **kwargs) -> None:
         """Update specific status fields."""
-        for key, value in kwargs.items():
-            if hasattr(self._status, key):
-                setattr(self._status, key, value)
-        self.write()
+        with self._lock:
+            for key, value in kwargs.items():
+                if hasattr(self._status, key):
+                    setattr(self._status, key, value)
+            # State transitions are shown immediately
+            self._changed(checkpoint="state" in kwargs or "active" in kwargs)
 
     def set_active(self, spec: str, state: BuildState) -> None:
         """Mark build as active."""
-        self._status.active = True
-        self._status.spec = spec
-        self._status.state = state
-        self._status.session_started = datetime.now().isoformat()
-        self.write()
+        with self._lock:
+            self._status.active = True
+            self._status.spec = spec
+            self._status.state = state
+            self._status.session_started = datetime.now().isoformat()
+            self.write()
 
     def set_inactive(self) -> None:
         """Mark build as inactive."""
-        self._status.active = False
-        self._status.state = BuildState.IDLE
-        self.write()
+        with self._lock:
+            self._status.active = False
+            self._status.state = BuildState.IDLE
+            self.write()
 
     def update_subtasks(
         self,
@@ -163,39 +303,91 @@ class StatusManager:
         failed: int = None,
     ) -> None:
         """Update subtask progress."""
-        if completed is not None:
-            self._status.subtasks_completed = completed
-        if total is not None:
-            self._status.subtasks_total = total
-        if in_progress is not None:
-            self._status.subtasks_in_progress = in_progress
-        if failed is not None:
-            self._status.subtasks_failed = failed
-        self.write()
+        with self._lock:
+            if completed is not None:
+                self._status.subtasks_completed = completed
+            if total is not None:
+                self._status.subtasks_total = total
+            if in_progress is not None:
+                self._status.subtasks_in_progress = in_progress
+            if failed is not None:
+                self._status.subtasks_failed = failed
+            self._changed()
 
     def update_phase(self, current: str, phase_id: int = 0, total: int = 0) -> None:
         """Update current phase."""
-        self._status.phase_current = current
-        self._status.phase_id = phase_id
-        self._status.phase_total = total
-        self.write()
+        with self._lock:
+            self._status.phase_current = current
+            self._status.phase_id = phase_id
+            self._status.phase_total = total
+            self._changed()
 
     def update_workers(self, active: int, max_workers: int = None) -> None:
         """Update worker count."""
-        self._status.workers_active = active
-        if max_workers is not None:
-            self._status.workers_max = max_workers
-        self.write()
+        with self._lock:
+            self._status.workers_active = active
+            if max_workers is not None:
+                self._status.workers_max = max_workers
+            self._changed()
 
     def update_session(self, number: int) -> None:
         """Update session number."""
-        self._status.session_number = number
-        self.write()
+        with self._lock:
+            self._status.session_number = number
+            self._changed()
 
     def clear(self) -> None:
         """Remove status file."""
+        with self._lock:
+            self._cancel_timer()
+            self._dirty = False
         if self.status_file.exists():
             try:
                 self.status_file.unlink()
             except OSError:
                 pass
+
+
+class MultiBuildStatusManager(StatusManager):
+    """
+    Status manager for one of several concurrent builds in a project.
+
+    Each write merges this build's status into the shared file under an
+    exclusive lock, so builds running in other processes keep theirs.
+    """
+
+    def _write_file(self, status: dict) -> None:
+        spec = status["spec"]
+        with status_lock(self.project_dir):
+            current = self._read_file() or {}
+            builds = dict(current.get("builds") or {})
+            if status["active"]:
+                builds[spec] = status
+            else:
+                builds.pop(spec, None)
+
+            # Top level shows the most recently updated active build
+            if builds:
+                latest = max(builds.values(), key=lambda b: b.get("last_update", ""))
+                merged = {**latest, "builds": builds}
+            else:
+                merged = status
+            _write_json_atomic(self.status_file, merged, self.work_dir)
+
+    def attach(self, spec: str) -> None:
+        """Continue the spec's entry in the shared file (or start a new one)."""
+        build = self.read_all().get(spec)
+        with self._lock:
+            self._status = build or BuildStatus(spec=spec)
+
+    def read_all(self) -> dict[str, BuildStatus]:
+        """Read the status of every active build, keyed by spec."""
+        data = self._read_file() or {}
+        builds = data.get("builds") or {}
+        result = {}
+        for spec, build in builds.items():
+            try:
+                result[spec] = BuildStatus.from_dict(build)
+            except ValueError:
+                continue
+        return result
@@ -43,7 +43,7 @@ from ui import (
     BuildState,
     BuildStatus,
     Icons,
-    StatusManager,
+    MultiBuildStatusManager,
     icon,
     supports_unicode,
 )
@@ -207,13 +207,16 @@ Examples:
     project_dir = args.project_dir or find_project_root()
 
     # Read status
-    manager = StatusManager(project_dir)
+    manager = MultiBuildStatusManager(project_dir)
     status = manager.read()
 
     # If spec filter provided, check if it matches
     if args.spec and status.spec and args.spec not in status.spec:
-        # Spec doesn't match, treat as inactive
-        status = BuildStatus()
+        # Another concurrent build may match; otherwise treat as inactive
+        matches = [
+            build for spec, build in manager.read_all().items() if args.spec in spec
+        ]
+        status = matches[0] if matches else BuildStatus()
 
     # Format output
     if args.format == "compact":
@@ -0,0 +1,369 @@
+#!/usr/bin/env python3
+"""
+Tests for the Subtask Scheduler
+===============================
+
+Tests agents/scheduler.py:
+- Batch selection from the phase DAG (parallel_safe, depends_on)
+- File-scope isolation between subtasks in a batch
+- Atomic folding of concurrent session results into the plan
+- Per-worker worktrees, scope enforcement and merging commits back
+"""
+
+import json
+import subprocess
+from pathlib import Path
+
+from agents.scheduler import (
+    BATCH_WORKTREES_DIR,
+    apply_worker_commits,
+    collect_worker_commits,
+    create_worker_workspace,
+    fold_subtask_results,
+    get_max_workers,
+    get_parallel_batch,
+    read_subtask_statuses,
+    reject_subtasks,
+    remove_worker_workspace,
+    sync_worker_spec,
+)
+
+
+def _plan(parallel_safe: bool = True) -> dict:
+    return {
+        "feature": "Test",
+        "phases": [
+            {
+                "phase": 1,
+                "name": "Setup",
+                "subtasks": [
+                    {"id": "setup-1", "status": "completed", "files_to_modify": []},
+                ],
+            },
+            {
+                "phase": 2,
+                "name": "Components",
+                "depends_on": [1],
+                "parallel_safe": parallel_safe,
+                "subtasks": [
+                    {"id": "c-1", "status": "pending", "files_to_modify": ["a.py"]},
+                    {"id": "c-2", "status": "pending", "files_to_modify": ["b.py"]},
+                    {"id": "c-3", "status": "pending", "files_to_modify": ["a.py"]},
+                ],
+            },
+            {
+                "phase": 3,
+                "name": "Integration",
+                "depends_on": [2],
+                "parallel_safe": True,
+                "subtasks": [
+                    {"id": "i-1", "status": "pending", "files_to_modify": ["c.py"]},
+                ],
+            },
+        ],
+    }
+
+
+class TestGetParallelBatch:
+    """Tests for batch selection."""
+
+    def test_sequential_when_single_worker(self):
+        assert get_parallel_batch(_plan(), max_workers=1) == []
+
+    def test_picks_disjoint_subtasks(self):
+        batch = get_parallel_batch(_plan(), max_workers=4)
+        assert [s["id"] for s in batch] == ["c-1", "c-2"]
+        assert batch[0]["phase_name"] == "Components"
+
+    def test_respects_worker_cap(self):
+        plan = _plan()
+        plan["phases"][1]["subtasks"][2]["files_to_modify"] = ["d.py"]
+        batch = get_parallel_batch(plan, max_workers=2)
+        assert len(batch) == 2
+
+    def test_not_parallel_safe_phase_keeps_order(self):
+        assert get_parallel_batch(_plan(parallel_safe=False), max_workers=4) == []
+
+    def test_unmet_dependencies_are_skipped(self):
+        plan = _plan()
+        plan["phases"][0]["subtasks"][0]["status"] = "pending"
+        # Phase 1 is next in line and not parallel_safe
+        assert get_parallel_batch(plan, max_workers=4) == []
+
+    def test_draws_from_multiple_available_phases(self):
+        plan = _plan()
+        plan["phases"][2]["depends_on"] = [1]
+        plan["phases"][1]["subtasks"] = plan["phases"][1]["subtasks"][:1]
+        batch = get_parallel_batch(plan, max_workers=4)
+        assert [s["id"] for s in batch] == ["c-1", "i-1"]
+
+    def test_files_to_create_count_toward_scope(self):
+        plan = _plan()
+        plan["phases"][1]["subtasks"][1]["files_to_create"] = ["./a.py"]
+        # c-2 would create c-1's file and c-3 shares it, leaving a batch of one
+        assert get_parallel_batch(plan, max_workers=4) == []
+
+    def test_unscoped_subtasks_run_sequentially(self):
+        plan = _plan()
+        plan["phases"][1]["subtasks"][1]["files_to_modify"] = []
+        plan["phases"][1]["subtasks"][2]["files_to_modify"] = ["d.py"]
+        batch = get_parallel_batch(plan, max_workers=4)
+        assert [s["id"] for s in batch] == ["c-1", "c-3"]
+
+
+class TestMaxWorkers:
+    """Tests for the worker cap setting."""
+
+    def test_default_is_sequential(self, monkeypatch):
+        monkeypatch.delenv("AUTO_CLAUDE_MAX_WORKERS", raising=False)
+        assert get_max_workers() == 1
+
+    def test_reads_env(self, monkeypatch):
+        monkeypatch.setenv("AUTO_CLAUDE_MAX_WORKERS", "3")
+        assert get_max_workers() == 3
+
+    def test_invalid_env_falls_back(self, monkeypatch):
+        monkeypatch.setenv("AUTO_CLAUDE_MAX_WORKERS", "lots")
+        assert get_max_workers() == 1
+
+
+class TestFoldSubtaskResults:
+    """Tests for folding concurrent results into the plan."""
+
+    def test_promotes_statuses(self, spec_dir: Path):
+        plan_file = spec_dir / "implementation_plan.json"
+        plan_file.write_text(json.dumps(_plan()))
+
+        changed = fold_subtask_results(
+            spec_dir, {"c-1": "completed", "c-2": "in_progress"}
+        )
+
+        assert changed
+        assert read_subtask_statuses(spec_dir, ["c-1", "c-2", "c-3"]) == {
+            "c-1": "completed",
+            "c-2": "in_progress",
+            "c-3": "pending",
+        }
+
+    def test_never_demotes_completed(self, spec_dir: Path):
+        plan = _plan()
+        plan["phases"][1]["subtasks"][0]["status"] = "completed"
+        plan_file = spec_dir / "implementation_plan.json"
+        plan_file.write_text(json.dumps(plan))
+
+        changed = fold_subtask_results(spec_dir, {"c-1": "pending"})
+
+        assert not changed
+        assert read_subtask_statuses(spec_dir, ["c-1"]) == {"c-1": "completed"}
+
+    def test_missing_plan(self, spec_dir: Path):
+        assert fold_subtask_results(spec_dir, {"c-1": "completed"}) is False
+
+
+def _commit(repo: Path, files: dict[str, str], message: str) -> str:
+    for name, content in files.items():
+        path = repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    subprocess.run(["git", "add", "-A"], cwd=repo, check=True, capture_output=True)
+    subprocess.run(
+        ["git", "commit", "-m", message], cwd=repo, check=True, capture_output=True
+    )
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def _head(repo: Path) -> str:
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.strip()
+
+
+def _log(repo: Path) -> list[str]:
+    return subprocess.run(
+        ["git", "log", "--format=%s"],
+        cwd=repo,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout.split("\n")
+
+
+class TestWorkerWorkspaces:
+    """Tests for per-worker worktrees and merging their commits back."""
+
+    def _spec(self, repo: Path) -> Path:
+        # Projects always gitignore .auto-claude (see init.ensure_gitignore_entry)
+        _commit(repo, {".gitignore": ".auto-claude/\n"}, "ignore bookkeeping")
+        spec = repo / ".auto-claude" / "specs" / "001-test"
+        spec.mkdir(parents=True)
+        (spec / "implementation_plan.json").write_text(json.dumps(_plan()))
+        (spec / "build-progress.txt").write_text("start\n")
+        return spec
+
+    def test_workers_get_private_checkouts(self, temp_git_repo: Path):
+        spec = self._spec(temp_git_repo)
+        base = _head(temp_git_repo)
+
+        one = create_worker_workspace(temp_git_repo, spec, "c-1", base)
+        two = create_worker_workspace(temp_git_repo, spec, "c-2", base)
+        try:
+            assert one.path == temp_git_repo / BATCH_WORKTREES_DIR / "c-1"
+            assert one.path != two.path
+            assert (one.spec_dir / "implementation_plan.json").exists()
+            assert one.spec_dir == one.path / ".auto-claude" / "specs" / "001-test"
+
+            (one.path / "a.py").write_text("a")
+            (two.path / "b.py").write_text("b")
+            _commit(one.path, {}, "c-1 work")
+
+            # The other worker's index and files are untouched
+            assert not (two.path / "a.py").exists()
+            assert "c-1 work" not in _log(two.path)
+            assert _head(temp_git_repo) == base
+        finally:
+            remove_worker_workspace(temp_git_repo, one.path)
+            remove_worker_workspace(temp_git_repo, two.path)
+
+        assert not one.path.exists()
+        assert not two.path.exists()
+
+    def test_commits_checked_against_own_scope_only(self, temp_git_repo: Path):
+        spec = self._spec(temp_git_repo)
+        base = _head(temp_git_repo)
+        one = create_worker_workspace(temp_git_repo, spec, "c-1", base)
+        two = create_worker_workspace(temp_git_repo, spec, "c-2", base)
+        try:
+            first = _commit(one.path, {"a.py": "a"}, "c-1")
+            _commit(two.path, {"b.py": "b", "README.md": "stray"}, "c-2")
+
+            good = collect_worker_commits(one, {"a.py"})
+            bad = collect_worker_commits(two, {"b.py"})
+        finally:
+            remove_worker_workspace(temp_git_repo, one.path)
+            remove_worker_workspace(temp_git_repo, two.path)
+
+        assert good.commits == [first]
+        assert good.base == base
+        assert good.head == first
+        assert not good.out_of_scope
+        # The stray is charged to the worker that committed it, nobody else
+        assert bad.out_of_scope == {"README.md"}
+
+    def test_bookkeeping_is_not_out_of_scope(self, temp_git_repo: Path):
+        spec = self._spec(temp_git_repo)
+        one = create_worker_workspace(temp_git_repo, spec, "c-1", _head(temp_git_repo))
+        try:
+            (one.path / ".auto-claude" / "x.txt").write_text("ok")
+            subprocess.run(
+                ["git", "add", "-f", ".auto-claude/x.txt"],
+                cwd=one.path,
+                check=True,
+                capture_output=True,
+            )
+            _commit(one.path, {"a.py": "a"}, "c-1")
+            commits = collect_worker_commits(one, {"a.py"})
+        finally:
+            remove_worker_workspace(temp_git_repo, one.path)
+
+        assert not commits.out_of_scope
+
+    def test_no_commits(self, temp_git_repo: Path):
+        spec = self._spec(temp_git_repo)
+        base = _head(temp_git_repo)
+        one = create_worker_workspace(temp_git_repo, spec, "c-1", base)
+        try:
+            commits = collect_worker_commits(one, {"a.py"})
+        finally:
+            remove_worker_workspace(temp_git_repo, one.path)
+
+        assert commits.head is None
+        assert commits.base == base
+
+    def test_apply_commits_onto_head(self, temp_git_repo: Path):
+        spec = self._spec(temp_git_repo)
+        base = _head(temp_git_repo)
+        one = create_worker_workspace(temp_git_repo, spec, "c-1", base)
+        two = create_worker_workspace(temp_git_repo, spec, "c-2", base)
+        try:
+            _commit(one.path, {"a.py": "a"}, "c-1")
+            _commit(two.path, {"b.py": "b"}, "c-2")
+
+            applied_one = apply_worker_commits(
+                temp_git_repo, collect_worker_commits(one, {"a.py"}).commits
+            )
+            applied_two = apply_worker_commits(
+                temp_git_repo, collect_worker_commits(two, {"b.py"}).commits
+            )
+        finally:
+            remove_worker_workspace(temp_git_repo, one.path)
+            remove_worker_workspace(temp_git_repo, two.path)
+
+        assert len(applied_one) == 1
+        assert applied_two == [_head(temp_git_repo)]
+        assert (temp_git_repo / "a.py").read_text() == "a"
+        assert (temp_git_repo / "b.py").read_text() == "b"
+        assert _log(temp_git_repo)[:2] == ["c-2", "c-1"]
+
+    def test_conflicting_commits_leave_head_untouched(self, temp_git_repo: Path):
+        spec = self._spec(temp_git_repo)
+        base = _head(temp_git_repo)
+        one = create_worker_workspace(temp_git_repo, spec, "c-1", base)
+        try:
+            _commit(one.path, {"a.py": "worker"}, "c-1")
+            commits = collect_worker_commits(one, {"a.py"}).commits
+        finally:
+            remove_worker_workspace(temp_git_repo, one.path)
+        head = _commit(temp_git_repo, {"a.py": "main"}, "main")
+
+        assert apply_worker_commits(temp_git_repo, commits) is None
+        assert _head(temp_git_repo) == head
+        assert (temp_git_repo / "a.py").read_text() == "main"
+
+    def test_sync_worker_spec(self, temp_git_repo: Path):
+        spec = self._spec(temp_git_repo)
+        one = create_worker_workspace(temp_git_repo, spec, "c-1", _head(temp_git_repo))
+        try:
+            with open(one.spec_dir / "build-progress.txt", "a") as f:
+                f.write("c-1 done\n")
+            (one.spec_dir / "memory").mkdir()
+            (one.spec_dir / "memory" / "gotchas.md").write_text("note\n")
+            (one.spec_dir / "implementation_plan.json").write_text("{}")
+            # Another worker appended first
+            with open(spec / "build-progress.txt", "a") as f:
+                f.write("c-2 done\n")
+
+            sync_worker_spec(one, spec)
+        finally:
+            remove_worker_workspace(temp_git_repo, one.path)
+
+        assert (spec / "build-progress.txt").read_text() == (
+            "start\nc-2 done\nc-1 done\n"
+        )
+        assert (spec / "memory" / "gotchas.md").read_text() == "note\n"
+        assert json.loads((spec / "implementation_plan.json").read_text())["phases"]
+
+
+class TestRejectSubtasks:
+    """Tests for resetting out-of-scope subtasks."""
+
+    def test_resets_completed_to_pending(self, spec_dir: Path):
+        plan = _plan()
+        plan["phases"][1]["subtasks"][0]["status"] = "completed"
+        (spec_dir / "implementation_plan.json").write_text(json.dumps(plan))
+
+        assert reject_subtasks(spec_dir, ["c-1"])
+        assert read_subtask_statuses(spec_dir, ["c-1"]) == {"c-1": "pending"}
+
+    def test_nothing_to_reject(self, spec_dir: Path):
+        (spec_dir / "implementation_plan.json").write_text(json.dumps(_plan()))
+        assert reject_subtasks(spec_dir, []) is False
@@ -0,0 +1,188 @@
+#!/usr/bin/env python3
+"""
+Tests for Context Code Search
+=============================
+
+Tests context/search.py and context/index.py:
+- Index-backed search matches the full-text scan
+- Incremental refresh only re-reads changed files
+- Removed files drop out of the index
+- Sharded storage rewrites only changed shards
+- Substring lookups through the vocabulary trigram index
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from context.index import (
+    INDEX_DIR,
+    LEGACY_INDEX_FILE,
+    SHARD_COUNT,
+    SearchIndex,
+    index_manifest,
+    tokenize_file,
+)
+from context import index as index_module
+from context.search import CodeSearcher
+
+
+def _write(path: Path, content: str) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _project(temp_dir: Path) -> Path:
+    service = temp_dir / "api"
+    _write(
+        service / "auth.py",
+        "def login(user):\n    return authenticate(user)\n\n# auth helpers\n",
+    )
+    _write(service / "models" / "user.py", "class User:\n    user_id = 1\n")
+    _write(service / "node_modules" / "dep.js", "const auth = 1;\n")
+    _write(service / "README.md", "auth user\n")
+    return service
+
+
+def _as_tuples(matches):
+    return sorted(
+        (m.path, m.relevance_score, m.reason, m.matching_lines) for m in matches
+    )
+
+
+class TestIndexedSearch:
+    """Tests for index-backed CodeSearcher."""
+
+    def test_matches_full_scan(self, temp_dir: Path):
+        service = _project(temp_dir)
+        keywords = ["auth", "user", "missing"]
+
+        indexed = CodeSearcher(temp_dir).search_service(service, "api", keywords)
+        scanned = CodeSearcher(temp_dir, use_index=False).search_service(
+            service, "api", keywords
+        )
+
+        assert _as_tuples(indexed) == _as_tuples(scanned)
+        assert {m.path for m in indexed} == {"api/auth.py", "api/models/user.py"}
+        assert index_manifest(temp_dir).exists()
+
+    def test_unchanged_files_not_reread(self, temp_dir: Path):
+        service = _project(temp_dir)
+        SearchIndex(temp_dir).refresh(service)
+
+        auth = service / "auth.py"
+        auth.write_text("def logout():\n    pass\n")
+        os.utime(auth, ns=(1, 1))
+
+        index = SearchIndex(temp_dir)
+        with patch("context.index.tokenize_file", wraps=tokenize_file) as tokenize:
+            files = index.refresh(service)
+
+        assert tokenize.call_count == 1
+        hits = index.query(set(files), ["logout", "login"])
+        assert [files[file_id] for file_id in hits] == ["api/auth.py"]
+        assert hits[next(iter(hits))][1] == ["logout"]
+
+    def test_deleted_files_are_dropped(self, temp_dir: Path):
+        service = _project(temp_dir)
+        searcher = CodeSearcher(temp_dir)
+        assert searcher.search_service(service, "api", ["user_id"])
+
+        (service / "models" / "user.py").unlink()
+
+        assert CodeSearcher(temp_dir).search_service(service, "api", ["user_id"]) == []
+
+    def test_non_token_keyword_falls_back_to_scan(self, temp_dir: Path):
+        service = temp_dir / "web"
+        _write(service / "app.ts", "const route = '/user-profile';\n")
+
+        matches = CodeSearcher(temp_dir).search_service(
+            service, "web", ["user-profile"]
+        )
+
+        assert [m.path for m in matches] == ["web/app.ts"]
+        assert matches[0].matching_lines == [(1, "const route = '/user-profile';")]
+
+
+class TestIndexStorage:
+    """Tests for the sharded on-disk layout."""
+
+    def test_save_rewrites_only_changed_shard(self, temp_dir: Path):
+        service = _project(temp_dir)
+        index = SearchIndex(temp_dir)
+        files = index.refresh(service)
+        assert len(list(index.index_dir.glob("postings-*.json"))) == len(files)
+
+        auth = service / "auth.py"
+        auth.write_text("def logout():\n    pass\n")
+        os.utime(auth, ns=(1, 1))
+        with patch("context.index._write_json", wraps=index_module._write_json) as w:
+            SearchIndex(temp_dir).refresh(service)
+
+        written = sorted(call.args[0].name for call in w.call_args_list)
+        assert written == sorted(
+            [f"postings-{len(files) % SHARD_COUNT:02x}.json", "manifest.json"]
+        )
+
+    def test_reload_matches_fresh_index(self, temp_dir: Path):
+        service = _project(temp_dir)
+        files = SearchIndex(temp_dir).refresh(service)
+
+        reloaded = SearchIndex(temp_dir)
+        hits = reloaded.query(set(files), ["auth", "user"])
+
+        assert {files[file_id] for file_id in hits} == {
+            "api/auth.py",
+            "api/models/user.py",
+        }
+
+    def test_missing_shard_forces_reread(self, temp_dir: Path):
+        service = _project(temp_dir)
+        index = SearchIndex(temp_dir)
+        index.refresh(service)
+        for shard in index.index_dir.glob("postings-*.json"):
+            shard.unlink()
+
+        index = SearchIndex(temp_dir)
+        with patch("context.index.tokenize_file", wraps=tokenize_file) as tokenize:
+            files = index.refresh(service)
+
+        assert tokenize.call_count == len(files)
+        assert index.files_containing("login")[1] == {"api/auth.py"}
+
+    def test_legacy_index_removed(self, temp_dir: Path):
+        service = _project(temp_dir)
+        legacy = temp_dir / INDEX_DIR / LEGACY_INDEX_FILE
+        legacy.parent.mkdir(parents=True, exist_ok=True)
+        legacy.write_text("{}")
+
+        SearchIndex(temp_dir).refresh(service)
+
+        assert not legacy.exists()
+
+
+class TestVocabularyLookup:
+    """Tests for substring lookups against the vocabulary."""
+
+    def test_substring_and_short_keywords(self, temp_dir: Path):
+        service = _project(temp_dir)
+        index = SearchIndex(temp_dir)
+        index.refresh(service)
+
+        assert index.files_containing("thent")[1] == {"api/auth.py"}
+        assert index.files_containing("id")[1] == {"api/models/user.py"}
+        assert index.files_containing("zzz")[1] == set()
+
+    def test_gram_index_follows_updates(self, temp_dir: Path):
+        service = _project(temp_dir)
+        index = SearchIndex(temp_dir)
+        index.refresh(service)
+        assert index.files_containing("login")[1] == {"api/auth.py"}
+
+        auth = service / "auth.py"
+        auth.write_text("def signout():\n    pass\n")
+        os.utime(auth, ns=(1, 1))
+        index.refresh(service)
+
+        assert index.files_containing("login")[1] == set()
+        assert index.files_containing("signout")[1] == {"api/auth.py"}
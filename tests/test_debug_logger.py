@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Tests for the Debug Logger
+==========================
+
+Tests core/debug.py:
+- Disabled / filtered messages skip all formatting (Lazy values untouched)
+- Buffered background file sink with ANSI codes stripped
+- Ring buffer of verbose messages dumped on demand
+- Config re-read once setup_environment() has loaded .env
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+from core import debug as debug_module
+from core.debug import (
+    Lazy,
+    debug,
+    debug_error,
+    debug_verbose,
+    dump_debug_buffer,
+    flush_debug_log,
+    reload_debug_config,
+)
+
+
+@pytest.fixture
+def debug_env(monkeypatch):
+    """Set DEBUG* variables; the logger is re-configured on exit."""
+    for name in ("DEBUG", "DEBUG_LEVEL", "DEBUG_LOG_FILE", "DEBUG_RING_BUFFER"):
+        monkeypatch.delenv(name, raising=False)
+
+    def configure(**env):
+        for name, value in env.items():
+            monkeypatch.setenv(name, str(value))
+        reload_debug_config()
+
+    yield configure
+
+    monkeypatch.undo()
+    reload_debug_config()
+
+
+def _exploding():
+    raise AssertionError("lazy value evaluated")
+
+
+class TestFastPath:
+    """Tests for messages that are not emitted."""
+
+    def test_disabled_skips_formatting(self, debug_env, capsys, monkeypatch):
+        debug_env()
+        monkeypatch.setattr(debug_module, "_format_value", _exploding)
+
+        debug("merge", "hidden", value=Lazy(_exploding))
+        debug_error("merge", "hidden", value=Lazy(_exploding))
+
+        assert capsys.readouterr().err == ""
+
+    def test_level_filter_skips_lazy_values(self, debug_env, capsys):
+        debug_env(DEBUG="true", DEBUG_LEVEL=1)
+
+        debug_verbose("merge", "too detailed", diff=Lazy(_exploding))
+        debug("merge", "shown", count=Lazy(lambda: 42))
+
+        err = capsys.readouterr().err
+        assert "too detailed" not in err
+        assert "count" in err and "42" in err
+
+    def test_disabled_calls_are_cheap(self, debug_env):
+        debug_env()
+        payload = {"files": list(range(1000))}
+
+        start = time.perf_counter()
+        for _ in range(100_000):
+            debug("merge", "per-file", payload=payload)
+        elapsed = time.perf_counter() - start
+
+        # A flag check per call - far below formatting even one payload
+        assert elapsed < 0.5
+
+
+class TestSinks:
+    """Tests for the file sink and the ring buffer."""
+
+    def test_file_sink_strips_ansi(self, debug_env, temp_dir: Path, capsys):
+        log_file = temp_dir / "logs" / "debug.log"
+        debug_env(DEBUG="true", DEBUG_LOG_FILE=log_file)
+
+        for i in range(3):
+            debug("workspace", f"message {i}", path=f"file{i}.py")
+        flush_debug_log()
+
+        text = log_file.read_text()
+        assert "message 2" in text and "file0.py" in text
+        assert "\033[" not in text
+
+    def test_ring_buffer_keeps_verbose_messages(self, debug_env, temp_dir: Path, capsys):
+        debug_env(DEBUG="true", DEBUG_LEVEL=1, DEBUG_RING_BUFFER=2)
+
+        debug("a", "first")
+        debug_verbose("b", "second")
+        debug_verbose("c", "third")
+
+        # Verbose messages are recorded but not printed at level 1
+        assert "third" not in capsys.readouterr().err
+
+        dump_file = temp_dir / "crash.log"
+        assert dump_debug_buffer(dump_file) == 2
+        text = dump_file.read_text()
+        assert "first" not in text
+        assert "second" in text and "third" in text
+
+    def test_dump_without_ring_buffer(self, debug_env):
+        debug_env(DEBUG="true")
+
+        assert dump_debug_buffer() == 0
+
+
+class TestEnvironmentSetup:
+    """Tests for picking up DEBUG* values loaded from .env."""
+
+    def test_setup_environment_reloads_config(self, debug_env, monkeypatch):
+        from cli.utils import setup_environment
+
+        debug_env()
+        # As load_dotenv would, after core.debug was first imported
+        monkeypatch.setenv("DEBUG", "true")
+        monkeypatch.setattr(sys, "path", list(sys.path))
+
+        setup_environment()
+
+        assert debug_module.is_debug_enabled()
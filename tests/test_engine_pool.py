@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+"""
+Tests for the Engine Pool
+=========================
+
+Tests core/client.py::EnginePool:
+- Options (security settings, MCP config) are built once per configuration
+- Reusable engines are reset and handed out again
+- Failed sessions and non-reusable engines are cleaned up
+- close() cleans up idle engines
+"""
+
+import asyncio
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from core import client as client_module
+from core.client import EnginePool
+from core.engine import AgentOptions, BaseAgentEngine, CustomCliAgentEngine
+
+
+class _FakeEngine(BaseAgentEngine):
+    reusable = True
+
+    def __init__(self, options: AgentOptions):
+        super().__init__(options)
+        self.resets = 0
+        self.cleaned_up = False
+
+    async def query(self, message: str) -> None:
+        self.history.append({"role": "user", "content": message})
+
+    async def receive_response(self):
+        yield "done"
+
+    def reset(self) -> None:
+        self.resets += 1
+        self.history = []
+
+    async def cleanup(self) -> None:
+        self.cleaned_up = True
+
+
+class _OneShotEngine(_FakeEngine):
+    reusable = False
+
+
+@pytest.fixture
+def built_options():
+    calls = []
+
+    def build(project_dir, spec_dir, model, **kwargs):
+        calls.append((model, kwargs))
+        return AgentOptions(model=model, system_prompt="sys")
+
+    with patch.object(client_module, "build_agent_options", side_effect=build):
+        yield calls
+
+
+def _acquire(pool: EnginePool, temp_dir: Path, model: str = "model-a"):
+    return pool.acquire(temp_dir, temp_dir / "spec", model, cwd=temp_dir)
+
+
+async def _session(engine: BaseAgentEngine, fail: bool = False) -> None:
+    async with engine:
+        await engine.query("work")
+        if fail:
+            raise RuntimeError("session failed")
+
+
+class TestEnginePool:
+    """Tests for engine reuse."""
+
+    def test_engine_is_reset_and_reused(self, temp_dir: Path, built_options):
+        pool = EnginePool()
+
+        async def run():
+            with patch.object(client_module, "create_engine", side_effect=_FakeEngine):
+                first = _acquire(pool, temp_dir)
+                await _session(first)
+                second = _acquire(pool, temp_dir)
+                await _session(second)
+            return first, second
+
+        first, second = asyncio.run(run())
+
+        assert first is second
+        assert first.resets == 2
+        assert first.history == []
+        assert not first.cleaned_up
+        assert (pool.created, pool.reused) == (1, 1)
+        assert len(built_options) == 1
+
+    def test_configurations_are_kept_apart(self, temp_dir: Path, built_options):
+        pool = EnginePool()
+
+        async def run():
+            with patch.object(client_module, "create_engine", side_effect=_FakeEngine):
+                a = _acquire(pool, temp_dir, "model-a")
+                await _session(a)
+                b = _acquire(pool, temp_dir, "model-b")
+            return a, b
+
+        a, b = asyncio.run(run())
+
+        assert a is not b
+        assert b.options.model == "model-b"
+        assert len(built_options) == 2
+
+    def test_concurrent_sessions_get_distinct_engines(self, temp_dir: Path, built_options):
+        pool = EnginePool(max_idle=1)
+
+        async def run():
+            with patch.object(client_module, "create_engine", side_effect=_FakeEngine):
+                engines = [_acquire(pool, temp_dir) for _ in range(3)]
+                await asyncio.gather(*(_session(e) for e in engines))
+            return engines
+
+        engines = asyncio.run(run())
+
+        assert len({id(e) for e in engines}) == 3
+        # Only max_idle engines are kept; the rest are cleaned up
+        assert [e.cleaned_up for e in engines].count(False) == 1
+        assert len(built_options) == 1
+
+    def test_failed_session_discards_engine(self, temp_dir: Path, built_options):
+        pool = EnginePool()
+
+        async def run():
+            with patch.object(client_module, "create_engine", side_effect=_FakeEngine):
+                first = _acquire(pool, temp_dir)
+                with pytest.raises(RuntimeError):
+                    await _session(first, fail=True)
+                return first, _acquire(pool, temp_dir)
+
+        first, second = asyncio.run(run())
+
+        assert first.cleaned_up
+        assert second is not first
+
+    def test_non_reusable_engine_reuses_options_only(self, temp_dir: Path, built_options):
+        pool = EnginePool()
+
+        async def run():
+            with patch.object(client_module, "create_engine", side_effect=_OneShotEngine):
+                first = _acquire(pool, temp_dir)
+                await _session(first)
+                return first, _acquire(pool, temp_dir)
+
+        first, second = asyncio.run(run())
+
+        assert first.cleaned_up
+        assert second is not first
+        assert len(built_options) == 1
+
+    def test_close_cleans_up_idle_and_released_engines(self, temp_dir: Path, built_options):
+        pool = EnginePool()
+
+        async def run():
+            with patch.object(client_module, "create_engine", side_effect=_FakeEngine):
+                idle = _acquire(pool, temp_dir)
+                busy = _acquire(pool, temp_dir)
+                await _session(idle)
+                async with busy:
+                    await pool.close()
+            return idle, busy
+
+        idle, busy = asyncio.run(run())
+
+        assert idle.cleaned_up
+        assert busy.cleaned_up
+
+
+class TestEngineReset:
+    """Tests for per-engine conversation reset."""
+
+    def test_custom_cli_reset(self, temp_dir: Path):
+        (temp_dir / ".droid_session_id").write_text("session-2")
+        engine = CustomCliAgentEngine(
+            AgentOptions(model="m", system_prompt="sys", spec_dir=str(temp_dir))
+        )
+        engine.prompt = "old prompt"
+        engine.collected_output = ["old output"]
+
+        engine.reset()
+
+        assert engine.prompt == ""
+        assert engine.collected_output == []
+        assert engine.session_id == "session-2"
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Tests for the File Inventory
+============================
+
+Tests project/file_inventory.py:
+- Glob answers match pathlib for pruned trees
+- SKIP_DIRS pruning
+- One shared walk per analysis
+- Persistence invalidated by directory mtimes
+"""
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from project.file_inventory import (
+    FileInventory,
+    get_inventory,
+    shared_inventory,
+)
+from project.stack_detector import StackDetector
+
+
+def _touch(path: Path, content: str = "") -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(content)
+
+
+def _tree(root: Path) -> Path:
+    _touch(root / "main.py")
+    _touch(root / "app" / "models.py")
+    _touch(root / "app" / "models" / "user.py")
+    _touch(root / "app" / "user.entity.ts")
+    _touch(root / "web" / "index.js")
+    _touch(root / "web" / "migrations" / "0001.py")
+    _touch(root / "deploy.sh")
+    return root
+
+
+class TestGlob:
+    """Tests for glob queries."""
+
+    def test_matches_pathlib(self, temp_dir: Path):
+        root = _tree(temp_dir)
+        inventory = FileInventory(root)
+
+        for pattern in [
+            "*.py",
+            "*.sh",
+            "**/*.py",
+            "**/*.ts",
+            "**/*.entity.ts",
+            "**/models.py",
+            "**/models/*.py",
+            "**/migrations",
+            "app/*.py",
+        ]:
+            expected = sorted(root.glob(pattern))
+            assert inventory.glob(pattern) == expected, pattern
+
+    def test_relative_to_subdirectory(self, temp_dir: Path):
+        root = _tree(temp_dir)
+        inventory = FileInventory(root)
+
+        assert inventory.glob("**/*.py", root / "app") == sorted(
+            (root / "app").glob("**/*.py")
+        )
+        assert inventory.relative_files(root / "web") == [
+            "index.js",
+            "migrations/0001.py",
+        ]
+
+    def test_prunes_skip_dirs(self, temp_dir: Path):
+        root = _tree(temp_dir)
+        _touch(root / "node_modules" / "pkg" / "setup.py")
+        _touch(root / ".venv" / "lib" / "site.py")
+        _touch(root / "thing.egg-info" / "top_level.py")
+
+        found = FileInventory(root).glob("**/*.py")
+
+        assert root / "node_modules" / "pkg" / "setup.py" not in found
+        assert root / ".venv" / "lib" / "site.py" not in found
+        assert root / "thing.egg-info" / "top_level.py" not in found
+        assert root / "main.py" in found
+
+
+class TestSharedInventory:
+    """Tests for sharing one walk across detectors."""
+
+    def test_detectors_share_one_walk(self, temp_dir: Path):
+        root = _tree(temp_dir)
+
+        with patch.object(
+            FileInventory, "scan", autospec=True, side_effect=FileInventory.scan
+        ) as scan:
+            with shared_inventory(root):
+                StackDetector(root).detect_all()
+                StackDetector(root).detect_languages()
+                assert get_inventory(root / "app").root == root
+
+        assert scan.call_count == 1
+
+    def test_private_inventory_outside_scope(self, temp_dir: Path):
+        root = _tree(temp_dir)
+        with shared_inventory(root) as inventory:
+            assert get_inventory(root) is inventory
+        assert get_inventory(root) is not inventory
+
+
+class TestPersistence:
+    """Tests for saving and revalidating inventories."""
+
+    def test_round_trip(self, temp_dir: Path):
+        root = _tree(temp_dir)
+        cache_file = root / ".auto-claude" / "file_inventory.json"
+        FileInventory(root).save(cache_file)
+
+        loaded = FileInventory.load(root, cache_file)
+
+        assert loaded is not None
+        assert loaded.glob("**/*.py") == FileInventory(root).glob("**/*.py")
+
+    def test_stale_when_directory_changes(self, temp_dir: Path):
+        root = _tree(temp_dir)
+        cache_file = root / ".auto-claude" / "file_inventory.json"
+        FileInventory(root).save(cache_file)
+
+        _touch(root / "app" / "new_module.py")
+        stat = (root / "app").stat()
+        os.utime(root / "app", ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert FileInventory.load(root, cache_file) is None
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Tests for Conversation History Management
+=========================================
+
+Tests core/history.py:
+- Prompt-size metrics per request
+- No compaction under the budget
+- Stale tool outputs and file bodies are elided, oldest first
+- System prompt, user messages and recent turns stay verbatim
+- Compaction leaves headroom so the prefix stays stable between compactions
+"""
+
+import json
+
+from core.history import (
+    ELISION_MARKER,
+    HistoryManager,
+    TokenBudgetHistory,
+    create_history_manager,
+    estimate_tokens,
+)
+
+
+def _turn(index: int, output_chars: int = 4000) -> list[dict]:
+    call_id = f"call-{index}"
+    return [
+        {
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {
+                    "id": call_id,
+                    "type": "function",
+                    "function": {
+                        "name": "Read",
+                        "arguments": json.dumps({"file_path": f"src/f{index}.py"}),
+                    },
+                }
+            ],
+        },
+        {
+            "role": "tool",
+            "tool_call_id": call_id,
+            "name": "Read",
+            "content": "\n".join(["x" * 79] * (output_chars // 80)),
+        },
+    ]
+
+
+def _history(turns: int) -> list[dict]:
+    messages = [
+        {"role": "system", "content": "You are a coder. " * 100},
+        {"role": "user", "content": "Implement the feature. " * 100},
+    ]
+    for i in range(turns):
+        messages.extend(_turn(i))
+    return messages
+
+
+class TestMetrics:
+    """Tests for prompt-size tracking."""
+
+    def test_metrics_recorded_per_request(self):
+        manager = HistoryManager()
+        messages = _history(2)
+
+        first = manager.prepare(messages)
+        messages.extend(_turn(2))
+        second = manager.prepare(messages)
+
+        assert [m.request for m in manager.metrics] == [1, 2]
+        assert second.messages == first.messages + 2
+        assert second.tokens > first.tokens
+        assert first.tokens == first.tokens_before_compaction
+
+    def test_estimate_tokens(self):
+        assert estimate_tokens("") == 0
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+
+
+class TestTokenBudgetHistory:
+    """Tests for budgeted compaction."""
+
+    def test_under_budget_untouched(self):
+        messages = _history(3)
+        snapshot = json.dumps(messages)
+
+        metrics = TokenBudgetHistory(budget_tokens=100_000).prepare(messages)
+
+        assert metrics.elided_messages == 0
+        assert json.dumps(messages) == snapshot
+
+    def test_elides_oldest_tool_outputs_first(self):
+        messages = _history(10)
+        manager = TokenBudgetHistory(budget_tokens=6000, keep_recent_turns=2)
+
+        metrics = manager.prepare(messages)
+
+        assert metrics.tokens <= 6000 < metrics.tokens_before_compaction
+        tool_outputs = [m["content"] for m in messages if m["role"] == "tool"]
+        elided = [ELISION_MARKER in c for c in tool_outputs]
+        # Oldest elided first, and never the last two turns
+        assert elided == sorted(elided, reverse=True)
+        assert elided[0] and not elided[-1] and not elided[-2]
+        assert messages[0]["content"] == "You are a coder. " * 100
+        assert messages[1]["content"] == "Implement the feature. " * 100
+
+    def test_compaction_is_stable_across_requests(self):
+        messages = _history(10)
+        manager = TokenBudgetHistory(budget_tokens=6000)
+        manager.prepare(messages)
+        snapshot = json.dumps(messages)
+
+        again = manager.prepare(messages)
+
+        assert again.elided_messages == 0
+        assert json.dumps(messages) == snapshot
+
+    def test_compaction_leaves_headroom(self):
+        messages = _history(10)
+        manager = TokenBudgetHistory(budget_tokens=10_000, compaction_target=0.5)
+
+        metrics = manager.prepare(messages)
+        assert metrics.tokens <= 5000 < metrics.tokens_before_compaction
+
+        # The next turns fit in the headroom, so the prefix is not rewritten
+        prefix = json.dumps(messages)
+        for i in range(10, 13):
+            messages.extend(_turn(i))
+            assert manager.prepare(messages).elided_messages == 0
+        assert json.dumps(messages).startswith(prefix[:-1])
+
+    def test_large_write_arguments_are_stubbed(self):
+        body = "line of code\n" * 2000
+        messages = _history(0) + [
+            {
+                "role": "assistant",
+                "content": None,
+                "tool_calls": [
+                    {
+                        "id": "w",
+                        "type": "function",
+                        "function": {
+                            "name": "Write",
+                            "arguments": json.dumps(
+                                {"file_path": "big.py", "content": body}
+                            ),
+                        },
+                    }
+                ],
+            },
+            {"role": "tool", "tool_call_id": "w", "content": "Successfully wrote"},
+        ] + _turn(1, 400) + _turn(2, 400)
+
+        TokenBudgetHistory(budget_tokens=2000).prepare(messages)
+
+        args = json.loads(messages[2]["tool_calls"][0]["function"]["arguments"])
+        assert args["file_path"] == "big.py"
+        assert args["content"].startswith(ELISION_MARKER)
+
+    def test_budget_zero_disables_compaction(self):
+        manager = create_history_manager(0)
+        assert type(manager) is HistoryManager
+        assert isinstance(create_history_manager(1000), TokenBudgetHistory)
@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+"""
+Tests for the KBA Memory Client
+===============================
+
+Tests core/kba_memory.py against a local stub kba-memory server:
+- Collection IDs are looked up once per project
+- Connections are kept alive and reused
+- Repeated searches are served from the cache until notes change
+- Notes are uploaded in bulk, concurrently
+- Requests lost on a stale keep-alive connection are only resent when safe
+"""
+
+import asyncio
+import http.client
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+from core.kba_memory import KBAClient, _ConnectionPool
+
+
+class _StubState:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.requests: list[tuple[str, str]] = []
+        self.connections: set[int] = set()
+        self.collections = [{"id": "col-1", "name": "Existing"}]
+        self.notes: list[dict] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.note_delay = threading.Event()
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, format, *args):
+        pass
+
+    def _reply(self, payload, status: int = 200) -> None:
+        body = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _record(self) -> _StubState:
+        state = self.server.state
+        with state.lock:
+            state.requests.append((self.command, urlsplit(self.path).path))
+            state.connections.add(id(self.connection))
+        return state
+
+    def do_GET(self):
+        state = self._record()
+        url = urlsplit(self.path)
+        if url.path == "/api/collections":
+            self._reply(state.collections)
+        elif url.path == "/api/notes/search":
+            query = parse_qs(url.query)["query"][0]
+            self._reply([n for n in state.notes if query in n["content"]])
+        else:
+            self._reply({"success": False}, status=404)
+
+    def do_POST(self):
+        state = self._record()
+        length = int(self.headers.get("Content-Length", 0))
+        data = json.loads(self.rfile.read(length))
+        path = urlsplit(self.path).path
+        if path == "/api/collections":
+            collection = {"id": f"col-{len(state.collections) + 1}", "name": data["name"]}
+            state.collections.append(collection)
+            self._reply(collection)
+        elif path == "/api/notes":
+            with state.lock:
+                state.in_flight += 1
+                state.max_in_flight = max(state.max_in_flight, state.in_flight)
+            # Hold uploads briefly so concurrent ones overlap
+            state.note_delay.wait(0.1)
+            with state.lock:
+                state.in_flight -= 1
+                state.notes.append(data)
+            self._reply({"id": f"note-{len(state.notes)}"})
+        else:
+            self._reply({"success": False}, status=404)
+
+
+@pytest.fixture
+def kba_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    server.state = _StubState()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def client(kba_server):
+    host, port = kba_server.server_address
+    client = KBAClient(f"http://{host}:{port}", pool_size=4)
+    yield client
+    client.close()
+
+
+class TestCollections:
+    """Tests for collection lookup."""
+
+    def test_collection_id_is_cached(self, client, kba_server):
+        assert client.get_or_create_collection("existing") == "col-1"
+        assert client.get_or_create_collection("Existing") == "col-1"
+        client.search("Existing", "anything")
+
+        lists = [r for r in kba_server.state.requests if r == ("GET", "/api/collections")]
+        assert len(lists) == 1
+
+    def test_missing_collection_is_created_once(self, client, kba_server):
+        assert client.get_or_create_collection("NewProject") == "col-2"
+        assert client.get_or_create_collection("NewProject") == "col-2"
+
+        creates = [r for r in kba_server.state.requests if r == ("POST", "/api/collections")]
+        assert len(creates) == 1
+
+    def test_server_down_returns_none(self):
+        client = KBAClient("http://127.0.0.1:9", timeout=1)
+        try:
+            assert client.get_or_create_collection("Existing") is None
+            assert client.search("Existing", "q") == []
+            assert client.add_note("Existing", "t", "c") is False
+        finally:
+            client.close()
+
+
+class TestSearchAndNotes:
+    """Tests for searching and storing notes."""
+
+    def test_connections_are_reused(self, client, kba_server):
+        for i in range(5):
+            client.search("Existing", f"query-{i}")
+
+        # Collection list + a search (and list fallback) per query, one socket
+        assert len(kba_server.state.requests) == 11
+        assert len(kba_server.state.connections) == 1
+
+    def test_search_cache_invalidated_by_new_note(self, client, kba_server):
+        assert client.search("Existing", "redis") == []
+        assert client.search("Existing", "redis") == []
+        searches = [r for r in kba_server.state.requests if r[1] == "/api/notes/search"]
+        assert len(searches) == 1
+
+        assert client.add_note("Existing", "Cache", "use redis for sessions", ["note"])
+
+        [note] = client.search("Existing", "redis")
+        assert note["title"] == "Cache"
+        assert note["collectionId"] == "col-1"
+
+    def test_bulk_notes_upload_concurrently(self, client, kba_server):
+        notes = [
+            {"title": f"Insight {i}", "content": f"content {i}", "tags": ["insight"]}
+            for i in range(6)
+        ]
+
+        results = asyncio.run(client.add_notes_async("Existing", notes))
+
+        assert results == [True] * 6
+        assert {n["title"] for n in kba_server.state.notes} == {n["title"] for n in notes}
+        assert kba_server.state.max_in_flight > 1
+
+    def test_search_async(self, client, kba_server):
+        client.add_note("Existing", "Auth", "jwt tokens expire hourly")
+
+        notes = asyncio.run(client.search_async("Existing", "jwt"))
+
+        assert [n["title"] for n in notes] == ["Auth"]
+
+
+class _FakeResponse:
+    status = 200
+    will_close = False
+
+    def read(self) -> bytes:
+        return b"{}"
+
+
+class _FakeConnection:
+    """Connection whose server has gone away after (or before) the send."""
+
+    def __init__(self, sent: list, fail_on: str | None = None):
+        self.sent = sent
+        self.fail_on = fail_on
+
+    def request(self, method, path, body=None, headers=None):
+        if self.fail_on == "send":
+            raise BrokenPipeError
+        self.sent.append((method, path))
+
+    def getresponse(self):
+        if self.fail_on == "response":
+            raise http.client.RemoteDisconnected("closed")
+        return _FakeResponse()
+
+    def close(self):
+        pass
+
+
+class TestStaleConnections:
+    """Tests for retries after the server closed an idle connection."""
+
+    def _pool(self, fail_on: str) -> tuple[_ConnectionPool, list]:
+        sent: list = []
+        pool = _ConnectionPool("http://kba.invalid", size=1, timeout=1)
+        pool._new_connection = lambda: _FakeConnection(sent)
+        pool._idle.put(_FakeConnection(sent, fail_on=fail_on))
+        return pool, sent
+
+    def test_get_retried_after_lost_response(self):
+        pool, sent = self._pool(fail_on="response")
+        assert pool.request("GET", "/api/notes", None) == (200, b"{}")
+        assert sent == [("GET", "/api/notes"), ("GET", "/api/notes")]
+
+    def test_post_not_resent_after_lost_response(self):
+        pool, sent = self._pool(fail_on="response")
+        with pytest.raises(http.client.RemoteDisconnected):
+            pool.request("POST", "/api/notes", b"{}")
+        assert sent == [("POST", "/api/notes")]
+
+    def test_post_retried_when_never_sent(self):
+        pool, sent = self._pool(fail_on="send")
+        assert pool.request("POST", "/api/notes", b"{}") == (200, b"{}")
+        assert sent == [("POST", "/api/notes")]
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+"""
+Tests for the MCP Connection Manager
+====================================
+
+Tests core/mcp_manager.py against a tiny local echo MCP server:
+- Tool discovery (qualified names, cached listings)
+- Concurrent calls multiplexed over one server process
+- Servers shared across managers
+- Crashed servers restarted with backoff
+- mcp__ tool calls routed through the ToolExecutor
+"""
+
+import asyncio
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+import pytest
+
+from core import mcp_manager
+from core.engine import AgentOptions, BaseAgentEngine
+from core.mcp_manager import MCPManager, format_tool_result, shutdown_mcp_servers
+from core.tools.executor import ToolCall, ToolExecutor
+
+ECHO_SERVER = textwrap.dedent(
+    '''
+    import json, sys, threading, time
+
+    log = open(sys.argv[1], "a", buffering=1)
+    log.write("start\\n")
+    write_lock = threading.Lock()
+
+    TOOLS = [
+        {
+            "name": "echo",
+            "description": "Echo text back",
+            "inputSchema": {
+                "type": "object",
+                "properties": {"text": {"type": "string"}, "delay": {"type": "number"}},
+                "required": ["text"],
+            },
+        },
+        {"name": "crash", "description": "Exit", "inputSchema": {"type": "object"}},
+    ]
+
+    def reply(msg_id, result):
+        with write_lock:
+            sys.stdout.write(json.dumps({"jsonrpc": "2.0", "id": msg_id, "result": result}) + "\\n")
+            sys.stdout.flush()
+
+    def call(msg_id, params):
+        args = params.get("arguments") or {}
+        time.sleep(args.get("delay", 0))
+        reply(msg_id, {"content": [{"type": "text", "text": args.get("text", "")}]})
+
+    for line in sys.stdin:
+        msg = json.loads(line)
+        if "id" not in msg:
+            continue
+        log.write(msg["method"] + "\\n")
+        if msg["method"] == "initialize":
+            reply(msg["id"], {"protocolVersion": "2024-11-05", "capabilities": {"tools": {}}})
+        elif msg["method"] == "tools/list":
+            reply(msg["id"], {"tools": TOOLS})
+        elif msg["params"]["name"] == "crash":
+            sys.exit(1)
+        else:
+            threading.Thread(target=call, args=(msg["id"], msg["params"])).start()
+    '''
+)
+
+
+@pytest.fixture
+def echo_config(temp_dir: Path) -> dict:
+    script = temp_dir / "echo_server.py"
+    script.write_text(ECHO_SERVER)
+    log = temp_dir / "server.log"
+    log.touch()
+    return {"command": sys.executable, "args": [str(script), str(log)], "log": log}
+
+
+def _log(config: dict) -> list[str]:
+    return config["log"].read_text().splitlines()
+
+
+def _run(coro_fn):
+    async def wrapper():
+        try:
+            return await coro_fn()
+        finally:
+            await shutdown_mcp_servers()
+
+    return asyncio.run(wrapper())
+
+
+class TestDiscovery:
+    """Tests for tool listing."""
+
+    def test_lists_qualified_tools_once(self, echo_config):
+        manager = MCPManager(
+            {"echo": echo_config, "remote": {"type": "http", "url": "http://localhost:1"}}
+        )
+
+        async def run():
+            first = await manager.list_tools()
+            second = await manager.list_tools()
+            return first, second
+
+        first, second = _run(run)
+
+        assert [t["name"] for t in first] == ["mcp__echo__echo", "mcp__echo__crash"]
+        assert first[0]["input_schema"]["required"] == ["text"]
+        assert second == first
+        assert _log(echo_config).count("tools/list") == 1
+
+    def test_engine_exposes_only_listed_mcp_tools(self, echo_config):
+        class _Engine(BaseAgentEngine):
+            async def query(self, message):
+                pass
+
+            async def receive_response(self):
+                yield None
+
+            async def cleanup(self):
+                pass
+
+        engine = _Engine(
+            AgentOptions(
+                model="m",
+                system_prompt="sys",
+                allowed_tools=["Read", "mcp__echo__crash"],
+                mcp_tools=["mcp__echo__echo"],
+            )
+        )
+        engine.mcp_manager = MCPManager({"echo": echo_config})
+
+        tools = _run(engine._get_mcp_tools)
+
+        assert [t["name"] for t in tools] == ["mcp__echo__echo"]
+
+    def test_unstartable_server_is_skipped(self, temp_dir: Path):
+        manager = MCPManager({"missing": {"command": str(temp_dir / "no-such-binary")}})
+
+        assert _run(manager.list_tools) == []
+
+
+class TestCalls:
+    """Tests for tool calls."""
+
+    def test_concurrent_calls_share_one_process(self, echo_config):
+        manager = MCPManager({"echo": echo_config})
+
+        async def run():
+            start = time.monotonic()
+            results = await asyncio.gather(
+                *(
+                    manager.call("mcp__echo__echo", {"text": f"msg-{i}", "delay": 0.3})
+                    for i in range(4)
+                )
+            )
+            return results, time.monotonic() - start
+
+        results, elapsed = _run(run)
+
+        assert results == ["msg-0", "msg-1", "msg-2", "msg-3"]
+        assert elapsed < 1.0
+        assert _log(echo_config).count("start") == 1
+
+    def test_servers_are_shared_between_managers(self, echo_config):
+        async def run():
+            a = await MCPManager({"echo": echo_config}).call("mcp__echo__echo", {"text": "a"})
+            b = await MCPManager({"echo": echo_config}).call("mcp__echo__echo", {"text": "b"})
+            return a, b
+
+        assert _run(run) == ("a", "b")
+        assert _log(echo_config).count("start") == 1
+
+    def test_crashed_server_restarts_with_backoff(self, echo_config, monkeypatch):
+        monkeypatch.setattr(mcp_manager, "RESTART_BACKOFF_SECONDS", 0.3)
+        manager = MCPManager({"echo": echo_config})
+
+        async def run():
+            crashed = await manager.call("mcp__echo__crash", {})
+            too_soon = await manager.call("mcp__echo__echo", {"text": "x"})
+            await asyncio.sleep(0.4)
+            recovered = await manager.call("mcp__echo__echo", {"text": "back"})
+            return crashed, too_soon, recovered
+
+        crashed, too_soon, recovered = _run(run)
+
+        assert crashed.startswith("Error: MCP server echo exited")
+        assert "restarting in" in too_soon
+        assert recovered == "back"
+        assert _log(echo_config).count("start") == 2
+
+    def test_executor_routes_mcp_calls(self, echo_config, temp_dir: Path):
+        executor = ToolExecutor(cwd=str(temp_dir), mcp_manager=MCPManager({"echo": echo_config}))
+        (temp_dir / "a.txt").write_text("file body")
+        calls = [
+            ToolCall(id="1", name="mcp__echo__echo", args={"text": "hi"}),
+            ToolCall(id="2", name="Read", args={"file_path": "a.txt"}),
+        ]
+
+        async def run():
+            return sorted([(r.index, r.result) async for r in executor.run(calls)])
+
+        try:
+            results = _run(run)
+        finally:
+            executor.shutdown()
+
+        assert results[0] == (0, "hi")
+        assert "file body" in results[1][1]
+
+    def test_error_results_are_flagged(self):
+        result = {"content": [{"type": "text", "text": "bad input"}], "isError": True}
+
+        assert format_tool_result(result) == "Error: bad input"
+        assert format_tool_result({"content": [{"type": "image"}]}) == "[image content omitted]"
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Benchmark for Multi-Task Merges
+===============================
+
+Times MergeOrchestrator.merge_tasks over a synthetic 5-task x 500-file
+merge, in-process and with the per-file pipelines on a process pool, and
+checks that both produce the same results and statistics.
+
+Run with timings printed:
+    pytest tests/test_merge_benchmark.py -m slow -s
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+from merge import MergeOrchestrator, orchestrator as orchestrator_module
+from merge.orchestrator import TaskMergeRequest
+
+pytestmark = pytest.mark.slow
+
+TASK_COUNT = 5
+FILE_COUNT = 500
+
+# In every 10th file the first two tasks add the same function
+CONFLICT_EVERY = 10
+
+
+def _module_source(index: int) -> str:
+    functions = "\n".join(
+        f"def func_{index}_{n}(value):\n"
+        f'    """Function {n} of module {index}."""\n'
+        f"    return value + {n}\n"
+        for n in range(20)
+    )
+    return f'"""Module {index}."""\nimport os\n\n{functions}'
+
+
+def _task_version(index: int, task: int, base: str) -> str:
+    content = base + (
+        f"\n\ndef task_{task}_helper():\n"
+        f'    """Added by task {task}."""\n'
+        f"    return {task}\n"
+    )
+    if index % CONFLICT_EVERY == 0 and task < 2:
+        content += f"\n\ndef shared_helper():\n    return {task}\n"
+    if task == 3:
+        content = content.replace("import os\n", "import os\nimport json\n", 1)
+    return content
+
+
+def _build_merge(project: Path) -> tuple[MergeOrchestrator, list[TaskMergeRequest]]:
+    """Orchestrator with TASK_COUNT tasks each modifying all FILE_COUNT files."""
+    src = project / "src"
+    src.mkdir(parents=True, exist_ok=True)
+    sources = {}
+    for index in range(FILE_COUNT):
+        path = src / f"module_{index}.py"
+        sources[index] = _module_source(index)
+        path.write_text(sources[index])
+
+    orchestrator = MergeOrchestrator(project, enable_ai=False, dry_run=True)
+    tracker = orchestrator.evolution_tracker
+    files = [src / f"module_{index}.py" for index in range(FILE_COUNT)]
+    for task in range(TASK_COUNT):
+        task_id = f"task-{task:03d}"
+        tracker.capture_baselines(task_id, files)
+        for index in range(FILE_COUNT):
+            tracker.modification_tracker.record_modification(
+                task_id,
+                f"src/module_{index}.py",
+                sources[index],
+                _task_version(index, task, sources[index]),
+                tracker._evolutions,
+            )
+    tracker._save_evolutions()
+
+    requests = [
+        TaskMergeRequest(task_id=f"task-{task:03d}", worktree_path=None)
+        for task in range(TASK_COUNT)
+    ]
+    return orchestrator, requests
+
+
+def _outcome(report) -> tuple:
+    stats = report.stats.to_dict()
+    stats.pop("duration_seconds")
+    files = [
+        (path, result.decision.value, result.merged_content)
+        for path, result in report.file_results.items()
+    ]
+    return stats, files
+
+
+class TestMergeTasksBenchmark:
+    """Timing and consistency checks for merge_tasks."""
+
+    def test_parallel_merge_matches_in_process(self, temp_git_repo: Path, monkeypatch):
+        orchestrator, requests = _build_merge(temp_git_repo)
+
+        monkeypatch.setattr(orchestrator_module, "PARALLEL_MERGE_THRESHOLD", 10**9)
+        start = time.perf_counter()
+        serial = orchestrator.merge_tasks(requests)
+        serial_seconds = time.perf_counter() - start
+
+        monkeypatch.setattr(orchestrator_module, "PARALLEL_MERGE_THRESHOLD", 1)
+        monkeypatch.setattr(orchestrator_module, "MAX_MERGE_WORKERS", 4)
+        start = time.perf_counter()
+        parallel = orchestrator.merge_tasks(requests)
+        parallel_seconds = time.perf_counter() - start
+
+        print(
+            f"\nmerge_tasks over {TASK_COUNT} tasks x {FILE_COUNT} files: "
+            f"in-process {serial_seconds:.2f}s, "
+            f"process pool {parallel_seconds:.2f}s"
+        )
+        assert serial.success and parallel.success
+        assert serial.stats.files_processed == FILE_COUNT
+        assert serial.stats.conflicts_detected > 0
+        assert _outcome(parallel) == _outcome(serial)
@@ -0,0 +1,207 @@
+#!/usr/bin/env python3
+"""
+Tests for the Merge Blob Store
+==============================
+
+Tests merge/blob_store.py and its users:
+- Content-addressed, compressed, deduplicated storage
+- Garbage collection of unreferenced blobs
+- Timelines saved as blob keys and loaded lazily
+- Evolution baselines shared across tasks and collected on cleanup
+"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+from merge import blob_store
+from merge.blob_store import BlobStore, MissingBlobError, collect_garbage
+from merge.timeline_models import BranchPoint, FileTimeline, TaskFileView
+from merge.timeline_persistence import TimelinePersistence
+
+
+@pytest.fixture
+def no_grace(monkeypatch):
+    """Let garbage collection remove blobs written just now."""
+    monkeypatch.setattr(blob_store, "GC_GRACE_SECONDS", 0)
+
+
+def _timeline(file_path: str, content: str, task_ids: list[str]) -> FileTimeline:
+    timeline = FileTimeline(file_path=file_path)
+    for task_id in task_ids:
+        timeline.add_task_view(
+            TaskFileView(
+                task_id=task_id,
+                branch_point=BranchPoint(
+                    commit_hash="abc123", content=content, timestamp=datetime.now()
+                ),
+            )
+        )
+    return timeline
+
+
+class TestBlobStore:
+    """Tests for the store itself."""
+
+    def test_round_trip_and_dedup(self, temp_dir: Path):
+        store = BlobStore(temp_dir / "blobs")
+        content = "def hello():\n    return 'world'\n" * 200
+
+        first = store.put(content)
+        second = store.put(content)
+
+        assert first == second == BlobStore.hash_content(content)
+        assert store.get(first) == content
+        assert list(store.iter_hashes()) == [first]
+        # Stored compressed
+        assert store._path(first).stat().st_size < len(content) // 10
+
+    def test_missing_blob(self, temp_dir: Path):
+        store = BlobStore(temp_dir / "blobs")
+
+        assert store.get("0" * 64) is None
+        assert not store.contains("0" * 64)
+
+    def test_gc_keeps_referenced_and_recent(self, temp_dir: Path):
+        store = BlobStore(temp_dir / "blobs")
+        keep = store.put("keep")
+        drop = store.put("drop")
+
+        assert store.gc({keep}) == 0  # Both inside the grace period
+        assert store.gc({keep}, grace_seconds=0) == 1
+
+        assert store.contains(keep)
+        assert not store.contains(drop)
+
+
+class TestTimelineBlobs:
+    """Tests for timelines saved through TimelinePersistence."""
+
+    def test_timeline_saves_keys_not_content(self, temp_dir: Path):
+        persistence = TimelinePersistence(temp_dir)
+        content = "export const App = () => null;\n"
+        timeline = _timeline("src/App.tsx", content, ["task-001", "task-002"])
+
+        persistence.save_timeline("src/App.tsx", timeline)
+        persistence.update_index(["src/App.tsx"])
+
+        saved = persistence._get_timeline_file_path("src/App.tsx").read_text()
+        assert content not in saved
+        assert BlobStore.hash_content(content) in saved
+        # Both tasks branched from the same content: one blob
+        assert len(list(persistence.blobs.iter_hashes())) == 1
+
+    def test_content_loads_lazily(self, temp_dir: Path, monkeypatch):
+        persistence = TimelinePersistence(temp_dir)
+        persistence.save_timeline(
+            "src/App.tsx", _timeline("src/App.tsx", "original", ["task-001"])
+        )
+        persistence.update_index(["src/App.tsx"])
+
+        reader = TimelinePersistence(temp_dir)
+        reads = []
+        original_get = reader.blobs.get
+
+        def get(blob_hash):
+            reads.append(blob_hash)
+            return original_get(blob_hash)
+
+        monkeypatch.setattr(reader.blobs, "get", get)
+        timelines = reader.load_all_timelines()
+        assert reads == []
+
+        branch_point = timelines["src/App.tsx"].get_task_view("task-001").branch_point
+        assert branch_point.content == "original"
+        assert branch_point.content == "original"
+        assert len(reads) == 1
+
+    def test_missing_blob_raises(self, temp_dir: Path):
+        persistence = TimelinePersistence(temp_dir)
+        persistence.save_timeline(
+            "src/App.tsx", _timeline("src/App.tsx", "original", ["task-001"])
+        )
+        persistence.update_index(["src/App.tsx"])
+        blob_hash = BlobStore.hash_content("original")
+        persistence.blobs._path(blob_hash).unlink()
+
+        timelines = TimelinePersistence(temp_dir).load_all_timelines()
+        branch_point = timelines["src/App.tsx"].get_task_view("task-001").branch_point
+
+        with pytest.raises(MissingBlobError) as excinfo:
+            branch_point.content
+        assert excinfo.value.blob_hash == blob_hash
+
+    def test_legacy_inline_content_still_loads(self, temp_dir: Path):
+        persistence = TimelinePersistence(temp_dir)
+        legacy = _timeline("a.py", "print('legacy')\n", ["task-001"]).to_dict()
+        (persistence.timelines_dir / "a.py.json").write_text(json.dumps(legacy))
+        persistence.update_index(["a.py"])
+
+        timelines = TimelinePersistence(temp_dir).load_all_timelines()
+
+        view = timelines["a.py"].get_task_view("task-001")
+        assert view.branch_point.content == "print('legacy')\n"
+
+    def test_collect_garbage_keeps_timeline_blobs(self, temp_dir: Path, no_grace):
+        persistence = TimelinePersistence(temp_dir)
+        timeline = _timeline("a.py", "v1", ["task-001"])
+        persistence.save_timeline("a.py", timeline)
+
+        timeline.get_task_view("task-001").branch_point.content = "v2"
+        persistence.save_timeline("a.py", timeline)
+
+        assert collect_garbage(temp_dir) == 1
+        assert [persistence.blobs.get(h) for h in persistence.blobs.iter_hashes()] == [
+            "v2"
+        ]
+
+    def test_abandoned_task_worktree_blobs_collected(
+        self, temp_git_repo: Path, no_grace
+    ):
+        from merge import FileTimelineTracker
+
+        tracker = FileTimelineTracker(temp_git_repo)
+        tracker.on_task_start("task-001", ["README.md"], task_intent="Docs")
+        tracker.on_task_worktree_change("task-001", "README.md", "# Rewritten\n")
+        blobs = tracker.persistence.blobs
+        assert len(list(blobs.iter_hashes())) == 2
+
+        tracker.on_task_abandoned("task-001")
+
+        remaining = [blobs.get(h) for h in blobs.iter_hashes()]
+        assert remaining == ["# Test Project\n"]
+
+
+class TestEvolutionBaselines:
+    """Tests for FileEvolutionTracker baselines in the blob store."""
+
+    def test_baselines_shared_across_tasks(self, file_tracker, temp_project):
+        files = [temp_project / "src" / "utils.py"]
+        file_tracker.capture_baselines("task-001", files)
+        file_tracker.capture_baselines("task-002", files)
+
+        blobs = file_tracker.storage.blobs
+        assert len(list(blobs.iter_hashes())) == 1
+        assert "def " in file_tracker.get_baseline_content("src/utils.py")
+
+    def test_cleanup_collects_unreferenced_baselines(
+        self, file_tracker, temp_project, no_grace
+    ):
+        files = [temp_project / "src" / "utils.py"]
+        file_tracker.capture_baselines("task-001", files)
+        file_tracker.capture_baselines("task-002", files)
+        blobs = file_tracker.storage.blobs
+
+        file_tracker.cleanup_task("task-001")
+        assert len(list(blobs.iter_hashes())) == 1
+        assert file_tracker.get_baseline_content("src/utils.py") is not None
+
+        file_tracker.cleanup_task("task-002")
+        assert list(blobs.iter_hashes()) == []
+
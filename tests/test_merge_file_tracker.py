@@ -242,3 +242,65 @@ class TestEvolutionSummary:
         summary = file_tracker.get_evolution_summary()
 
         assert summary["total_tasks"] >= 2
+
+
+class TestRefreshFromGit:
+    """Tests for batched git reads when refreshing from a worktree."""
+
+    @staticmethod
+    def _git(repo, *args):
+        import subprocess
+
+        subprocess.run(["git", *args], cwd=repo, capture_output=True, check=True)
+
+    def _make_branch_with_changes(self, repo: Path) -> None:
+        (repo / "src").mkdir(exist_ok=True)
+        (repo / "src" / "utils.py").write_text(SAMPLE_PYTHON_MODULE)
+        (repo / "src" / "gone.py").write_text("x = 1\n")
+        self._git(repo, "add", ".")
+        self._git(repo, "commit", "-m", "base")
+        self._git(repo, "checkout", "-b", "feature")
+        (repo / "src" / "utils.py").write_text(SAMPLE_PYTHON_WITH_NEW_FUNCTION)
+        (repo / "src" / "new file.py").write_text("def added():\n    pass\n")
+        (repo / "src" / "gone.py").unlink()
+        self._git(repo, "add", "-A")
+        self._git(repo, "commit", "-m", "feature")
+
+    def test_changed_files_with_diffs(self, temp_git_repo: Path):
+        """One diff is split into per-file patches keyed by exact path."""
+        from merge.git_utils import get_changed_files_with_diffs
+
+        self._make_branch_with_changes(temp_git_repo)
+
+        diffs = get_changed_files_with_diffs(temp_git_repo, "main...HEAD")
+
+        assert set(diffs) == {"src/utils.py", "src/new file.py", "src/gone.py"}
+        assert diffs["src/utils.py"].startswith("diff --git a/src/utils.py")
+        assert "+def added():" in diffs["src/new file.py"]
+        assert "deleted file mode" in diffs["src/gone.py"]
+
+    def test_blob_reader(self, temp_git_repo: Path):
+        """cat-file batch reader returns content, or None for missing paths."""
+        from merge.git_utils import GitBlobReader
+
+        self._make_branch_with_changes(temp_git_repo)
+
+        with GitBlobReader(temp_git_repo) as reader:
+            assert reader.read("main", "src/utils.py") == SAMPLE_PYTHON_MODULE
+            assert reader.read("main", "src/new file.py") is None
+            assert reader.read("HEAD", "src/utils.py") == SAMPLE_PYTHON_WITH_NEW_FUNCTION
+
+    def test_refresh_records_all_files(self, temp_git_repo: Path):
+        """refresh_from_git records a snapshot for every changed file."""
+        from merge import FileEvolutionTracker
+
+        self._make_branch_with_changes(temp_git_repo)
+        tracker = FileEvolutionTracker(temp_git_repo)
+
+        tracker.refresh_from_git("task-001", temp_git_repo)
+
+        modified = {path for path, _ in tracker.get_task_modifications("task-001")}
+        assert {"src/utils.py", "src/new file.py"} <= modified
+        for path in ("src/utils.py", "src/new file.py", "src/gone.py"):
+            snapshot = tracker.get_file_evolution(path).get_task_snapshot("task-001")
+            assert snapshot.raw_diff.startswith(f"diff --git a/{path}")
@@ -14,10 +14,13 @@ Covers:
 - Merge statistics and reports
 - AI enabled/disabled modes
 - Report serialization
+- Concurrent worktree refresh and process-pool file merges
 """
 
 import json
+import subprocess
 import sys
+from datetime import datetime
 from pathlib import Path
 
 import pytest
@@ -28,7 +31,15 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
 sys.path.insert(0, str(Path(__file__).parent))
 
 from merge import MergeOrchestrator
+from merge import orchestrator as orchestrator_module
 from merge.orchestrator import TaskMergeRequest
+from merge.types import (
+    ChangeType,
+    MergeDecision,
+    MergeResult,
+    SemanticChange,
+    TaskSnapshot,
+)
 
 from test_fixtures import (
     SAMPLE_PYTHON_MODULE,
@@ -248,3 +259,138 @@ class TestErrorHandling:
 
         assert report is not None
         assert len(report.tasks_merged) == 0
+
+
+class InlineExecutor:
+    """Stand-in for ProcessPoolExecutor running every call in-process."""
+
+    def __init__(self, max_workers=None):
+        self.max_workers = max_workers
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        return False
+
+    def map(self, fn, iterable):
+        return map(fn, iterable)
+
+
+class StubAIResolver:
+    """AI resolver that resolves every conflict with fixed content."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def resolve_conflict(self, conflict, baseline_code, task_snapshots):
+        self.calls += 1
+        return MergeResult(
+            decision=MergeDecision.AI_MERGED,
+            file_path=conflict.file_path,
+            merged_content="def f():\n    return 3\n",
+            ai_calls_made=1,
+            tokens_used=10,
+        )
+
+
+def _modify_f(task_id: str, line: int) -> TaskSnapshot:
+    return TaskSnapshot(
+        task_id=task_id,
+        task_intent="",
+        started_at=datetime.now(),
+        semantic_changes=[
+            SemanticChange(
+                change_type=ChangeType.MODIFY_FUNCTION,
+                target="f",
+                location="function:f",
+                line_start=line,
+                line_end=line,
+                content_before="def f():\n    return 0\n",
+                content_after=f"def f():\n    return {line}\n",
+            )
+        ],
+    )
+
+
+class TestParallelMerge:
+    """Tests for concurrent refresh and pooled per-file merges."""
+
+    def test_merge_tasks_refreshes_each_worktree(
+        self, temp_git_repo: Path, monkeypatch
+    ):
+        """Every task's worktree changes are recorded before merging."""
+        (temp_git_repo / "app.py").write_text("def main():\n    pass\n")
+        subprocess.run(["git", "add", "."], cwd=temp_git_repo, check=True)
+        subprocess.run(
+            ["git", "commit", "-m", "Add app"],
+            cwd=temp_git_repo,
+            capture_output=True,
+            check=True,
+        )
+        requests = []
+        for n in (1, 2):
+            task_id = f"task-00{n}"
+            worktree = temp_git_repo / ".worktrees" / task_id
+            subprocess.run(
+                ["git", "worktree", "add", "-b", task_id, str(worktree)],
+                cwd=temp_git_repo,
+                capture_output=True,
+                check=True,
+            )
+            (worktree / f"feature_{n}.py").write_text(f"def feature_{n}():\n    pass\n")
+            with open(worktree / "app.py", "a") as f:
+                f.write(f"\ndef helper_{n}():\n    pass\n")
+            subprocess.run(["git", "add", "."], cwd=worktree, check=True)
+            subprocess.run(
+                ["git", "commit", "-m", f"Add feature {n}"],
+                cwd=worktree,
+                capture_output=True,
+                check=True,
+            )
+            requests.append(TaskMergeRequest(task_id=task_id, worktree_path=worktree))
+
+        orchestrator = MergeOrchestrator(temp_git_repo, enable_ai=False, dry_run=True)
+        baselines = {}
+        prefetch = orchestrator._prefetch_baselines
+
+        def record_prefetch(file_paths, target_branch):
+            baselines.update(prefetch(file_paths, target_branch))
+            return baselines
+
+        monkeypatch.setattr(orchestrator, "_prefetch_baselines", record_prefetch)
+        report = orchestrator.merge_tasks(requests)
+
+        assert set(report.file_results) == {"feature_1.py", "feature_2.py", "app.py"}
+        evolution = orchestrator.evolution_tracker.get_file_evolution("app.py")
+        assert {s.task_id for s in evolution.task_snapshots} == {"task-001", "task-002"}
+        # Uncaptured baselines come from main; files new in the tasks start empty
+        assert baselines == {
+            "app.py": "def main():\n    pass\n",
+            "feature_1.py": "",
+            "feature_2.py": "",
+        }
+
+    def test_pooled_merge_redoes_ai_conflicts_in_process(
+        self, temp_project, monkeypatch
+    ):
+        """Files left with AI-resolvable conflicts are merged again with AI."""
+        monkeypatch.setattr(orchestrator_module, "ProcessPoolExecutor", InlineExecutor)
+        monkeypatch.setattr(orchestrator_module, "PARALLEL_MERGE_THRESHOLD", 1)
+        monkeypatch.setattr(orchestrator_module, "MAX_MERGE_WORKERS", 2)
+        resolver = StubAIResolver()
+        orchestrator = MergeOrchestrator(
+            temp_project, ai_resolver=resolver, dry_run=True
+        )
+        baseline = "def f():\n    return 0\n"
+        jobs = [
+            ("a.py", baseline, [_modify_f("task-001", 1), _modify_f("task-002", 5)]),
+            ("b.py", baseline, [_modify_f("task-001", 1)]),
+        ]
+
+        results = orchestrator._merge_files(jobs)
+
+        assert resolver.calls == 1
+        assert results[0].decision == MergeDecision.AI_MERGED
+        assert results[0].ai_calls_made == 1
+        assert results[1].decision == MergeDecision.AUTO_MERGED
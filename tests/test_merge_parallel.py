@@ -20,10 +20,14 @@ import pytest
 # Add auto-claude directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
 
-from workspace import ParallelMergeTask, ParallelMergeResult
+from core.workspace.git_utils import create_conflict_file_with_git
+from workspace import ParallelMergeTask, ParallelMergeResult, _run_parallel_merges
 
-# _run_parallel_merges is not yet implemented - tests that use it are skipped
-_run_parallel_merges = None
+
+def _spaced(first: str, last: str) -> str:
+    """A file whose first and last lines are far enough apart to merge separately."""
+    middle = "".join(f"x{n} = {n}\n" for n in range(8))
+    return f"{first}\n{middle}{last}\n"
 
 
 class TestParallelMergeDataclasses:
@@ -101,13 +105,150 @@ class TestParallelMergeDataclasses:
 class TestParallelMergeRunner:
     """Tests for the parallel merge runner."""
 
-    @pytest.mark.skip(reason="_run_parallel_merges not yet implemented")
     def test_run_parallel_merges_empty_list(self, project_dir):
         """Running with empty task list returns empty results."""
         import asyncio
         results = asyncio.run(_run_parallel_merges([], project_dir))
         assert results == []
 
+    def test_clean_three_way_merge_skips_ai(self, project_dir):
+        """Non-overlapping edits are git auto-merged without calling the AI."""
+        import asyncio
+
+        async def no_ai(system, user):
+            raise AssertionError("AI should not be called for clean merges")
+
+        task = ParallelMergeTask(
+            file_path="src/clean.py",
+            main_content="a = 10\nb = 2\nc = 3\nd = 4\ne = 5\n",
+            worktree_content="a = 1\nb = 2\nc = 3\nd = 4\ne = 50\n",
+            base_content="a = 1\nb = 2\nc = 3\nd = 4\ne = 5\n",
+            spec_name="001-clean",
+        )
+
+        results = asyncio.run(
+            _run_parallel_merges([task], project_dir, ai_call_fn=no_ai)
+        )
+
+        assert len(results) == 1
+        assert results[0].success is True
+        assert results[0].was_auto_merged is True
+        assert results[0].merged_content == "a = 10\nb = 2\nc = 3\nd = 4\ne = 50\n"
+
+    def test_conflicts_resolved_by_ai_and_streamed(self, project_dir):
+        """Conflicting files go to the AI; results stream back in task order."""
+        import asyncio
+
+        calls = []
+
+        async def fake_ai(system, user):
+            calls.append(user)
+            return "--- CONFLICT_1 RESOLVED ---\n```python\nvalue = 3\n```\n"
+
+        tasks = [
+            ParallelMergeTask(
+                file_path=f"src/conflict{i}.py",
+                main_content="value = 1\n",
+                worktree_content="value = 2\n",
+                base_content="value = 0\n",
+                spec_name="001-conflict",
+            )
+            for i in range(3)
+        ]
+        streamed = []
+
+        results = asyncio.run(
+            _run_parallel_merges(
+                tasks,
+                project_dir,
+                max_concurrent=2,
+                ai_call_fn=fake_ai,
+                on_result=streamed.append,
+            )
+        )
+
+        assert len(calls) == 3
+        assert [r.file_path for r in results] == [t.file_path for t in tasks]
+        assert all(r.success and not r.was_auto_merged for r in results)
+        assert results[0].merged_content == "value = 3\n"
+        assert sorted(r.file_path for r in streamed) == sorted(t.file_path for t in tasks)
+
+    def test_multiple_conflicts_sent_to_ai(self, project_dir):
+        """git merge-file exits with 2 for two conflicts; both reach the AI."""
+        import asyncio
+
+        calls = []
+
+        async def fake_ai(system, user):
+            calls.append(user)
+            return (
+                "--- CONFLICT_1 RESOLVED ---\n```python\na = 3\n```\n"
+                "--- CONFLICT_2 RESOLVED ---\n```python\ne = 30\n```\n"
+            )
+
+        task = ParallelMergeTask(
+            file_path="src/two.py",
+            main_content=_spaced("a = 1", "e = 10"),
+            worktree_content=_spaced("a = 2", "e = 20"),
+            base_content=_spaced("a = 0", "e = 0"),
+            spec_name="001-two",
+        )
+
+        results = asyncio.run(
+            _run_parallel_merges([task], project_dir, ai_call_fn=fake_ai)
+        )
+
+        assert len(calls) == 1
+        assert "CONFLICT_2" in calls[0]
+        assert results[0].success is True
+        assert results[0].was_auto_merged is False
+        assert results[0].merged_content == _spaced("a = 3", "e = 30")
+
+    def test_ai_timeout_reports_failure(self, project_dir):
+        """A slow AI merge is cut off by the per-file timeout."""
+        import asyncio
+
+        async def slow_ai(system, user):
+            await asyncio.sleep(5)
+            return ""
+
+        task = ParallelMergeTask(
+            file_path="src/slow.py",
+            main_content="value = 1\n",
+            worktree_content="value = 2\n",
+            base_content="value = 0\n",
+            spec_name="001-slow",
+        )
+
+        results = asyncio.run(
+            _run_parallel_merges([task], project_dir, timeout=0.1, ai_call_fn=slow_ai)
+        )
+
+        assert results[0].success is False
+        assert "timed out" in results[0].error
+
+    def test_invalid_ai_output_rejected(self, project_dir):
+        """AI output that fails syntax validation is not accepted."""
+        import asyncio
+
+        async def broken_ai(system, user):
+            return "--- CONFLICT_1 RESOLVED ---\n```python\nvalue = (\n```\n"
+
+        task = ParallelMergeTask(
+            file_path="src/broken.py",
+            main_content="value = 1\n",
+            worktree_content="value = 2\n",
+            base_content="value = 0\n",
+            spec_name="001-broken",
+        )
+
+        results = asyncio.run(
+            _run_parallel_merges([task], project_dir, ai_call_fn=broken_ai)
+        )
+
+        assert results[0].success is False
+        assert "syntax" in results[0].error.lower()
+
     def test_parallel_merge_task_with_data(self):
         """ParallelMergeTask holds merge data correctly."""
         task = ParallelMergeTask(
@@ -123,6 +264,30 @@ class TestParallelMergeRunner:
         assert task.spec_name == "001-feature"
 
 
+class TestCreateConflictFileWithGit:
+    """Tests for the git merge-file three-way merge."""
+
+    def test_clean_merge(self, project_dir):
+        merged, had_conflicts = create_conflict_file_with_git(
+            _spaced("a = 1", "e = 0"),
+            _spaced("a = 0", "e = 2"),
+            _spaced("a = 0", "e = 0"),
+            project_dir,
+        )
+        assert merged == _spaced("a = 1", "e = 2")
+        assert had_conflicts is False
+
+    def test_several_conflicts_are_not_errors(self, project_dir):
+        merged, had_conflicts = create_conflict_file_with_git(
+            _spaced("a = 1", "e = 10"),
+            _spaced("a = 2", "e = 20"),
+            _spaced("a = 0", "e = 0"),
+            project_dir,
+        )
+        assert had_conflicts is True
+        assert merged.count("<<<<<<<") == 2
+
+
 class TestParallelMergeIntegration:
     """Integration tests for parallel merge flow."""
 
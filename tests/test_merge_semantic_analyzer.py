@@ -11,6 +11,8 @@ Covers:
 - React hook detection
 - File structure analysis
 - Supported file types
+- Byte offset to line mapping and parse caching
+- Incremental re-parsing of a task's successive versions of a file
 """
 
 import sys
@@ -233,3 +235,206 @@ class TestEdgeCases:
         # Should complete without issues
         assert analysis is not None
         assert len(analysis.changes) > 0
+
+
+class TestLineMapping:
+    """Tests for byte offset to line number conversion."""
+
+    def test_line_lookup_counts_utf8_bytes(self):
+        """Offsets past multi-byte characters map to the right line."""
+        from merge.semantic_analyzer import _line_lookup
+
+        source = "# héllo wörld ✓\ndef a():\n    pass\n".encode("utf-8")
+        get_line = _line_lookup(source)
+
+        assert get_line(0) == 1
+        assert get_line(source.index(b"def")) == 2
+        assert get_line(source.index(b"pass")) == 3
+        assert get_line(len(source)) == 4
+
+    def test_line_lookup_matches_newline_count(self):
+        """Lookup agrees with counting newlines before the offset."""
+        from merge.semantic_analyzer import _line_lookup
+
+        source = b"a\n\nbb\nccc\n"
+        get_line = _line_lookup(source)
+
+        for pos in range(len(source) + 1):
+            assert get_line(pos) == source[:pos].count(b"\n") + 1
+
+
+class FakeNode:
+    """Top-level node of the fake line language (one per line)."""
+
+    def __init__(self, start_byte: int, end_byte: int):
+        self.start_byte = start_byte
+        self.end_byte = end_byte
+        self.children = []
+
+
+class FakeTree:
+    """Tree of the fake line language, recording incremental edits."""
+
+    def __init__(self, source_bytes: bytes):
+        self.root_node = FakeNode(0, len(source_bytes))
+        pos = 0
+        for line in source_bytes.split(b"\n"):
+            if line:
+                self.root_node.children.append(FakeNode(pos, pos + len(line)))
+            pos += len(line) + 1
+        self.edits = []
+
+    def copy(self):
+        copied = FakeTree(b"")
+        copied.root_node = self.root_node
+        return copied
+
+    def edit(self, **edit):
+        self.edits.append(edit)
+
+    def changed_ranges(self, new_tree):
+        return []
+
+
+class FakeParser:
+    """Parser for the fake line language, recording what it parses."""
+
+    def __init__(self):
+        self.parses = []
+
+    def parse(self, source_bytes, old_tree=None):
+        self.parses.append((source_bytes, old_tree))
+        return FakeTree(source_bytes)
+
+
+@pytest.fixture
+def fake_analyzer(monkeypatch):
+    """Analyzer parsing .py files as "name = value" lines with a fake parser."""
+    from merge import semantic_analyzer as module
+
+    extracted = []
+
+    def fake_extract(node, elements, get_text, get_line):
+        for child in node.children:
+            text = get_text(child)
+            extracted.append(text)
+            name = text.split("=")[0].strip()
+            elements[f"variable:{name}"] = module.ExtractedElement(
+                element_type="variable",
+                name=name,
+                start_line=get_line(child.start_byte),
+                end_line=get_line(child.end_byte),
+                content=text,
+            )
+
+    monkeypatch.setattr(module, "extract_python_elements", fake_extract, raising=False)
+    analyzer = module.SemanticAnalyzer()
+    parser = analyzer._parsers[".py"] = FakeParser()
+    return analyzer, parser, extracted
+
+
+def _changes(analysis):
+    return sorted(
+        (c.change_type.value, c.target, c.line_start, c.line_end, c.content_after)
+        for c in analysis.changes
+    )
+
+
+class TestParseCache:
+    """Tests for reusing parsed versions across analyses."""
+
+    def test_baseline_parsed_once_across_tasks(self, fake_analyzer):
+        """Analyzing N task versions against one baseline parses it once."""
+        analyzer, parser, _ = fake_analyzer
+        baseline = "a = 1\nb = 2\n"
+
+        for i in range(5):
+            analyzer.analyze_diff("app.py", baseline, f"a = 1\nb = {i + 10}\n")
+
+        sources = [source for source, _ in parser.parses]
+        assert sources.count(baseline.encode("utf-8")) == 1
+        assert len(sources) == 6
+
+    def test_cache_is_bounded(self, fake_analyzer, monkeypatch):
+        """Least recently used versions are evicted."""
+        from merge import semantic_analyzer as module
+
+        analyzer, parser, _ = fake_analyzer
+        monkeypatch.setattr(module, "PARSE_CACHE_SIZE", 2)
+
+        for source in ("a = 1\n", "b = 2\n", "c = 3\n"):
+            analyzer.analyze_file("app.py", source)
+        analyzer.analyze_file("app.py", "a = 1\n")
+
+        sources = [source for source, _ in parser.parses]
+        assert sources.count(b"a = 1\n") == 2
+        assert len(analyzer._parse_cache) == 2
+
+
+class TestIncrementalParsing:
+    """Tests for re-parsing a task's file from its previous tree."""
+
+    def test_edit_range(self):
+        """The edit is the span between the common prefix and suffix."""
+        from merge.semantic_analyzer import _edit_range
+
+        assert _edit_range(b"abcXdef", b"abcYYdef") == (3, 4, 5)
+        assert _edit_range(b"abc", b"abcd") == (3, 3, 4)
+        assert _edit_range(b"aaaa", b"aa") == (2, 4, 2)
+        assert _edit_range(b"same", b"same") == (4, 4, 4)
+
+    def test_reparse_uses_edited_previous_tree(self, fake_analyzer):
+        """The second version of a task's file is parsed from the first."""
+        analyzer, parser, extracted = fake_analyzer
+        baseline = "".join(f"v{i} = {i}\n" for i in range(50))
+        first = baseline.replace("v10 = 10", "v10 = 100")
+        second = first.replace("v40 = 40", "v40 = 400")
+
+        analyzer.analyze_diff("app.py", baseline, first, task_id="task-001")
+        extracted.clear()
+        analysis = analyzer.analyze_diff("app.py", baseline, second, task_id="task-001")
+
+        source, old_tree = parser.parses[-1]
+        assert source == second.encode("utf-8")
+        assert old_tree is not None
+        edit = old_tree.edits[0]
+        assert edit["start_point"] == (40, 8)
+        assert edit["old_end_point"] == (40, 8)
+        assert edit["new_end_point"] == (40, 9)
+        # Only the edited line was re-extracted
+        assert extracted == ["v40 = 400"]
+        assert {c.target for c in analysis.changes} == {"v10", "v40"}
+
+    def test_incremental_matches_full_parse(self, fake_analyzer):
+        """Edits that shift lines produce the same changes as a full parse."""
+        from merge.semantic_analyzer import SemanticAnalyzer
+
+        analyzer, parser, _ = fake_analyzer
+        full = SemanticAnalyzer()
+        full._parsers[".py"] = FakeParser()
+
+        baseline = "".join(f"v{i} = {i}\n" for i in range(20))
+        versions = [
+            baseline.replace("v3 = 3\n", "v3 = 3\nnew = 'é'\n"),
+        ]
+        versions.append(versions[-1].replace("v15 = 15", "v15 = 'ü'"))
+        versions.append(versions[-1].replace("v0 = 0\nv1 = 1\n", ""))
+        versions.append(versions[-1] + "tail = 1\n")
+
+        for version in versions:
+            incremental = analyzer.analyze_diff(
+                "app.py", baseline, version, task_id="task-001"
+            )
+            assert _changes(incremental) == _changes(
+                full.analyze_diff("app.py", baseline, version)
+            )
+        assert sum(old is not None for _, old in parser.parses) == len(versions) - 1
+
+    def test_versions_tracked_per_task(self, fake_analyzer):
+        """Another task's edits to the same file start from a full parse."""
+        analyzer, parser, _ = fake_analyzer
+
+        analyzer.analyze_diff("app.py", "", "a = 1\n", task_id="task-001")
+        analyzer.analyze_diff("app.py", "", "a = 2\n", task_id="task-002")
+
+        assert parser.parses[-1][1] is None
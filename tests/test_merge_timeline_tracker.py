@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Tests for FileTimelineTracker Storage
+=====================================
+
+Tests merge/timeline_tracker.py and merge/timeline_persistence.py:
+- Timelines loaded lazily from the sharded layout
+- Write-behind: one write per timeline and per index per event
+- Commit metadata fetched once per main-branch commit
+- Reading the flat layout and file-list index of older versions
+- Files whose saved content is missing are skipped, not merged as empty
+"""
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add auto-claude directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "auto-claude"))
+
+from merge import FileTimelineTracker
+from merge.timeline_persistence import TimelinePersistence
+
+
+def _commit(repo: Path, files: dict[str, str], message: str) -> str:
+    for name, content in files.items():
+        path = repo / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    subprocess.run(["git", "add", "."], cwd=repo, capture_output=True, check=True)
+    subprocess.run(
+        ["git", "commit", "-m", message], cwd=repo, capture_output=True, check=True
+    )
+    return subprocess.run(
+        ["git", "rev-parse", "HEAD"],
+        cwd=repo,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(temp_git_repo: Path) -> Path:
+    """Git repo with 20 committed source modules."""
+    _commit(
+        temp_git_repo,
+        {f"src/mod{i}.py": f"value = {i}\n" for i in range(20)},
+        "Add modules",
+    )
+    return temp_git_repo
+
+
+FILES = [f"src/mod{i}.py" for i in range(20)]
+
+
+def _count_calls(monkeypatch, obj, name: str) -> list:
+    calls = []
+    original = getattr(obj, name)
+
+    def wrapper(*args, **kwargs):
+        calls.append(args)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(obj, name, wrapper)
+    return calls
+
+
+class TestWriteBehind:
+    """Tests for coalesced timeline and index writes."""
+
+    def test_task_start_writes_index_once(self, repo: Path, monkeypatch):
+        tracker = FileTimelineTracker(repo)
+        saves = _count_calls(monkeypatch, tracker.persistence, "save_timeline")
+        index_writes = _count_calls(monkeypatch, tracker.persistence, "update_index")
+
+        tracker.on_task_start("task-001", FILES, task_intent="Refactor")
+
+        assert len(saves) == len(FILES)
+        assert len(index_writes) == 1
+        index = json.loads(tracker.persistence.index_path.read_text())
+        assert index["files"]["src/mod3.py"] == ["task-001"]
+        view = tracker.get_timeline("src/mod3.py").get_task_view("task-001")
+        assert view.branch_point.content == "value = 3\n"
+
+    def test_worktree_change_does_not_rewrite_index(self, repo: Path, monkeypatch):
+        tracker = FileTimelineTracker(repo)
+        tracker.on_task_start("task-001", FILES[:2])
+        index_writes = _count_calls(monkeypatch, tracker.persistence, "update_index")
+        saves = _count_calls(monkeypatch, tracker.persistence, "save_timeline")
+
+        tracker.on_task_worktree_change("task-001", "src/mod0.py", "value = 100\n")
+
+        assert len(saves) == 1
+        assert index_writes == []
+
+    def test_batch_updates_coalesce_writes(self, repo: Path, monkeypatch):
+        tracker = FileTimelineTracker(repo)
+        tracker.on_task_start("task-001", FILES[:1])
+        saves = _count_calls(monkeypatch, tracker.persistence, "save_timeline")
+
+        with tracker.batch_updates():
+            for i in range(5):
+                tracker.on_task_worktree_change("task-001", "src/mod0.py", f"v{i}")
+            assert saves == []
+
+        assert len(saves) == 1
+        reloaded = FileTimelineTracker(repo).get_timeline("src/mod0.py")
+        assert reloaded.get_task_view("task-001").worktree_state.content == "v4"
+
+
+class TestLazyLoading:
+    """Tests for loading timelines on first access."""
+
+    def test_only_accessed_timelines_are_loaded(self, repo: Path, monkeypatch):
+        FileTimelineTracker(repo).on_task_start("task-001", FILES)
+
+        tracker = FileTimelineTracker(repo)
+        loads = _count_calls(monkeypatch, tracker.persistence, "load_timeline")
+
+        assert tracker.has_timeline("src/mod5.py")
+        assert tracker.get_files_for_task("task-001") == FILES
+        assert loads == []
+
+        assert tracker.get_timeline("src/mod5.py") is not None
+        assert tracker.get_pending_tasks_for_file("src/mod5.py")[0].task_id == (
+            "task-001"
+        )
+        assert len(loads) == 1
+
+    def test_timelines_are_sharded(self, repo: Path):
+        tracker = FileTimelineTracker(repo)
+        tracker.on_task_start("task-001", FILES)
+
+        timelines_dir = tracker.persistence.timelines_dir
+        assert not list(timelines_dir.glob("*_mod*.json"))
+        assert len(list(timelines_dir.glob("*/*.json"))) == len(FILES)
+
+    def test_reads_legacy_layout(self, repo: Path):
+        tracker = FileTimelineTracker(repo)
+        tracker.on_task_start("task-001", ["src/mod1.py"])
+        persistence = tracker.persistence
+
+        # Rewrite as an older version would have stored it
+        sharded = persistence._get_timeline_file_path("src/mod1.py")
+        sharded.rename(persistence.timelines_dir / "src_mod1.py.json")
+        persistence.index_path.write_text(json.dumps({"files": ["src/mod1.py"]}))
+
+        tracker = FileTimelineTracker(repo)
+        assert tracker.get_files_for_task("task-001") == ["src/mod1.py"]
+
+        tracker.on_task_worktree_change("task-001", "src/mod1.py", "value = 9\n")
+
+        assert sharded.exists()
+        assert not (persistence.timelines_dir / "src_mod1.py.json").exists()
+        assert TimelinePersistence(repo / ".auto-claude").load_index() == {
+            "src/mod1.py": ["task-001"]
+        }
+
+
+class TestMainBranchCommit:
+    """Tests for the post-commit hook path."""
+
+    def test_commit_info_fetched_once(self, repo: Path, monkeypatch):
+        tracker = FileTimelineTracker(repo)
+        tracker.on_task_start("task-001", FILES)
+        commit = _commit(
+            repo,
+            {**{f: "value = 0  # edited\n" for f in FILES}, "other.py": "x = 1\n"},
+            "Edit every module",
+        )
+        info_calls = _count_calls(monkeypatch, tracker.git, "get_commit_info")
+
+        tracker.on_main_branch_commit(commit)
+
+        assert len(info_calls) == 1
+        assert not tracker.has_timeline("other.py")
+        event = tracker.get_timeline("src/mod7.py").get_current_main_state()
+        assert event.commit_message == "Edit every module"
+        assert event.author == "Test User"
+        assert event.content == "value = 0  # edited\n"
+        assert tracker.get_task_drift("task-001")["src/mod7.py"] == 1
+
+    def test_untracked_commit_skips_git_metadata(self, repo: Path, monkeypatch):
+        tracker = FileTimelineTracker(repo)
+        commit = _commit(repo, {"other.py": "x = 1\n"}, "Unrelated")
+        info_calls = _count_calls(monkeypatch, tracker.git, "get_commit_info")
+
+        tracker.on_main_branch_commit(commit)
+
+        assert info_calls == []
+
+
+class TestMissingContent:
+    """Tests for timelines whose content blobs are gone."""
+
+    def test_merge_context_skips_file(self, repo: Path):
+        tracker = FileTimelineTracker(repo)
+        tracker.on_task_start("task-001", FILES[:2])
+        tracker.persistence.blobs._path(
+            tracker.persistence.blobs.hash_content("value = 0\n")
+        ).unlink()
+
+        reader = FileTimelineTracker(repo)
+
+        assert reader.get_merge_context("task-001", "src/mod0.py") is None
+        context = reader.get_merge_context("task-001", "src/mod1.py")
+        assert context.current_main_content == "value = 1\n"
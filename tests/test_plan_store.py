@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+Tests for the Implementation Plan Store
+=======================================
+
+Tests implementation_plan/store.py:
+- Parsed plans cached until the file's stamp changes
+- Private copies and typed ImplementationPlan views
+- Locked, atomic read-modify-write without lost updates
+- Progress helpers reading the typed plan
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from core.progress import count_subtasks, get_current_phase, get_plan_summary
+from implementation_plan import ImplementationPlan, PlanStore, get_plan_store
+
+
+def _plan(n_subtasks: int = 3) -> dict:
+    return {
+        "feature": "Store",
+        "phases": [
+            {
+                "phase": 1,
+                "name": "Only",
+                "subtasks": [
+                    {"id": f"s-{i}", "description": f"Task {i}", "status": "pending"}
+                    for i in range(n_subtasks)
+                ],
+            }
+        ],
+    }
+
+
+def _write(plan_file: Path, plan: dict) -> None:
+    plan_file.write_text(json.dumps(plan, indent=2))
+    # Age the file past the racy window so it can be cached
+    old = time.time() - 5
+    os.utime(plan_file, (old, old))
+
+
+@pytest.fixture
+def counting_store(spec_dir: Path, monkeypatch):
+    store = PlanStore(spec_dir)
+    parses = []
+    original = store._parse
+
+    def parse():
+        parses.append(1)
+        return original()
+
+    monkeypatch.setattr(store, "_parse", parse)
+    return store, parses
+
+
+class TestReads:
+    """Tests for cached reads."""
+
+    def test_missing_plan(self, spec_dir: Path):
+        store = PlanStore(spec_dir)
+
+        assert store.read() is None
+        assert store.load() is None
+        assert store.plan() is None
+
+    def test_invalid_json_returns_none(self, spec_dir: Path):
+        (spec_dir / "implementation_plan.json").write_text("{not json")
+
+        assert PlanStore(spec_dir).read() is None
+
+    def test_parses_once_until_file_changes(self, spec_dir: Path, counting_store):
+        store, parses = counting_store
+        plan_file = spec_dir / "implementation_plan.json"
+        _write(plan_file, _plan(3))
+
+        for _ in range(5):
+            assert len(store.read()["phases"][0]["subtasks"]) == 3
+        assert len(parses) == 1
+
+        _write(plan_file, _plan(4))
+
+        assert len(store.read()["phases"][0]["subtasks"]) == 4
+        assert len(parses) == 2
+
+    def test_recent_writes_are_not_cached(self, spec_dir: Path, counting_store):
+        store, parses = counting_store
+        (spec_dir / "implementation_plan.json").write_text(json.dumps(_plan()))
+
+        store.read()
+        store.read()
+
+        assert len(parses) == 2
+
+    def test_load_returns_private_copy(self, spec_dir: Path):
+        _write(spec_dir / "implementation_plan.json", _plan())
+        store = PlanStore(spec_dir)
+
+        copy = store.load()
+        copy["phases"][0]["subtasks"][0]["status"] = "completed"
+
+        assert store.read()["phases"][0]["subtasks"][0]["status"] == "pending"
+
+    def test_typed_plan_is_cached(self, spec_dir: Path):
+        _write(spec_dir / "implementation_plan.json", _plan())
+        store = PlanStore(spec_dir)
+
+        typed = store.plan()
+
+        assert isinstance(typed, ImplementationPlan)
+        assert typed.feature == "Store"
+        assert store.plan() is typed
+
+    def test_typed_plan_off_schema_returns_none(self, spec_dir: Path):
+        plan = _plan()
+        plan["phases"][0]["subtasks"][0]["status"] = "skipped"
+        _write(spec_dir / "implementation_plan.json", plan)
+
+        assert PlanStore(spec_dir).plan() is None
+
+    def test_shared_store_per_directory(self, spec_dir: Path):
+        assert get_plan_store(spec_dir) is get_plan_store(Path(str(spec_dir) + "/"))
+
+
+class TestWrites:
+    """Tests for locked, atomic writes."""
+
+    def test_write_replaces_plan(self, spec_dir: Path):
+        _write(spec_dir / "implementation_plan.json", _plan(1))
+        store = PlanStore(spec_dir)
+        store.read()
+
+        store.write(_plan(2))
+
+        assert len(store.read()["phases"][0]["subtasks"]) == 2
+        assert not list(spec_dir.glob(".implementation_plan.*.tmp"))
+
+    def test_update_skips_write_when_unchanged(self, spec_dir: Path):
+        plan_file = spec_dir / "implementation_plan.json"
+        _write(plan_file, _plan())
+        before = plan_file.stat().st_mtime_ns
+
+        assert PlanStore(spec_dir).update(lambda plan: False) is False
+        assert plan_file.stat().st_mtime_ns == before
+
+    def test_update_missing_plan_raises(self, spec_dir: Path):
+        with pytest.raises(FileNotFoundError):
+            PlanStore(spec_dir).update(lambda plan: True)
+
+    def test_update_can_create_plan(self, spec_dir: Path):
+        def mutate(plan: dict) -> bool:
+            plan["qa_stats"] = {"total_iterations": 1}
+            return True
+
+        assert PlanStore(spec_dir).update(mutate, create=True) is True
+
+        plan = json.loads((spec_dir / "implementation_plan.json").read_text())
+        assert plan == {"qa_stats": {"total_iterations": 1}}
+
+    def test_update_plan_keeps_unmodelled_keys(self, spec_dir: Path):
+        plan = _plan()
+        plan["qa_iteration_history"] = [{"iteration": 1, "status": "approved"}]
+        plan["qa_signoff"] = {"status": "approved"}
+        for subtask in plan["phases"][0]["subtasks"]:
+            subtask["status"] = "completed"
+        _write(spec_dir / "implementation_plan.json", plan)
+
+        assert PlanStore(spec_dir).update_plan(lambda p: p.reset_for_followup())
+
+        saved = json.loads((spec_dir / "implementation_plan.json").read_text())
+        assert saved["qa_iteration_history"] == plan["qa_iteration_history"]
+        assert "qa_signoff" not in saved
+        assert saved["status"] == "ai_review"
+        assert saved["updated_at"]
+
+    def test_concurrent_updates_are_not_lost(self, spec_dir: Path):
+        _write(spec_dir / "implementation_plan.json", _plan(20))
+
+        def complete(subtask_id: str) -> None:
+            # Separate stores, as in separate processes
+            def mutate(plan: dict) -> bool:
+                for subtask in plan["phases"][0]["subtasks"]:
+                    if subtask["id"] == subtask_id:
+                        subtask["status"] = "completed"
+                return True
+
+            PlanStore(spec_dir).update(mutate)
+
+        threads = [
+            threading.Thread(target=complete, args=(f"s-{i}",)) for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        plan = json.loads((spec_dir / "implementation_plan.json").read_text())
+        statuses = {s["status"] for s in plan["phases"][0]["subtasks"]}
+        assert statuses == {"completed"}
+
+    def test_implementation_plan_save_is_atomic(self, spec_dir: Path):
+        plan = ImplementationPlan.from_dict(_plan())
+        plan_file = spec_dir / "implementation_plan.json"
+
+        plan.save(plan_file)
+
+        assert json.loads(plan_file.read_text())["feature"] == "Store"
+        assert not list(spec_dir.glob(".implementation_plan.*.tmp"))
+
+
+class TestProgressReaders:
+    """Tests for core/progress.py on the typed plan."""
+
+    def _followup_plan(self) -> dict:
+        return {
+            "feature": "Store",
+            "workflow_type": "feature",
+            "phases": [
+                {
+                    "id": "phase-1-backend",
+                    "name": "Backend",
+                    "subtasks": [
+                        {"id": "s-1", "description": "API", "status": "completed"}
+                    ],
+                },
+                {
+                    "phase": 2,
+                    "name": "Follow-Up: Docs",
+                    "type": "followup",
+                    "depends_on": ["phase-1-backend"],
+                    "subtasks": [
+                        {"id": "s-2", "description": "Docs", "status": "pending"}
+                    ],
+                },
+            ],
+        }
+
+    def test_counts_followup_phases(self, spec_dir: Path):
+        _write(spec_dir / "implementation_plan.json", self._followup_plan())
+
+        assert count_subtasks(spec_dir) == (1, 2)
+        assert get_current_phase(spec_dir) == {
+            "id": None,
+            "phase": 2,
+            "name": "Follow-Up: Docs",
+            "completed": 0,
+            "total": 1,
+        }
+
+    def test_summary_keeps_phase_ids(self, spec_dir: Path):
+        _write(spec_dir / "implementation_plan.json", self._followup_plan())
+
+        summary = get_plan_summary(spec_dir)
+
+        assert summary["workflow_type"] == "feature"
+        assert summary["completed_subtasks"] == 1
+        assert summary["pending_subtasks"] == 1
+        assert summary["phases"][0]["id"] == "phase-1-backend"
+        assert summary["phases"][1]["depends_on"] == ["phase-1-backend"]
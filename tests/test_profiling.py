@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Tests for Hot-Path Profiling
+============================
+
+Tests core/profiling.py:
+- Nested spans with total and self time (concurrent children counted once)
+- Counters and histograms
+- No recording while profiling is off
+- timings.json export
+- debug_timer / debug_async_timer spans
+"""
+
+import asyncio
+import json
+import time
+from pathlib import Path
+
+import pytest
+
+from core import profiling
+from core.debug import debug_async_timer, debug_timer
+from core.profiling import (
+    TIMINGS_FILE,
+    export_timings,
+    get_profiler,
+    profile_count,
+    profile_observe,
+    profile_span,
+    profiled,
+)
+
+
+@pytest.fixture
+def profiler(monkeypatch):
+    """Enabled, empty profiler; disabled again afterwards."""
+    instance = get_profiler()
+    monkeypatch.setattr(instance, "enabled", True)
+    instance.reset()
+    yield instance
+    instance.reset()
+
+
+class TestSpans:
+    """Tests for span timing."""
+
+    def test_nested_spans_record_self_time(self, profiler):
+        with profile_span("outer"):
+            time.sleep(0.02)
+            with profile_span("inner"):
+                time.sleep(0.03)
+
+        spans = profiler.snapshot()["spans"]
+        assert set(spans) == {"outer", "outer/inner"}
+        outer, inner = spans["outer"], spans["outer/inner"]
+        assert outer["total_ms"] >= inner["total_ms"] >= 25
+        assert outer["self_ms"] == pytest.approx(
+            outer["total_ms"] - inner["total_ms"], abs=0.01
+        )
+        assert profiler.hot_spans(1)[0][0] == "outer/inner"
+
+    def test_concurrent_children_count_wall_time_once(self, profiler):
+        async def child():
+            with profile_span("child"):
+                await asyncio.sleep(0.05)
+
+        async def parent():
+            with profile_span("parent"):
+                await asyncio.gather(*(child() for _ in range(4)))
+
+        asyncio.run(parent())
+
+        spans = profiler.snapshot()["spans"]
+        parent_stats, child_stats = spans["parent"], spans["parent/child"]
+        assert child_stats["count"] == 4
+        assert child_stats["total_ms"] > parent_stats["total_ms"]
+        assert 0 <= parent_stats["self_ms"] < 10
+
+    def test_profiled_sync_and_async(self, profiler):
+        @profiled("work.sync")
+        def sync_work():
+            return 1
+
+        @profiled("work.async")
+        async def async_work():
+            return 2
+
+        assert sync_work() + asyncio.run(async_work()) == 3
+        sync_work()
+
+        spans = profiler.snapshot()["spans"]
+        assert spans["work.sync"]["count"] == 2
+        assert spans["work.async"]["count"] == 1
+
+    def test_debug_timers_record_spans(self, profiler):
+        @debug_timer("merge")
+        def timed():
+            return "ok"
+
+        @debug_async_timer("merge")
+        async def timed_async():
+            return "ok"
+
+        timed()
+        asyncio.run(timed_async())
+
+        spans = profiler.snapshot()["spans"]
+        assert spans["merge.timed"]["count"] == 1
+        assert spans["merge.timed_async"]["count"] == 1
+
+
+class TestMetrics:
+    """Tests for counters and histograms."""
+
+    def test_counters_and_histograms(self, profiler):
+        profile_count("git.calls")
+        profile_count("git.calls", 2)
+        for value in (10.0, 20.0, 30.0):
+            profile_observe("llm.ttft.Engine", value)
+
+        snapshot = profiler.snapshot()
+        assert snapshot["counters"] == {"git.calls": 3}
+        ttft = snapshot["histograms"]["llm.ttft.Engine"]
+        assert ttft["count"] == 3
+        assert (ttft["min_ms"], ttft["p50_ms"], ttft["max_ms"]) == (10.0, 20.0, 30.0)
+
+
+class TestDisabled:
+    """Tests for the profiling-off fast path."""
+
+    def test_nothing_recorded_when_disabled(self, profiler, monkeypatch):
+        monkeypatch.setattr(profiler, "enabled", False)
+
+        with profile_span("hidden"):
+            profile_count("hidden")
+            profile_observe("hidden", 1.0)
+
+        snapshot = profiler.snapshot()
+        assert snapshot["spans"] == {}
+        assert snapshot["counters"] == {}
+        assert snapshot["histograms"] == {}
+
+    def test_export_skipped_when_disabled(self, profiler, monkeypatch, temp_dir: Path):
+        monkeypatch.setattr(profiler, "enabled", False)
+
+        assert export_timings(temp_dir) is None
+        assert not (temp_dir / TIMINGS_FILE).exists()
+
+
+class TestExport:
+    """Tests for timings.json."""
+
+    def test_export_writes_timings_json(self, profiler, spec_dir: Path):
+        with profile_span("context.build"):
+            pass
+
+        path = export_timings(spec_dir)
+
+        assert path == spec_dir / TIMINGS_FILE
+        data = json.loads(path.read_text())
+        assert data["spans"]["context.build"]["count"] == 1
+        assert not list(spec_dir.glob(".timings.json.tmp"))
+
+    def test_format_hot_spans(self, profiler):
+        assert "No profiled spans" in profiling.format_hot_spans()
+
+        with profile_span("analyzer.project_index"):
+            pass
+
+        assert "analyzer.project_index" in profiling.format_hot_spans()
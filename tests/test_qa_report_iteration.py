@@ -11,6 +11,7 @@ Tests the iteration tracking functionality of qa/report.py including:
 
 import json
 import sys
+import threading
 from pathlib import Path
 
 import pytest
@@ -150,6 +151,23 @@ class TestRecordIteration:
         plan = load_implementation_plan(spec_dir)
         assert "qa_iteration_history" in plan
 
+    def test_concurrent_records_are_not_lost(self, spec_with_plan: Path) -> None:
+        """Test that iterations recorded at the same time all land in the plan."""
+        threads = [
+            threading.Thread(
+                target=record_iteration, args=(spec_with_plan, n, "rejected", [])
+            )
+            for n in range(1, 11)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        plan = json.loads((spec_with_plan / "implementation_plan.json").read_text())
+        assert len(plan["qa_iteration_history"]) == 10
+        assert plan["qa_stats"]["total_iterations"] == 10
+
     def test_rounds_duration(self, spec_with_plan: Path) -> None:
         """Test that duration is rounded to 2 decimal places."""
         record_iteration(spec_with_plan, 1, "rejected", [], 12.345678)
@@ -29,6 +29,7 @@ from security import (
     validate_mongosh_command,
     validate_mysqladmin_command,
     get_command_for_validation,
+    reset_decision_cache,
     reset_profile_cache,
 )
 from project_analyzer import SecurityProfile, BASE_COMMANDS
@@ -307,6 +308,63 @@ class TestValidateCommand:
         assert allowed is True
 
 
+class TestDecisionCache:
+    """Tests for memoized command decisions."""
+
+    def test_repeated_command_uses_cache(self, temp_dir, monkeypatch):
+        """A repeated command is not re-parsed."""
+        from security import hooks
+
+        reset_profile_cache()
+        reset_decision_cache()
+        assert validate_command("rm -rf /", temp_dir)[0] is False
+
+        def fail(*args, **kwargs):
+            raise AssertionError("command was re-parsed")
+
+        monkeypatch.setattr(hooks, "extract_commands", fail)
+        assert validate_command("rm -rf /", temp_dir)[0] is False
+        assert validate_command("  rm -rf /  ", temp_dir)[0] is False
+
+    def test_stateful_validator_reruns(self, temp_dir, monkeypatch):
+        """git commit is re-validated on every call (depends on staged files)."""
+        from security import hooks
+
+        reset_profile_cache()
+        reset_decision_cache()
+        results = iter([(True, ""), (False, "secrets staged")])
+        monkeypatch.setitem(hooks.VALIDATORS, "git", lambda cmd: next(results))
+
+        assert validate_command("git commit -m 'x'", temp_dir) == (True, "")
+        assert validate_command("git commit -m 'x'", temp_dir) == (
+            False,
+            "secrets staged",
+        )
+
+    def test_profile_change_invalidates(self):
+        """Decisions are keyed by the profile's allow-set."""
+        profile = SecurityProfile()
+        profile.base_commands = BASE_COMMANDS.copy()
+        before = profile.fingerprint
+
+        profile.custom_commands = {"terraform"}
+
+        assert profile.fingerprint != before
+        assert "terraform" in profile.allowed_commands
+
+    def test_in_place_edit_invalidates(self):
+        """Editing a set in place without changing its size is picked up."""
+        profile = SecurityProfile(custom_commands={"terraform"})
+        before = profile.fingerprint
+
+        profile.custom_commands.discard("terraform")
+        profile.custom_commands.add("pulumi")
+
+        assert profile.fingerprint != before
+        assert "pulumi" in profile.allowed_commands
+        assert "terraform" not in profile.allowed_commands
+
+
 class TestGetCommandForValidation:
     """Tests for finding command segment for validation."""
 
@@ -370,6 +428,91 @@ class TestSecurityProfileIntegration:
 
         assert profile1 is profile2
 
+    def test_worktree_gets_own_profile(self, python_project):
+        """Worktrees are analyzed on their own - their stack can diverge."""
+        import json
+
+        from security import get_security_profile, reset_profile_cache
+        reset_profile_cache()
+
+        worktree = python_project / ".worktrees" / "001-feature"
+        worktree.mkdir(parents=True)
+        (worktree / "package.json").write_text(
+            json.dumps({"name": "web", "scripts": {"dev": "vite"}})
+        )
+
+        parent = get_security_profile(python_project)
+        profile = get_security_profile(worktree)
+
+        assert profile is not parent
+        assert "npm" in profile.get_all_allowed_commands()
+        assert get_security_profile(worktree) is profile
+
+    def test_slow_analysis_does_not_block_other_projects(
+        self, python_project, tmp_path, monkeypatch
+    ):
+        """Only lookups for the project being analyzed wait on it."""
+        import threading
+
+        from security import get_security_profile, profile as profile_module
+        reset_profile_cache()
+
+        real = profile_module.get_or_create_profile
+        started = threading.Event()
+        release = threading.Event()
+
+        def slow(project_dir, spec_dir=None):
+            if project_dir == python_project.resolve():
+                started.set()
+                release.wait(5)
+            return real(project_dir, spec_dir)
+
+        monkeypatch.setattr(profile_module, "get_or_create_profile", slow)
+        slow_lookup = threading.Thread(
+            target=get_security_profile, args=(python_project,)
+        )
+        slow_lookup.start()
+        try:
+            assert started.wait(5)
+            # Returns while the python project is still being analyzed
+            assert get_security_profile(tmp_path) is not None
+            assert slow_lookup.is_alive()
+        finally:
+            release.set()
+            slow_lookup.join(5)
+
+    def test_cache_holds_multiple_projects(self, python_project, tmp_path):
+        """Switching projects does not evict the other project's profile."""
+        from security import get_security_profile, reset_profile_cache
+        reset_profile_cache()
+
+        python_profile = get_security_profile(python_project)
+        other_profile = get_security_profile(tmp_path)
+
+        assert python_profile is not other_profile
+        assert get_security_profile(python_project) is python_profile
+        assert get_security_profile(tmp_path) is other_profile
+
+    def test_revalidates_after_ttl(self, python_project, monkeypatch):
+        """A changed project is re-analyzed once the revalidation TTL passes."""
+        import json
+
+        from security import get_security_profile, profile as profile_module
+        reset_profile_cache()
+
+        profile1 = get_security_profile(python_project)
+        (python_project / "package.json").write_text(
+            json.dumps({"name": "web", "scripts": {"dev": "vite"}})
+        )
+
+        assert get_security_profile(python_project) is profile1
+
+        monkeypatch.setattr(profile_module, "PROFILE_REVALIDATE_SECONDS", 0.0)
+        profile2 = get_security_profile(python_project)
+
+        assert profile2 is not profile1
+        assert "npm" in profile2.get_all_allowed_commands()
+
 
 class TestGitCommitValidator:
     """Tests for git commit validation (secret scanning)."""
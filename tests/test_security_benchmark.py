@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Micro-benchmarks for Command Validation
+=======================================
+
+Checks that memoized security.validate_command decisions match the original
+uncached validation over a realistic agent command corpus, and times it cold
+(empty decision cache) and warm.
+
+Run with timings printed:
+    pytest tests/test_security_benchmark.py -m slow -s
+"""
+
+import time
+from pathlib import Path
+
+import pytest
+
+from project_analyzer import is_command_allowed
+from security import (
+    extract_commands,
+    get_command_for_validation,
+    reset_decision_cache,
+    reset_profile_cache,
+    split_command_segments,
+    validate_command,
+)
+from security.profile import get_security_profile
+from security.validator import VALIDATORS
+
+# Commands agents actually issue during a build, plus a few that are blocked
+COMMAND_CORPUS = [
+    "ls -la",
+    "pwd",
+    "cat package.json",
+    "git status",
+    "git diff --stat",
+    "git log --oneline -10",
+    "git add -A",
+    "npm test",
+    "npm run build",
+    "npm install",
+    "npx tsc --noEmit",
+    "node scripts/seed.js",
+    "python -m pytest -x tests/",
+    "pytest -q tests/test_api.py::TestAuth",
+    "pip install -r requirements.txt",
+    "python manage.py migrate",
+    "ruff check . --fix",
+    "grep -rn 'TODO' src/ | head -20",
+    "find . -name '*.py' -not -path './.venv/*' | wc -l",
+    "cd frontend && npm run lint",
+    "mkdir -p build/out && cp dist/* build/out/",
+    "rm -rf node_modules/.cache",
+    "rm -rf /",
+    "chmod +x scripts/deploy.sh",
+    "chmod 777 /etc/passwd",
+    "pkill -f 'node server.js'",
+    "kill -9 1",
+    "curl -s http://localhost:3000/health",
+    "echo $PATH && which python",
+    "psql -d test_db -c 'SELECT 1'",
+    "dropdb production",
+    "format c:",
+    "sudo rm -rf /var",
+    "echo 'unterminated",
+]
+
+ITERATIONS = 20
+
+
+def _uncached_validate(command: str, profile) -> tuple[bool, str]:
+    """validate_command as it was before decisions were memoized."""
+    commands = extract_commands(command)
+    if not commands:
+        return False, "Could not parse command"
+
+    segments = split_command_segments(command)
+    for cmd in commands:
+        is_allowed_result, reason = is_command_allowed(cmd, profile)
+        if not is_allowed_result:
+            return False, reason
+
+        if cmd in VALIDATORS:
+            cmd_segment = get_command_for_validation(cmd, segments)
+            if not cmd_segment:
+                cmd_segment = command
+            allowed, reason = VALIDATORS[cmd](cmd_segment)
+            if not allowed:
+                return False, reason
+
+    return True, ""
+
+
+def _time_corpus(project_dir: Path, iterations: int) -> float:
+    """Mean seconds per validate_command call over the corpus."""
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for command in COMMAND_CORPUS:
+            validate_command(command, project_dir)
+    return (time.perf_counter() - start) / (iterations * len(COMMAND_CORPUS))
+
+
+class TestValidateCommandBenchmark:
+    """Timing and consistency checks for validate_command."""
+
+    def test_cached_decisions_match_uncached(self, python_project: Path):
+        reset_profile_cache()
+        reset_decision_cache()
+        profile = get_security_profile(python_project)
+
+        for command in COMMAND_CORPUS:
+            expected = _uncached_validate(command, profile)
+            # First call fills the cache, second is served from it
+            assert validate_command(command, python_project) == expected
+            assert validate_command(command, python_project) == expected
+
+    @pytest.mark.slow
+    def test_warm_validation_timing(self, python_project: Path):
+        reset_profile_cache()
+        reset_decision_cache()
+        get_security_profile(python_project)
+
+        cold = _time_corpus(python_project, 1)
+        warm = _time_corpus(python_project, ITERATIONS)
+
+        print(
+            f"\nvalidate_command over {len(COMMAND_CORPUS)} commands: "
+            f"cold {cold * 1e6:.1f}us/call, warm {warm * 1e6:.1f}us/call"
+        )
@@ -0,0 +1,152 @@
+#!/usr/bin/env python3
+"""
+Tests for the Status Manager
+============================
+
+Tests ui/status.py:
+- Atomic status file writes
+- Coalesced setter writes (flush interval, checkpoints, deferred flush)
+- Several concurrent builds sharing one status file
+"""
+
+import json
+import time
+from pathlib import Path
+
+from ui.status import BuildState, MultiBuildStatusManager, StatusManager
+
+
+def _count_writes(manager: StatusManager) -> list:
+    writes = []
+    original = manager._write_file
+
+    def write_file(status: dict) -> None:
+        writes.append(status)
+        original(status)
+
+    manager._write_file = write_file
+    return writes
+
+
+class TestWriteThrough:
+    """Tests for the default (uncoalesced) mode."""
+
+    def test_every_setter_writes(self, temp_dir: Path):
+        manager = StatusManager(temp_dir)
+        writes = _count_writes(manager)
+
+        manager.update_subtasks(completed=1, total=3)
+        manager.update_session(2)
+
+        assert len(writes) == 2
+        assert manager.read().session_number == 2
+
+    def test_writes_are_atomic(self, temp_dir: Path):
+        manager = StatusManager(temp_dir)
+
+        manager.set_active("001-spec", BuildState.BUILDING)
+
+        data = json.loads((temp_dir / ".auto-claude-status").read_text())
+        assert data["spec"] == "001-spec"
+        assert not list(temp_dir.glob(".auto-claude-status.*.tmp"))
+        assert not list((temp_dir / ".auto-claude").glob("*.tmp"))
+
+    def test_lock_and_temp_files_stay_out_of_project_root(self, temp_dir: Path):
+        MultiBuildStatusManager(temp_dir).set_active("001-spec", BuildState.BUILDING)
+
+        assert sorted(p.name for p in temp_dir.iterdir()) == [
+            ".auto-claude",
+            ".auto-claude-status",
+        ]
+        assert (temp_dir / ".auto-claude" / "status.lock").exists()
+
+
+class TestCoalescing:
+    """Tests for the flush-interval mode."""
+
+    def test_back_to_back_setters_write_once(self, temp_dir: Path):
+        manager = StatusManager(temp_dir, flush_interval_ms=10_000)
+        manager.set_active("001-spec", BuildState.BUILDING)
+        writes = _count_writes(manager)
+
+        manager.update_session(1)
+        manager.update_phase("Setup", 1, 3)
+        manager.update_subtasks(in_progress=1)
+        assert writes == []
+
+        manager.flush()
+
+        assert len(writes) == 1
+        status = manager.read()
+        assert (status.session_number, status.phase_current) == (1, "Setup")
+        assert status.subtasks_in_progress == 1
+
+    def test_state_changes_are_written_at_once(self, temp_dir: Path):
+        manager = StatusManager(temp_dir, flush_interval_ms=10_000)
+        manager.set_active("001-spec", BuildState.BUILDING)
+        writes = _count_writes(manager)
+
+        manager.update(state=BuildState.COMPLETE)
+
+        assert len(writes) == 1
+        assert manager.read().state == BuildState.COMPLETE
+
+    def test_pending_changes_flush_after_interval(self, temp_dir: Path):
+        manager = StatusManager(temp_dir, flush_interval_ms=50)
+        manager.set_active("001-spec", BuildState.BUILDING)
+
+        manager.update_session(7)
+        time.sleep(0.3)
+
+        assert manager.read().session_number == 7
+
+    def test_flush_without_changes_does_not_write(self, temp_dir: Path):
+        manager = StatusManager(temp_dir, flush_interval_ms=10_000)
+        writes = _count_writes(manager)
+
+        manager.flush()
+
+        assert writes == []
+
+
+class TestMultiBuild:
+    """Tests for concurrent builds sharing the status file."""
+
+    def test_builds_are_aggregated(self, temp_dir: Path):
+        first = MultiBuildStatusManager(temp_dir)
+        second = MultiBuildStatusManager(temp_dir)
+
+        first.set_active("001-first", BuildState.BUILDING)
+        second.set_active("002-second", BuildState.QA)
+        first.update_subtasks(completed=2, total=5)
+
+        builds = first.read_all()
+        assert set(builds) == {"001-first", "002-second"}
+        assert builds["001-first"].subtasks_completed == 2
+        assert builds["002-second"].state == BuildState.QA
+        # Top level shows the most recently updated build
+        assert StatusManager(temp_dir).read().spec == "001-first"
+
+    def test_inactive_build_is_removed(self, temp_dir: Path):
+        first = MultiBuildStatusManager(temp_dir)
+        second = MultiBuildStatusManager(temp_dir)
+        first.set_active("001-first", BuildState.BUILDING)
+        second.set_active("002-second", BuildState.BUILDING)
+
+        second.set_inactive()
+
+        assert set(first.read_all()) == {"001-first"}
+        assert StatusManager(temp_dir).read().spec == "001-first"
+
+    def test_attach_updates_only_its_build(self, temp_dir: Path):
+        MultiBuildStatusManager(temp_dir).set_active("001-first", BuildState.BUILDING)
+        MultiBuildStatusManager(temp_dir).set_active("002-second", BuildState.QA)
+
+        paused = MultiBuildStatusManager(temp_dir)
+        paused.attach("001-first")
+        paused.update(state=BuildState.PAUSED)
+
+        builds = paused.read_all()
+        assert set(builds) == {"001-first", "002-second"}
+        assert builds["001-first"].state == BuildState.PAUSED
+        assert builds["002-second"].state == BuildState.QA
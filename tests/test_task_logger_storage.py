@@ -0,0 +1,163 @@
+#!/usr/bin/env python3
+"""
+Tests for Task Log Storage
+==========================
+
+Tests the task_logger.storage module including:
+- Append-only journal writes
+- Snapshot compaction (record limit, timer, exit)
+- Rebuilding state from snapshot + journal tail
+"""
+
+import json
+import sys
+import time
+from pathlib import Path
+
+from task_logger.models import LogEntry, LogPhase
+from task_logger.storage import LogStorage, get_active_phase, load_task_logs
+
+
+def _entry(content: str, phase: str = LogPhase.CODING.value) -> LogEntry:
+    return LogEntry(
+        timestamp="2024-01-01T00:00:00+00:00",
+        type="text",
+        content=content,
+        phase=phase,
+    )
+
+
+class TestJournalWrites:
+    """Tests for append-only journal mode."""
+
+    def test_add_entry_appends_to_journal(self, spec_dir: Path):
+        """Entries are appended to the journal instead of rewriting the snapshot."""
+        storage = LogStorage(spec_dir)
+        storage.COMPACT_EVERY_SECONDS = 3600
+
+        storage.add_entry(_entry("first"))
+        storage.add_entry(_entry("second"))
+
+        journal = spec_dir / LogStorage.JOURNAL_FILE
+        lines = journal.read_text().splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[1])["entry"]["content"] == "second"
+        assert not (spec_dir / LogStorage.LOG_FILE).exists()
+
+    def test_compacts_after_record_limit(self, spec_dir: Path):
+        """Journal is folded into the snapshot once the record limit is hit."""
+        storage = LogStorage(spec_dir)
+        storage.COMPACT_EVERY_SECONDS = 3600
+        storage.COMPACT_EVERY_RECORDS = 3
+
+        for i in range(3):
+            storage.add_entry(_entry(f"entry {i}"))
+
+        assert not (spec_dir / LogStorage.JOURNAL_FILE).exists()
+        snapshot = json.loads((spec_dir / LogStorage.LOG_FILE).read_text())
+        assert len(snapshot["phases"]["coding"]["entries"]) == 3
+
+    def test_timer_compacts_without_further_records(self, spec_dir: Path):
+        """Pending records reach the snapshot even if no record follows."""
+        storage = LogStorage(spec_dir)
+        storage.COMPACT_EVERY_SECONDS = 0.05
+
+        storage.add_entry(_entry("only"))
+        deadline = time.monotonic() + 5
+        while (spec_dir / LogStorage.JOURNAL_FILE).exists():
+            assert time.monotonic() < deadline
+            time.sleep(0.02)
+
+        data = json.loads((spec_dir / LogStorage.LOG_FILE).read_text())
+        entries = data["phases"][LogPhase.CODING.value]["entries"]
+        assert [e["content"] for e in entries] == ["only"]
+
+    def test_exit_hook_compacts_pending_records(self, spec_dir: Path):
+        """Records still in the journal are compacted at interpreter exit."""
+        storage = LogStorage(spec_dir)
+        storage.COMPACT_EVERY_SECONDS = 3600
+        storage.add_entry(_entry("pending"))
+
+        # Some test modules swap a mock in for the task_logger package
+        sys.modules[LogStorage.__module__]._flush_live_storages()
+
+        assert not (spec_dir / LogStorage.JOURNAL_FILE).exists()
+        assert "pending" in (spec_dir / LogStorage.LOG_FILE).read_text()
+
+    def test_legacy_mode_rewrites_snapshot(self, spec_dir: Path):
+        """use_journal=False keeps the write-through behaviour."""
+        storage = LogStorage(spec_dir, use_journal=False)
+        storage.add_entry(_entry("only"))
+
+        assert not (spec_dir / LogStorage.JOURNAL_FILE).exists()
+        snapshot = json.loads((spec_dir / LogStorage.LOG_FILE).read_text())
+        assert snapshot["phases"]["coding"]["entries"][0]["content"] == "only"
+
+
+class TestJournalReplay:
+    """Tests for rebuilding state from snapshot + journal tail."""
+
+    def test_load_task_logs_includes_journal_tail(self, spec_dir: Path):
+        """load_task_logs sees entries that are not yet compacted."""
+        storage = LogStorage(spec_dir)
+        storage.COMPACT_EVERY_SECONDS = 3600
+        storage.add_entry(_entry("before"))
+        storage.save()
+        storage.add_entry(_entry("after"))
+
+        logs = load_task_logs(spec_dir)
+        contents = [e["content"] for e in logs["phases"]["coding"]["entries"]]
+        assert contents == ["before", "after"]
+
+    def test_load_task_logs_journal_only(self, spec_dir: Path):
+        """A journal without a snapshot still yields the full UI shape."""
+        storage = LogStorage(spec_dir)
+        storage.COMPACT_EVERY_SECONDS = 3600
+        storage.update_phase_status(LogPhase.PLANNING.value, "active")
+        storage.add_entry(_entry("plan", LogPhase.PLANNING.value))
+
+        logs = load_task_logs(spec_dir)
+        assert set(logs["phases"]) == {"planning", "coding", "validation"}
+        assert logs["phases"]["planning"]["entries"][0]["content"] == "plan"
+        assert get_active_phase(spec_dir) == "planning"
+
+    def test_snapshot_published_before_journal_removed(self, spec_dir: Path):
+        """A reader between snapshot rename and journal unlink sees no duplicates."""
+        storage = LogStorage(spec_dir)
+        storage.COMPACT_EVERY_SECONDS = 3600
+        storage.add_entry(_entry("first"))
+        storage.add_entry(_entry("second"))
+        journal = (spec_dir / LogStorage.JOURNAL_FILE).read_text()
+
+        storage.save()
+        # As if the reader ran before the old journal was unlinked
+        (spec_dir / LogStorage.JOURNAL_FILE).write_text(journal)
+
+        data = load_task_logs(spec_dir)
+        entries = data["phases"][LogPhase.CODING.value]["entries"]
+        assert [e["content"] for e in entries] == ["first", "second"]
+
+    def test_ignores_torn_trailing_line(self, spec_dir: Path):
+        """A partially written last line is skipped on replay."""
+        storage = LogStorage(spec_dir)
+        storage.COMPACT_EVERY_SECONDS = 3600
+        storage.add_entry(_entry("complete"))
+        storage._close_journal()
+        with open(spec_dir / LogStorage.JOURNAL_FILE, "a") as f:
+            f.write('{"op": "entry", "entry": {"conte')
+
+        logs = load_task_logs(spec_dir)
+        assert len(logs["phases"]["coding"]["entries"]) == 1
+
+    def test_reopen_folds_leftover_journal(self, spec_dir: Path):
+        """A new storage compacts a journal left behind by a previous run."""
+        storage = LogStorage(spec_dir)
+        storage.COMPACT_EVERY_SECONDS = 3600
+        storage.add_entry(_entry("left over"))
+        storage._close_journal()
+
+        reopened = LogStorage(spec_dir)
+
+        assert not (spec_dir / LogStorage.JOURNAL_FILE).exists()
+        entries = reopened.get_phase_data("coding")["entries"]
+        assert entries[0]["content"] == "left over"
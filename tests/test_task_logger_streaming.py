@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+Tests for Task Log Streaming
+============================
+
+Tests the task_logger.streaming module including:
+- Stdout markers when no listener is configured
+- Length-prefixed frames over a Unix socket
+- TEXT batching and ordering
+- Fallback to stdout when the listener is missing or goes away mid-write
+- Non-JSON payloads and unencodable markers
+"""
+
+import json
+import shutil
+import socket
+import tempfile
+from pathlib import Path
+
+import pytest
+
+from task_logger import streaming
+from task_logger.streaming import (
+    EVENT_SOCKET_ENV,
+    EventChannel,
+    close_event_channel,
+    decode_frames,
+    emit_marker,
+    encode_frame,
+)
+
+pytestmark = pytest.mark.skipif(
+    not hasattr(socket, "AF_UNIX"), reason="requires Unix domain sockets"
+)
+
+
+@pytest.fixture
+def listener(monkeypatch):
+    """A Unix socket the event channel connects to."""
+    # Socket paths are length-limited, so avoid deep pytest temp dirs
+    sock_dir = Path(tempfile.mkdtemp(prefix="tl-"))
+    path = sock_dir / "events.sock"
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(path))
+    server.listen(1)
+    server.settimeout(5)
+    monkeypatch.setenv(EVENT_SOCKET_ENV, str(path))
+    close_event_channel()
+    yield server
+    close_event_channel()
+    server.close()
+    shutil.rmtree(sock_dir, ignore_errors=True)
+
+
+def _receive(conn: socket.socket, count: int) -> list[tuple[str, dict]]:
+    events: list[tuple[str, dict]] = []
+    buffer = b""
+    while len(events) < count:
+        chunk = conn.recv(65536)
+        if not chunk:
+            break
+        decoded, buffer = decode_frames(buffer + chunk)
+        events.extend(decoded)
+    return events
+
+
+class TestFrames:
+    """Tests for the frame format."""
+
+    def test_round_trip_with_partial_buffer(self):
+        data = encode_frame("text", {"content": "héllo"}) + encode_frame(
+            "TOOL_END", {"tool": "Read"}
+        )
+
+        events, rest = decode_frames(data[:-3])
+        assert events == [("TEXT", {"content": "héllo"})]
+
+        more, rest = decode_frames(rest + data[-3:])
+        assert more == [("TOOL_END", {"tool": "Read"})]
+        assert rest == b""
+
+
+class TestEmitMarker:
+    """Tests for emit_marker transports."""
+
+    def test_stdout_without_listener(self, monkeypatch, capsys):
+        monkeypatch.delenv(EVENT_SOCKET_ENV, raising=False)
+        close_event_channel()
+
+        emit_marker("tool_start", {"tool": "Bash"})
+
+        out = capsys.readouterr().out.strip()
+        assert out == f"__TASK_LOG_TOOL_START__:{json.dumps({'tool': 'Bash'})}"
+
+    def test_falls_back_when_listener_missing(self, monkeypatch, capsys):
+        monkeypatch.setenv(EVENT_SOCKET_ENV, "/nonexistent/dir/events.sock")
+        close_event_channel()
+
+        emit_marker("TEXT", {"content": "hi"})
+        emit_marker("PHASE_END", {"phase": "coding"})
+        close_event_channel()
+
+        lines = capsys.readouterr().out.splitlines()
+        assert lines == [
+            '__TASK_LOG_TEXT__:{"content": "hi"}',
+            '__TASK_LOG_PHASE_END__:{"phase": "coding"}',
+        ]
+
+    def test_frames_preserve_order(self, listener, capsys):
+        emit_marker("TEXT", {"content": "a"})
+        conn, _ = listener.accept()
+        emit_marker("TEXT", {"content": "b"})
+        emit_marker("TOOL_START", {"tool": "Read"})
+        emit_marker("TEXT", {"content": "c"})
+        close_event_channel()
+
+        events = _receive(conn, 4)
+        conn.close()
+
+        assert events == [
+            ("TEXT", {"content": "a"}),
+            ("TEXT", {"content": "b"}),
+            ("TOOL_START", {"tool": "Read"}),
+            ("TEXT", {"content": "c"}),
+        ]
+        assert capsys.readouterr().out == ""
+
+    def test_text_is_batched_then_flushed(self, listener, monkeypatch):
+        monkeypatch.setattr(streaming, "TEXT_FLUSH_SECONDS", 0.5)
+        emit_marker("TEXT", {"content": "a"})
+        conn, _ = listener.accept()
+        conn.setblocking(False)
+        emit_marker("TEXT", {"content": "b"})
+
+        # Nothing is written until the batch ages out
+        with pytest.raises(BlockingIOError):
+            conn.recv(65536)
+
+        conn.settimeout(5)
+        assert _receive(conn, 2) == [
+            ("TEXT", {"content": "a"}),
+            ("TEXT", {"content": "b"}),
+        ]
+        conn.close()
+
+    def test_non_json_values_sent_as_str(self, listener, capsys):
+        emit_marker("TOOL_START", {"path": Path("src/app.py")})
+        conn, _ = listener.accept()
+        close_event_channel()
+
+        events = _receive(conn, 1)
+        conn.close()
+
+        assert events == [("TOOL_START", {"path": "src/app.py"})]
+        assert capsys.readouterr().out == ""
+
+    def test_unencodable_marker_dropped_alone(self, listener, capsys):
+        circular: dict = {}
+        circular["self"] = circular
+        emit_marker("TEXT", {"content": "a"})
+        conn, _ = listener.accept()
+        emit_marker("TOOL_START", circular)
+        emit_marker("TOOL_END", {"tool": "Read"})
+        close_event_channel()
+
+        events = _receive(conn, 2)
+        conn.close()
+
+        assert events == [("TEXT", {"content": "a"}), ("TOOL_END", {"tool": "Read"})]
+        assert capsys.readouterr().out == ""
+
+
+class _FlakySocket:
+    """Accepts the first `limit` bytes, then fails like a dropped peer."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.received = b""
+
+    def send(self, data) -> int:
+        room = self.limit - len(self.received)
+        if room <= 0:
+            raise BrokenPipeError("listener went away")
+        chunk = bytes(data[:room])
+        self.received += chunk
+        return len(chunk)
+
+    def close(self) -> None:
+        pass
+
+
+class TestPartialWrite:
+    """A listener lost mid-write only gets the undelivered frames on stdout."""
+
+    def test_fallback_skips_delivered_frames(self, capsys):
+        first = encode_frame("TEXT", {"content": "a"})
+        second = encode_frame("TEXT", {"content": "b"})
+        # Delivers the first frame and half of the second
+        sock = _FlakySocket(len(first) + len(second) // 2)
+        channel = EventChannel("unused")
+        channel._sock = sock
+
+        channel.send("TEXT", {"content": "a"})
+        channel.send("TEXT", {"content": "b"})
+        channel.send("TOOL_END", {"tool": "Read"})
+
+        events, _ = decode_frames(sock.received)
+        assert events == [("TEXT", {"content": "a"})]
+        assert channel.broken
+        out = capsys.readouterr().out.splitlines()
+        assert out == [
+            '__TASK_LOG_TEXT__:{"content": "b"}',
+            '__TASK_LOG_TOOL_END__:{"tool": "Read"}',
+        ]
+        channel.close()
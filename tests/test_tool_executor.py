@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Tests for the Tool Executor
+===========================
+
+Tests core/tools/executor.py:
+- Independent read-only calls run concurrently
+- Calls on the same path keep their order
+- Results carry their index for ordered history
+- Worker cap configuration
+"""
+
+import asyncio
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+from core.tools import builtin
+from core.tools.executor import ToolCall, ToolExecutor, _get_max_tool_workers
+
+
+def _run(executor: ToolExecutor, calls: list[ToolCall]) -> list:
+    async def collect():
+        return [done async for done in executor.run(calls)]
+
+    try:
+        return asyncio.run(collect())
+    finally:
+        executor.shutdown()
+
+
+class TestConcurrency:
+    """Tests for scheduling of tool calls."""
+
+    def test_reads_run_concurrently(self, temp_dir: Path):
+        for name in ("a.py", "b.py", "c.py"):
+            (temp_dir / name).write_text(name)
+        # Every read waits for the other two: only passes if all run at once
+        barrier = threading.Barrier(3, timeout=5)
+
+        def read_file(**kwargs):
+            barrier.wait()
+            return builtin.read_file(**kwargs)
+
+        calls = [
+            ToolCall(id=str(i), name="Read", args={"file_path": name})
+            for i, name in enumerate(("a.py", "b.py", "c.py"))
+        ]
+        with patch("core.tools.executor.read_file", side_effect=read_file):
+            results = _run(ToolExecutor(cwd=str(temp_dir)), calls)
+
+        by_index = {done.index: done for done in results}
+        assert [by_index[i].result for i in range(3)] == ["a.py", "b.py", "c.py"]
+        assert not any(done.is_error for done in results)
+
+    def test_same_path_keeps_call_order(self, temp_dir: Path):
+        calls = [
+            ToolCall(id="1", name="Write", args={"file_path": "f.txt", "content": "one"}),
+            ToolCall(id="2", name="Read", args={"file_path": "f.txt"}),
+            ToolCall(
+                id="3",
+                name="Edit",
+                args={
+                    "file_path": "f.txt",
+                    "target_content": "one",
+                    "replacement_content": "two",
+                },
+            ),
+            ToolCall(id="4", name="Read", args={"file_path": "f.txt"}),
+        ]
+
+        results = _run(ToolExecutor(cwd=str(temp_dir)), calls)
+
+        by_index = {done.index: done.result for done in results}
+        assert by_index[1] == "one"
+        assert by_index[3] == "two"
+        assert (temp_dir / "f.txt").read_text() == "two"
+
+    def test_bash_conflicts_with_everything(self, temp_dir: Path):
+        executor = ToolExecutor(cwd=str(temp_dir))
+        bash = executor.footprint(ToolCall("1", "Bash", {"command": "ls"}))
+        read = executor.footprint(ToolCall("2", "Read", {"file_path": "/x/a.py"}))
+        other = executor.footprint(ToolCall("3", "Read", {"file_path": "/x/b.py"}))
+        write = executor.footprint(ToolCall("4", "Write", {"file_path": "/x/b.py"}))
+        grep = executor.footprint(ToolCall("5", "Grep", {"query": "x"}))
+
+        assert bash.conflicts_with(read) and read.conflicts_with(bash)
+        assert not read.conflicts_with(other)
+        assert write.conflicts_with(other) and not write.conflicts_with(read)
+        assert grep.conflicts_with(write) and not grep.conflicts_with(read)
+
+
+class TestResults:
+    """Tests for result reporting."""
+
+    def test_unknown_tool_and_bad_args(self, temp_dir: Path):
+        calls = [
+            ToolCall(id="1", name="Teleport", args={}),
+            ToolCall(id="2", name="Read", args={"path": "missing"}),
+        ]
+
+        results = sorted(_run(ToolExecutor(cwd=str(temp_dir)), calls), key=lambda r: r.index)
+
+        assert results[0].result == "Error: Tool Teleport not implemented."
+        assert results[1].is_error
+        assert results[1].result.startswith("Error: Tool Read failed:")
+
+    def test_glob_defaults_to_cwd(self, temp_dir: Path):
+        (temp_dir / "src").mkdir()
+        (temp_dir / "src" / "app.py").write_text("")
+
+        [done] = _run(
+            ToolExecutor(cwd=str(temp_dir)),
+            [ToolCall(id="1", name="Glob", args={"pattern": "*.py"})],
+        )
+
+        assert done.result == [str(Path("src") / "app.py")]
+
+
+class TestMaxToolWorkers:
+    """Tests for the AUTO_CLAUDE_TOOL_WORKERS setting."""
+
+    def test_reads_env(self, monkeypatch):
+        monkeypatch.setenv("AUTO_CLAUDE_TOOL_WORKERS", "3")
+        assert _get_max_tool_workers() == 3
+
+    def test_invalid_env_falls_back(self, monkeypatch):
+        monkeypatch.setenv("AUTO_CLAUDE_TOOL_WORKERS", "many")
+        assert _get_max_tool_workers() == 8
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Tests for the Built-in File Search
+==================================
+
+Tests core/tools/search.py (behind the Glob/Grep tools):
+- SKIP_DIRS and .gitignore pruning, with and without git
+- Binary files skipped, large files scanned via mmap
+- Line-accurate regex matches and result caps
+- Reuse of the persistent context search index
+"""
+
+import subprocess
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from context.index import SearchIndex
+from core.tools import search
+from core.tools.builtin import glob_files, grep_files
+from core.tools.search import search_glob, search_grep
+
+
+def _write(path: Path, content) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    if isinstance(content, bytes):
+        path.write_bytes(content)
+    else:
+        path.write_text(content)
+
+
+@pytest.fixture
+def project(temp_dir: Path) -> Path:
+    _write(temp_dir / "src" / "app.py", "import os\n\ndef handler():\n    return TODO\n")
+    _write(temp_dir / "src" / "util.py", "def helper():\n    pass\n")
+    _write(temp_dir / "README.md", "TODO: document\n")
+    _write(temp_dir / "node_modules" / "dep" / "index.js", "// TODO vendored\n")
+    _write(temp_dir / "logs" / "run.log", "TODO in a log\n")
+    _write(temp_dir / ".gitignore", "logs/\n*.tmp\n")
+    _write(temp_dir / "scratch.tmp", "TODO scratch\n")
+    _write(temp_dir / "image.png", b"\x89PNG\0\0TODO")
+    return temp_dir
+
+
+class TestListing:
+    """Tests for which files are searched."""
+
+    def test_prunes_skip_dirs_and_gitignore_without_git(self, project: Path):
+        with patch.object(search, "_git_files", return_value=None):
+            files = search.list_files(project)
+
+        assert files == [".gitignore", "README.md", "image.png", "src/app.py", "src/util.py"]
+
+    def test_uses_git_when_available(self, project: Path):
+        subprocess.run(["git", "init", "-q"], cwd=project, check=True)
+
+        files = search.list_files(project)
+
+        assert "src/app.py" in files
+        assert "logs/run.log" not in files
+        assert "scratch.tmp" not in files
+        assert not any(f.startswith("node_modules/") for f in files)
+
+    def test_glob(self, project: Path):
+        assert glob_files("*.py", project) == [
+            str(Path("src/app.py")),
+            str(Path("src/util.py")),
+        ]
+        assert search_glob("src/*.py", project) == glob_files("*.py", project)
+        assert search_glob("*.js", project) == []
+
+    def test_glob_truncation_notice(self, project: Path):
+        for i in range(5):
+            _write(project / "many" / f"f{i}.txt", "")
+
+        found = search_glob("*.txt", project, max_results=3)
+
+        assert len(found) == 4
+        assert found[-1].startswith("[... 2 more files")
+
+
+class TestGrep:
+    """Tests for content search."""
+
+    def test_finds_matches_skipping_binary_and_ignored(self, project: Path):
+        with patch.object(search, "_git_files", return_value=None):
+            result = grep_files("todo", root_dir=project)
+
+        assert result.splitlines() == [
+            "README.md:1: TODO: document",
+            f"{Path('src/app.py')}:4: return TODO",
+        ]
+
+    def test_regex_is_checked_per_line(self, temp_dir: Path):
+        _write(temp_dir / "a.py", "foo\nbar\nfoo bar\r\nend foo\r\n")
+
+        assert search_grep(r"foo\s+bar", root=temp_dir) == "a.py:3: foo bar"
+        assert search_grep(r"foo$", root=temp_dir) == "a.py:1: foo\na.py:4: end foo"
+
+    def test_large_files_use_mmap(self, temp_dir: Path, monkeypatch):
+        monkeypatch.setattr(search, "MMAP_THRESHOLD_BYTES", 16)
+        _write(temp_dir / "big.txt", "filler line\n" * 100 + "needle here\n")
+
+        with patch("core.tools.search.mmap.mmap", wraps=search.mmap.mmap) as mm:
+            result = search_grep("needle", root=temp_dir)
+
+        assert result == "big.txt:101: needle here"
+        assert mm.called
+
+    def test_results_are_capped(self, temp_dir: Path):
+        _write(temp_dir / "a.txt", "match\n" * 20)
+
+        lines = search_grep("match", root=temp_dir, max_matches=5).splitlines()
+
+        assert lines[:5] == [f"a.txt:{i}: match" for i in range(1, 6)]
+        assert lines[5].startswith("[... results truncated at 5 matches")
+
+    def test_unicode_aware_regex_on_utf8_input(self, temp_dir: Path):
+        _write(temp_dir / "a.py", "x = 'café'\nname = 'Zoë'\n")
+
+        assert search_grep(r"caf.'", root=temp_dir) == "a.py:1: x = 'café'"
+        assert search_grep(r"Zo\w'", root=temp_dir) == "a.py:2: name = 'Zoë'"
+        assert search_grep(r"caf\S\b", root=temp_dir) == "a.py:1: x = 'café'"
+        assert search_grep(r"\u00e9", root=temp_dir) == "a.py:1: x = 'café'"
+
+    def test_bytes_prefilter_only_for_byte_safe_queries(self):
+        assert search._Matcher(r"foo\.bar|baz+").buffer_regex is not None
+        assert search._Matcher("foo.bar").buffer_regex is None
+        assert search._Matcher(r"\bfoo").buffer_regex is None
+        assert search._Matcher("[a-z]+").buffer_regex is None
+
+    def test_invalid_regex(self, temp_dir: Path):
+        assert search_grep("foo(", root=temp_dir).startswith("Error: Invalid regex")
+
+    def test_index_skips_files_without_keyword(self, project: Path):
+        SearchIndex(project).refresh(project)
+
+        with patch.object(search, "_grep_file", wraps=search._grep_file) as grep_file:
+            result = search_grep("handler", "*.py", project)
+
+        assert result == f"{Path('src/app.py')}:3: def handler():"
+        # util.py is indexed and unchanged, so it is never opened
+        assert [Path(c.args[0]).name for c in grep_file.call_args_list] == ["app.py"]
+
+    def test_index_reused_until_rewritten(self, project: Path):
+        SearchIndex(project).refresh(project)
+        search._index_cache.clear()
+
+        _, first = search._find_search_index(project / "src")
+        _, again = search._find_search_index(project)
+        assert again is first
+
+        _write(project / "src" / "new.py", "def fresh():\n    pass\n")
+        SearchIndex(project).refresh(project)
+
+        _, reloaded = search._find_search_index(project)
+        assert reloaded is not first
+        assert "src/new.py" in reloaded.files_containing("fresh")[1]